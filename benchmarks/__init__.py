@@ -0,0 +1,11 @@
+"""Benchmarks of the hot paths of rotki built on pytest-benchmark
+
+They use the fixtures of rotki's tests and the deterministic data of benchmarks/generators.py
+and run from the root of the repository with:
+
+python pytestgeventwrapper.py benchmarks --benchmark-json=benchmarks.json
+
+BENCHMARK_SCALE multiplies the size of the generated data, e.g. BENCHMARK_SCALE=10.
+benchmarks/compare.py compares the json output of two runs and fails if a tracked
+benchmark got slower than a threshold.
+"""
@@ -0,0 +1,101 @@
+"""
+Compares the results of two runs of the benchmarks and exits with 1 if any tracked
+benchmark got slower than the threshold. The results are the json files that
+pytest-benchmark writes with --benchmark-json. Run from the root of the repository:
+
+python -m benchmarks.compare baseline.json benchmarks.json --threshold 0.15
+
+The median time of each benchmark is compared since it is the least affected by the
+occasional outlier round of a busy machine.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Prefixes of the names of the benchmarks whose regressions fail the comparison
+TRACKED_BENCHMARKS = (
+    'test_process_history',
+    'test_decode_transactions',
+    'test_get_history_events',
+    'test_get_netvalue_data',
+    'test_get_historical_price',
+    'test_process_result',
+    'test_resolve_assets',
+    'test_db_point_queries',
+    'test_import_csv',
+    'test_get_report_data',
+    'test_add_receipts_data',
+    'test_sale_of_dust_acquisitions',
+    'test_initialize_decoders',
+    'test_upgrade_db',
+    'test_apply_assets_update',
+)
+DEFAULT_THRESHOLD = 0.15
+COMPARED_STAT = 'median'
+
+
+def load_results(path: Path) -> dict[str, float]:
+    """Returns the compared stat of each benchmark of a pytest-benchmark json file"""
+    with path.open(encoding='utf-8') as f:
+        data = json.load(f)
+    return {x['name']: x['stats'][COMPARED_STAT] for x in data['benchmarks']}
+
+
+def is_tracked(name: str) -> bool:
+    return name.startswith(TRACKED_BENCHMARKS)
+
+
+def compare(
+        baseline: dict[str, float],
+        current: dict[str, float],
+        threshold: float,
+) -> list[str]:
+    """Prints the change of each benchmark and returns the tracked ones that regressed
+    beyond the threshold. Tracked benchmarks missing from the current run also count
+    as regressions so that a broken benchmark can't hide one."""
+    regressions = []
+    print(f'{"benchmark":<50} {"baseline (s)":>12} {"current (s)":>12} {"change":>8}')
+    for name in sorted(baseline.keys() | current.keys()):
+        if name not in current:
+            print(f'{name:<50} {baseline[name]:>12.4f} {"missing":>12}')
+            if is_tracked(name):
+                regressions.append(name)
+            continue
+        if name not in baseline:
+            print(f'{name:<50} {"new":>12} {current[name]:>12.4f}')
+            continue
+
+        change = current[name] / baseline[name] - 1
+        regressed = is_tracked(name) and change > threshold
+        print(f'{name:<50} {baseline[name]:>12.4f} {current[name]:>12.4f} {change:>+8.1%}{" REGRESSED" if regressed else ""}')  # noqa: E501
+        if regressed:
+            regressions.append(name)
+
+    return regressions
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description='Compare the results of two benchmark runs')
+    p.add_argument('baseline', type=Path, help='pytest-benchmark json of the baseline run')
+    p.add_argument('current', type=Path, help='pytest-benchmark json of the run to check')
+    p.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help='Ratio by which a tracked benchmark may get slower, e.g. 0.15 for 15%%',
+    )
+    args = p.parse_args()
+    regressions = compare(
+        baseline=load_results(args.baseline),
+        current=load_results(args.current),
+        threshold=args.threshold,
+    )
+    if len(regressions) != 0:
+        print(f'{len(regressions)} tracked benchmarks regressed by more than {args.threshold:.0%}: {", ".join(regressions)}')  # noqa: E501
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1 @@
+from rotkehlchen.tests.conftest import *  # noqa: F403  # the fixtures of rotki's tests
@@ -0,0 +1,237 @@
+"""Deterministic generators of synthetic rotki data for the benchmarks
+
+Each generator takes the number of entries and a seed, and always returns the same data
+for the same arguments so that the results of two runs are comparable.
+"""
+import itertools
+import os
+import random
+from collections.abc import Sequence
+
+from eth_utils import to_checksum_address
+
+from rotkehlchen.accounting.structures.balance import Balance, BalanceType
+from rotkehlchen.accounting.structures.base import HistoryBaseEntry, HistoryEvent
+from rotkehlchen.accounting.structures.evm_event import EvmEvent
+from rotkehlchen.accounting.structures.types import HistoryEventSubType, HistoryEventType
+from rotkehlchen.assets.asset import Asset
+from rotkehlchen.chain.evm.decoding.constants import ERC20_OR_ERC721_TRANSFER
+from rotkehlchen.chain.evm.structures import EvmTxReceipt, EvmTxReceiptLog
+from rotkehlchen.constants.assets import A_BTC, A_DAI, A_ETH, A_LINK, A_USD, A_USDC, A_USDT
+from rotkehlchen.db.utils import DBAssetBalance, LocationData
+from rotkehlchen.fval import FVal
+from rotkehlchen.history.types import HistoricalPrice, HistoricalPriceOracle
+from rotkehlchen.serialization.deserialize import deserialize_evm_tx_hash
+from rotkehlchen.types import (
+    ChainID,
+    ChecksumEvmAddress,
+    EvmTransaction,
+    EVMTxHash,
+    Location,
+    Price,
+    Timestamp,
+    TimestampMS,
+)
+
+BENCHMARK_SCALE = int(os.environ.get('BENCHMARK_SCALE', '1'))
+BENCHMARK_START_TS = Timestamp(1609459200)  # 2021-01-01
+BENCHMARK_ACCOUNT = to_checksum_address('0x9531c059098e3d194ff87febb587ab07b30b1306')
+# tokens of the packaged global DB so that decoding does not need to query the chain
+BENCHMARK_TOKENS = {
+    A_DAI: to_checksum_address('0x6B175474E89094C44Da98b954EedeAC495271d0F'),
+    A_USDC: to_checksum_address('0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48'),
+    A_USDT: to_checksum_address('0xdAC17F958D2ee523a2206206994597C13D831ec7'),
+    A_LINK: to_checksum_address('0x514910771AF9Ca656af840dff83E8264EcF986CA'),
+}
+BENCHMARK_ASSETS: tuple[Asset, ...] = (A_ETH, A_BTC, *BENCHMARK_TOKENS)
+
+
+def scaled(number: int) -> int:
+    """The size of the generated data of a benchmark multiplied by BENCHMARK_SCALE"""
+    return number * BENCHMARK_SCALE
+
+
+def _address(rng: random.Random) -> ChecksumEvmAddress:
+    return to_checksum_address('0x' + rng.randbytes(20).hex())
+
+
+def _tx_hash(rng: random.Random) -> EVMTxHash:
+    return deserialize_evm_tx_hash(rng.randbytes(32))
+
+
+def _balance(rng: random.Random) -> Balance:
+    amount = FVal(rng.randint(1, 10**6)) / 1000
+    return Balance(amount=amount, usd_value=amount * rng.randint(1, 3000))
+
+
+def make_history_events(number: int, seed: int = 0) -> list[HistoryBaseEntry]:
+    """Returns `number` history events sorted by timestamp, about an hour apart. They are a
+    mix of EVM receives, spends and fees, exchange trades and staking rewards."""
+    rng = random.Random(seed)
+    events: list[HistoryBaseEntry] = []
+    timestamp = BENCHMARK_START_TS
+    for group in itertools.count():
+        if len(events) >= number:
+            break
+
+        timestamp = Timestamp(timestamp + rng.randint(1, 7200))
+        timestamp_ms = TimestampMS(timestamp * 1000)
+        kind = group % 5
+        if kind == 0:  # exchange trade of a stable coin for ETH or BTC with its fee
+            event_identifier = f'trade{group}'
+            for sequence_index, (event_type, event_subtype, asset) in enumerate((
+                    (HistoryEventType.TRADE, HistoryEventSubType.SPEND, rng.choice((A_USDC, A_USDT))),  # noqa: E501
+                    (HistoryEventType.TRADE, HistoryEventSubType.RECEIVE, rng.choice((A_ETH, A_BTC))),  # noqa: E501
+                    (HistoryEventType.TRADE, HistoryEventSubType.FEE, A_USD),
+            )):
+                events.append(HistoryEvent(
+                    event_identifier=event_identifier,
+                    sequence_index=sequence_index,
+                    timestamp=timestamp_ms,
+                    location=Location.KRAKEN,
+                    event_type=event_type,
+                    event_subtype=event_subtype,
+                    asset=asset,
+                    balance=_balance(rng),
+                ))
+        elif kind == 1:  # staking reward
+            events.append(HistoryEvent(
+                event_identifier=f'reward{group}',
+                sequence_index=0,
+                timestamp=timestamp_ms,
+                location=Location.KRAKEN,
+                event_type=HistoryEventType.STAKING,
+                event_subtype=HistoryEventSubType.REWARD,
+                asset=A_ETH,
+                balance=_balance(rng),
+            ))
+        else:  # onchain receive, or spend with its gas fee
+            tx_hash = _tx_hash(rng)
+            asset = rng.choice(BENCHMARK_ASSETS[2:] + (A_ETH,))
+            if kind == 2:
+                types = [(HistoryEventType.RECEIVE, HistoryEventSubType.NONE, asset)]
+            else:
+                types = [
+                    (HistoryEventType.SPEND, HistoryEventSubType.FEE, A_ETH),
+                    (HistoryEventType.SPEND, HistoryEventSubType.NONE, asset),
+                ]
+            for sequence_index, (event_type, event_subtype, event_asset) in enumerate(types):
+                events.append(EvmEvent(
+                    tx_hash=tx_hash,
+                    sequence_index=sequence_index,
+                    timestamp=timestamp_ms,
+                    location=Location.ETHEREUM,
+                    event_type=event_type,
+                    event_subtype=event_subtype,
+                    asset=event_asset,
+                    balance=_balance(rng),
+                    location_label=BENCHMARK_ACCOUNT,
+                    address=_address(rng),
+                ))
+
+    return events[:number]
+
+
+def make_evm_transactions(
+        number: int,
+        account: ChecksumEvmAddress = BENCHMARK_ACCOUNT,
+        seed: int = 0,
+) -> list[tuple[EvmTransaction, EvmTxReceipt]]:
+    """Returns `number` ethereum transactions of the account with their receipts. Every
+    third one is a plain ETH transfer and the rest have one to four ERC20 transfer logs
+    of known tokens from or to the account."""
+    rng = random.Random(seed)
+    transactions = []
+    for idx in range(number):
+        tx_hash = _tx_hash(rng)
+        counterparty = _address(rng)
+        is_eth_transfer = idx % 3 == 0
+        logs = []
+        if not is_eth_transfer:
+            for log_index in range(rng.randint(1, 4)):
+                from_address, to_address = (account, counterparty) if rng.random() < 0.5 else (counterparty, account)  # noqa: E501
+                logs.append(EvmTxReceiptLog(
+                    log_index=log_index,
+                    data=rng.randint(1, 10**24).to_bytes(32, 'big'),
+                    address=rng.choice(list(BENCHMARK_TOKENS.values())),
+                    removed=False,
+                    topics=[
+                        ERC20_OR_ERC721_TRANSFER,
+                        bytes.fromhex(from_address[2:]).rjust(32, b'\x00'),
+                        bytes.fromhex(to_address[2:]).rjust(32, b'\x00'),
+                    ],
+                ))
+        transactions.append((
+            EvmTransaction(
+                tx_hash=tx_hash,
+                chain_id=ChainID.ETHEREUM,
+                timestamp=Timestamp(BENCHMARK_START_TS + idx * 600),
+                block_number=11565019 + idx * 50,
+                from_address=account,
+                to_address=counterparty,
+                value=rng.randint(1, 10**19) if is_eth_transfer else 0,
+                gas=21000 if is_eth_transfer else 90000,
+                gas_price=rng.randint(10**9, 10**11),
+                gas_used=21000 if is_eth_transfer else rng.randint(40000, 90000),
+                input_data=b'' if is_eth_transfer else rng.randbytes(68),
+                nonce=idx,
+            ),
+            EvmTxReceipt(
+                tx_hash=tx_hash,
+                chain_id=ChainID.ETHEREUM,
+                contract_address=None,
+                status=True,
+                type=2,
+                logs=logs,
+            ),
+        ))
+
+    return transactions
+
+
+def make_timed_balances(
+        days: int,
+        assets: Sequence[Asset],
+        seed: int = 0,
+) -> tuple[list[DBAssetBalance], list[LocationData]]:
+    """Returns one daily snapshot for each of the `days` with a balance of each of the
+    assets, and the total net value of each snapshot as location data"""
+    rng = random.Random(seed)
+    balances, location_data = [], []
+    for day in range(days):
+        timestamp = Timestamp(BENCHMARK_START_TS + day * 86400)
+        total = FVal(0)
+        for asset in assets:
+            balance = _balance(rng)
+            total += balance.usd_value
+            balances.append(DBAssetBalance(
+                category=BalanceType.ASSET,
+                time=timestamp,
+                asset=asset,
+                amount=balance.amount,
+                usd_value=balance.usd_value,
+            ))
+        location_data.append(LocationData(
+            time=timestamp,
+            location=Location.TOTAL.serialize_for_db(),
+            usd_value=str(total),
+        ))
+
+    return balances, location_data
+
+
+def make_historical_prices(
+        number: int,
+        assets: Sequence[Asset] = BENCHMARK_ASSETS,
+        seed: int = 0,
+) -> list[HistoricalPrice]:
+    """Returns `number` hourly USD prices spread evenly over the assets"""
+    rng = random.Random(seed)
+    per_asset = max(1, number // len(assets))
+    return [HistoricalPrice(
+        from_asset=asset,
+        to_asset=A_USD,
+        source=HistoricalPriceOracle.CRYPTOCOMPARE,
+        timestamp=Timestamp(BENCHMARK_START_TS + hour * 3600),
+        price=Price(FVal(rng.randint(1, 10**7)) / 1000),
+    ) for asset in assets for hour in range(per_asset)][:number]
@@ -0,0 +1,152 @@
+from contextlib import suppress
+from typing import TYPE_CHECKING, Optional
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.generators import BENCHMARK_START_TS, make_history_events, scaled
+from rotkehlchen.accounting.mixins.event import AccountingEventType
+from rotkehlchen.accounting.structures.types import HistoryEventSubType, HistoryEventType
+from rotkehlchen.chain.evm.accounting.structures import BaseEventSettings
+from rotkehlchen.constants import ONE, ZERO
+from rotkehlchen.constants.assets import A_ETH
+from rotkehlchen.constants.timing import DAY_IN_SECONDS
+from rotkehlchen.db.accounting_rules import DBAccountingRules
+from rotkehlchen.db.reports import DBAccountingReports
+from rotkehlchen.db.settings import DBSettings
+from rotkehlchen.errors.misc import InputError
+from rotkehlchen.fval import FVal
+from rotkehlchen.premium.premium import SubscriptionStatus
+from rotkehlchen.types import Location, Price, Timestamp
+from rotkehlchen.utils.misc import ts_now
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from rotkehlchen.accounting.accountant import Accountant
+
+ACCOUNTING_EVENTS = scaled(5000)
+RESUMED_ACCOUNTING_EVENTS = scaled(20000)  # about a year and a half of history
+DUST_ACQUISITIONS = scaled(5000)
+# process_history sleeps every 500 events to let other greenlets run. That is idle time,
+# not processing time, so it is patched out of the measurements
+YIELD_SLEEP = 'rotkehlchen.accounting.accountant.gevent.sleep'
+# The rules of the generated onchain events, in case the downloaded ones are not available
+ACCOUNTING_RULES = {
+    (HistoryEventType.RECEIVE, HistoryEventSubType.NONE): BaseEventSettings(
+        taxable=True,
+        count_entire_amount_spend=False,
+        count_cost_basis_pnl=False,
+    ),
+    (HistoryEventType.SPEND, HistoryEventSubType.NONE): BaseEventSettings(
+        taxable=True,
+        count_entire_amount_spend=True,
+        count_cost_basis_pnl=True,
+    ),
+    (HistoryEventType.SPEND, HistoryEventSubType.FEE): BaseEventSettings(
+        taxable=True,
+        count_entire_amount_spend=True,
+        count_cost_basis_pnl=True,
+    ),
+}
+
+
+def _prepare_accountant(accountant: 'Accountant') -> None:
+    accountant.premium.status = SubscriptionStatus.ACTIVE  # type: ignore[union-attr]  # skip the server check
+    dbrules = DBAccountingRules(accountant.db)
+    for (event_type, event_subtype), rule in ACCOUNTING_RULES.items():
+        with suppress(InputError):
+            dbrules.add_accounting_rule(
+                event_type=event_type,
+                event_subtype=event_subtype,
+                counterparty=None,
+                rule=rule,
+                links={},
+            )
+
+
+@pytest.mark.parametrize('default_mock_price_value', [ONE])  # every price query is stubbed
+@pytest.mark.parametrize('start_with_valid_premium', [True])  # no limit on processed events
+def test_process_history(benchmark: 'BenchmarkFixture', accountant: 'Accountant') -> None:
+    _prepare_accountant(accountant)
+    events = make_history_events(ACCOUNTING_EVENTS)
+
+    def process_history() -> int:
+        return accountant.process_history(
+            start_ts=Timestamp(0),
+            end_ts=ts_now(),
+            events=events,  # type: ignore[arg-type]  # history events are accounting events
+        )
+
+    with patch(YIELD_SLEEP):
+        benchmark.pedantic(process_history, rounds=3, warmup_rounds=1)
+    assert len(accountant.pots[0].processed_events) > ACCOUNTING_EVENTS // 2
+
+
+@pytest.mark.parametrize('default_mock_price_value', [ONE])
+@pytest.mark.parametrize('start_with_valid_premium', [True])
+def test_process_history_resumed(benchmark: 'BenchmarkFixture', accountant: 'Accountant') -> None:
+    """Re-running a report for the last month of a long history. After the first run the
+    processing resumes from the latest saved checkpoint"""
+    _prepare_accountant(accountant)
+    events = make_history_events(RESUMED_ACCOUNTING_EVENTS)
+    last_month_ts = Timestamp(events[-1].get_timestamp() - DAY_IN_SECONDS * 30)
+
+    def process_history() -> int:
+        return accountant.process_history(
+            start_ts=last_month_ts,
+            end_ts=ts_now(),
+            events=events,  # type: ignore[arg-type]  # history events are accounting events
+        )
+
+    with patch(YIELD_SLEEP):
+        benchmark.pedantic(process_history, rounds=3, warmup_rounds=1)
+    assert accountant.pots[0].processed_events_offset > 0
+
+
+@pytest.mark.parametrize('merge_tolerance', [None, ZERO], ids=['unmerged', 'merged'])
+def test_sale_of_dust_acquisitions(
+        benchmark: 'BenchmarkFixture',
+        accountant: 'Accountant',
+        merge_tolerance: Optional[FVal],
+) -> None:
+    """A sale that uses up many tiny staking reward acquisitions, each 50 of which have
+    the same price, with and without merging them"""
+    pot = accountant.pots[0]
+    settings = DBSettings(taxfree_after_period=None, acquisitions_merge_tolerance=merge_tolerance)
+    end_ts = ts_now()
+    report_id = DBAccountingReports(accountant.db).add_report(
+        first_processed_timestamp=BENCHMARK_START_TS,
+        start_ts=Timestamp(0),
+        end_ts=end_ts,
+        settings=settings,
+    )
+
+    def add_rewards() -> None:
+        pot.reset(settings=settings, start_ts=Timestamp(0), end_ts=end_ts, report_id=report_id)
+        for idx in range(DUST_ACQUISITIONS):
+            pot.add_in_event(
+                event_type=AccountingEventType.TRANSACTION_EVENT,
+                notes='Staking reward',
+                location=Location.BLOCKCHAIN,
+                timestamp=Timestamp(BENCHMARK_START_TS + idx * 60),
+                asset=A_ETH,
+                amount=FVal('0.001'),
+                taxable=True,
+                given_price=Price(FVal(1000 + idx // 50 % 3)),
+            )
+
+    def sell() -> None:
+        pot.add_out_event(
+            event_type=AccountingEventType.TRADE,
+            notes='Sell ETH',
+            location=Location.KRAKEN,
+            timestamp=Timestamp(BENCHMARK_START_TS + DUST_ACQUISITIONS * 60),
+            asset=A_ETH,
+            amount=FVal('0.001') * DUST_ACQUISITIONS * FVal('0.9'),
+            taxable=True,
+            given_price=Price(FVal(1200)),
+        )
+
+    benchmark.pedantic(sell, setup=add_rewards, rounds=3)
+    assert pot.pnls.taxable != ZERO
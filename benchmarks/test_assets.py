@@ -0,0 +1,98 @@
+from contextlib import ExitStack
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.generators import scaled
+from rotkehlchen.assets.resolver import AssetResolver
+from rotkehlchen.globaldb.handler import GlobalDBHandler, initialize_globaldb
+from rotkehlchen.globaldb.updates import AssetsUpdater, UpdateFileType, _replace_assets_from_db
+from rotkehlchen.user_messages import MessagesAggregator
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+RESOLVED_ASSETS = scaled(2000)
+UPDATED_ASSETS = scaled(5000)
+
+
+@pytest.mark.parametrize('resolve_method', ['resolve_asset', 'resolve_many'])
+def test_resolve_assets(
+        benchmark: 'BenchmarkFixture',
+        globaldb: GlobalDBHandler,
+        resolve_method: str,
+) -> None:
+    """Resolution of assets of the global DB that are not in the memory cache yet"""
+    with globaldb.conn.read_ctx() as cursor:
+        identifiers = [x[0] for x in cursor.execute(
+            'SELECT identifier FROM assets ORDER BY identifier LIMIT ?', (RESOLVED_ASSETS,),
+        )]
+
+    def resolve_assets() -> int:
+        if resolve_method == 'resolve_many':
+            return len(AssetResolver.resolve_many(identifiers))
+        return len([AssetResolver.resolve_asset(x) for x in identifiers])
+
+    resolved = benchmark.pedantic(
+        resolve_assets,
+        setup=AssetResolver.clean_memory_cache,
+        rounds=10,
+    )
+    assert resolved == len(identifiers)
+
+
+def _asset_update_lines(identifier: str, name: str) -> str:
+    """The lines of the full insert of an asset in an assets update file"""
+    return f'INSERT INTO assets(identifier, name, type) VALUES("{identifier}", "{name}", "Y"); INSERT INTO common_asset_details(identifier, symbol, coingecko, cryptocompare, forked, started, swapped_for) VALUES("{identifier}", "{name}", "", "", NULL, NULL, NULL);\n*\n'  # noqa: E501
+
+
+@pytest.mark.parametrize('sequential', [False, True], ids=['bulk', 'sequential'])
+def test_apply_assets_update(
+        benchmark: 'BenchmarkFixture',
+        globaldb: GlobalDBHandler,
+        tmp_path: Path,
+        sequential: bool,
+) -> None:
+    """Applying an assets update of new assets and of updates of a tenth as many existing
+    assets to a copy of the global DB, in bulk or asset by asset"""
+    with globaldb.conn.read_ctx() as cursor:
+        existing = [x[0] for x in cursor.execute(
+            'SELECT identifier FROM assets WHERE type="Y" ORDER BY identifier LIMIT ?',
+            (UPDATED_ASSETS // 10,),
+        )]
+    update_text = ''.join(
+        _asset_update_lines(f'BENCHMARK-ASSET-{idx}', f'asset{idx}')
+        for idx in range(UPDATED_ASSETS - len(existing))
+    ) + ''.join(_asset_update_lines(identifier, f'{identifier} updated') for identifier in existing)  # noqa: E501
+    connection, _ = initialize_globaldb(
+        global_dir=tmp_path,
+        db_filename='temp.db',
+        sql_vm_instructions_cb=globaldb.conn.sql_vm_instructions_cb,
+    )
+    assets_updater = AssetsUpdater(MessagesAggregator())
+
+    def copy_assets() -> None:
+        _replace_assets_from_db(connection, globaldb.filepath())
+
+    def apply_update() -> None:
+        with connection.write_ctx():
+            assets_updater._apply_single_version_update(
+                connection=connection,
+                version=999,  # doesn't matter
+                text=update_text,
+                assets_conflicts={},
+                update_file_type=UpdateFileType.ASSETS,
+            )
+
+    with ExitStack() as stack:
+        if sequential:  # every asset is applied on its own as if its action failed in bulk
+            stack.enter_context(patch.object(AssetsUpdater, '_apply_assets_in_bulk', return_value=0))  # noqa: E501
+        benchmark.pedantic(apply_update, setup=copy_assets, rounds=3)
+
+    with connection.read_ctx() as cursor:
+        assert cursor.execute(
+            "SELECT COUNT(*) FROM assets WHERE identifier LIKE 'BENCHMARK-ASSET-%'",
+        ).fetchone()[0] == UPDATED_ASSETS - len(existing)
+    connection.close()
@@ -0,0 +1,49 @@
+import resource
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from benchmarks.generators import scaled
+from rotkehlchen.data_import.importers.rotki_trades import RotkiGenericTradesImporter
+from rotkehlchen.tests.utils.dataimport import generate_rotki_trades_csv
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from rotkehlchen.db.dbhandler import DBHandler
+
+CSV_IMPORT_ROWS = scaled(5000)
+
+
+def test_import_csv(
+        benchmark: 'BenchmarkFixture',
+        database: 'DBHandler',
+        tmpdir_factory: pytest.TempdirFactory,
+) -> None:
+    """Import of a synthetic rotki generic trades csv file into an empty trades table.
+    Records the rows/sec of the fastest round and the peak RSS of the process"""
+    filepath = Path(tmpdir_factory.mktemp('csv')) / 'trades.csv'
+    generate_rotki_trades_csv(filepath=filepath, rows=CSV_IMPORT_ROWS)
+
+    def delete_trades() -> None:
+        with database.user_write() as write_cursor:
+            write_cursor.execute('DELETE FROM trades')
+
+    import_seconds: list[float] = []
+
+    def import_csv() -> tuple[bool, str]:
+        start = time.perf_counter()
+        result = RotkiGenericTradesImporter(database).import_csv(filepath=filepath)
+        import_seconds.append(time.perf_counter() - start)
+        return result
+
+    assert benchmark.pedantic(import_csv, setup=delete_trades, rounds=3) == (True, '')
+    benchmark.extra_info['rows_per_second'] = CSV_IMPORT_ROWS / min(import_seconds)
+    # the high-water mark of the whole process. ru_maxrss is in bytes on macOS, kB elsewhere
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    benchmark.extra_info['peak_rss_mb'] = max_rss / (1024 * 1024 if sys.platform == 'darwin' else 1024)  # noqa: E501
+    with database.conn.read_ctx() as cursor:
+        assert cursor.execute('SELECT COUNT(*) FROM trades').fetchone()[0] == CSV_IMPORT_ROWS
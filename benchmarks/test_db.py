@@ -0,0 +1,226 @@
+import sqlite3
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+import pytest
+
+from benchmarks.generators import (
+    BENCHMARK_ACCOUNT,
+    BENCHMARK_ASSETS,
+    BENCHMARK_START_TS,
+    make_evm_transactions,
+    make_historical_prices,
+    make_history_events,
+    make_timed_balances,
+    scaled,
+)
+from rotkehlchen.accounting.structures.types import HistoryEventSubType, HistoryEventType
+from rotkehlchen.constants.assets import A_ETH, A_USD
+from rotkehlchen.constants.misc import DEFAULT_SQL_VM_INSTRUCTIONS_CB
+from rotkehlchen.db.drivers.gevent import CONNECTION_MAP, DBConnection, DBConnectionType
+from rotkehlchen.db.evmtx import DBEvmTx
+from rotkehlchen.db.filtering import HistoryEventFilterQuery
+from rotkehlchen.db.history_events import DBHistoryEvents
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.tests.utils.database import _grow_prepared_db, _init_upgraded_db
+from rotkehlchen.tests.utils.ethereum import txreceipt_to_data
+from rotkehlchen.types import ChainID, Location, Timestamp
+from rotkehlchen.user_messages import MessagesAggregator
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from rotkehlchen.db.dbhandler import DBHandler
+
+HISTORY_EVENTS = scaled(20000)
+BALANCE_DAYS = scaled(730)
+PRICE_ROWS = scaled(50000)
+POINT_QUERY_ROWS = scaled(100000)
+# How many times slower point queries may be through the gevent DB driver wrapper than
+# through raw sqlite3. Most of it is the progress handler that lets other greenlets run.
+MAX_WRAPPER_OVERHEAD_RATIO = 2.0
+EVM_RECEIPTS = scaled(5000)
+UPGRADED_DB_MEGABYTES = scaled(50)
+
+# the filters with which the frontend most commonly queries the history events
+HISTORY_EVENTS_FILTERS = {
+    'first_page': HistoryEventFilterQuery.make(limit=10, offset=0),
+    'middle_page': HistoryEventFilterQuery.make(limit=10, offset=HISTORY_EVENTS // 2),
+    'asset': HistoryEventFilterQuery.make(assets=(A_ETH,)),
+    'time_range': HistoryEventFilterQuery.make(
+        from_ts=Timestamp(BENCHMARK_START_TS + HISTORY_EVENTS * 900),
+        to_ts=Timestamp(BENCHMARK_START_TS + HISTORY_EVENTS * 1800),
+    ),
+    'event_type': HistoryEventFilterQuery.make(
+        event_types=[HistoryEventType.TRADE],
+        event_subtypes=[HistoryEventSubType.RECEIVE],
+        limit=100,
+    ),
+    'location_label': HistoryEventFilterQuery.make(
+        location=Location.ETHEREUM,
+        location_labels=[BENCHMARK_ACCOUNT],
+        limit=100,
+    ),
+}
+
+
+@pytest.mark.parametrize('filter_name', list(HISTORY_EVENTS_FILTERS))
+def test_get_history_events(
+        benchmark: 'BenchmarkFixture',
+        database: 'DBHandler',
+        filter_name: str,
+) -> None:
+    with database.user_write() as write_cursor:
+        DBHistoryEvents(database).add_history_events(
+            write_cursor=write_cursor,
+            history=make_history_events(HISTORY_EVENTS),
+        )
+
+    def get_history_events() -> list:
+        with database.conn.read_ctx() as cursor:
+            return DBHistoryEvents(database).get_history_events(
+                cursor=cursor,
+                filter_query=HISTORY_EVENTS_FILTERS[filter_name],
+                has_premium=True,
+            )
+
+    assert len(benchmark(get_history_events)) != 0
+
+
+def test_get_netvalue_data(benchmark: 'BenchmarkFixture', database: 'DBHandler') -> None:
+    balances, location_data = make_timed_balances(days=BALANCE_DAYS, assets=BENCHMARK_ASSETS)
+    with database.user_write() as write_cursor:
+        database.add_multiple_balances(write_cursor, balances)
+        database.add_multiple_location_data(write_cursor, location_data)
+
+    times, values = benchmark(database.get_netvalue_data, from_ts=Timestamp(0))
+    assert len(times) == len(values) == BALANCE_DAYS
+
+
+def test_get_historical_price(benchmark: 'BenchmarkFixture', globaldb: GlobalDBHandler) -> None:
+    """Price lookups at every hour of the stored price history of an asset"""
+    prices = make_historical_prices(PRICE_ROWS)
+    globaldb.add_historical_prices(prices)
+    timestamps = [x.timestamp for x in prices if x.from_asset == A_ETH][::10]
+
+    def get_historical_prices() -> int:
+        return sum(globaldb.get_historical_price(
+            from_asset=A_ETH,
+            to_asset=A_USD,
+            timestamp=timestamp,
+            max_seconds_distance=3600,
+        ) is not None for timestamp in timestamps)
+
+    assert benchmark(get_historical_prices) == len(timestamps)
+
+
+def test_add_receipts_data(benchmark: 'BenchmarkFixture', database: 'DBHandler') -> None:
+    """Storing the receipts of many transactions with their logs in one write"""
+    transactions = make_evm_transactions(EVM_RECEIPTS)
+    receipts_data = [txreceipt_to_data(receipt) for _, receipt in transactions]
+    dbevmtx = DBEvmTx(database)
+    with database.user_write() as write_cursor:
+        dbevmtx.add_evm_transactions(
+            write_cursor=write_cursor,
+            evm_transactions=[tx for tx, _ in transactions],
+            relevant_address=BENCHMARK_ACCOUNT,
+        )
+
+    def delete_receipts() -> None:
+        with database.user_write() as write_cursor:
+            write_cursor.execute('DELETE FROM evmtx_receipts')
+
+    def add_receipts_data() -> None:
+        with database.user_write() as write_cursor:
+            dbevmtx.add_receipts_data(
+                write_cursor=write_cursor,
+                chain_id=ChainID.ETHEREUM,
+                receipts_data=receipts_data,
+            )
+
+    benchmark.pedantic(add_receipts_data, setup=delete_receipts, rounds=3)
+    with database.conn.read_ctx() as cursor:
+        assert dbevmtx.get_receipt(cursor, transactions[-1][0].tx_hash, ChainID.ETHEREUM) == transactions[-1][1]  # noqa: E501
+
+
+def test_upgrade_db(benchmark: 'BenchmarkFixture', user_data_dir: Path) -> None:
+    """Opening a big DB from v33, which is backed up once and then upgraded to the latest
+    version"""
+    original_db = _grow_prepared_db(user_data_dir, 'v33_rotkehlchen.db', megabytes=UPGRADED_DB_MEGABYTES)  # noqa: E501
+    databases: list['DBHandler'] = []
+
+    def restore_original_db() -> None:
+        while len(databases) != 0:
+            databases.pop().logout()
+        for path in user_data_dir.glob('*.backup'):
+            path.unlink()
+        (user_data_dir / 'rotkehlchen.db').write_bytes(original_db)
+
+    def upgrade_db() -> None:
+        databases.append(_init_upgraded_db(user_data_dir, MessagesAggregator()))
+
+    benchmark.pedantic(upgrade_db, setup=restore_original_db, rounds=3)
+    assert len(list(user_data_dir.glob('*.backup'))) == 1
+    databases.pop().logout()
+
+
+@contextmanager
+def _point_queries_cursor(driver: Literal['sqlite3', 'wrapper']) -> Iterator[Any]:
+    """A cursor of a new in-memory DB. For the wrapper it is a global DB connection with the
+    progress handler of the app, which is unregistered again at the end"""
+    if driver == 'sqlite3':
+        raw_connection = sqlite3.connect(':memory:', isolation_level=None)
+        try:
+            yield raw_connection.cursor()
+        finally:
+            raw_connection.close()
+        return
+
+    previous_connection = CONNECTION_MAP.get(DBConnectionType.GLOBAL)
+    connection = DBConnection(
+        path=':memory:',
+        connection_type=DBConnectionType.GLOBAL,
+        sql_vm_instructions_cb=DEFAULT_SQL_VM_INSTRUCTIONS_CB,
+    )
+    try:
+        yield connection.cursor()
+    finally:
+        connection.close()
+        if previous_connection is not None:
+            CONNECTION_MAP[DBConnectionType.GLOBAL] = previous_connection
+
+
+def _time_point_queries(driver: Literal['sqlite3', 'wrapper']) -> float:
+    """Inserts POINT_QUERY_ROWS rows one by one and then selects each of them by primary
+    key. Returns the time it took in seconds"""
+    with _point_queries_cursor(driver) as cursor:
+        cursor.execute('CREATE TABLE bench(id INTEGER PRIMARY KEY, value TEXT)')
+        start = time.perf_counter()
+        cursor.execute('BEGIN TRANSACTION')
+        for i in range(POINT_QUERY_ROWS):
+            cursor.execute('INSERT INTO bench(id, value) VALUES(?, ?)', (i, str(i)))
+        cursor.execute('COMMIT')
+        for i in range(POINT_QUERY_ROWS):
+            assert cursor.execute('SELECT value FROM bench WHERE id=?', (i,)).fetchone()[0] == str(i)  # noqa: E501
+        return time.perf_counter() - start
+
+
+def test_db_point_queries(benchmark: 'BenchmarkFixture') -> None:
+    """Point inserts and selects by primary key through the gevent DB driver wrapper.
+    Makes sure that they take at most MAX_WRAPPER_OVERHEAD_RATIO times the time of raw
+    sqlite3, measured as the best of 3 runs of each. Each round runs raw sqlite3 in its
+    setup so that the runs of the two are interleaved"""
+    sqlite3_seconds: list[float] = []
+    wrapper_seconds: list[float] = []
+    benchmark.pedantic(
+        lambda: wrapper_seconds.append(_time_point_queries('wrapper')),
+        setup=lambda: sqlite3_seconds.append(_time_point_queries('sqlite3')),
+        rounds=3,
+    )
+    overhead_ratio = min(wrapper_seconds) / min(sqlite3_seconds)
+    benchmark.extra_info['sqlite3_seconds'] = min(sqlite3_seconds)
+    benchmark.extra_info['wrapper_overhead_ratio'] = overhead_ratio
+    assert overhead_ratio <= MAX_WRAPPER_OVERHEAD_RATIO
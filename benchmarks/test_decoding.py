@@ -0,0 +1,71 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from benchmarks.generators import BENCHMARK_ACCOUNT, make_evm_transactions, scaled
+from rotkehlchen.chain.evm.decoding.decoder import walk_decoder_modules
+from rotkehlchen.chain.evm.decoding.decoders_manifest import DECODER_MODULES
+from rotkehlchen.db.evmtx import DBEvmTx
+from rotkehlchen.tests.utils.ethereum import txreceipt_to_data
+from rotkehlchen.types import ChainID
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from rotkehlchen.chain.ethereum.decoding.decoder import EthereumTransactionDecoder
+
+EVM_TRANSACTIONS = scaled(500)
+
+
+@pytest.mark.parametrize('ethereum_accounts', [[BENCHMARK_ACCOUNT]])
+def test_decode_transactions(
+        benchmark: 'BenchmarkFixture',
+        ethereum_transaction_decoder: 'EthereumTransactionDecoder',
+) -> None:
+    """Decoding of stored transactions and receipts, so without any remote queries"""
+    transactions = make_evm_transactions(EVM_TRANSACTIONS)
+    database = ethereum_transaction_decoder.database
+    dbevmtx = DBEvmTx(database)
+    with database.user_write() as write_cursor:
+        dbevmtx.add_evm_transactions(
+            write_cursor=write_cursor,
+            evm_transactions=[tx for tx, _ in transactions],
+            relevant_address=BENCHMARK_ACCOUNT,
+        )
+        dbevmtx.add_receipts_data(
+            write_cursor=write_cursor,
+            chain_id=ChainID.ETHEREUM,
+            receipts_data=[txreceipt_to_data(receipt) for _, receipt in transactions],
+        )
+
+    tx_hashes = [tx.tx_hash for tx, _ in transactions]
+    events = benchmark.pedantic(
+        ethereum_transaction_decoder.decode_transaction_hashes,
+        kwargs={'ignore_cache': True, 'tx_hashes': tx_hashes},
+        rounds=3,
+        warmup_rounds=1,
+    )
+    assert len(events) > EVM_TRANSACTIONS
+
+
+@pytest.mark.parametrize('chain_name', list(DECODER_MODULES))
+def test_walk_decoder_modules(benchmark: 'BenchmarkFixture', chain_name: str) -> None:
+    """Walking the packages of a chain's modules, which the decoders manifest avoids"""
+    decoder_modules = benchmark(walk_decoder_modules, f'rotkehlchen.chain.{chain_name}.modules')
+    assert decoder_modules == list(DECODER_MODULES[chain_name])
+
+
+def test_initialize_decoders(
+        benchmark: 'BenchmarkFixture',
+        ethereum_transaction_decoder: 'EthereumTransactionDecoder',
+) -> None:
+    """Initializing the decoders of ethereum from the manifest at the first decoding"""
+    def reset_decoders() -> None:
+        ethereum_transaction_decoder._rules = None
+
+    rules = benchmark.pedantic(
+        lambda: ethereum_transaction_decoder.rules,
+        setup=reset_decoders,
+        rounds=3,
+    )
+    assert len(rules.address_mappings) != 0
@@ -0,0 +1,105 @@
+import time
+from typing import TYPE_CHECKING
+
+from benchmarks.generators import scaled
+from rotkehlchen.accounting.mixins.event import AccountingEventType
+from rotkehlchen.accounting.pnl import PNL
+from rotkehlchen.accounting.structures.processed_event import ProcessedAccountingEvent
+from rotkehlchen.constants import ONE, ZERO
+from rotkehlchen.constants.assets import A_ETH
+from rotkehlchen.db.filtering import ReportDataFilterQuery
+from rotkehlchen.db.reports import DBAccountingReports
+from rotkehlchen.db.settings import DBSettings
+from rotkehlchen.fval import FVal
+from rotkehlchen.types import Location, Price, Timestamp
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from rotkehlchen.db.dbhandler import DBHandler
+
+REPORT_EVENTS = scaled(500000)
+PAGE_SIZE = 1000
+# How much slower the last page of the report may be than the first one. With keyset
+# pagination both read only the page's rows, while with OFFSET the last page has to
+# step over all the events before it, which makes it about 40% slower at 500k events.
+LAST_PAGE_TOLERANCE = 0.2
+
+
+def _time_page(
+        dbreport: DBAccountingReports,
+        filter_query: ReportDataFilterQuery,
+) -> float:
+    start = time.perf_counter()
+    events, entries_found = dbreport.get_report_data(filter_=filter_query, with_limit=False)
+    seconds = time.perf_counter() - start
+    assert entries_found == REPORT_EVENTS
+    assert len(events) == PAGE_SIZE
+    return seconds
+
+
+def test_get_report_data(benchmark: 'BenchmarkFixture', database: 'DBHandler') -> None:
+    """The last page of the events of a big PnL report. Makes sure that it takes at most
+    LAST_PAGE_TOLERANCE more time than the first page, measured as the best of 3 runs"""
+    dbreport = DBAccountingReports(database)
+    report_id = dbreport.add_report(
+        first_processed_timestamp=Timestamp(1),
+        start_ts=Timestamp(0),
+        end_ts=Timestamp(REPORT_EVENTS),
+        settings=DBSettings(),
+    )
+    event = ProcessedAccountingEvent(
+        type=AccountingEventType.TRADE,
+        notes='benchmark event',
+        location=Location.KRAKEN,
+        timestamp=Timestamp(0),
+        asset=A_ETH,
+        free_amount=ONE,
+        taxable_amount=ONE,
+        price=Price(FVal(10)),
+        pnl=PNL(taxable=ONE, free=ZERO),
+        cost_basis=None,
+        index=0,
+    )
+    data = event.serialize_for_db(str)
+    with database.transient_write() as write_cursor:
+        write_cursor.executemany(
+            'INSERT INTO pnl_events(report_id, timestamp, type, asset, location, taxable, '
+            'pnl_taxable, pnl_free, data) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [(
+                report_id,
+                idx // 4,  # a few events share each timestamp
+                event.type.serialize(),
+                event.asset.identifier,
+                event.location.serialize_for_db(),
+                True,
+                str(event.pnl.taxable),
+                str(event.pnl.free),
+                data,
+            ) for idx in range(REPORT_EVENTS)],
+        )
+        # the last page starts after the event that is right before its PAGE_SIZE events
+        before_last_page = write_cursor.execute(
+            'SELECT identifier FROM pnl_events WHERE report_id=? '
+            'ORDER BY timestamp ASC, identifier ASC LIMIT 1 OFFSET ?',
+            (report_id, REPORT_EVENTS - PAGE_SIZE - 1),
+        ).fetchone()[0]
+
+    first_page = ReportDataFilterQuery.make(
+        report_id=report_id,
+        order_by_rules=[('timestamp', False)],
+        limit=PAGE_SIZE,
+        offset=0,
+    )
+    last_page = ReportDataFilterQuery.make(
+        report_id=report_id,
+        order_by_rules=[('timestamp', False)],
+        limit=PAGE_SIZE,
+        after_identifier=before_last_page,
+    )
+    first_page_seconds = min(_time_page(dbreport, first_page) for _ in range(3))
+    last_page_seconds: list[float] = []
+    benchmark.pedantic(lambda: last_page_seconds.append(_time_page(dbreport, last_page)), rounds=3)
+    benchmark.extra_info['first_page_seconds'] = first_page_seconds
+    benchmark.extra_info['last_page_seconds'] = min(last_page_seconds)
+    assert min(last_page_seconds) <= first_page_seconds * (1 + LAST_PAGE_TOLERANCE)
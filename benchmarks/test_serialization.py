@@ -0,0 +1,52 @@
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from benchmarks.generators import (
+    BENCHMARK_ASSETS,
+    make_evm_transactions,
+    make_history_events,
+    make_timed_balances,
+    scaled,
+)
+from rotkehlchen.serialization.serialize import process_result
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+SERIALIZED_ENTRIES = scaled(5000)
+
+
+def _history_events() -> dict[str, Any]:
+    return {'entries': [x.serialize_for_api(
+        customized_event_ids=[],
+        ignored_ids_mapping={},
+        hidden_event_ids=[],
+    ) for x in make_history_events(SERIALIZED_ENTRIES)]}
+
+
+def _evm_transactions() -> dict[str, Any]:
+    return {'entries': [tx for tx, _ in make_evm_transactions(SERIALIZED_ENTRIES)]}
+
+
+def _timed_balances() -> dict[str, Any]:
+    balances, location_data = make_timed_balances(
+        days=SERIALIZED_ENTRIES // len(BENCHMARK_ASSETS),
+        assets=BENCHMARK_ASSETS,
+    )
+    return {'balances': balances, 'location_data': location_data}
+
+
+# the biggest results the API serializes
+API_RESULTS = {
+    'history_events': _history_events,
+    'evm_transactions': _evm_transactions,
+    'timed_balances': _timed_balances,
+}
+
+
+@pytest.mark.parametrize('result_name', list(API_RESULTS))
+def test_process_result(benchmark: 'BenchmarkFixture', result_name: str) -> None:
+    result = API_RESULTS[result_name]()
+    processed_result = benchmark(process_result, result)
+    assert processed_result.keys() == result.keys()
@@ -72,6 +72,7 @@ def load_config_from_env() -> Dict[str, Any]:
     max_size_in_mb_all_logs = os.environ.get('MAX_SIZE_IN_MB_ALL_LOGS')
     max_logfiles_num = os.environ.get('MAX_LOGFILES_NUM')
     sqlite_instructions = os.environ.get('SQLITE_INSTRUCTIONS')
+    db_profile = os.environ.get('DB_PROFILE')
 
     return {
         'loglevel': loglevel,
@@ -79,6 +80,7 @@ def load_config_from_env() -> Dict[str, Any]:
         'max_logfiles_num': max_logfiles_num,
         'max_size_in_mb_all_logs': max_size_in_mb_all_logs,
         'sqlite_instructions': sqlite_instructions,
+        'db_profile': db_profile,
     }
 
 
@@ -93,6 +95,7 @@ def load_config() -> List[str]:
     max_logfiles_num = env_config.get('max_logfiles_num')
     max_size_in_mb_all_logs = env_config.get('max_size_in_mb_all_logs')
     sqlite_instructions = env_config.get('sqlite_instructions')
+    db_profile = env_config.get('db_profile')
 
     if file_config is not None:
         logger.info('loading config from file')
@@ -112,6 +115,9 @@ def load_config() -> List[str]:
         if file_config.get('sqlite_instructions') is not None:
             sqlite_instructions = file_config.get('sqlite_instructions')
 
+        if file_config.get('db_profile') is not None:
+            db_profile = file_config.get('db_profile')
+
     args = [
         '--data-dir',
         '/data',
@@ -135,6 +141,10 @@ def load_config() -> List[str]:
     if sqlite_instructions is not None:
         args.append('--sqlite-instructions')
         args.append(int(sqlite_instructions))
+
+    if db_profile is not None:
+        args.append('--db-profile')
+        args.append(db_profile)
     return args
 
 
@@ -1,15 +1,20 @@
 import logging
+from collections import deque
 from collections.abc import Iterator
+from itertools import islice
+from operator import length_hint
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 import gevent
 
-from rotkehlchen.accounting.constants import FREE_PNL_EVENTS_LIMIT
+from rotkehlchen.accounting.checkpoints import AccountingCheckpoints
+from rotkehlchen.accounting.constants import FREE_PNL_EVENTS_LIMIT, PNL_CHECKPOINT_PERIOD
 from rotkehlchen.accounting.export.csv import CSVExporter
 from rotkehlchen.accounting.mixins.event import AccountingEventMixin
 from rotkehlchen.accounting.pot import AccountingPot
 from rotkehlchen.accounting.structures.types import ActionType
+from rotkehlchen.accounting.timings import PnlTimings
 from rotkehlchen.accounting.types import MissingPrice
 from rotkehlchen.chain.evm.accounting.aggregator import EVMAccountingAggregators
 from rotkehlchen.db.reports import DBAccountingReports
@@ -43,7 +48,7 @@ class Accountant:
         self.db = db
         self.msg_aggregator = msg_aggregator
         self.csvexporter = CSVExporter(database=db)
-        evm_accounting_aggregators = EVMAccountingAggregators([chains_aggregator.get_evm_manager(x).accounting_aggregator for x in EVM_CHAIN_IDS_WITH_TRANSACTIONS])  # noqa: E501
+        evm_accounting_aggregators = EVMAccountingAggregators([chains_aggregator.get_evm_manager(x) for x in EVM_CHAIN_IDS_WITH_TRANSACTIONS])  # noqa: E501
 
         # TODO: Allow for setting of multiple accounting pots
         self.pots = [
@@ -57,6 +62,7 @@ class Accountant:
         self.currently_processing_timestamp = Timestamp(-1)
         self.first_processed_timestamp = Timestamp(-1)
         self.premium = premium
+        self.checkpoints = AccountingCheckpoints(database=db, period=PNL_CHECKPOINT_PERIOD)
 
     def activate_premium_status(self, premium: Premium) -> None:
         self.premium = premium
@@ -99,6 +105,7 @@ class Accountant:
             start_ts: Timestamp,
             end_ts: Timestamp,
             events: list[AccountingEventMixin],
+            timings: Optional[PnlTimings] = None,
     ) -> int:
         """Processes the entire history of cryptoworld actions in order to determine
         the price and time at which every asset was obtained and also
@@ -108,10 +115,34 @@ class Accountant:
 
         start_ts here is the timestamp at which to start taking trades and other
         taxable events into account. Not where processing starts from. Processing
-        always starts from the very first event we find in the history.
+        starts from the very first event we find in the history or from the latest
+        checkpoint before start_ts if neither the settings nor the events before it changed.
+
+        If enabled timings are given, the time spent in each stage of the processing is
+        measured in them and saved with the report.
 
         Returns the id of the generated report
         """
+        if timings is None:
+            timings = PnlTimings(enabled=False)
+        self.pots[0].timings = timings
+        with timings.measure('processing'):
+            report_id = self._process_history(start_ts=start_ts, end_ts=end_ts, events=events)
+
+        if timings.enabled:
+            timings.finish()
+            DBAccountingReports(self.db).add_report_timings(
+                report_id=report_id,
+                timings=timings.serialize(),  # type: ignore[arg-type]  # not None after finish
+            )
+        return report_id
+
+    def _process_history(
+            self,
+            start_ts: Timestamp,
+            end_ts: Timestamp,
+            events: list[AccountingEventMixin],
+    ) -> int:
         active_premium = self.premium and self.premium.is_active()
         log.info(
             'Start of history processing',
@@ -145,9 +176,25 @@ class Accountant:
             actions_length = len(events)
             prev_time = last_event_ts = Timestamp(0)
             ignored_ids_mapping = self.db.get_ignored_action_ids(cursor=cursor, action_type=None)
+            checkpoint = self.checkpoints.resume(
+                cursor=cursor,
+                pot=self.pots[0],
+                events=events,
+                ignored_ids_mapping=ignored_ids_mapping,
+            )
 
         events_iter = iter(events)
+        if checkpoint is not None:  # skip the events whose state was restored
+            deque(islice(events_iter, checkpoint.events_num), maxlen=0)
+            count = checkpoint.processed_actions
+            prev_time = last_event_ts = events[checkpoint.events_num - 1].get_timestamp()
         while True:
+            self.checkpoints.maybe_save(
+                pot=self.pots[0],
+                events=events,
+                events_num=actions_length - length_hint(events_iter),
+                processed_actions=count,
+            )
             try:
                 (
                     processed_events_num,
@@ -195,7 +242,8 @@ class Accountant:
                 # This loop can take a very long time depending on the amount of events
                 # to process. We need to yield to other greenlets or else calls to the
                 # API may time out
-                gevent.sleep(0.5)
+                with self.pots[0].timings.measure('yield'):
+                    gevent.sleep(0.5)
             count += processed_events_num
             if not active_premium and count >= FREE_PNL_EVENTS_LIMIT:
                 log.debug(
@@ -292,7 +340,8 @@ class Accountant:
             )
             return 1, prev_time
 
-        consumed_events = event.process(self.pots[0], events_iterator)
+        with self.pots[0].timings.measure('events', event_type=event.get_accounting_event_type()):
+            consumed_events = event.process(self.pots[0], events_iterator)
         return consumed_events, prev_time
 
     def export(self, directory_path: Optional[Path]) -> tuple[bool, str]:
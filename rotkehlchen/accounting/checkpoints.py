@@ -0,0 +1,204 @@
+import hashlib
+import json
+import logging
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Optional
+
+from rotkehlchen.accounting.mixins.event import AccountingEventMixin
+from rotkehlchen.accounting.structures.types import ActionType
+from rotkehlchen.accounting.types import AccountingCheckpoint
+from rotkehlchen.db.reports import DBAccountingReports, report_settings
+from rotkehlchen.db.settings import DBSettings
+from rotkehlchen.errors.serialization import DeserializationError
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.history.types import HistoricalPriceOracle
+from rotkehlchen.logging import RotkehlchenLogsAdapter
+from rotkehlchen.types import Timestamp
+
+if TYPE_CHECKING:
+    from rotkehlchen.accounting.pot import AccountingPot
+    from rotkehlchen.db.dbhandler import DBHandler
+    from rotkehlchen.db.drivers.gevent import DBCursor
+
+logger = logging.getLogger(__name__)
+log = RotkehlchenLogsAdapter(logger)
+
+# Version of the serialized processing state. Checkpoints of other versions are discarded
+PNL_CHECKPOINT_VERSION = 2
+
+
+def accounting_settings_hash(
+        cursor: 'DBCursor',
+        settings: DBSettings,
+        ignored_asset_ids: set[str],
+        ignored_ids_mapping: dict[ActionType, set[str]],
+) -> str:
+    """Hash of everything apart from the events that affects the history processing.
+    The settings, the ignored assets and actions, the accounting rules and the prices,
+    so the order of the historical price oracles and the manual historical prices."""
+    with GlobalDBHandler().conn.read_ctx() as globaldb_cursor:
+        manual_prices = hashlib.sha256()
+        for entry in globaldb_cursor.execute(
+            'SELECT from_asset, to_asset, timestamp, price FROM price_history '
+            'WHERE source_type=? ORDER BY from_asset, to_asset, timestamp',
+            (HistoricalPriceOracle.MANUAL.serialize_for_db(),),
+        ):
+            manual_prices.update(str(entry).encode())
+
+    data = {
+        'settings': report_settings(settings),
+        'price_oracles': [x.serialize() for x in settings.historical_price_oracles],
+        'manual_prices': manual_prices.hexdigest(),
+        'ignored_assets': sorted(ignored_asset_ids),
+        'ignored_actions': {
+            action_type.serialize(): sorted(ids)
+            for action_type, ids in ignored_ids_mapping.items()
+        },
+        'rules': cursor.execute('SELECT * FROM accounting_rules ORDER BY identifier').fetchall(),
+        'linked_rules': cursor.execute(
+            'SELECT * FROM linked_rules_properties ORDER BY identifier',
+        ).fetchall(),
+    }
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+class AccountingCheckpoints:
+    """Saves the state of the history processing at the first event of each period and
+    lets a later processing of the same history resume from the latest of them.
+
+    A checkpoint is keyed on the hash of the settings and prices that affect accounting
+    and on a digest of all the events consumed before it, so any change in the settings,
+    the price oracles or the manual prices or any added, edited or removed event before
+    it invalidates it. Processing only resumes from
+    a checkpoint that is not after the start of the report so that the PnL totals and
+    the events of the report are the same as those of a full replay.
+    """
+
+    def __init__(self, database: 'DBHandler', period: Optional[int]) -> None:
+        self.dbpnl = DBAccountingReports(database)
+        self.period = period
+        self.settings_hash: Optional[str] = None
+        self.saved: dict[Timestamp, AccountingCheckpoint] = {}
+        self.digest = hashlib.sha256()
+        self.digested_events_num = 0
+
+    def _digest_events(self, events: Sequence[AccountingEventMixin], up_to: int) -> str:
+        """Updates the running digest with the events up to the given position"""
+        for event in events[self.digested_events_num:up_to]:
+            self.digest.update(str(event.serialize()).encode())
+        self.digested_events_num = max(self.digested_events_num, up_to)
+        return self.digest.hexdigest()
+
+    def resume(
+            self,
+            cursor: 'DBCursor',
+            pot: 'AccountingPot',
+            events: Sequence[AccountingEventMixin],
+            ignored_ids_mapping: dict[ActionType, set[str]],
+    ) -> Optional[AccountingCheckpoint]:
+        """Restores the state of the pot from the latest valid checkpoint that is not after
+        the start of the report. The pot should have just been reset.
+
+        Stale checkpoints, those whose events changed or that were saved with other
+        settings, are deleted. Returns the checkpoint processing should resume from or None.
+        """
+        self.settings_hash = None
+        self.saved = {}
+        self.digest = hashlib.sha256()
+        self.digested_events_num = 0
+        if self.period is None or pot.settings.calculate_past_cost_basis is False:
+            return None  # without past cost basis the events before the start are skipped
+
+        self.settings_hash = accounting_settings_hash(
+            cursor=cursor,
+            settings=pot.settings,
+            ignored_asset_ids=pot.ignored_asset_ids,
+            ignored_ids_mapping=ignored_ids_mapping,
+        )
+        valid, stale = [], []
+        for checkpoint in self.dbpnl.get_checkpoints(
+            settings_hash=self.settings_hash,
+            version=PNL_CHECKPOINT_VERSION,
+            to_ts=pot.query_end_ts,
+        ):
+            if checkpoint.timestamp > pot.query_start_ts:
+                # can't resume from it but there is no need to save it again if unchanged
+                self.saved[checkpoint.timestamp] = checkpoint
+            elif (
+                checkpoint.events_num <= len(events) and
+                self._digest_events(events, checkpoint.events_num) == checkpoint.events_digest
+            ):
+                valid.append((checkpoint, self.digest.copy()))
+            else:
+                stale.append(checkpoint.timestamp)
+
+        self.dbpnl.delete_checkpoints(
+            settings_hash=self.settings_hash,
+            version=PNL_CHECKPOINT_VERSION,
+            timestamps=stale,
+        )
+        self.digest = hashlib.sha256()
+        self.digested_events_num = 0
+        for checkpoint, digest in reversed(valid):
+            state = self.dbpnl.get_checkpoint_state(self.settings_hash, checkpoint.timestamp)
+            if state is None:
+                continue
+
+            try:
+                pot.restore_state(json.loads(state))
+            except (json.JSONDecodeError, DeserializationError, KeyError) as e:
+                log.error(f'Could not restore PnL checkpoint at {checkpoint.timestamp} due to {e!s}')  # noqa: E501
+                pot.reset(
+                    settings=pot.settings,
+                    start_ts=pot.query_start_ts,
+                    end_ts=pot.query_end_ts,
+                    report_id=pot.report_id,  # type: ignore[arg-type]  # set by the reset
+                )
+                continue
+
+            log.debug(f'Resuming history processing from the checkpoint at {checkpoint.timestamp}')
+            self.saved[checkpoint.timestamp] = checkpoint
+            self.digest = digest
+            self.digested_events_num = checkpoint.events_num
+            return checkpoint
+
+        return None
+
+    def maybe_save(
+            self,
+            pot: 'AccountingPot',
+            events: Sequence[AccountingEventMixin],
+            events_num: int,
+            processed_actions: int,
+    ) -> None:
+        """Called before the event at position `events_num` is processed. If it is the first
+        event of a new period the state of the pot is saved in a checkpoint.
+
+        No checkpoint is saved after a price was missing since the user may add the price
+        and the state would be different."""
+        if (
+            self.settings_hash is None or self.period is None or
+            not 0 < events_num < len(events) or len(pot.cost_basis.missing_prices) != 0
+        ):
+            return
+
+        timestamp = events[events_num].get_timestamp()
+        if events[events_num - 1].get_timestamp() // self.period == timestamp // self.period:
+            return  # not the first event of a period
+
+        checkpoint = AccountingCheckpoint(
+            timestamp=Timestamp(timestamp // self.period * self.period),
+            events_num=events_num,
+            processed_actions=processed_actions,
+            events_digest=self._digest_events(events, events_num),
+        )
+        if self.saved.get(checkpoint.timestamp) == checkpoint:
+            return
+
+        self.dbpnl.add_checkpoint(
+            settings_hash=self.settings_hash,
+            version=PNL_CHECKPOINT_VERSION,
+            checkpoint=checkpoint,
+            state=json.dumps(pot.serialize_state()),
+        )
+        self.saved[checkpoint.timestamp] = checkpoint
@@ -8,9 +8,12 @@ from rotkehlchen.accounting.structures.types import (
     HistoryEventType,
 )
 from rotkehlchen.chain.evm.decoding.constants import CPT_GAS
+from rotkehlchen.constants.timing import DAY_IN_SECONDS
 
 FREE_PNL_EVENTS_LIMIT = 1000
 FREE_REPORTS_LOOKUP_LIMIT = 20
+# Period at the start of which the history processing state is saved in a checkpoint
+PNL_CHECKPOINT_PERIOD = DAY_IN_SECONDS * 30
 DEFAULT: Final = 'default'
 
 EVENT_CATEGORY_MAPPINGS = {  # possible combinations of types and subtypes mapped to their event category  # noqa: E501
@@ -1,7 +1,7 @@
 import heapq
 import logging
 from abc import ABCMeta, abstractmethod
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable, Literal, NamedTuple, Optional, overload
@@ -26,6 +26,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+# How many of the latest entirely used acquisitions of an asset are kept for inspection
+USED_ACQUISITIONS_KEPT = 100
+
 
 @dataclass(init=True, repr=True, eq=True, order=False, unsafe_hash=False, frozen=False)
 class AssetAcquisitionEvent:
@@ -73,6 +76,28 @@ class AssetAcquisitionEvent:
             'index': self.index,
         }
 
+    @classmethod
+    def deserialize_state(cls: type['AssetAcquisitionEvent'], data: dict[str, Any]) -> 'AssetAcquisitionEvent':  # noqa: E501
+        """Deserializes an acquisition saved by serialize_state in a checkpoint
+
+        May raise DeserializationError"""
+        try:
+            event = cls(
+                amount=deserialize_fval(data['full_amount'], name='full_amount', location='checkpoint'),  # noqa: E501
+                timestamp=Timestamp(data['timestamp']),
+                rate=Price(deserialize_fval(data['rate'], name='rate', location='checkpoint')),
+                index=data['index'],
+            )
+            event.remaining_amount = deserialize_fval(data['remaining_amount'], name='remaining_amount', location='checkpoint')  # noqa: E501
+        except KeyError as e:
+            raise DeserializationError(f'Missing key {e!s}') from e
+
+        return event
+
+    def serialize_state(self) -> dict[str, Any]:
+        """Same as serialize but also keeps the remaining amount, to be saved in checkpoints"""
+        return {**self.serialize(), 'remaining_amount': str(self.remaining_amount)}
+
     def __gt__(self, other: Any) -> bool:
         if not isinstance(other, AssetAcquisitionEvent):
             raise NotImplementedError
@@ -123,6 +148,8 @@ class BaseCostBasisMethod(metaclass=ABCMeta):
     """The base class in which every other cost basis method inherits from."""
     def __init__(self) -> None:
         self._acquisitions_heap: list[AssetAcquisitionHeapElement] = []
+        # the acquisition added last. Only this one can have later acquisitions merged into it
+        self._last_acquisition: Optional[AssetAcquisitionEvent] = None
 
     @abstractmethod
     def add_in_event(self, acquisition: AssetAcquisitionEvent) -> None:
@@ -132,6 +159,46 @@ class BaseCostBasisMethod(metaclass=ABCMeta):
         and thus determines the PnL order.
         """
 
+    def _push(self, priority: FVal, acquisition: AssetAcquisitionEvent) -> None:
+        heapq.heappush(self._acquisitions_heap, AssetAcquisitionHeapElement(priority, acquisition))
+        self._last_acquisition = acquisition
+
+    def maybe_merge_in_event(
+            self,
+            acquisition: AssetAcquisitionEvent,
+            tolerance: FVal,
+            taxfree_after_period: Optional[int],
+    ) -> bool:
+        """Merges the acquisition into the acquisition added last if that has not been used
+        at all yet, their rates differ by at most `tolerance` of the last rate and, if there
+        is a tax free period, their timestamps differ by at most `tolerance` of the period.
+        The merged acquisition keeps the total cost of both and the timestamp of the last.
+
+        With a zero tolerance only acquisitions of the same rate, and timestamp if there is
+        a tax free period, are merged and since they would be consumed one after the other
+        anyway the PnL does not change. Otherwise the merged acquisition keeps its place in
+        the heap, even for HIFO, and becomes tax free together with the last acquisition.
+
+        Returns True if the acquisition was merged and should not be added.
+        """
+        last = self._last_acquisition
+        if (
+            last is None or last.amount == ZERO or last.remaining_amount != last.amount or
+            abs(acquisition.rate - last.rate) > tolerance * last.rate or
+            (
+                taxfree_after_period is not None and
+                acquisition.timestamp - last.timestamp > tolerance * taxfree_after_period
+            )
+        ):
+            return False
+
+        total_cost = last.amount * last.rate + acquisition.amount * acquisition.rate
+        last.amount += acquisition.amount
+        last.remaining_amount = last.amount
+        if acquisition.rate != last.rate:
+            last.rate = Price(total_cost / last.amount)
+        return True
+
     def processing_iterator(self) -> Iterator[AssetAcquisitionEvent]:
         """
         Iteration method over acquisition events.
@@ -168,7 +235,7 @@ class BaseCostBasisMethod(metaclass=ABCMeta):
             spending_asset: Asset,
             timestamp: Timestamp,
             missing_acquisitions: list[MissingAcquisition],
-            used_acquisitions: list[AssetAcquisitionEvent],
+            used_acquisitions: deque[AssetAcquisitionEvent],
             settings: DBSettings,
             timestamp_to_date: Callable[[Timestamp], str],
             average_cost_basis: Optional[FVal] = None,
@@ -207,16 +274,17 @@ class BaseCostBasisMethod(metaclass=ABCMeta):
                     taxable_amount += remaining_sold_amount
                     taxable_bought_cost += acquisition_cost
 
-                log.debug(
-                    'Spend uses up part of historical acquisition',
-                    tax_status='TAX-FREE' if at_taxfree_period else 'TAXABLE',
-                    used_amount=remaining_sold_amount,
-                    from_amount=acquisition_event.amount,
-                    asset=spending_asset,
-                    acquisition_rate=acquisition_event.rate,
-                    profit_currency=settings.main_currency,
-                    time=timestamp_to_date(acquisition_event.timestamp),
-                )
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(
+                        'Spend uses up part of historical acquisition',
+                        tax_status='TAX-FREE' if at_taxfree_period else 'TAXABLE',
+                        used_amount=remaining_sold_amount,
+                        from_amount=acquisition_event.amount,
+                        asset=spending_asset,
+                        acquisition_rate=acquisition_event.rate,
+                        profit_currency=settings.main_currency,
+                        time=timestamp_to_date(acquisition_event.timestamp),
+                    )
                 matched_acquisitions.append(MatchedAcquisition(
                     amount=remaining_sold_amount,
                     event=acquisition_event,
@@ -239,15 +307,16 @@ class BaseCostBasisMethod(metaclass=ABCMeta):
                 taxable_amount += acquisition_event.remaining_amount
                 taxable_bought_cost += acquisition_cost
 
-            log.debug(
-                'Spend uses up entire historical acquisition',
-                tax_status='TAX-FREE' if at_taxfree_period else 'TAXABLE',
-                bought_amount=acquisition_event.remaining_amount,
-                asset=spending_asset,
-                acquisition_rate=acquisition_event.rate,
-                profit_currency=settings.main_currency,
-                time=timestamp_to_date(acquisition_event.timestamp),
-            )
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    'Spend uses up entire historical acquisition',
+                    tax_status='TAX-FREE' if at_taxfree_period else 'TAXABLE',
+                    bought_amount=acquisition_event.remaining_amount,
+                    asset=spending_asset,
+                    acquisition_rate=acquisition_event.rate,
+                    profit_currency=settings.main_currency,
+                    time=timestamp_to_date(acquisition_event.timestamp),
+                )
             matched_acquisitions.append(MatchedAcquisition(
                 amount=acquisition_event.remaining_amount,
                 event=acquisition_event,
@@ -285,6 +354,36 @@ class BaseCostBasisMethod(metaclass=ABCMeta):
     def __len__(self) -> int:
         return len(self._acquisitions_heap)
 
+    def serialize_state(self) -> dict[str, Any]:
+        """Serializes the acquisitions heap so that it can be restored from a checkpoint.
+        The heap list is kept in order so it is still a heap when restored."""
+        return {
+            'heap': [
+                [str(entry.priority), entry.acquisition_event.serialize_state()]
+                for entry in self._acquisitions_heap
+            ],
+            'last': next((
+                idx for idx, entry in enumerate(self._acquisitions_heap)
+                if entry.acquisition_event is self._last_acquisition
+            ), None),
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Restores the state saved by serialize_state
+
+        May raise:
+        - DeserializationError if the state can't be read
+        - KeyError if a key is missing from the state
+        """
+        self._acquisitions_heap = [
+            AssetAcquisitionHeapElement(
+                priority=deserialize_fval(priority, name='priority', location='checkpoint'),
+                acquisition_event=AssetAcquisitionEvent.deserialize_state(event),
+            ) for priority, event in state['heap']
+        ]
+        last = state['last']
+        self._last_acquisition = None if last is None else self._acquisitions_heap[last].acquisition_event  # noqa: E501
+
 
 class FIFOCostBasisMethod(BaseCostBasisMethod):
     """
@@ -297,9 +396,16 @@ class FIFOCostBasisMethod(BaseCostBasisMethod):
 
     def add_in_event(self, acquisition: AssetAcquisitionEvent) -> None:
         """Adds an acquisition to the `_acquisitions_heap` using a counter to achieve the FIFO order."""  # noqa: E501
-        heapq.heappush(self._acquisitions_heap, AssetAcquisitionHeapElement(self._count, acquisition))  # noqa: E501
+        self._push(self._count, acquisition)
         self._count += 1
 
+    def serialize_state(self) -> dict[str, Any]:
+        return {**super().serialize_state(), 'count': str(self._count)}
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        super().restore_state(state)
+        self._count = deserialize_fval(state['count'], name='count', location='checkpoint')
+
 
 class LIFOCostBasisMethod(BaseCostBasisMethod):
     """
@@ -312,9 +418,16 @@ class LIFOCostBasisMethod(BaseCostBasisMethod):
 
     def add_in_event(self, acquisition: AssetAcquisitionEvent) -> None:
         """Adds an acquisition to the `_acquisitions_heap` using a negated counter to achieve the LIFO order."""  # noqa: E501
-        heapq.heappush(self._acquisitions_heap, AssetAcquisitionHeapElement(-self._count, acquisition))  # noqa: E501
+        self._push(-self._count, acquisition)
         self._count += 1
 
+    def serialize_state(self) -> dict[str, Any]:
+        return {**super().serialize_state(), 'count': str(self._count)}
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        super().restore_state(state)
+        self._count = deserialize_fval(state['count'], name='count', location='checkpoint')
+
 
 class HIFOCostBasisMethod(BaseCostBasisMethod):
     """
@@ -326,7 +439,7 @@ class HIFOCostBasisMethod(BaseCostBasisMethod):
         Adds an acquisition to the `_acquisitions_heap` using the negated rate
         of the acquisition to achieve the HIFO order.
         """
-        heapq.heappush(self._acquisitions_heap, AssetAcquisitionHeapElement(-acquisition.rate, acquisition))  # noqa: E501
+        self._push(-acquisition.rate, acquisition)
 
 
 class AverageCostBasisMethod(BaseCostBasisMethod):
@@ -361,14 +474,25 @@ class AverageCostBasisMethod(BaseCostBasisMethod):
         The formula used to calculate the average cost basis of an acquisition is:
         [Previous Total ACB] + [Cost of New Shares] + [Transaction Costs]
         """
-        heapq.heappush(
-            self._acquisitions_heap,
-            AssetAcquisitionHeapElement(self._count, acquisition),
-        )
+        self._push(self._count, acquisition)
         self.current_total_acb += acquisition.amount * acquisition.rate
         self.current_amount += acquisition.amount
         self._count += 1
 
+    def maybe_merge_in_event(
+            self,
+            acquisition: AssetAcquisitionEvent,
+            tolerance: FVal,
+            taxfree_after_period: Optional[int],
+    ) -> bool:
+        """Same as its parent function but also adds the merged acquisition to the totals"""
+        if not super().maybe_merge_in_event(acquisition, tolerance, taxfree_after_period):
+            return False
+
+        self.current_total_acb += acquisition.amount * acquisition.rate
+        self.current_amount += acquisition.amount
+        return True
+
     def consume_result(self, used_amount: FVal) -> None:
         """
         Same as its parent function but also deducts `used_amount` from `current_amount`.
@@ -379,13 +503,27 @@ class AverageCostBasisMethod(BaseCostBasisMethod):
         self.current_amount -= used_amount
         super().consume_result(used_amount)
 
+    def serialize_state(self) -> dict[str, Any]:
+        return {
+            **super().serialize_state(),
+            'count': str(self._count),
+            'current_amount': str(self.current_amount),
+            'current_total_acb': str(self.current_total_acb),
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        super().restore_state(state)
+        self._count = deserialize_fval(state['count'], name='count', location='checkpoint')
+        self.current_amount = deserialize_fval(state['current_amount'], name='current_amount', location='checkpoint')  # noqa: E501
+        self.current_total_acb = deserialize_fval(state['current_total_acb'], name='current_total_acb', location='checkpoint')  # noqa: E501
+
     def calculate_spend_cost_basis(
             self,
             spending_amount: FVal,
             spending_asset: Asset,
             timestamp: Timestamp,
             missing_acquisitions: list[MissingAcquisition],
-            used_acquisitions: list[AssetAcquisitionEvent],
+            used_acquisitions: deque[AssetAcquisitionEvent],
             settings: DBSettings,
             timestamp_to_date: Callable[[Timestamp], str],
             average_cost_basis: Optional[FVal] = None,  # pylint: disable=unused-argument
@@ -437,7 +575,8 @@ class CostBasisEvents:
         elif cost_basis_method == CostBasisMethod.ACB:
             self.acquisitions_manager = AverageCostBasisMethod()
         self.spends: list[AssetSpendEvent] = []
-        self.used_acquisitions: list[AssetAcquisitionEvent] = []
+        # only the latest are kept since nothing looks up older ones and they grow with history
+        self.used_acquisitions: deque[AssetAcquisitionEvent] = deque(maxlen=USED_ACQUISITIONS_KEPT)
 
 
 class MatchedAcquisition(NamedTuple):
@@ -569,6 +708,31 @@ class CostBasisCalculator(CustomizableDateMixin):
         self.missing_acquisitions: list[MissingAcquisition] = []
         self.missing_prices: set[MissingPrice] = set()
 
+    def serialize_state(self) -> dict[str, Any]:
+        """Serializes the acquisitions of each asset and the missing acquisitions so that
+        history processing can resume from a checkpoint. The spends and used acquisitions
+        are not kept since they are only a log and grow with the history"""
+        return {
+            'assets': {
+                asset.identifier: events.acquisitions_manager.serialize_state()
+                for asset, events in self._events.items()
+            },
+            'missing_acquisitions': [x.serialize() for x in self.missing_acquisitions],
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Restores the state saved by serialize_state. Should be called right after reset
+
+        May raise:
+        - DeserializationError if the state can't be read
+        - KeyError if a key is missing from the state
+        """
+        for identifier, events_state in state['assets'].items():
+            self._events[Asset(identifier)].acquisitions_manager.restore_state(events_state)
+        self.missing_acquisitions = [
+            MissingAcquisition.deserialize(x) for x in state['missing_acquisitions']
+        ]
+
     def get_events(self, asset: Asset) -> CostBasisEvents:
         """Custom getter for events so that we have common cost basis for some assets"""
         if asset == A_WETH:
@@ -621,6 +785,13 @@ class CostBasisCalculator(CustomizableDateMixin):
         """Adds an acquisition event for an asset"""
         asset_event = AssetAcquisitionEvent.from_processed_event(event=event)
         asset_events = self.get_events(event.asset)
+        if self.settings.acquisitions_merge_tolerance is not None and asset_events.acquisitions_manager.maybe_merge_in_event(  # noqa: E501
+            acquisition=asset_event,
+            tolerance=self.settings.acquisitions_merge_tolerance,
+            taxfree_after_period=self.settings.taxfree_after_period,
+        ):
+            return
+
         asset_events.acquisitions_manager.add_in_event(asset_event)
 
     @overload
@@ -1,10 +1,13 @@
 import json
 import logging
-from collections.abc import Collection
+from collections.abc import Callable, Collection, Iterable, Iterator
+from contextlib import AbstractContextManager
 from csv import DictWriter
+from functools import partial
+from io import TextIOWrapper
 from pathlib import Path
 from tempfile import mkdtemp
-from typing import TYPE_CHECKING, Any, Literal, Optional
+from typing import IO, TYPE_CHECKING, Any, Literal, Optional
 from zipfile import ZIP_DEFLATED, ZipFile
 
 from rotkehlchen.accounting.pnl import PnlTotals
@@ -193,13 +196,13 @@ class CSVExporter(CustomizableDateMixin):
 
         dict_event[f'cost_basis_{name}'] = cost_basis
 
-    def _maybe_add_summary(self, events: list[dict[str, Any]], pnls: PnlTotals) -> None:
-        """Depending on given settings, adds a few summary lines at the end of
-        the all events PnL report"""
+    def _summary_rows(self, events_num: int, pnls: PnlTotals) -> Iterator[dict[str, Any]]:
+        """Depending on given settings, yields a few summary lines to be written at the
+        end of the all events PnL report after the given number of events"""
         if self.settings.pnl_csv_have_summary is False:
             return
 
-        length = len(events) + 1
+        length = events_num + 1
         template: dict[str, Any] = {
             'type': '',
             'notes': '',
@@ -214,13 +217,13 @@ class CSVExporter(CustomizableDateMixin):
             'pnl_free': '',
             'cost_basis_free': '',
         }
-        events.append(template)  # separate with 2 new lines
-        events.append(template)
+        yield template  # separate with 2 new lines
+        yield template
 
         entry = template.copy()
         entry['taxable_amount'] = 'TAXABLE'
         entry['price'] = 'FREE'
-        events.append(entry)
+        yield entry
 
         start_sums_index = length + 4
         sums = 0
@@ -242,7 +245,7 @@ class CSVExporter(CustomizableDateMixin):
                 sum_range=f'J2:J{length}',
                 actual_value=value.free,
             )
-            events.append(entry)
+            yield entry
 
         entry = template.copy()
         entry['free_amount'] = 'TOTAL'
@@ -251,44 +254,84 @@ class CSVExporter(CustomizableDateMixin):
             entry['price'] = f'=SUM(H{start_sums_index}:H{start_sums_index + sums - 1})'
         else:
             entry['taxable_amount'] = entry['price'] = 0
-        events.append(entry)
+        yield entry
 
-        events.append(template)  # separate with 2 new lines
-        events.append(template)
+        yield template  # separate with 2 new lines
+        yield template
 
         version_result = get_current_version()
         entry = template.copy()
         entry['free_amount'] = 'rotki version'
         entry['taxable_amount'] = version_result.our_version
-        events.append(entry)
+        yield entry
 
         for setting in ACCOUNTING_SETTINGS:
             entry = template.copy()
             entry['free_amount'] = setting
             entry['taxable_amount'] = str(getattr(self.settings, setting))
-            events.append(entry)
+            yield entry
+
+    def _csv_rows(
+            self,
+            events: Iterable['ProcessedAccountingEvent'],
+            pnls: PnlTotals,
+    ) -> Iterator[dict[str, Any]]:
+        """Yields the rows of the all events CSV one by one. The summary needs only the
+        number of events so they are never all kept in memory"""
+        events_num = 0
+        for event in events:
+            events_num += 1
+            yield self.to_csv_entry(event)
+
+        yield from self._summary_rows(events_num=events_num, pnls=pnls)
+
+    def _write_csv(
+            self,
+            open_file: Callable[[], AbstractContextManager[IO[str]]],
+            events: Iterable['ProcessedAccountingEvent'],
+            pnls: PnlTotals,
+    ) -> None:
+        """Streams the rows of the all events CSV into the file opened by `open_file`.
+        The file is not opened at all if there are no rows to write.
+
+        May raise:
+        - CSVWriteError if a row contains fields not in the header
+        """
+        rows = self._csv_rows(events=events, pnls=pnls)
+        if (first_row := next(rows, None)) is None:
+            log.debug(f'Skipping writting empty CSV for {FILENAME_ALL_CSV}')
+            return
+
+        with open_file() as f:
+            writer = DictWriter(f, fieldnames=first_row.keys())
+            writer.writeheader()
+            try:
+                writer.writerow(first_row)
+                writer.writerows(rows)
+            except ValueError as e:
+                raise CSVWriteError(f'Failed to write {FILENAME_ALL_CSV} CSV due to {e!s}') from e
 
     def create_zip(
             self,
-            events: list['ProcessedAccountingEvent'],
+            events: Iterable['ProcessedAccountingEvent'],
             pnls: PnlTotals,
     ) -> tuple[bool, str]:
+        """Streams the CSV export straight into an entry of a zip file"""
         # TODO: Find a way to properly delete the directory after send is complete
         dirpath = Path(mkdtemp())
-        success, msg = self.export(events=events, pnls=pnls, directory=dirpath)
-        if not success:
-            return False, msg
-
-        files: list[tuple[Path, str]] = [
-            (dirpath / FILENAME_ALL_CSV, FILENAME_ALL_CSV),
-        ]
         with ZipFile(file=dirpath / 'csv.zip', mode='w', compression=ZIP_DEFLATED) as csv_zip:
-            for path, filename in files:
-                if not path.exists():
-                    continue
-
-                csv_zip.write(path, filename)
-                path.unlink()
+            try:
+                self._write_csv(
+                    open_file=lambda: TextIOWrapper(
+                        csv_zip.open(FILENAME_ALL_CSV, mode='w'),
+                        encoding='utf-8',
+                        newline='',
+                    ),
+                    events=events,
+                    pnls=pnls,
+                )
+            except (CSVWriteError, PermissionError) as e:
+                return False, str(e)
 
         success = False
         filename = ''
@@ -324,17 +367,17 @@ class CSVExporter(CustomizableDateMixin):
 
     def export(
             self,
-            events: list['ProcessedAccountingEvent'],
+            events: Iterable['ProcessedAccountingEvent'],
             pnls: PnlTotals,
             directory: Path,
     ) -> tuple[bool, str]:
-        serialized_events = [self.to_csv_entry(x) for idx, x in enumerate(events)]
-        self._maybe_add_summary(events=serialized_events, pnls=pnls)
+        """Streams the CSV export into the given directory"""
         try:
             directory.mkdir(parents=True, exist_ok=True)
-            dict_to_csv_file(
-                directory / FILENAME_ALL_CSV,
-                serialized_events,
+            self._write_csv(
+                open_file=partial(open, directory / FILENAME_ALL_CSV, 'w', newline='', encoding='utf-8'),  # noqa: E501
+                events=events,
+                pnls=pnls,
             )
         except (CSVWriteError, PermissionError) as e:
             return False, str(e)
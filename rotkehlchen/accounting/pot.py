@@ -11,6 +11,7 @@ from rotkehlchen.accounting.mixins.event import AccountingEventType
 from rotkehlchen.accounting.pnl import PNL, PnlTotals
 from rotkehlchen.accounting.structures.processed_event import ProcessedAccountingEvent
 from rotkehlchen.accounting.structures.types import EventDirection
+from rotkehlchen.accounting.timings import PnlTimings
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.constants.assets import A_KFEE
@@ -57,28 +58,58 @@ class AccountingPot(CustomizableDateMixin):
         )
         self.pnls = PnlTotals()
         self.processed_events: list[ProcessedAccountingEvent] = []
+        # Number of events processed before the checkpoint processing resumed from, if any
+        self.processed_events_offset = 0
         self.events_accountant = EventsAccountant(
             evm_accounting_aggregators=evm_accounting_aggregators,
             pot=self,
         )
         self.query_start_ts = self.query_end_ts = Timestamp(0)
         self.report_id: Optional[int] = None
+        self.timings = PnlTimings(enabled=False)
 
     def _add_processed_event(self, event: ProcessedAccountingEvent) -> None:
         dbpnl = DBAccountingReports(self.database)
         self.processed_events.append(event)
         try:
-            dbpnl.add_report_data(
-                report_id=self.report_id,  # type: ignore # report id is initialized by now
-                time=event.timestamp,
-                ts_converter=self.timestamp_to_date,
-                event=event,
-            )
+            with self.timings.measure('db_writes'):
+                dbpnl.add_report_data(
+                    report_id=self.report_id,  # type: ignore # report id is initialized by now
+                    time=event.timestamp,
+                    ts_converter=self.timestamp_to_date,
+                    event=event,
+                )
         except (DeserializationError, InputError) as e:
             log.error(str(e))
             return
 
-        log.debug(event.to_string(self.timestamp_to_date))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(event.to_string(self.timestamp_to_date))
+
+    @property
+    def next_event_index(self) -> int:
+        """The index of the next processed event. When processing resumed from a checkpoint
+        the events before it are not in processed_events."""
+        return self.processed_events_offset + len(self.processed_events)
+
+    def serialize_state(self) -> dict[str, Any]:
+        """Serializes what is needed to resume history processing from this point"""
+        return {
+            'cost_basis': self.cost_basis.serialize_state(),
+            'accountants': self.events_accountant.evm_accounting_aggregators.serialize_state(),
+            'next_event_index': self.next_event_index,
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Restores the state saved by serialize_state. Should be called right after reset
+
+        May raise:
+        - DeserializationError if the state can't be read
+        - KeyError if a key is missing from the state
+        """
+        self.cost_basis.restore_state(state['cost_basis'])
+        self.events_accountant.evm_accounting_aggregators.restore_state(state['accountants'])
+        self.processed_events_offset = state['next_event_index']
 
     def get_rate_in_profit_currency(self, asset: Asset, timestamp: Timestamp) -> Price:
         """Get the profit_currency price of asset in the given timestamp
@@ -93,11 +124,12 @@ class AccountingPot(CustomizableDateMixin):
         if asset == self.profit_currency:
             rate = Price(ONE)
         else:
-            rate = PriceHistorian().query_historical_price(
-                from_asset=asset,
-                to_asset=self.profit_currency,
-                timestamp=timestamp,
-            )
+            with self.timings.measure('prices'):
+                rate = PriceHistorian().query_historical_price(
+                    from_asset=asset,
+                    to_asset=self.profit_currency,
+                    timestamp=timestamp,
+                )
         return rate
 
     def reset(
@@ -118,6 +150,7 @@ class AccountingPot(CustomizableDateMixin):
         self.cost_basis.reset(settings)
         self.events_accountant.reset()
         self.processed_events = []
+        self.processed_events_offset = 0
 
     def add_in_event(
             self,  # pylint: disable=unused-argument
@@ -161,7 +194,7 @@ class AccountingPot(CustomizableDateMixin):
             amount=amount,
             price=price,
             ignored_asset_ids=self.ignored_asset_ids,
-            starting_index=len(self.processed_events),
+            starting_index=self.next_event_index,
         )
         for prefork_event in prefork_events:
             self._add_processed_event(prefork_event)
@@ -183,11 +216,12 @@ class AccountingPot(CustomizableDateMixin):
             price=price,
             pnl=PNL(),  # filled out later
             cost_basis=None,
-            index=len(self.processed_events),
+            index=self.next_event_index,
         )
         if extra_data:
             event.extra_data = extra_data
-        self.cost_basis.obtain_asset(event)
+        with self.timings.measure('cost_basis'):
+            self.cost_basis.obtain_asset(event)
         # count profit/losses if we are inside the query period
         if timestamp >= self.query_start_ts and taxable:
             self.pnls[event_type] += event.calculate_pnl(
@@ -234,12 +268,13 @@ class AccountingPot(CustomizableDateMixin):
         if asset.is_fiat() and event_type == AccountingEventType.TRADE:
             taxable = False  # for buys with fiat do not count it as taxable
 
-        handle_prefork_asset_spends(
-            cost_basis=self.cost_basis,
-            asset=asset,
-            amount=amount,
-            timestamp=timestamp,
-        )
+        with self.timings.measure('cost_basis'):
+            handle_prefork_asset_spends(
+                cost_basis=self.cost_basis,
+                asset=asset,
+                amount=amount,
+                timestamp=timestamp,
+            )
         if given_price is not None:
             price = given_price
         else:
@@ -254,14 +289,15 @@ class AccountingPot(CustomizableDateMixin):
 
         spend_cost = None
         if count_cost_basis_pnl:
-            spend_cost = self.cost_basis.spend_asset(
-                location=location,
-                timestamp=timestamp,
-                asset=asset,
-                amount=amount,
-                rate=price,
-                taxable_spend=taxable,
-            )
+            with self.timings.measure('cost_basis'):
+                spend_cost = self.cost_basis.spend_asset(
+                    location=location,
+                    timestamp=timestamp,
+                    asset=asset,
+                    amount=amount,
+                    rate=price,
+                    taxable_spend=taxable,
+                )
         taxable_amount = taxable_amount_ratio * amount
         free_amount = amount - taxable_amount
         if spend_cost:
@@ -279,7 +315,7 @@ class AccountingPot(CustomizableDateMixin):
             price=price,
             pnl=PNL(),  # filled out later
             cost_basis=spend_cost,
-            index=len(self.processed_events),
+            index=self.next_event_index,
         )
         if extra_data:
             spend_event.extra_data = extra_data
@@ -51,6 +51,8 @@ class ProcessedAccountingEvent:
     # processed accounting event so that the CSV export formulas can be correctly made
     count_entire_amount_spend: bool = field(init=False, default=False)
     count_cost_basis_pnl: bool = field(init=False, default=False)
+    # The identifier of the event in a saved report. Set only when read from the DB
+    identifier: Optional[int] = field(init=False, default=None, compare=False)
 
     def to_string(self, ts_converter: Callable[[Timestamp], str]) -> str:
         desc = f'{self.type.name} for {self.free_amount}/{self.taxable_amount} {self.asset.symbol_or_name()} with price: {self.price} and PNL: {self.pnl}.'  # noqa: E501
@@ -126,6 +128,9 @@ class ProcessedAccountingEvent:
             if group_id is not None:
                 exported_dict['group_id'] = group_id
 
+            if self.identifier is not None:
+                exported_dict['identifier'] = self.identifier
+
         return exported_dict
 
     def serialize_to_dict(self, ts_converter: Callable[[Timestamp], str]) -> dict[str, Any]:
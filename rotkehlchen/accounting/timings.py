@@ -0,0 +1,94 @@
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from typing import Any, Literal, Optional
+
+from rotkehlchen.accounting.mixins.event import AccountingEventType
+
+PnlStage = Literal[
+    'history',  # querying and sorting the history events
+    'processing',  # everything in the processing of the history not in another stage
+    'events',  # processing of the events not in another stage
+    'prices',  # historical price lookups
+    'cost_basis',  # acquisitions and spends in the cost basis calculator
+    'db_writes',  # writing the processed events in the DB
+    'yield',  # yielding to other greenlets during processing
+]
+
+_DISABLED = nullcontext()
+
+
+class PnlTimings:
+    """Aggregates the wall time and the number of calls of each stage of the generation of
+    a PnL report and the time spent processing each type of accounting event.
+
+    The time of a stage does not include the time of the stages measured inside of it so
+    that the time of all stages adds up to the total time of the report. The time of an
+    event type includes everything that was done to process the events of that type.
+
+    When disabled measuring does nothing so it can be left in hot paths.
+    """
+
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.total: Optional[float] = None
+        self.stages: defaultdict[PnlStage, list] = defaultdict(lambda: [0.0, 0])
+        self.event_types: defaultdict[AccountingEventType, list] = defaultdict(lambda: [0.0, 0])
+        # time spent in nested stages of each stage currently being measured
+        self._nested: list[float] = []
+
+    def measure(
+            self,
+            stage: PnlStage,
+            event_type: Optional[AccountingEventType] = None,
+    ) -> AbstractContextManager:
+        """Measures the code run in the context as the given stage and, if given, for the
+        given type of accounting event"""
+        if self.enabled is False:
+            return _DISABLED
+
+        return self._measure(stage, event_type)
+
+    @contextmanager
+    def _measure(
+            self,
+            stage: PnlStage,
+            event_type: Optional[AccountingEventType],
+    ) -> Iterator[None]:
+        start = time.perf_counter()
+        self._nested.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            entry = self.stages[stage]
+            entry[0] += elapsed - self._nested.pop()
+            entry[1] += 1
+            if len(self._nested) != 0:
+                self._nested[-1] += elapsed
+            if event_type is not None:
+                entry = self.event_types[event_type]
+                entry[0] += elapsed
+                entry[1] += 1
+
+    def finish(self) -> None:
+        self.total = time.perf_counter() - self.start
+
+    def serialize(self) -> Optional[dict[str, Any]]:
+        """Serializes the measured timings or returns None if they were not measured"""
+        if self.enabled is False or self.total is None:
+            return None
+
+        return {
+            'total': self.total,
+            'stages': {
+                stage: {'time': seconds, 'calls': calls}
+                for stage, (seconds, calls) in self.stages.items()
+            },
+            'event_types': {
+                event_type.serialize(): {'time': seconds, 'calls': calls}
+                for event_type, (seconds, calls) in self.event_types.items()
+            },
+        }
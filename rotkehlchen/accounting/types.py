@@ -6,6 +6,7 @@ import jsonschema
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.fval import FVal
+from rotkehlchen.serialization.deserialize import deserialize_fval
 from rotkehlchen.types import Timestamp
 from rotkehlchen.utils.mixins.enums import DBCharEnumMixIn
 from rotkehlchen.utils.serialization import rlk_jsondumps
@@ -120,6 +121,27 @@ class MissingAcquisition(NamedTuple):
             'missing_amount': str(self.missing_amount),
         }
 
+    @classmethod
+    def deserialize(cls: type['MissingAcquisition'], data: dict[str, Any]) -> 'MissingAcquisition':
+        """May raise DeserializationError"""
+        try:
+            return cls(
+                asset=Asset(data['asset']),
+                time=Timestamp(data['time']),
+                found_amount=deserialize_fval(data['found_amount'], name='found_amount', location='missing acquisition'),  # noqa: E501
+                missing_amount=deserialize_fval(data['missing_amount'], name='missing_amount', location='missing acquisition'),  # noqa: E501
+            )
+        except KeyError as e:
+            raise DeserializationError(f'Missing key {e!s}') from e
+
+
+class AccountingCheckpoint(NamedTuple):
+    """A saved state of the history processing before the events of `timestamp`"""
+    timestamp: Timestamp
+    events_num: int  # number of the sorted history events consumed before the checkpoint
+    processed_actions: int
+    events_digest: str  # digest of the events consumed before the checkpoint
+
 
 class MissingPrice(NamedTuple):
     from_asset: Asset
@@ -0,0 +1,133 @@
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from typing import Final, Optional
+
+from rotkehlchen.utils.metrics import RequestTimings
+
+PROMETHEUS_CONTENT_TYPE: Final = 'text/plain; version=0.0.4; charset=utf-8'
+# Upper bounds of the buckets of the histograms. The last bucket is +Inf
+LATENCY_BUCKETS: Final = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+SIZE_BUCKETS: Final = (100, 1000, 10000, 100000, 1000000, 10000000)
+
+# method and route template of a request, e.g. ('GET', '/api/1/tasks/<int:task_id>')
+RouteLabels = tuple[str, ...]
+ROUTE_LABEL_NAMES: Final = ('method', 'route')
+
+
+class Histogram:
+    __slots__ = ('bucket_counts', 'buckets', 'count', 'sum')
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    return ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+
+
+def _format_number(value: float) -> str:
+    return str(value) if isinstance(value, int) else repr(round(value, 6))
+
+
+class APIMetrics:
+    """Aggregates of the API requests and async tasks since the start of the backend.
+    Routes are labeled with their template and not the requested path so that the
+    number of series stays bounded."""
+
+    def __init__(self) -> None:
+        self.in_flight: defaultdict[RouteLabels, int] = defaultdict(int)
+        # by method, route and status code
+        self.responses: defaultdict[RouteLabels, int] = defaultdict(int)
+        self.request_latency: defaultdict[RouteLabels, Histogram] = defaultdict(lambda: Histogram(LATENCY_BUCKETS))  # noqa: E501
+        self.response_size: defaultdict[RouteLabels, Histogram] = defaultdict(lambda: Histogram(SIZE_BUCKETS))  # noqa: E501
+        self.request_db_seconds: defaultdict[RouteLabels, float] = defaultdict(float)
+        self.request_remote_seconds: defaultdict[RouteLabels, float] = defaultdict(float)
+        self.task_latency: defaultdict[RouteLabels, Histogram] = defaultdict(lambda: Histogram(LATENCY_BUCKETS))  # noqa: E501
+        self.task_db_seconds: defaultdict[RouteLabels, float] = defaultdict(float)
+        self.task_remote_seconds: defaultdict[RouteLabels, float] = defaultdict(float)
+
+    def request_started(self, labels: RouteLabels) -> None:
+        self.in_flight[labels] += 1
+
+    def request_finished(self, labels: RouteLabels) -> None:
+        self.in_flight[labels] -= 1
+
+    def observe_response(
+            self,
+            labels: RouteLabels,
+            status_code: int,
+            seconds: float,
+            size: Optional[int],
+            timings: RequestTimings,
+    ) -> None:
+        self.responses[(*labels, str(status_code))] += 1
+        self.request_latency[labels].observe(seconds)
+        if size is not None:  # unknown for streamed responses
+            self.response_size[labels].observe(size)
+        self.request_db_seconds[labels] += timings.db_seconds
+        self.request_remote_seconds[labels] += timings.remote_seconds
+
+    def observe_task(self, labels: RouteLabels, seconds: float, timings: RequestTimings) -> None:
+        self.task_latency[labels].observe(seconds)
+        self.task_db_seconds[labels] += timings.db_seconds
+        self.task_remote_seconds[labels] += timings.remote_seconds
+
+    @staticmethod
+    def _histogram_lines(
+            name: str,
+            description: str,
+            histograms: Mapping[RouteLabels, Histogram],
+    ) -> list[str]:
+        lines = [f'# HELP {name} {description}', f'# TYPE {name} histogram']
+        for labels, histogram in sorted(histograms.items()):
+            formatted_labels = _format_labels(ROUTE_LABEL_NAMES, labels)
+            cumulative = 0
+            for bound, count in zip((*histogram.buckets, '+Inf'), histogram.bucket_counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{formatted_labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_sum{{{formatted_labels}}} {_format_number(histogram.sum)}')
+            lines.append(f'{name}_count{{{formatted_labels}}} {histogram.count}')
+        return lines
+
+    @staticmethod
+    def _sample_lines(
+            name: str,
+            metric_type: str,
+            description: str,
+            samples: Mapping[RouteLabels, float],
+            label_names: Sequence[str] = ROUTE_LABEL_NAMES,
+    ) -> list[str]:
+        lines = [f'# HELP {name} {description}', f'# TYPE {name} {metric_type}']
+        lines.extend(
+            f'{name}{{{_format_labels(label_names, labels)}}} {_format_number(value)}'
+            for labels, value in sorted(samples.items())
+        )
+        return lines
+
+    def to_prometheus(self) -> str:
+        """The metrics in the text exposition format of Prometheus"""
+        lines = [
+            *self._sample_lines('rotki_api_requests_in_flight', 'gauge', 'API requests being served', self.in_flight),  # noqa: E501
+            *self._sample_lines('rotki_api_responses_total', 'counter', 'API responses by status code', self.responses, (*ROUTE_LABEL_NAMES, 'status')),  # noqa: E501
+            *self._histogram_lines('rotki_api_request_duration_seconds', 'Seconds it took to serve an API request', self.request_latency),  # noqa: E501
+            *self._histogram_lines('rotki_api_response_size_bytes', 'Size of the body of API responses', self.response_size),  # noqa: E501
+            *self._sample_lines('rotki_api_request_db_seconds_total', 'counter', 'Seconds API requests spent in DB queries', self.request_db_seconds),  # noqa: E501
+            *self._sample_lines('rotki_api_request_remote_seconds_total', 'counter', 'Seconds API requests spent in queries to external services', self.request_remote_seconds),  # noqa: E501
+            *self._histogram_lines('rotki_api_task_duration_seconds', 'Seconds it took to run an async API task', self.task_latency),  # noqa: E501
+            *self._sample_lines('rotki_api_task_db_seconds_total', 'counter', 'Seconds async API tasks spent in DB queries', self.task_db_seconds),  # noqa: E501
+            *self._sample_lines('rotki_api_task_remote_seconds_total', 'counter', 'Seconds async API tasks spent in queries to external services', self.task_remote_seconds),  # noqa: E501
+        ]
+        return '\n'.join(lines) + '\n'
@@ -4,6 +4,7 @@ import logging
 import os
 import sys
 import tempfile
+import time
 import traceback
 from collections import defaultdict
 from collections.abc import Sequence
@@ -14,7 +15,7 @@ from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union, cast,
 from zipfile import ZipFile
 
 import gevent
-from flask import Response, make_response, send_file
+from flask import Response, has_request_context, make_response, request, send_file
 from gevent.event import Event
 from gevent.lock import Semaphore
 from marshmallow.exceptions import ValidationError
@@ -45,6 +46,7 @@ from rotkehlchen.accounting.structures.types import (
     HistoryEventSubType,
     HistoryEventType,
 )
+from rotkehlchen.api.metrics import PROMETHEUS_CONTENT_TYPE, APIMetrics, RouteLabels
 from rotkehlchen.api.v1.schemas import TradeSchema
 from rotkehlchen.api.v1.types import (
     EvmPendingTransactionDecodingApiData,
@@ -145,6 +147,7 @@ from rotkehlchen.db.filtering import (
     UserNotesFilterQuery,
 )
 from rotkehlchen.db.history_events import DBHistoryEvents
+from rotkehlchen.db.profiles import DEFAULT_DB_PROFILE
 from rotkehlchen.db.queried_addresses import QueriedAddresses
 from rotkehlchen.db.reports import DBAccountingReports
 from rotkehlchen.db.search_assets import search_assets_levenshtein
@@ -183,6 +186,7 @@ from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.assets_management import export_assets_from_file, import_assets_from_file
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.globaldb.updates import ASSETS_VERSION_KEY
+from rotkehlchen.greenlets.profiler import ProfileFormat, SamplingProfiler
 from rotkehlchen.history.price import PriceHistorian
 from rotkehlchen.history.skipped import (
     export_skipped_external_events,
@@ -235,6 +239,7 @@ from rotkehlchen.types import (
     TradeType,
     UserNote,
 )
+from rotkehlchen.utils.metrics import track_request_timings
 from rotkehlchen.utils.misc import combine_dicts, ts_now
 from rotkehlchen.utils.snapshots import parse_import_snapshot_data
 from rotkehlchen.utils.version_check import get_current_version
@@ -357,9 +362,11 @@ class RestAPI:
         self.waited_greenlets = [mainloop_greenlet]
         self.task_lock = Semaphore()
         self.login_lock = Semaphore()
+        self.profiler_lock = Semaphore()
         self.task_id = 0
         self.task_results: dict[int, Any] = {}
         self.trade_schema = TradeSchema()
+        self.metrics = APIMetrics()
 
     # - Private functions not exposed to the API
     def _new_task_id(self) -> int:
@@ -407,17 +414,35 @@ class RestAPI:
             }
             self._write_task_result(task_id, result)
 
-    def _do_query_async(self, command: Callable, task_id: int, **kwargs: Any) -> None:
+    def _do_query_async(
+            self,
+            command: Callable,
+            task_id: int,
+            metrics_labels: RouteLabels,
+            **kwargs: Any,
+    ) -> None:
         log.debug(f'Async task with task id {task_id} started')
-        result = command(self, **kwargs)
+        start = time.perf_counter()
+        with track_request_timings() as timings:
+            result = command(self, **kwargs)
+        self.metrics.observe_task(
+            labels=metrics_labels,
+            seconds=time.perf_counter() - start,
+            timings=timings,
+        )
         self._write_task_result(task_id, result)
 
     def _query_async(self, command: Callable, **kwargs: Any) -> Response:
         task_id = self._new_task_id()
+        if has_request_context() and request.url_rule is not None:
+            metrics_labels = (request.method, request.url_rule.rule)
+        else:
+            metrics_labels = ('', command.__name__)
         greenlet = gevent.spawn(
             self._do_query_async,
             command,
             task_id,
+            metrics_labels,
             **kwargs,
         )
         greenlet.task_id = task_id
@@ -506,6 +531,37 @@ class RestAPI:
         }
         return api_response(result=result_dict, status_code=HTTPStatus.NOT_FOUND)
 
+    def get_periodic_tasks_stats(self) -> Response:
+        assert self.rotkehlchen.task_manager is not None, 'should exist for a logged in user'
+        result = _wrap_in_ok_result(self.rotkehlchen.task_manager.get_tasks_stats())
+        return api_response(result=result, status_code=HTTPStatus.OK)
+
+    def get_metrics(self) -> Response:
+        return Response(
+            self.metrics.to_prometheus(),
+            status=HTTPStatus.OK,
+            content_type=PROMETHEUS_CONTENT_TYPE,
+        )
+
+    @async_api_call()
+    def profile_greenlets(
+            self,
+            duration: float,
+            interval: float,
+            profile_format: ProfileFormat,
+    ) -> dict[str, Any]:
+        if self.profiler_lock.locked():
+            return {
+                'result': None,
+                'message': 'Another profile is being captured at the moment',
+                'status_code': HTTPStatus.CONFLICT,
+            }
+
+        with self.profiler_lock:
+            profiler = SamplingProfiler(interval=interval)
+            profiler.profile(duration=duration)
+        return {'result': profiler.serialize(profile_format=profile_format), 'message': ''}
+
     @async_api_call()
     def get_exchange_rates(self, given_currencies: list[AssetWithOracles]) -> dict[str, Any]:
         currencies = given_currencies
@@ -1521,10 +1577,12 @@ class RestAPI:
             self,
             from_timestamp: Timestamp,
             to_timestamp: Timestamp,
+            measure_timings: bool,
     ) -> dict[str, Any]:
         report_id, error_or_empty = self.rotkehlchen.process_history(
             start_ts=from_timestamp,
             end_ts=to_timestamp,
+            measure_timings=measure_timings,
         )
         return {'result': report_id, 'message': error_or_empty}
 
@@ -1997,6 +2055,7 @@ class RestAPI:
                 'max_logfiles_num': DEFAULT_MAX_LOG_BACKUP_FILES,
                 'max_size_in_mb_all_logs': DEFAULT_MAX_LOG_SIZE_IN_MB,
                 'sqlite_instructions': DEFAULT_SQL_VM_INSTRUCTIONS_CB,
+                'db_profile': DEFAULT_DB_PROFILE,
             },
         }
         return api_response(_wrap_in_ok_result(result), status_code=HTTPStatus.OK)
@@ -3859,6 +3918,10 @@ class RestAPI:
                 'value': self.rotkehlchen.args.sqlite_instructions,
                 'is_default': self.rotkehlchen.args.sqlite_instructions == DEFAULT_SQL_VM_INSTRUCTIONS_CB,  # noqa: E501
             },
+            'db_profile': {
+                'value': self.rotkehlchen.args.db_profile,
+                'is_default': self.rotkehlchen.args.db_profile == DEFAULT_DB_PROFILE,
+            },
         }
         return api_response(_wrap_in_ok_result(config), status_code=HTTPStatus.OK)
 
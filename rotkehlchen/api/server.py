@@ -1,11 +1,12 @@
 import json
 import logging
 import sys
+import time
 from http import HTTPStatus
 from typing import Any, Optional, Union
 
 import werkzeug
-from flask import Blueprint, Flask, Response, abort, jsonify, request
+from flask import Blueprint, Flask, Response, abort, g, jsonify, request
 from flask.views import MethodView
 from flask_cors import CORS
 from gevent.pywsgi import WSGIServer
@@ -110,6 +111,7 @@ from rotkehlchen.api.v1.resources import (
     MakerdaoVaultsResource,
     ManuallyTrackedBalancesResource,
     MessagesResource,
+    MetricsResource,
     ModuleStatsResource,
     NamedEthereumModuleDataResource,
     NamedOracleCacheResource,
@@ -119,8 +121,10 @@ from rotkehlchen.api.v1.resources import (
     OraclesResource,
     OwnedAssetsResource,
     PeriodicDataResource,
+    PeriodicTasksResource,
     PickleDillResource,
     PingResource,
+    ProfilingResource,
     QueriedAddressesResource,
     RefreshGeneralCacheResource,
     ReverseEnsResource,
@@ -151,6 +155,7 @@ from rotkehlchen.api.v1.resources import (
 )
 from rotkehlchen.api.websockets.notifier import RotkiNotifier, RotkiWSApp
 from rotkehlchen.logging import RotkehlchenLogsAdapter
+from rotkehlchen.utils.metrics import start_request_timings, stop_request_timings
 
 URLS = list[
     Union[
@@ -171,6 +176,9 @@ URLS_V1: URLS = [
     ('/settings/configuration', ConfigurationsResource),
     ('/tasks', AsyncTasksResource),
     ('/tasks/<int:task_id>', AsyncTasksResource, 'specific_async_tasks_resource'),
+    ('/tasks/periodic', PeriodicTasksResource),
+    ('/tasks/profile', ProfilingResource),
+    ('/metrics', MetricsResource),
     ('/exchange_rates', ExchangeRatesResource),
     ('/external_services', ExternalServicesResource),
     ('/oracles', OraclesResource),
@@ -411,6 +419,7 @@ class APIServer:
         self.flask_app.register_error_handler(Exception, self.unhandled_exception)
         self.flask_app.before_request(self.before_request_callback)
         self.flask_app.after_request(self.after_request_callback)
+        self.flask_app.teardown_request(self.teardown_request_callback)
 
     @staticmethod
     def unhandled_exception(exception: Exception) -> Response:
@@ -424,22 +433,41 @@ class APIServer:
         )
         return api_response(wrap_in_fail_result(str(exception)), HTTPStatus.INTERNAL_SERVER_ERROR)
 
-    @staticmethod
-    def before_request_callback() -> None:
-        """Function that runs before each request"""
+    def before_request_callback(self) -> None:
+        """Function that runs before each request
+
+        Starts counting the time of the request and the time it spends in the DB
+        and in remote queries for the metrics.
+        """
         log.debug(
             f'start rotki api {request.method} {request.path}',
             view_args=request.view_args,
             query_string=request.query_string,
         )
+        g.metrics_labels = (
+            request.method,
+            request.url_rule.rule if request.url_rule is not None else 'unmatched',
+        )
+        g.request_start = time.perf_counter()
+        g.request_timings = start_request_timings()
+        self.rest_api.metrics.request_started(g.metrics_labels)
 
-    @staticmethod
-    def after_request_callback(response: Response) -> Response:
+    def after_request_callback(self, response: Response) -> Response:
         """Function that runs after each completed request
 
         Logs the response if required. This is determined by the
         fake header rotki-log-result passed to all responses.
+        Also records the response in the metrics.
         """
+        if (labels := g.get('metrics_labels')) is not None:
+            self.rest_api.metrics.observe_response(
+                labels=labels,
+                status_code=response.status_code,
+                seconds=time.perf_counter() - g.request_start,
+                size=response.content_length,
+                timings=g.request_timings,
+            )
+
         if response.headers.pop('rotki-log-result', 'True') == 'True':
             result = response.json
         else:
@@ -454,6 +482,12 @@ class APIServer:
         )
         return response
 
+    def teardown_request_callback(self, _exception: Optional[BaseException]) -> None:
+        """Function that runs at the end of each request, even if it failed"""
+        stop_request_timings()
+        if (labels := g.pop('metrics_labels', None)) is not None:
+            self.rest_api.metrics.request_finished(labels)
+
     def run(self, host: str = '127.0.0.1', port: int = 5042, **kwargs: Any) -> None:
         """This is only used for the data faker and not used in production"""
         self.flask_app.run(host=host, port=port, **kwargs)
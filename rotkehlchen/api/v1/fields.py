@@ -23,7 +23,7 @@ from rotkehlchen.assets.asset import (
 from rotkehlchen.assets.types import AssetType
 from rotkehlchen.chain.bitcoin.hdkey import HDKey
 from rotkehlchen.chain.bitcoin.utils import is_valid_derivation_path
-from rotkehlchen.constants import ZERO
+from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.constants.misc import NFT_DIRECTIVE
 from rotkehlchen.errors.asset import UnknownAsset, WrongAssetType
 from rotkehlchen.errors.misc import XPUBError
@@ -273,6 +273,31 @@ class TaxFreeAfterPeriodField(fields.Field):
         return value
 
 
+class AcquisitionsMergeToleranceField(fields.Field):
+
+    def _deserialize(
+            self,
+            value: str,
+            attr: Optional[str],  # pylint: disable=unused-argument
+            data: Optional[Mapping[str, Any]],
+            **_kwargs: Any,
+    ) -> FVal:
+        try:
+            tolerance = FVal(value)
+        except ValueError as e:
+            raise ValidationError(str(e)) from e
+
+        if tolerance == -1:
+            return tolerance
+        if not ZERO <= tolerance < ONE:
+            raise ValidationError(
+                'The acquisitions_merge_tolerance value should be in the interval [0, 1), '
+                'except for the value of -1 to disable the setting',
+            )
+
+        return tolerance
+
+
 class AmountField(fields.Field):
 
     @staticmethod
@@ -103,7 +103,6 @@ from rotkehlchen.api.v1.schemas import (
     HistoryExportingSchema,
     HistoryProcessingDebugImportSchema,
     HistoryProcessingExportSchema,
-    HistoryProcessingSchema,
     IgnoredActionsModifySchema,
     IgnoredAssetsSchema,
     IntegerIdentifierSchema,
@@ -125,6 +124,8 @@ from rotkehlchen.api.v1.schemas import (
     NFTFilterQuerySchema,
     NFTLpFilterSchema,
     OptionalAddressesWithBlockchainsListSchema,
+    PnlReportProcessingSchema,
+    ProfilingSchema,
     QueriedAddressesSchema,
     QueryAddressbookSchema,
     ReverseEnsSchema,
@@ -243,6 +244,7 @@ if TYPE_CHECKING:
     from rotkehlchen.chain.evm.accounting.structures import BaseEventSettings
     from rotkehlchen.db.filtering import HistoryEventFilterQuery
     from rotkehlchen.exchanges.kraken import KrakenAccountType
+    from rotkehlchen.greenlets.profiler import ProfileFormat
 
 
 def _combine_parser_data(
@@ -486,6 +488,40 @@ class AsyncTasksResource(BaseMethodView):
         return self.rest_api.query_tasks_outcome(task_id=task_id)
 
 
+class PeriodicTasksResource(BaseMethodView):
+
+    @require_loggedin_user()
+    def get(self) -> Response:
+        return self.rest_api.get_periodic_tasks_stats()
+
+
+class MetricsResource(BaseMethodView):
+
+    def get(self) -> Response:
+        return self.rest_api.get_metrics()
+
+
+class ProfilingResource(BaseMethodView):
+
+    get_schema = ProfilingSchema()
+
+    @require_loggedin_user()
+    @use_kwargs(get_schema, location='json_and_query')
+    def get(
+            self,
+            async_query: bool,
+            duration: float,
+            interval: float,
+            profile_format: 'ProfileFormat',
+    ) -> Response:
+        return self.rest_api.profile_greenlets(
+            async_query=async_query,
+            duration=duration,
+            interval=interval,
+            profile_format=profile_format,
+        )
+
+
 class ExchangeRatesResource(BaseMethodView):
 
     get_schema = ExchangeRatesSchema()
@@ -1400,7 +1436,7 @@ class HistoryStatusResource(BaseMethodView):
 
 class HistoryProcessingResource(BaseMethodView):
 
-    get_schema = HistoryProcessingSchema()
+    get_schema = PnlReportProcessingSchema()
 
     @require_loggedin_user()
     @use_kwargs(get_schema, location='json_and_query')
@@ -1408,11 +1444,13 @@ class HistoryProcessingResource(BaseMethodView):
             self,
             from_timestamp: Timestamp,
             to_timestamp: Timestamp,
+            measure_timings: bool,
             async_query: bool,
     ) -> Response:
         return self.rest_api.process_history(
             from_timestamp=from_timestamp,
             to_timestamp=to_timestamp,
+            measure_timings=measure_timings,
             async_query=async_query,
         )
 
@@ -7,6 +7,7 @@ from eth_utils import to_checksum_address
 from marshmallow import INCLUDE, Schema, fields, post_load, validate, validates_schema
 from marshmallow.exceptions import ValidationError
 
+from rotkehlchen.accounting.mixins.event import AccountingEventType
 from rotkehlchen.accounting.structures.balance import Balance, BalanceType
 from rotkehlchen.accounting.structures.base import HistoryBaseEntryType, HistoryEvent
 from rotkehlchen.accounting.structures.eth2 import (
@@ -20,7 +21,6 @@ from rotkehlchen.accounting.structures.types import (
     HistoryEventSubType,
     HistoryEventType,
 )
-from rotkehlchen.accounting.types import SchemaEventType
 from rotkehlchen.assets.asset import Asset, AssetWithNameAndType, AssetWithOracles, CryptoAsset
 from rotkehlchen.assets.types import AssetType
 from rotkehlchen.assets.utils import IgnoredAssetsHandling
@@ -76,6 +76,13 @@ from rotkehlchen.errors.misc import InputError, RemoteError, XPUBError
 from rotkehlchen.errors.serialization import DeserializationError, EncodingError
 from rotkehlchen.exchanges.constants import ALL_SUPPORTED_EXCHANGES, SUPPORTED_EXCHANGES
 from rotkehlchen.exchanges.kraken import KrakenAccountType
+from rotkehlchen.greenlets.profiler import (
+    DEFAULT_PROFILE_INTERVAL,
+    MAX_PROFILE_DURATION,
+    MAX_PROFILE_INTERVAL,
+    MIN_PROFILE_INTERVAL,
+    ProfileFormat,
+)
 from rotkehlchen.history.types import HistoricalPriceOracle
 from rotkehlchen.icons import ALLOWED_ICON_EXTENSIONS
 from rotkehlchen.inquirer import CurrentPriceOracle
@@ -109,6 +116,7 @@ from rotkehlchen.utils.hexbytes import hexstring_to_bytes
 from rotkehlchen.utils.misc import create_order_by_rules_list, ts_now
 
 from .fields import (
+    AcquisitionsMergeToleranceField,
     AmountField,
     ApiKeyField,
     ApiSecretField,
@@ -193,6 +201,31 @@ class AsyncTasksQuerySchema(Schema):
     task_id = fields.Integer(strict=True, load_default=None)
 
 
+class ProfilingSchema(AsyncQueryArgumentSchema):
+    duration = fields.Float(
+        required=True,
+        validate=webargs.validate.Range(
+            min=0,
+            min_inclusive=False,
+            max=MAX_PROFILE_DURATION,
+            error=f'Profiling duration must be more than 0 and at most {MAX_PROFILE_DURATION} seconds',  # noqa: E501
+        ),
+    )
+    interval = fields.Float(
+        load_default=DEFAULT_PROFILE_INTERVAL,
+        validate=webargs.validate.Range(
+            min=MIN_PROFILE_INTERVAL,
+            max=MAX_PROFILE_INTERVAL,
+            error=f'Sampling interval must be between {MIN_PROFILE_INTERVAL} and {MAX_PROFILE_INTERVAL} seconds',  # noqa: E501
+        ),
+    )
+    profile_format = fields.String(
+        data_key='format',
+        load_default='collapsed',
+        validate=webargs.validate.OneOf(choices=get_args(ProfileFormat)),
+    )
+
+
 class OnlyCacheQuerySchema(Schema):
     only_cache = fields.Boolean(load_default=False)
 
@@ -1231,6 +1264,7 @@ class ModifiableSettingsSchema(Schema):
         validate=webargs.validate.OneOf(choices=DEFAULT_ADDRESS_NAME_PRIORITY),
     ), load_default=DEFAULT_ADDRESS_NAME_PRIORITY)
     include_fees_in_cost_basis = fields.Boolean(load_default=None)
+    acquisitions_merge_tolerance = AcquisitionsMergeToleranceField(load_default=None)
     infer_zero_timed_balances = fields.Boolean(load_default=None)
     query_retry_limit = fields.Integer(
         validate=webargs.validate.Range(
@@ -1307,6 +1341,7 @@ class ModifiableSettingsSchema(Schema):
             query_retry_limit=data['query_retry_limit'],
             connect_timeout=data['connect_timeout'],
             read_timeout=data['read_timeout'],
+            acquisitions_merge_tolerance=data['acquisitions_merge_tolerance'],
         )
 
 
@@ -1475,6 +1510,10 @@ class HistoryProcessingSchema(AsyncQueryArgumentSchema, TimestampRangeSchema):
     """Schema for history processing"""
 
 
+class PnlReportProcessingSchema(HistoryProcessingSchema):
+    measure_timings = fields.Boolean(load_default=False)
+
+
 class ModuleBalanceProcessingSchema(AsyncQueryArgumentSchema):
     module = SerializableEnumField(enum_class=ModuleWithBalances, required=True)
 
@@ -1514,7 +1553,10 @@ class AccountingReportsSchema(Schema):
 
 class AccountingReportDataSchema(TimestampRangeSchema, DBPaginationSchema, DBOrderBySchema):
     report_id = fields.Integer(load_default=None)
-    event_type = SerializableEnumField(enum_class=SchemaEventType, load_default=None)
+    event_type = SerializableEnumField(enum_class=AccountingEventType, load_default=None)
+    asset = AssetField(expected_type=Asset, load_default=None)
+    location = LocationField(load_default=None)
+    after_identifier = fields.Integer(load_default=None)
 
     @validates_schema
     def validate_report_schema(
@@ -1536,6 +1578,12 @@ class AccountingReportDataSchema(TimestampRangeSchema, DBPaginationSchema, DBOrd
                 field_name='order_by_attributes',
             )
 
+        if data['after_identifier'] is not None and data['offset'] is not None:
+            raise ValidationError(
+                message='after_identifier and offset can not be given together',
+                field_name='after_identifier',
+            )
+
     @post_load
     def make_report_data_query(
             self,
@@ -1552,8 +1600,11 @@ class AccountingReportDataSchema(TimestampRangeSchema, DBPaginationSchema, DBOrd
             ),
             limit=data['limit'],
             offset=data['offset'],
+            after_identifier=data['after_identifier'],
             report_id=report_id,
             event_type=event_type,
+            asset=data['asset'],
+            location=data['location'],
             from_ts=data['from_timestamp'],
             to_ts=data['to_timestamp'],
         )
@@ -1,45 +1,209 @@
 import json
 import logging
+import time
+from collections import deque
 from contextlib import suppress
-from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+from typing import Any, Callable, Optional, Union
 
+import gevent
+from gevent.event import Event
 from gevent.lock import Semaphore
 from geventwebsocket import WebSocketApplication
 from geventwebsocket.exceptions import WebSocketError
 from geventwebsocket.websocket import WebSocket
 
+from rotkehlchen.api.websockets.typedefs import WSMessageType
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 
-if TYPE_CHECKING:
-    from rotkehlchen.api.websockets.typedefs import WSMessageType
-
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
 
-def _ws_send_impl(
-        websocket: WebSocket,
-        lock: Semaphore,
-        to_send_msg: str,
-        success_callback: Optional[Callable] = None,
-        success_callback_args: Optional[dict[str, Any]] = None,
-        failure_callback: Optional[Callable] = None,
-        failure_callback_args: Optional[dict[str, Any]] = None,
-) -> None:
-    try:
-        with lock:
-            websocket.send(to_send_msg)
-    except WebSocketError as e:
-        log.error(f'Websocket send with message {to_send_msg} failed due to {e!s}')
-
-        if failure_callback:
-            failure_callback_args = {} if failure_callback_args is None else failure_callback_args
-            failure_callback(**failure_callback_args)
-        return
+# Maximum number of messages waiting to be sent to a single subscriber. When full the
+# oldest waiting message is dropped
+WS_QUEUE_SIZE = 1000
+# How long a coalescable message waits in the queue so that newer updates can replace it
+WS_COALESCE_WINDOW = 0.2
+
+
+def _coalesce_key(message_type: WSMessageType, data: Union[dict[str, Any], list[Any]]) -> Optional[tuple]:  # noqa: E501
+    """Returns the key under which messages of the type are merged so that only the latest
+    waiting message per key is sent. None if the message can not be coalesced.
+
+    Only progress updates are merged. Start and finish notifications have different
+    statuses and as such different keys.
+    """
+    if not isinstance(data, dict):
+        return None
+    if message_type == WSMessageType.EVM_TRANSACTION_STATUS:
+        return (message_type, data.get('address'), data.get('evm_chain'), data.get('status'))
+    if message_type == WSMessageType.HISTORY_EVENTS_STATUS:
+        return (
+            message_type,
+            data.get('location'),
+            data.get('name'),
+            data.get('event_type'),
+            data.get('status'),
+        )
+    if message_type in (WSMessageType.DB_UPGRADE_STATUS, WSMessageType.DATA_MIGRATION_STATUS):
+        return (message_type,)
+    if message_type == WSMessageType.CSV_IMPORT_STATUS:
+        return (message_type, data.get('finished'))
+    return None
+
+
+class WSPayload:
+    """A message broadcast to all subscribers. Encoded lazily and only once"""
+
+    def __init__(self, message_type: WSMessageType, data: Union[dict[str, Any], list[Any]]) -> None:  # noqa: E501
+        self.message_type = message_type
+        self.data = data
+        self._encoded: Optional[str] = None
+
+    def encode(self) -> str:
+        """May raise:
+        - TypeError if the data is not json serializable
+        """
+        if self._encoded is None:
+            self._encoded = json.dumps({'type': str(self.message_type), 'data': self.data})
+        return self._encoded
 
-    if success_callback:  # send success
-        success_callback_args = {} if success_callback_args is None else success_callback_args
-        success_callback(**success_callback_args)
+
+class WSOutMessage:
+    """A message waiting in the queue of a subscriber along with its callbacks"""
+
+    __slots__ = (
+        'coalesce_key',
+        'enqueued_at',
+        'failure_callback',
+        'failure_callback_args',
+        'payload',
+        'success_callback',
+        'success_callback_args',
+    )
+
+    def __init__(
+            self,
+            payload: WSPayload,
+            coalesce_key: Optional[tuple],
+            success_callback: Optional[Callable],
+            success_callback_args: Optional[dict[str, Any]],
+            failure_callback: Optional[Callable],
+            failure_callback_args: Optional[dict[str, Any]],
+    ) -> None:
+        self.payload = payload
+        self.coalesce_key = coalesce_key
+        self.enqueued_at = time.monotonic()
+        self.success_callback = success_callback
+        self.success_callback_args = success_callback_args
+        self.failure_callback = failure_callback
+        self.failure_callback_args = failure_callback_args
+
+    def fail(self) -> None:
+        if self.failure_callback is not None:
+            self.failure_callback(**(self.failure_callback_args or {}))
+
+    def succeed(self) -> None:
+        if self.success_callback is not None:
+            self.success_callback(**(self.success_callback_args or {}))
+
+
+class WSSubscriber:
+    """A websocket subscriber with a bounded outbound queue and a single sender greenlet
+
+    Messages are sent in the order they were broadcast. A coalescable message that is
+    still waiting in the queue is replaced in place by a newer message with the same key.
+    If the queue is full the oldest message is dropped and its failure callback is called.
+    """
+
+    def __init__(self, websocket: WebSocket, lock: Semaphore, maxsize: int = WS_QUEUE_SIZE) -> None:  # noqa: E501
+        self.websocket = websocket
+        self.lock = lock
+        self.maxsize = maxsize
+        self.queue: deque[WSOutMessage] = deque()
+        self.waiting: dict[tuple, WSOutMessage] = {}  # coalesce key -> message in the queue
+        self.new_message = Event()
+        self.sent = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.greenlet = gevent.spawn(self._send_loop)
+        self.greenlet.name = f'Websocket sender for {hash(websocket)}'
+
+    def enqueue(self, message: WSOutMessage) -> None:
+        if message.coalesce_key is not None and (waiting := self.waiting.get(message.coalesce_key)) is not None:  # noqa: E501
+            waiting.payload = message.payload  # keep the position, send the latest data
+            waiting.success_callback = message.success_callback
+            waiting.success_callback_args = message.success_callback_args
+            waiting.failure_callback = message.failure_callback
+            waiting.failure_callback_args = message.failure_callback_args
+            self.coalesced += 1
+            return
+
+        if len(self.queue) >= self.maxsize:
+            dropped = self.queue.popleft()
+            if dropped.coalesce_key is not None:
+                self.waiting.pop(dropped.coalesce_key, None)
+            self.dropped += 1
+            if self.dropped % 100 == 1:
+                log.warning(
+                    f'Outbound queue of websocket {hash(self.websocket)} is full. '
+                    f'Dropped {self.dropped} messages so far',
+                )
+            dropped.fail()
+
+        self.queue.append(message)
+        if message.coalesce_key is not None:
+            self.waiting[message.coalesce_key] = message
+        self.new_message.set()
+
+    def _send_loop(self) -> None:
+        while True:
+            self.new_message.wait()
+            while len(self.queue) != 0:
+                message = self.queue[0]
+                if message.coalesce_key is not None and (delay := message.enqueued_at + WS_COALESCE_WINDOW - time.monotonic()) > 0:  # noqa: E501
+                    gevent.sleep(delay)  # let newer updates replace it
+                    continue  # the message may have been dropped while waiting
+
+                self.queue.popleft()
+                if message.coalesce_key is not None:
+                    self.waiting.pop(message.coalesce_key, None)
+                self._send(message)
+            self.new_message.clear()
+
+    def _send(self, message: WSOutMessage) -> None:
+        try:
+            to_send_msg = message.payload.encode()
+        except TypeError as e:
+            log.error(f'Failed to send websocket {message.payload.message_type} message due to {e!s}')  # noqa: E501
+            message.fail()
+            return
+
+        try:
+            with self.lock:
+                self.websocket.send(to_send_msg)
+        except WebSocketError as e:
+            log.error(f'Websocket send with message {to_send_msg} failed due to {e!s}')
+            message.fail()
+            return
+
+        self.sent += 1
+        message.succeed()
+
+    def stop(self) -> None:
+        """Stops the sender. Messages still in the queue are failed"""
+        self.greenlet.kill()
+        while len(self.queue) != 0:
+            self.queue.popleft().fail()
+        self.waiting = {}
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'queued': len(self.queue),
+            'sent': self.sent,
+            'coalesced': self.coalesced,
+            'dropped': self.dropped,
+        }
 
 
 class RotkiNotifier:
@@ -47,14 +211,18 @@ class RotkiNotifier:
     def __init__(self) -> None:
         self.subscribers: list[WebSocket] = []
         self.locks: dict[WebSocket, Semaphore] = {}
+        self.senders: dict[WebSocket, WSSubscriber] = {}
 
     def subscribe(self, websocket: WebSocket) -> None:
         log.info(f'Websocket with hash id {hash(websocket)} subscribed to rotki notifier')
         self.subscribers.append(websocket)
         self.locks[websocket] = Semaphore()
+        self.senders[websocket] = WSSubscriber(websocket=websocket, lock=self.locks[websocket])
 
     def unsubscribe(self, websocket: WebSocket) -> None:
         self.locks.pop(websocket, None)
+        if (sender := self.senders.pop(websocket, None)) is not None:
+            sender.stop()
         with suppress(ValueError):
             self.subscribers.remove(websocket)
             log.info(f'Websocket with hash id {hash(websocket)} unsubscribed from rotki notifier')
@@ -70,46 +238,37 @@ class RotkiNotifier:
     ) -> None:
         """Broadcasts a websocket message
 
-        A callback to run on message success and a callback to run on message
-        failure can be optionally provided.
+        The message is put in the outbound queue of each subscriber and is sent by its
+        sender greenlet. A callback to run on message success and a callback to run on
+        message failure can be optionally provided. The failure callback also runs if the
+        message is dropped from a full queue or there are no subscribers.
         """
-        message_data = {'type': str(message_type), 'data': to_send_data}
-        try:
-            message = json.dumps(message_data)
-        except TypeError as e:
-            log.error(f'Failed to broadcast websocket {message_type} message due to {e!s}')
-            if failure_callback is not None:
-                failure_callback_args = {} if failure_callback_args is None else failure_callback_args  # noqa: E501
-                failure_callback(**failure_callback_args)
-
-            return  # get out of the broadcast
-
-        to_remove_indices = set()
-        spawned_one_broadcast = False
-        for idx, websocket in enumerate(self.subscribers):
+        payload = WSPayload(message_type=message_type, data=to_send_data)
+        coalesce_key = _coalesce_key(message_type, to_send_data)
+        queued_one_broadcast = False
+        for websocket in self.subscribers.copy():
             if websocket.closed is True:
-                to_remove_indices.add(idx)
+                self.unsubscribe(websocket)
                 continue
 
-            _ws_send_impl(
-                websocket=websocket,
-                lock=self.locks[websocket],
-                to_send_msg=message,
+            self.senders[websocket].enqueue(WSOutMessage(
+                payload=payload,
+                coalesce_key=coalesce_key,
                 success_callback=success_callback,
                 success_callback_args=success_callback_args,
                 failure_callback=failure_callback,
                 failure_callback_args=failure_callback_args,
-            )
-            spawned_one_broadcast = True
+            ))
+            queued_one_broadcast = True
 
-        if len(to_remove_indices) != 0:  # removed closed websockets from the list
-            self.subscribers = [
-                i for j, i in enumerate(self.subscribers) if j not in to_remove_indices
-            ]
-        if spawned_one_broadcast is False and failure_callback is not None:
+        if queued_one_broadcast is False and failure_callback is not None:
             failure_callback_args = {} if failure_callback_args is None else failure_callback_args
             failure_callback(**failure_callback_args)
 
+    def stats(self) -> list[dict[str, int]]:
+        """Outbound queue stats of each subscriber"""
+        return [sender.stats() for sender in self.senders.values()]
+
 
 class RotkiWSApp(WebSocketApplication):
     """The WebSocket app that's instantiated for every message as it seems from the code
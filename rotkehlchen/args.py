@@ -8,6 +8,7 @@ from rotkehlchen.constants.misc import (
     DEFAULT_MAX_LOG_SIZE_IN_MB,
     DEFAULT_SQL_VM_INSTRUCTIONS_CB,
 )
+from rotkehlchen.db.profiles import DB_CONNECTION_PROFILES, DEFAULT_DB_PROFILE
 from rotkehlchen.utils.misc import get_system_spec
 
 
@@ -131,6 +132,16 @@ def app_args(prog: str, description: str) -> argparse.ArgumentParser:
         default=DEFAULT_SQL_VM_INSTRUCTIONS_CB,
         type=_positive_int_or_zero,
     )
+    p.add_argument(
+        '--db-profile',
+        help=(
+            'The profile of pragmas with which to tune the database connections. '
+            'low-memory uses less memory and throughput speeds up big databases at the cost '
+            'of more memory and of possibly losing the last writes on a power loss.'
+        ),
+        default=DEFAULT_DB_PROFILE,
+        choices=list(DB_CONNECTION_PROFILES),
+    )
     p.add_argument(
         'version',
         help='Shows the rotki version',
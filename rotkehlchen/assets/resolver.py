@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Optional, TypeVar
 
 from rotkehlchen.assets.types import AssetType
@@ -22,13 +23,16 @@ logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 T = TypeVar('T', 'FiatAsset', 'CryptoAsset', 'EvmToken', 'Nft', 'AssetWithNameAndType', 'AssetWithSymbol', 'AssetWithOracles')  # noqa: E501
 
+DEFAULT_ASSETS_CACHE_SIZE = 512
+MAX_ASSETS_CACHE_SIZE = 16384
+
 
 class AssetResolver:
     __instance: Optional['AssetResolver'] = None
     # A cache so that the DB is not hit every time
     # the cache maps identifier -> final representation of the asset
-    assets_cache: LRUCacheLowerKey['AssetWithNameAndType'] = LRUCacheLowerKey(maxsize=512)
-    types_cache: LRUCacheLowerKey[AssetType] = LRUCacheLowerKey(maxsize=512)
+    assets_cache: LRUCacheLowerKey['AssetWithNameAndType'] = LRUCacheLowerKey(maxsize=DEFAULT_ASSETS_CACHE_SIZE)  # noqa: E501
+    types_cache: LRUCacheLowerKey[AssetType] = LRUCacheLowerKey(maxsize=DEFAULT_ASSETS_CACHE_SIZE)
 
     def __new__(cls) -> 'AssetResolver':
         """Lazily initializes AssetResolver
@@ -89,6 +93,70 @@ class AssetResolver:
         instance.assets_cache.add(identifier, asset)
         return asset
 
+    @staticmethod
+    def resolve_many(identifiers: Iterable[str]) -> dict[str, 'AssetWithNameAndType']:
+        """Bulk version of `resolve_asset`. All identifiers missing from the cache are
+        resolved with a single round of queries to the globaldb instead of one query each.
+
+        Returns a mapping of each given identifier to its resolved asset.
+
+        May raise:
+        - UnknownAsset
+        - WrongAssetType
+        """
+        from rotkehlchen.globaldb.handler import GlobalDBHandler  # pylint: disable=import-outside-toplevel  # isort:skip
+
+        instance = AssetResolver()
+        result: dict[str, 'AssetWithNameAndType'] = {}
+        misses = []
+        for identifier in identifiers:
+            if (cached_data := instance.assets_cache.get(identifier)) is not None:
+                result[identifier] = cached_data
+            else:
+                misses.append(identifier)
+
+        if len(misses) == 0:
+            return result
+
+        resolved = GlobalDBHandler().resolve_assets(identifiers=misses)
+        for identifier in misses:
+            if (asset := resolved.get(identifier.lower())) is None:
+                # not in the globaldb. Let the single resolution handle the packaged db
+                result[identifier] = AssetResolver.resolve_asset(identifier)
+                continue
+
+            instance.assets_cache.add(identifier, asset)
+            result[identifier] = asset
+
+        return result
+
+    @staticmethod
+    def set_cache_size(maxsize: int) -> None:
+        """Change the capacity of the memory caches"""
+        instance = AssetResolver()
+        instance.assets_cache.resize(maxsize)
+        instance.types_cache.resize(maxsize)
+
+    @staticmethod
+    def auto_size_cache(owned_assets_num: int) -> None:
+        """Size the memory caches so that the assets of the user fit in them along with
+        the assets they relate to, such as underlying tokens and assets seen in history"""
+        AssetResolver.set_cache_size(
+            min(MAX_ASSETS_CACHE_SIZE, max(DEFAULT_ASSETS_CACHE_SIZE, owned_assets_num * 2)),
+        )
+
+    @staticmethod
+    def prewarm_cache(identifiers: Iterable[str]) -> None:
+        """Load the given assets in the memory cache. Unknown identifiers are skipped"""
+        from rotkehlchen.globaldb.handler import GlobalDBHandler  # pylint: disable=import-outside-toplevel  # isort:skip
+
+        instance = AssetResolver()
+        misses = [x for x in identifiers if instance.assets_cache.get(x) is None]
+        for identifier, asset in GlobalDBHandler().resolve_assets(identifiers=misses).items():
+            instance.assets_cache.add(identifier, asset)
+
+        log.debug(f'Pre-warmed the asset cache with {len(misses)} assets')
+
     @staticmethod
     def get_asset_type(identifier: str, query_packaged_db: bool = True) -> AssetType:
         # TODO: This is ugly here but is here to avoid a cyclic import in the Assets file
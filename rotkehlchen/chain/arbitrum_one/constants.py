@@ -5,6 +5,8 @@ from rotkehlchen.fval import FVal
 from rotkehlchen.types import SupportedBlockchain, Timestamp, deserialize_evm_tx_hash
 
 ARBITRUM_ONE_ETHERSCAN_NODE_NAME = 'arbitrum one etherscan'
+# Number of multicall chunks queried at the same time from arbitrum one nodes
+ARBITRUM_ONE_MULTICALL_CONCURRENCY = 4
 ARBITRUM_ONE_GENESIS = Timestamp(1622240000)
 ARBITRUM_ONE_ETHERSCAN_NODE = WeightedNode(
     node_info=NodeName(
@@ -16,6 +16,7 @@ from rotkehlchen.types import ChainID, ChecksumEvmAddress, EVMTxHash, SupportedB
 from .constants import (
     ARBITRUM_ONE_ETHERSCAN_NODE,
     ARBITRUM_ONE_ETHERSCAN_NODE_NAME,
+    ARBITRUM_ONE_MULTICALL_CONCURRENCY,
     ARCHIVE_NODE_CHECK_ADDRESS,
     ARCHIVE_NODE_CHECK_BLOCK,
     ARCHIVE_NODE_CHECK_EXPECTED_BALANCE,
@@ -37,6 +38,7 @@ class ArbitrumOneInquirer(EvmNodeInquirer):
             greenlet_manager: GreenletManager,
             database: 'DBHandler',
             rpc_timeout: int = DEFAULT_EVM_RPC_TIMEOUT,
+            multicall_concurrency: int = ARBITRUM_ONE_MULTICALL_CONCURRENCY,
     ) -> None:
         etherscan = ArbitrumOneEtherscan(
             database=database,
@@ -52,6 +54,7 @@ class ArbitrumOneInquirer(EvmNodeInquirer):
             etherscan_node_name=ARBITRUM_ONE_ETHERSCAN_NODE_NAME,
             contracts=contracts,
             rpc_timeout=rpc_timeout,
+            multicall_concurrency=multicall_concurrency,
             contract_multicall=contracts.contract(string_to_evm_address('0xcA11bde05977b3631167028862bE2a173976CA11')),
             contract_scan=contracts.contract(string_to_evm_address('0x532E03C3167726cCfE0C777758b58b31054d3402')),
             native_token=A_ETH.resolve_to_crypto_asset(),
@@ -4,6 +4,8 @@ from rotkehlchen.fval import FVal
 from rotkehlchen.types import SupportedBlockchain, Timestamp, deserialize_evm_tx_hash
 
 BASE_ETHERSCAN_NODE_NAME = 'base etherscan'
+# Number of multicall chunks queried at the same time from base nodes
+BASE_MULTICALL_CONCURRENCY = 4
 BASE_GENESIS = Timestamp(1686789347)
 BASE_ETHERSCAN_NODE = WeightedNode(
     node_info=NodeName(
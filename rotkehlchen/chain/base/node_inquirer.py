@@ -19,6 +19,7 @@ from .constants import (
     ARCHIVE_NODE_CHECK_EXPECTED_BALANCE,
     BASE_ETHERSCAN_NODE,
     BASE_ETHERSCAN_NODE_NAME,
+    BASE_MULTICALL_CONCURRENCY,
     PRUNED_NODE_CHECK_TX_HASH,
 )
 from .etherscan import BaseEtherscan
@@ -37,6 +38,7 @@ class BaseInquirer(OptimismSuperchainInquirer):
             greenlet_manager: GreenletManager,
             database: 'DBHandler',
             rpc_timeout: int = DEFAULT_EVM_RPC_TIMEOUT,
+            multicall_concurrency: int = BASE_MULTICALL_CONCURRENCY,
     ) -> None:
         etherscan = BaseEtherscan(
             database=database,
@@ -52,6 +54,7 @@ class BaseInquirer(OptimismSuperchainInquirer):
             etherscan_node_name=BASE_ETHERSCAN_NODE_NAME,
             contracts=contracts,
             rpc_timeout=rpc_timeout,
+            multicall_concurrency=multicall_concurrency,
             contract_multicall=contracts.contract(string_to_evm_address('0xeDF6D2a16e8081F777eB623EeB4411466556aF3d')),
             contract_scan=contracts.contract(string_to_evm_address('0x2d26d6b698f6494efdB908A2A4f11ae5Fee86099')),
             native_token=A_ETH.resolve_to_crypto_asset(),
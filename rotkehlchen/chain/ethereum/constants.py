@@ -4,6 +4,8 @@ from rotkehlchen.fval import FVal
 from rotkehlchen.types import SupportedBlockchain, Timestamp, deserialize_evm_tx_hash
 
 ETHEREUM_ETHERSCAN_NODE_NAME = 'etherscan'
+# Number of multicall chunks queried at the same time from ethereum nodes
+ETHEREUM_MULTICALL_CONCURRENCY = 4
 
 ETH2_DEPOSIT_ADDRESS = string_to_evm_address('0x00000000219ab540356cBB839Cbe05303d7705Fa')
 ETHEREUM_GENESIS = Timestamp(1438269973)
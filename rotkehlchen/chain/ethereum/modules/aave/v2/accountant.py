@@ -1,22 +1,23 @@
 from collections import defaultdict
 from collections.abc import Iterator
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from rotkehlchen.accounting.mixins.event import AccountingEventType
 from rotkehlchen.accounting.structures.base import get_event_type_identifier
 from rotkehlchen.accounting.structures.types import HistoryEventSubType, HistoryEventType
+from rotkehlchen.assets.asset import Asset
 from rotkehlchen.chain.evm.accounting.interfaces import ModuleAccountantInterface
 from rotkehlchen.chain.evm.accounting.structures import EventsAccountantCallback
 from rotkehlchen.chain.evm.types import string_to_evm_address
 from rotkehlchen.constants import ZERO
 from rotkehlchen.fval import FVal
+from rotkehlchen.serialization.deserialize import deserialize_fval
 
 from ..constants import CPT_AAVE_V2
 
 if TYPE_CHECKING:
     from rotkehlchen.accounting.pot import AccountingPot
     from rotkehlchen.accounting.structures.evm_event import EvmEvent
-    from rotkehlchen.assets.asset import Asset
     from rotkehlchen.types import ChecksumEvmAddress
 
 
@@ -26,6 +27,25 @@ class Aavev2Accountant(ModuleAccountantInterface):
         self.assets_borrowed: dict[tuple[ChecksumEvmAddress, Asset], FVal] = defaultdict(FVal)
         self.assets_supplied: dict[tuple[ChecksumEvmAddress, Asset], FVal] = defaultdict(FVal)
 
+    def serialize_state(self) -> dict[str, Any]:
+        return {
+            name: [
+                [address, asset.identifier, str(amount)]
+                for (address, asset), amount in balances.items() if amount != ZERO
+            ] for name, balances in (
+                ('assets_borrowed', self.assets_borrowed),
+                ('assets_supplied', self.assets_supplied),
+            )
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        for name, balances in (
+                ('assets_borrowed', self.assets_borrowed),
+                ('assets_supplied', self.assets_supplied),
+        ):
+            for address, identifier, amount in state[name]:
+                balances[(address, Asset(identifier))] = deserialize_fval(amount, name=name, location='aave v2 accountant')  # noqa: E501
+
     def _process_borrow(
             self,
             pot: 'AccountingPot',  # pylint: disable=unused-argument
@@ -1,6 +1,6 @@
 from collections import defaultdict
 from collections.abc import Iterator
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from rotkehlchen.accounting.mixins.event import AccountingEventType
 from rotkehlchen.accounting.structures.base import get_event_type_identifier
@@ -10,6 +10,7 @@ from rotkehlchen.chain.evm.accounting.structures import EventsAccountantCallback
 from rotkehlchen.constants import ZERO
 from rotkehlchen.constants.assets import A_DAI
 from rotkehlchen.fval import FVal
+from rotkehlchen.serialization.deserialize import deserialize_fval
 from rotkehlchen.types import ChecksumEvmAddress
 
 from .constants import CPT_DSR, CPT_VAULT
@@ -25,6 +26,18 @@ class MakerdaoAccountant(ModuleAccountantInterface):
         self.vault_balances: dict[str, FVal] = defaultdict(FVal)
         self.dsr_balances: dict[ChecksumEvmAddress, FVal] = defaultdict(FVal)
 
+    def serialize_state(self) -> dict[str, Any]:
+        return {
+            'vault_balances': {k: str(v) for k, v in self.vault_balances.items() if v != ZERO},
+            'dsr_balances': {k: str(v) for k, v in self.dsr_balances.items() if v != ZERO},
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        for cdp_id, balance in state['vault_balances'].items():
+            self.vault_balances[cdp_id] = deserialize_fval(balance, name='vault balance', location='makerdao accountant')  # noqa: E501
+        for address, balance in state['dsr_balances'].items():
+            self.dsr_balances[address] = deserialize_fval(balance, name='dsr balance', location='makerdao accountant')  # noqa: E501
+
     def _process_vault_dai_generation(
             self,
             pot: 'AccountingPot',  # pylint: disable=unused-argument
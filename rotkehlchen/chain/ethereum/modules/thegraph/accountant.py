@@ -1,6 +1,6 @@
 from collections import defaultdict
 from collections.abc import Iterator
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from rotkehlchen.accounting.mixins.event import AccountingEventType
 from rotkehlchen.accounting.structures.base import get_event_type_identifier
@@ -10,6 +10,7 @@ from rotkehlchen.chain.evm.accounting.interfaces import ModuleAccountantInterfac
 from rotkehlchen.chain.evm.accounting.structures import EventsAccountantCallback
 from rotkehlchen.constants import ZERO
 from rotkehlchen.fval import FVal
+from rotkehlchen.serialization.deserialize import deserialize_fval
 
 if TYPE_CHECKING:
     from rotkehlchen.accounting.pot import AccountingPot
@@ -21,6 +22,15 @@ class ThegraphAccountant(ModuleAccountantInterface):
     def reset(self) -> None:
         self.assets_supplied: dict[ChecksumEvmAddress, FVal] = defaultdict(FVal)
 
+    def serialize_state(self) -> dict[str, Any]:
+        return {'assets_supplied': {
+            k: str(v) for k, v in self.assets_supplied.items() if v != ZERO
+        }}
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        for address, amount in state['assets_supplied'].items():
+            self.assets_supplied[address] = deserialize_fval(amount, name='assets supplied', location='thegraph accountant')  # noqa: E501
+
     def _process_deposit(
             self,
             pot: 'AccountingPot',  # pylint: disable=unused-argument
@@ -43,7 +43,12 @@ from rotkehlchen.types import (
 from rotkehlchen.utils.misc import get_chunks
 from rotkehlchen.utils.network import request_get_dict
 
-from .constants import ETH2_DEPOSIT_ADDRESS, ETHEREUM_ETHERSCAN_NODE_NAME, WeightedNode
+from .constants import (
+    ETH2_DEPOSIT_ADDRESS,
+    ETHEREUM_ETHERSCAN_NODE_NAME,
+    ETHEREUM_MULTICALL_CONCURRENCY,
+    WeightedNode,
+)
 from .etherscan import EthereumEtherscan
 from .utils import ENS_RESOLVER_ABI_MULTICHAIN_ADDRESS
 
@@ -64,6 +69,7 @@ class EthereumInquirer(DSProxyInquirerWithCacheData):
             greenlet_manager: GreenletManager,
             database: 'DBHandler',
             rpc_timeout: int = DEFAULT_EVM_RPC_TIMEOUT,
+            multicall_concurrency: int = ETHEREUM_MULTICALL_CONCURRENCY,
     ) -> None:
         etherscan = EthereumEtherscan(
             database=database,
@@ -79,6 +85,7 @@ class EthereumInquirer(DSProxyInquirerWithCacheData):
             etherscan_node_name=ETHEREUM_ETHERSCAN_NODE_NAME,
             contracts=contracts,
             rpc_timeout=rpc_timeout,
+            multicall_concurrency=multicall_concurrency,
             contract_multicall=contracts.contract(string_to_evm_address('0x5BA1e12693Dc8F9c48aAD8770482f4739bEeD696')),
             contract_scan=contracts.contract(string_to_evm_address('0x86F25b64e1Fe4C5162cDEeD5245575D32eC549db')),
             dsproxy_registry=contracts.contract(string_to_evm_address('0x4678f0a6958e4D2Bc4F1BAF7Bc52E8F3564f3fE4')),
@@ -4,7 +4,7 @@ import pkgutil
 from collections.abc import Sequence
 from contextlib import suppress
 from types import ModuleType
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from rotkehlchen.chain.evm.decoding.types import CounterpartyDetails
 from rotkehlchen.errors.misc import ModuleLoadingError
@@ -14,6 +14,7 @@ from rotkehlchen.user_messages import MessagesAggregator
 from .structures import EventsAccountantCallback
 
 if TYPE_CHECKING:
+    from rotkehlchen.chain.evm.manager import EvmManager
     from rotkehlchen.chain.evm.node_inquirer import EvmNodeInquirer
 
     from .interfaces import ModuleAccountantInterface
@@ -99,14 +100,35 @@ class EVMAccountingAggregator:
         for accountant in self.accountants.values():
             accountant.reset()
 
+    def serialize_state(self) -> dict[str, dict[str, Any]]:
+        """Serializes the state of the submodule accountants that keep any"""
+        result = {}
+        for name, accountant in self.accountants.items():
+            if len(state := accountant.serialize_state()) != 0:
+                result[name] = state
+
+        return result
+
+    def restore_state(self, state: dict[str, dict[str, Any]]) -> None:
+        """May raise DeserializationError or KeyError"""
+        for name, accountant_state in state.items():
+            if (accountant := self.accountants.get(name)) is not None:
+                accountant.restore_state(accountant_state)
+
 
 class EVMAccountingAggregators:
     """
     This is just a convenience class to group together AccountingAggregators from multiple chains
     """
 
-    def __init__(self, aggregators: list[EVMAccountingAggregator]) -> None:
-        self.aggregators = aggregators
+    def __init__(self, evm_managers: Sequence['EvmManager']) -> None:
+        self.evm_managers = evm_managers
+
+    @property
+    def aggregators(self) -> list[EVMAccountingAggregator]:
+        """The accounting aggregators of the chains. Accessed only when accounting so that
+        chain managers that are constructed lazily are not constructed at login"""
+        return [evm_manager.accounting_aggregator for evm_manager in self.evm_managers]
 
     def get_accounting_callbacks(self) -> dict[int, EventsAccountantCallback]:
         """Iterate through loaded accountants and get accounting callbacks for each event type"""
@@ -120,3 +142,16 @@ class EVMAccountingAggregators:
         """Reset the state of all initialized submodule accountants"""
         for aggregator in self.aggregators:
             aggregator.reset()
+
+    def serialize_state(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Serializes the state of the accountants of each chain for the accounting checkpoints"""
+        return {
+            str(aggregator.node_inquirer.chain_id.serialize()): state
+            for aggregator in self.aggregators if len(state := aggregator.serialize_state()) != 0
+        }
+
+    def restore_state(self, state: dict[str, dict[str, dict[str, Any]]]) -> None:
+        """May raise DeserializationError or KeyError"""
+        for aggregator in self.aggregators:
+            if (chain_state := state.get(str(aggregator.node_inquirer.chain_id.serialize()))) is not None:  # noqa: E501
+                aggregator.restore_state(chain_state)
@@ -1,7 +1,7 @@
 import logging
 from abc import ABCMeta, abstractmethod
 from collections.abc import Iterator
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from rotkehlchen.accounting.mixins.event import AccountingEventType
 from rotkehlchen.accounting.structures.types import EventDirection, HistoryEventType
@@ -47,6 +47,21 @@ class ModuleAccountantInterface(metaclass=ABCMeta):
         """Subclasses may implement this to reset state between accounting runs"""
         return None
 
+    def serialize_state(self) -> dict[str, Any]:
+        """Subclasses that keep state between events should implement this and
+        restore_state so that the state is saved in the accounting checkpoints.
+        The result should be json serializable. Empty state is not saved."""
+        return {}
+
+    def restore_state(self, state: dict[str, Any]) -> None:  # pylint: disable=unused-argument
+        """Restores the state saved by serialize_state after a reset
+
+        May raise:
+        - DeserializationError if the state can't be read
+        - KeyError if a key is missing from the state
+        """
+        return None
+
 
 class DepositableAccountantInterface(ModuleAccountantInterface):
     """
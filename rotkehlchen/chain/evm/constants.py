@@ -32,3 +32,21 @@ FAKE_GENESIS_TX_RECEIPT = {
 ERC20_PROPERTIES: Final = ('decimals', 'symbol', 'name')
 ERC20_PROPERTIES_NUM: Final = len(ERC20_PROPERTIES)
 ERC721_PROPERTIES: Final = ('symbol', 'name')
+
+# Number of multicall chunks that are allowed to be in flight at the same time
+DEFAULT_MULTICALL_CONCURRENCY: Final = 4
+# Consecutive successful multicall chunks after which a node's chunk size is doubled again
+MULTICALL_CHUNK_GROWTH_SUCCESSES: Final = 5
+# Lowercase fragments of node errors that mean the multicall chunk was too big for the node
+MULTICALL_CHUNK_SIZE_ERRORS: Final = (
+    'out of gas',
+    'gas required exceeds',
+    'exceeds block gas limit',
+    'gas limit reached',
+    'response size',
+    'response is too big',
+    'payload too large',
+    'request entity too large',
+    'request too large',
+    'calldata too large',
+)
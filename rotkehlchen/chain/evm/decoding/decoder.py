@@ -4,8 +4,7 @@ import pkgutil
 from abc import ABCMeta, abstractmethod
 from contextlib import suppress
 from dataclasses import dataclass
-from types import ModuleType
-from typing import TYPE_CHECKING, Any, Callable, Optional, Protocol, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Protocol
 
 from gevent.lock import Semaphore
 
@@ -20,6 +19,7 @@ from rotkehlchen.api.websockets.typedefs import WSMessageType
 from rotkehlchen.assets.asset import AssetWithOracles, EvmToken
 from rotkehlchen.assets.utils import TokenEncounterInfo, get_or_create_evm_token
 from rotkehlchen.chain.ethereum.utils import token_normalized_value
+from rotkehlchen.chain.evm.decoding.decoders_manifest import DECODER_MODULES
 from rotkehlchen.chain.evm.decoding.interfaces import ReloadableDecoderMixin
 from rotkehlchen.chain.evm.decoding.oneinch.v5.decoder import Oneinchv5Decoder
 from rotkehlchen.chain.evm.decoding.safe.decoder import SafemultisigDecoder
@@ -53,6 +53,8 @@ from .structures import (
 from .utils import maybe_reshuffle_events
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from rotkehlchen.accounting.structures.evm_event import EvmEvent
     from rotkehlchen.chain.evm.node_inquirer import EvmNodeInquirer, EvmNodeInquirerWithDSProxy
     from rotkehlchen.chain.evm.transactions import EvmTransactions
@@ -112,6 +114,41 @@ class DecodingRules:
         )
 
 
+def walk_decoder_modules(
+        chain_modules_root: str,
+        package_name: Optional[str] = None,
+) -> list[tuple[str, str]]:
+    """Walks the packages under the given root of a chain's modules and imports the decoder
+    module of each. Returns the class name without the Decoder suffix and the module of each
+    decoder found in the order in which the decoders should be initialized.
+
+    The class name of a decoder is derived from the path of its package. For example
+    the decoder of `aave.v1` is `Aavev1Decoder` and that of `convex_finance` would be
+    `ConvexFinanceDecoder`.
+    """
+    package = importlib.import_module(chain_modules_root if package_name is None else package_name)
+    decoder_modules = []
+    for _, name, is_pkg in pkgutil.walk_packages(package.__path__):
+        full_name = package.__name__ + '.' + name
+        if full_name == __name__ or is_pkg is False:
+            continue  # skip
+
+        submodule = None
+        with suppress(ModuleNotFoundError):
+            submodule = importlib.import_module(full_name + '.decoder')
+
+        if submodule is not None:
+            # take module name, transform it and find decoder if exists
+            class_name = full_name[len(chain_modules_root):].translate({ord('.'): None})
+            class_name = ''.join([x.capitalize() for x in class_name.split('_')])
+            if getattr(submodule, f'{class_name}Decoder', None) is not None:
+                decoder_modules.append((class_name, submodule.__name__))
+
+        decoder_modules.extend(walk_decoder_modules(chain_modules_root, full_name))
+
+    return decoder_modules
+
+
 class EVMTransactionDecoder(metaclass=ABCMeta):
 
     def __init__(
@@ -143,32 +180,75 @@ class EVMTransactionDecoder(metaclass=ABCMeta):
         self.transactions = transactions
         self.msg_aggregator = database.msg_aggregator
         self.chain_modules_root = f'rotkehlchen.chain.{self.evm_inquirer.chain_name}.modules'
-        self.chain_modules_prefix_length = len(self.chain_modules_root)
         self.dbevmtx = dbevmtx_class(self.database)
         self.dbevents = DBHistoryEvents(self.database)
         self.base = base_tools
-        self.rules = DecodingRules(
-            address_mappings={},
-            event_rules=[
-                self._maybe_decode_erc20_approve,
-                self._maybe_decode_erc20_721_transfer,
-            ],
-            input_data_rules={},
-            token_enricher_rules=[],
-            post_decoding_rules={},
-            all_counterparties=set(self.misc_counterparties),
-            addresses_to_counterparties={},
-        )
-        self.rules.event_rules.extend(event_rules)
+        self.event_rules = event_rules
         self.value_asset = value_asset
-        self.decoders: dict[str, DecoderInterface] = {}
-
-        # Add the built-in decoders
-        self._add_builtin_decoders(self.rules)
-        # Recursively check all submodules to get all decoder address mappings and rules
-        self.rules += self._recursively_initialize_decoders(self.chain_modules_root)
+        # The decoders and their rules are only initialized when first needed
+        self._decoders: dict[str, DecoderInterface] = {}
+        self._rules: Optional[DecodingRules] = None
+        self.decoders_lock = Semaphore()
         self.undecoded_tx_query_lock = Semaphore()
 
+    @property
+    def rules(self) -> DecodingRules:
+        """The decoding rules of all decoders of the chain"""
+        if self._rules is None:
+            return self._initialize_decoders()
+        return self._rules
+
+    @property
+    def decoders(self) -> dict[str, 'DecoderInterface']:
+        """All decoders of the chain by their class name without the Decoder suffix"""
+        if self._rules is None:
+            self._initialize_decoders()
+        return self._decoders
+
+    def _initialize_decoders(self) -> DecodingRules:
+        """Imports and initializes the built-in decoders and the decoders of the chain's
+        modules and gathers their rules. Happens once, at the first access of the rules or
+        the decoders, so that logging in does not wait for it.
+
+        The decoder modules are found in the manifest generated at release time by
+        tools/scripts/generate_decoders_manifest.py so that the packages of the chain's
+        modules don't need to be walked. A chain missing from it is walked instead.
+        """
+        with self.decoders_lock:
+            if self._rules is not None:
+                return self._rules  # initialized by another greenlet while waiting
+
+            self._decoders = {}
+            rules = DecodingRules(
+                address_mappings={},
+                event_rules=[
+                    self._maybe_decode_erc20_approve,
+                    self._maybe_decode_erc20_721_transfer,
+                ],
+                input_data_rules={},
+                token_enricher_rules=[],
+                post_decoding_rules={},
+                all_counterparties=set(self.misc_counterparties),
+                addresses_to_counterparties={},
+            )
+            rules.event_rules.extend(self.event_rules)
+            self._add_builtin_decoders(rules)
+            decoder_modules: 'Sequence[tuple[str, str]]'
+            if self.evm_inquirer.chain_name in DECODER_MODULES:
+                decoder_modules = DECODER_MODULES[self.evm_inquirer.chain_name]
+            else:
+                decoder_modules = walk_decoder_modules(self.chain_modules_root)
+
+            for class_name, module_name in decoder_modules:
+                self._add_single_decoder(
+                    class_name=class_name,
+                    decoder_class=getattr(importlib.import_module(module_name), f'{class_name}Decoder'),  # noqa: E501
+                    rules=rules,
+                )
+
+            self._rules = rules
+            return rules
+
     def _add_builtin_decoders(self, rules: DecodingRules) -> None:
         """Adds decoders that should be built-in for every EVM decoding run
 
@@ -187,11 +267,11 @@ class EVMTransactionDecoder(metaclass=ABCMeta):
         """Initialize a single decoder, add it to the set of decoders to use
         and append its rules to the pased rules
         """
-        if class_name in self.decoders:
+        if class_name in self._decoders:
             raise ModuleLoadingError(f'{self.evm_inquirer.chain_name} decoder with name {class_name} already loaded')  # noqa: E501
 
         try:  # not giving kwargs since, kwargs name can differ
-            self.decoders[class_name] = decoder_class(
+            decoder = self._decoders[class_name] = decoder_class(
                 self.evm_inquirer,  # evm_inquirer
                 self.base,  # base_tools
                 self.msg_aggregator,  # msg_aggregator
@@ -203,9 +283,9 @@ class EVMTransactionDecoder(metaclass=ABCMeta):
             )
             return
 
-        new_input_data_rules = self.decoders[class_name].decoding_by_input_data()
-        new_address_to_decoders = self.decoders[class_name].addresses_to_decoders()
-        new_address_to_counterparties = self.decoders[class_name].addresses_to_counterparties()
+        new_input_data_rules = decoder.decoding_by_input_data()
+        new_address_to_decoders = decoder.addresses_to_decoders()
+        new_address_to_counterparties = decoder.addresses_to_counterparties()
 
         if __debug__:  # sanity checks for now only in debug as decoders are constant
             for new_struct, main_struct, type_name in (
@@ -216,55 +296,13 @@ class EVMTransactionDecoder(metaclass=ABCMeta):
                 self.assert_keys_are_unique(new_struct=new_struct, main_struct=main_struct, class_name=class_name, type_name=type_name)  # type: ignore  # not sure why it happens. Bug? # noqa: E501
 
         rules.address_mappings.update(new_address_to_decoders)
-        rules.event_rules.extend(self.decoders[class_name].decoding_rules())
+        rules.event_rules.extend(decoder.decoding_rules())
         rules.input_data_rules.update(new_input_data_rules)
-        rules.token_enricher_rules.extend(self.decoders[class_name].enricher_rules())
-        rules.post_decoding_rules.update(self.decoders[class_name].post_decoding_rules())
-        rules.all_counterparties.update(self.decoders[class_name].counterparties())
+        rules.token_enricher_rules.extend(decoder.enricher_rules())
+        rules.post_decoding_rules.update(decoder.post_decoding_rules())
+        rules.all_counterparties.update(decoder.counterparties())
         rules.addresses_to_counterparties.update(new_address_to_counterparties)
-        self._chain_specific_decoder_initialization(self.decoders[class_name])
-
-    def _recursively_initialize_decoders(
-            self,
-            package: Union[str, ModuleType],
-    ) -> DecodingRules:
-        if isinstance(package, str):
-            package = importlib.import_module(package)
-
-        rules = DecodingRules(
-            address_mappings={},
-            event_rules=[],
-            input_data_rules={},
-            token_enricher_rules=[],
-            post_decoding_rules={},
-            all_counterparties=set(),
-            addresses_to_counterparties={},
-        )
-
-        for _, name, is_pkg in pkgutil.walk_packages(package.__path__):
-            full_name = package.__name__ + '.' + name
-            if full_name == __name__ or is_pkg is False:
-                continue  # skip
-
-            submodule = None
-            with suppress(ModuleNotFoundError):
-                submodule = importlib.import_module(full_name + '.decoder')
-
-            if submodule is not None:
-                # take module name, transform it and find decoder if exists
-                class_name = full_name[self.chain_modules_prefix_length:].translate({ord('.'): None})  # noqa: E501
-                parts = class_name.split('_')
-                class_name = ''.join([x.capitalize() for x in parts])
-                submodule_decoder = getattr(submodule, f'{class_name}Decoder', None)
-
-                if submodule_decoder:
-                    self._add_single_decoder(class_name=class_name, decoder_class=submodule_decoder, rules=rules)  # noqa: E501
-
-            if is_pkg:
-                recursive_results = self._recursively_initialize_decoders(full_name)
-                rules += recursive_results
-
-        return rules
+        self._chain_specific_decoder_initialization(decoder)
 
     def get_decoders_products(self) -> dict[str, list[EvmProduct]]:
         """Get the list of possible products"""
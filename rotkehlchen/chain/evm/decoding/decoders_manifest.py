@@ -0,0 +1,76 @@
+# This file contains the decoder modules of each evm chain and it should not be touched manually but only generated by tools/scripts/generate_decoders_manifest.py
+# Created at 2026-10-19 11:20:37 UTC with rotki version 1.31.0 by rotki
+
+# chain name -> (class name without the Decoder suffix, decoder module) of each decoder
+DECODER_MODULES: dict[str, tuple[tuple[str, str], ...]] = {
+    'ethereum': (
+        ('Aavev1', 'rotkehlchen.chain.ethereum.modules.aave.v1.decoder'),
+        ('Aavev2', 'rotkehlchen.chain.ethereum.modules.aave.v2.decoder'),
+        ('Airdrops', 'rotkehlchen.chain.ethereum.modules.airdrops.decoder'),
+        ('ArbitrumOneBridge', 'rotkehlchen.chain.ethereum.modules.arbitrum_one_bridge.decoder'),
+        ('Balancerv1', 'rotkehlchen.chain.ethereum.modules.balancer.v1.decoder'),
+        ('Balancerv2', 'rotkehlchen.chain.ethereum.modules.balancer.v2.decoder'),
+        ('BaseBridge', 'rotkehlchen.chain.ethereum.modules.base_bridge.decoder'),
+        ('Compound', 'rotkehlchen.chain.ethereum.modules.compound.decoder'),
+        ('Convex', 'rotkehlchen.chain.ethereum.modules.convex.decoder'),
+        ('Cowswap', 'rotkehlchen.chain.ethereum.modules.cowswap.decoder'),
+        ('Curve', 'rotkehlchen.chain.ethereum.modules.curve.decoder'),
+        ('Diva', 'rotkehlchen.chain.ethereum.modules.diva.decoder'),
+        ('Dxdaomesa', 'rotkehlchen.chain.ethereum.modules.dxdaomesa.decoder'),
+        ('Ens', 'rotkehlchen.chain.ethereum.modules.ens.decoder'),
+        ('Eth2', 'rotkehlchen.chain.ethereum.modules.eth2.decoder'),
+        ('Gitcoin', 'rotkehlchen.chain.ethereum.modules.gitcoin.decoder'),
+        ('Gitcoinv2', 'rotkehlchen.chain.ethereum.modules.gitcoinv2.decoder'),
+        ('Golem', 'rotkehlchen.chain.ethereum.modules.golem.decoder'),
+        ('Hop', 'rotkehlchen.chain.ethereum.modules.hop.decoder'),
+        ('Kyber', 'rotkehlchen.chain.ethereum.modules.kyber.decoder'),
+        ('Liquity', 'rotkehlchen.chain.ethereum.modules.liquity.decoder'),
+        ('Lockedgno', 'rotkehlchen.chain.ethereum.modules.lockedgno.decoder'),
+        ('Makerdao', 'rotkehlchen.chain.ethereum.modules.makerdao.decoder'),
+        ('Makerdaosai', 'rotkehlchen.chain.ethereum.modules.makerdao.sai.decoder'),
+        ('Octant', 'rotkehlchen.chain.ethereum.modules.octant.decoder'),
+        ('Oneinchv1', 'rotkehlchen.chain.ethereum.modules.oneinch.v1.decoder'),
+        ('Oneinchv2', 'rotkehlchen.chain.ethereum.modules.oneinch.v2.decoder'),
+        ('Oneinchv4', 'rotkehlchen.chain.ethereum.modules.oneinch.v4.decoder'),
+        ('OptimismBridge', 'rotkehlchen.chain.ethereum.modules.optimism_bridge.decoder'),
+        ('PickleFinance', 'rotkehlchen.chain.ethereum.modules.pickle_finance.decoder'),
+        ('Polygon', 'rotkehlchen.chain.ethereum.modules.polygon.decoder'),
+        ('Stakedao', 'rotkehlchen.chain.ethereum.modules.stakedao.decoder'),
+        ('Sushiswap', 'rotkehlchen.chain.ethereum.modules.sushiswap.decoder'),
+        ('Thegraph', 'rotkehlchen.chain.ethereum.modules.thegraph.decoder'),
+        ('Uniswapv1', 'rotkehlchen.chain.ethereum.modules.uniswap.v1.decoder'),
+        ('Uniswapv2', 'rotkehlchen.chain.ethereum.modules.uniswap.v2.decoder'),
+        ('Uniswapv3', 'rotkehlchen.chain.ethereum.modules.uniswap.v3.decoder'),
+        ('Votium', 'rotkehlchen.chain.ethereum.modules.votium.decoder'),
+        ('Weth', 'rotkehlchen.chain.ethereum.modules.weth.decoder'),
+        ('XdaiBridge', 'rotkehlchen.chain.ethereum.modules.xdai_bridge.decoder'),
+        ('Yearn', 'rotkehlchen.chain.ethereum.modules.yearn.decoder'),
+        ('Zksync', 'rotkehlchen.chain.ethereum.modules.zksync.decoder'),
+    ),
+    'optimism': (
+        ('Airdrops', 'rotkehlchen.chain.optimism.modules.airdrops.decoder'),
+        ('Gitcoin', 'rotkehlchen.chain.optimism.modules.gitcoin.decoder'),
+        ('Hop', 'rotkehlchen.chain.optimism.modules.hop.decoder'),
+        ('Oneinchv4', 'rotkehlchen.chain.optimism.modules.oneinch.v4.decoder'),
+        ('Optimism', 'rotkehlchen.chain.optimism.modules.optimism.decoder'),
+        ('OptimismBridge', 'rotkehlchen.chain.optimism.modules.optimism_bridge.decoder'),
+        ('OptimismGovernor', 'rotkehlchen.chain.optimism.modules.optimism_governor.decoder'),
+        ('Velodrome', 'rotkehlchen.chain.optimism.modules.velodrome.decoder'),
+    ),
+    'polygon_pos': (
+        ('Oneinchv4', 'rotkehlchen.chain.polygon_pos.modules.oneinch.v4.decoder'),
+    ),
+    'arbitrum_one': (
+        ('Airdrops', 'rotkehlchen.chain.arbitrum_one.modules.airdrops.decoder'),
+        ('ArbitrumOneBridge', 'rotkehlchen.chain.arbitrum_one.modules.arbitrum_one_bridge.decoder'),
+        ('Oneinchv4', 'rotkehlchen.chain.arbitrum_one.modules.oneinch.v4.decoder'),
+    ),
+    'base': (
+    ),
+    'gnosis': (
+        ('Airdrops', 'rotkehlchen.chain.gnosis.modules.airdrops.decoder'),
+        ('Cowswap', 'rotkehlchen.chain.gnosis.modules.cowswap.decoder'),
+        ('Oneinchv4', 'rotkehlchen.chain.gnosis.modules.oneinch.v4.decoder'),
+        ('XdaiBridge', 'rotkehlchen.chain.gnosis.modules.xdai_bridge.decoder'),
+    ),
+}
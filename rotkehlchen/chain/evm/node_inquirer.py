@@ -12,6 +12,7 @@ import requests
 from ens import ENS
 from eth_abi.exceptions import InsufficientDataBytes
 from eth_typing import BlockNumber
+from gevent.pool import Pool
 from requests import RequestException
 from web3 import HTTPProvider, Web3
 from web3._utils.abi import get_abi_output_types
@@ -32,11 +33,14 @@ from rotkehlchen.chain.constants import DEFAULT_EVM_RPC_TIMEOUT
 from rotkehlchen.chain.ethereum.constants import DEFAULT_TOKEN_DECIMALS
 from rotkehlchen.chain.ethereum.utils import MULTICALL_CHUNKS, should_update_protocol_cache
 from rotkehlchen.chain.evm.constants import (
+    DEFAULT_MULTICALL_CONCURRENCY,
     ERC20_PROPERTIES,
     ERC20_PROPERTIES_NUM,
     ERC721_PROPERTIES,
     FAKE_GENESIS_TX_RECEIPT,
     GENESIS_HASH,
+    MULTICALL_CHUNK_GROWTH_SUCCESSES,
+    MULTICALL_CHUNK_SIZE_ERRORS,
 )
 from rotkehlchen.chain.evm.contracts import EvmContract, EvmContracts
 from rotkehlchen.chain.evm.proxies_inquirer import EvmProxiesInquirer
@@ -107,6 +111,15 @@ def _is_synchronized(current_block: int, latest_block: int) -> tuple[bool, str]:
     return True, message
 
 
+def _is_multicall_size_error(error: Exception) -> bool:
+    """Check if an error returned by a node means that the multicall chunk was too big"""
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None and error.response.status_code == 413:  # noqa: E501
+        return True
+
+    msg = str(error).lower()
+    return any(fragment in msg for fragment in MULTICALL_CHUNK_SIZE_ERRORS)
+
+
 WEB3_LOGQUERY_BLOCK_RANGE = 250000
 
 
@@ -209,6 +222,7 @@ class EvmNodeInquirer(metaclass=ABCMeta):
             contract_multicall: 'EvmContract',
             native_token: CryptoAsset,
             rpc_timeout: int = DEFAULT_EVM_RPC_TIMEOUT,
+            multicall_concurrency: int = DEFAULT_MULTICALL_CONCURRENCY,
     ) -> None:
         self.greenlet_manager = greenlet_manager
         self.database = database
@@ -226,6 +240,11 @@ class EvmNodeInquirer(metaclass=ABCMeta):
         self.contract_scan = contract_scan
         # Multicall from MakerDAO: https://github.com/makerdao/multicall/
         self.contract_multicall = contract_multicall
+        # How many multicall chunks can be queried concurrently. 1 means sequentially
+        self.multicall_concurrency = multicall_concurrency
+        # Multicall chunk size learned per node name and consecutive successes at that size
+        self.multicall_chunk_sizes: dict[str, int] = {}
+        self.multicall_chunk_successes: dict[str, int] = {}
 
         # A cache for erc20 and erc721 contract info to not requery the info
         self.contract_info_erc20_cache: LRUCacheWithRemove[ChecksumEvmAddress, dict[str, Any]] = LRUCacheWithRemove(maxsize=1024)  # noqa: E501
@@ -1071,21 +1090,119 @@ class EvmNodeInquirer(metaclass=ABCMeta):
     ) -> Any:
         """Uses MULTICALL contract. Failure of one call is a failure of the entire multicall.
         source: https://etherscan.io/address/0xeefBa1e63905eF1D7ACbA5a8513c70307C1cE441#code
+
+        The calls are split in chunks of at most `calls_chunk_size` (or less if a smaller
+        size has been learned for the first node of the call order) and up to
+        `multicall_concurrency` chunks are queried at the same time. The order of the
+        output always follows the order of the given calls.
+
         Can raise:
         - RemoteError
         """
-        calls_chunked = list(get_chunks(calls, n=calls_chunk_size))
-        output = []
-        for call_chunk in calls_chunked:
-            multicall_result = self.contract_multicall.call(
-                node_inquirer=self,
-                method_name='aggregate',
-                arguments=[call_chunk],
+        call_order = call_order if call_order is not None else self.default_call_order()
+        chunk_size = calls_chunk_size
+        for weighted_node in call_order:
+            node_name = weighted_node.node_info.name
+            if weighted_node.node_info in self.web3_mapping or node_name == self.etherscan_node_name:  # noqa: E501
+                chunk_size = min(chunk_size, self.multicall_chunk_sizes.get(node_name, chunk_size))
+                break
+
+        def query_chunk(call_chunk: list[tuple[ChecksumEvmAddress, str]]) -> list[bytes]:
+            return self._query(
+                method=self._multicall_chunk,
                 call_order=call_order,
+                calls=call_chunk,
                 block_identifier=block_identifier,
+                max_chunk_size=calls_chunk_size,
             )
-            _, chunk_output = multicall_result
+
+        calls_chunked = list(get_chunks(calls, n=chunk_size))
+        if self.multicall_concurrency <= 1 or len(calls_chunked) <= 1:
+            chunk_outputs = [query_chunk(call_chunk) for call_chunk in calls_chunked]
+        else:  # Pool.map keeps the order of the chunks and reraises the first failure
+            pool = Pool(size=self.multicall_concurrency)
+            chunk_outputs = pool.map(query_chunk, calls_chunked)
+
+        output = []
+        for chunk_output in chunk_outputs:
+            output += chunk_output
+        return output
+
+    def _multicall_node_name(self, web3: Optional[Web3]) -> str:
+        """Returns the name of the node the given web3 instance belongs to"""
+        if web3 is not None:
+            for node, web3node in self.web3_mapping.items():
+                if web3node.web3_instance is web3:
+                    return node.name
+
+        return self.etherscan_node_name
+
+    def _multicall_chunk(
+            self,
+            web3: Optional[Web3],
+            calls: list[tuple[ChecksumEvmAddress, str]],
+            block_identifier: BlockIdentifier,
+            max_chunk_size: int,
+    ) -> list[bytes]:
+        """Queries the aggregate method of the multicall contract for the given calls.
+
+        If the node complains that the request is too big (out of gas, response or
+        request size errors) the chunk size is halved and the remaining calls are retried
+        in smaller chunks. The learned size is remembered for the node and is doubled
+        again after consecutive successful chunks, as long as it is below `max_chunk_size`.
+
+        May raise:
+        - RemoteError if etherscan is used and there is a problem with
+        reaching it or with the returned result
+        - BlockchainQueryError if web3 is used and there is a VM execution error
+        """
+        node_name = self._multicall_node_name(web3)
+        output: list[bytes] = []
+        idx = 0
+        while idx < len(calls):
+            # read the learned size on every iteration since concurrent chunks may change it
+            chunk_size = min(self.multicall_chunk_sizes.get(node_name, max_chunk_size), max_chunk_size)  # noqa: E501
+            call_chunk = calls[idx:idx + chunk_size]
+            try:
+                _, chunk_output = self._call_contract(
+                    web3=web3,
+                    contract_address=self.contract_multicall.address,
+                    abi=self.contract_multicall.abi,
+                    method_name='aggregate',
+                    arguments=[call_chunk],
+                    block_identifier=block_identifier,
+                )
+            except (RemoteError, BlockchainQueryError, requests.exceptions.RequestException) as e:
+                if len(call_chunk) == 1 or _is_multicall_size_error(e) is False:
+                    raise
+
+                self.multicall_chunk_sizes[node_name] = min(
+                    self.multicall_chunk_sizes.get(node_name, max_chunk_size),
+                    len(call_chunk) // 2,
+                )
+                self.multicall_chunk_successes[node_name] = 0
+                log.debug(
+                    f'Multicall chunk of {len(call_chunk)} calls was too big for '
+                    f'{self.chain_name} node {node_name}. Retrying with '
+                    f'{self.multicall_chunk_sizes[node_name]}',
+                )
+                continue
+
             output += chunk_output
+            idx += len(call_chunk)
+            if (
+                (learned_size := self.multicall_chunk_sizes.get(node_name)) is None or
+                learned_size >= max_chunk_size or
+                len(call_chunk) < learned_size
+            ):
+                continue  # only full chunks at a reduced size count towards growing it
+
+            successes = self.multicall_chunk_successes.get(node_name, 0) + 1
+            if successes >= MULTICALL_CHUNK_GROWTH_SUCCESSES:
+                self.multicall_chunk_sizes[node_name] = learned_size * 2
+                successes = 0
+            self.multicall_chunk_successes[node_name] = successes
+
         return output
 
     def multicall_2(
@@ -1417,6 +1534,7 @@ class EvmNodeInquirerWithDSProxy(EvmNodeInquirer):
             dsproxy_registry: 'EvmContract',
             native_token: CryptoAsset,
             rpc_timeout: int = DEFAULT_EVM_RPC_TIMEOUT,
+            multicall_concurrency: int = DEFAULT_MULTICALL_CONCURRENCY,
     ) -> None:
         super().__init__(
             greenlet_manager=greenlet_manager,
@@ -1429,6 +1547,7 @@ class EvmNodeInquirerWithDSProxy(EvmNodeInquirer):
             contract_scan=contract_scan,
             contract_multicall=contract_multicall,
             rpc_timeout=rpc_timeout,
+            multicall_concurrency=multicall_concurrency,
             native_token=native_token,
         )
         self.proxies_inquirer = EvmProxiesInquirer(
@@ -1500,6 +1619,7 @@ class DSProxyInquirerWithCacheData(EvmNodeInquirerWithDSProxy, UpdatableCacheDat
             dsproxy_registry: 'EvmContract',
             native_token: CryptoAsset,
             rpc_timeout: int = DEFAULT_EVM_RPC_TIMEOUT,
+            multicall_concurrency: int = DEFAULT_MULTICALL_CONCURRENCY,
     ) -> None:
         UpdatableCacheDataMixin.__init__(self, database)
         super().__init__(
@@ -1513,6 +1633,7 @@ class DSProxyInquirerWithCacheData(EvmNodeInquirerWithDSProxy, UpdatableCacheDat
             contract_scan=contract_scan,
             contract_multicall=contract_multicall,
             rpc_timeout=rpc_timeout,
+            multicall_concurrency=multicall_concurrency,
             native_token=native_token,
             dsproxy_registry=dsproxy_registry,
         )
@@ -38,6 +38,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+# How many queried receipts to store in the DB in one write
+RECEIPTS_WRITE_BATCH_SIZE = 50
+
 
 class EvmTransactions(metaclass=ABCMeta):  # noqa: B024
 
@@ -671,6 +674,7 @@ class EvmTransactions(metaclass=ABCMeta):  # noqa: B024
             if len(hash_results) == 0:
                 return  # nothing to do
 
+            receipts_data: list[dict[str, Any]] = []
             for entry in hash_results:
                 try:
                     tx_receipt_data = self.evm_inquirer.get_transaction_receipt(tx_hash=entry)
@@ -678,17 +682,36 @@ class EvmTransactions(metaclass=ABCMeta):  # noqa: B024
                     self.msg_aggregator.add_warning(f'Failed to query information for {self.evm_inquirer.chain_name} transaction {entry.hex()} due to {e!s}. Skipping...')  # noqa: E501
                     continue
 
-                try:
-                    with self.database.user_write() as write_cursor:
-                        self.dbevmtx.add_receipt_data(
-                            write_cursor=write_cursor,
-                            chain_id=self.evm_inquirer.chain_id,
-                            data=tx_receipt_data,
-                        )
-                except sqlcipher.IntegrityError as e:  # pylint: disable=no-member
-                    if 'UNIQUE constraint failed: evmtx_receipts.tx_id' not in str(e):
-                        log.error(f'Failed to store transaction {entry.hex()} receipt due to {e!s}')  # noqa: E501
-                        raise  # if receipt is already added by other greenlet it's fine
+                receipts_data.append(tx_receipt_data)
+                if len(receipts_data) == RECEIPTS_WRITE_BATCH_SIZE:
+                    self._add_receipts_data(receipts_data)
+                    receipts_data = []
+
+            self._add_receipts_data(receipts_data)
+
+    def _add_receipts_data(self, receipts_data: list[dict[str, Any]]) -> None:
+        """Stores the given receipts in the DB in one write. If some of them were already
+        added by another greenlet in the meantime they are stored one by one skipping those"""
+        if len(receipts_data) == 0:
+            return
+
+        try:
+            with self.database.user_write() as write_cursor:
+                self.dbevmtx.add_receipts_data(
+                    write_cursor=write_cursor,
+                    chain_id=self.evm_inquirer.chain_id,
+                    receipts_data=receipts_data,
+                )
+        except sqlcipher.IntegrityError as e:  # pylint: disable=no-member
+            if 'UNIQUE constraint failed: evmtx_receipts.tx_id' not in str(e):
+                log.error(f'Failed to store {self.evm_inquirer.chain_name} transaction receipts due to {e!s}')  # noqa: E501
+                raise
+
+            if len(receipts_data) == 1:
+                return  # receipt was already added by another greenlet which is fine
+
+            for tx_receipt_data in receipts_data:  # find which ones are missing
+                self._add_receipts_data([tx_receipt_data])
 
     def add_transaction_by_hash(
             self,
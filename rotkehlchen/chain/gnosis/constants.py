@@ -4,6 +4,8 @@ from rotkehlchen.fval import FVal
 from rotkehlchen.types import SupportedBlockchain, Timestamp, deserialize_evm_tx_hash
 
 GNOSIS_ETHERSCAN_NODE_NAME = 'gnosis etherscan'
+# Number of multicall chunks queried at the same time from gnosis nodes
+GNOSIS_MULTICALL_CONCURRENCY = 4
 GNOSIS_GENESIS = Timestamp(1539024185)
 GNOSIS_ETHERSCAN_NODE = WeightedNode(
     node_info=NodeName(
@@ -19,6 +19,7 @@ from .constants import (
     ARCHIVE_NODE_CHECK_EXPECTED_BALANCE,
     GNOSIS_ETHERSCAN_NODE,
     GNOSIS_ETHERSCAN_NODE_NAME,
+    GNOSIS_MULTICALL_CONCURRENCY,
     PRUNED_NODE_CHECK_TX_HASH,
 )
 from .etherscan import GnosisEtherscan
@@ -37,6 +38,7 @@ class GnosisInquirer(EvmNodeInquirer):
             greenlet_manager: GreenletManager,
             database: 'DBHandler',
             rpc_timeout: int = DEFAULT_EVM_RPC_TIMEOUT,
+            multicall_concurrency: int = GNOSIS_MULTICALL_CONCURRENCY,
     ) -> None:
         etherscan = GnosisEtherscan(
             database=database,
@@ -52,6 +54,7 @@ class GnosisInquirer(EvmNodeInquirer):
             etherscan_node_name=GNOSIS_ETHERSCAN_NODE_NAME,
             contracts=contracts,
             rpc_timeout=rpc_timeout,
+            multicall_concurrency=multicall_concurrency,
             contract_multicall=contracts.contract(string_to_evm_address('0xcA11bde05977b3631167028862bE2a173976CA11')),
             contract_scan=contracts.contract(string_to_evm_address('0x571C62a1c863aEAD01c1d34D8cB3Ee2c6f938800')),
             native_token=A_XDAI.resolve_to_crypto_asset(),
@@ -0,0 +1,64 @@
+import logging
+import time
+from collections.abc import Callable
+from typing import Any, Generic, Optional, TypeVar
+
+from gevent.lock import Semaphore
+
+from rotkehlchen.logging import RotkehlchenLogsAdapter
+from rotkehlchen.types import SupportedBlockchain
+
+logger = logging.getLogger(__name__)
+log = RotkehlchenLogsAdapter(logger)
+
+T = TypeVar('T')
+
+
+class LazyChainManager(Generic[T]):
+    """Stands in for the manager of a chain and only constructs it the first time any of
+    its attributes is used, so that the managers of chains the user has no accounts on
+    don't have to be built at login.
+
+    Writes and deletes of attributes also go to the constructed manager so that patching
+    an attribute of the proxy patches the manager itself.
+    """
+    __slots__ = ('_blockchain', '_factory', '_lock', '_manager')
+
+    def __init__(self, blockchain: SupportedBlockchain, factory: Callable[[], T]) -> None:
+        object.__setattr__(self, '_blockchain', blockchain)
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_lock', Semaphore())
+        object.__setattr__(self, '_manager', None)
+
+    def initialize_manager(self) -> T:
+        """Constructs the manager if it was not constructed yet and returns it"""
+        manager: Optional[T] = self._manager
+        if manager is not None:
+            return manager
+
+        with self._lock:  # constructing the manager may switch greenlets
+            if (manager := self._manager) is None:
+                start = time.perf_counter()
+                manager = self._factory()
+                object.__setattr__(self, '_manager', manager)
+                log.debug(
+                    f'Initialized the {self._blockchain!s} manager in '
+                    f'{time.perf_counter() - start:.3f} seconds',
+                )
+
+        return manager
+
+    def manager_is_initialized(self) -> bool:
+        return self._manager is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.initialize_manager(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.initialize_manager(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self.initialize_manager(), name)
+
+    def __repr__(self) -> str:
+        return f'LazyChainManager({self._blockchain!s}, initialized={self.manager_is_initialized()})'  # noqa: E501
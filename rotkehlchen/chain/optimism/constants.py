@@ -4,6 +4,8 @@ from rotkehlchen.fval import FVal
 from rotkehlchen.types import SupportedBlockchain, Timestamp, deserialize_evm_tx_hash
 
 OPTIMISM_ETHERSCAN_NODE_NAME = 'optimism etherscan'
+# Number of multicall chunks queried at the same time from optimism nodes
+OPTIMISM_MULTICALL_CONCURRENCY = 4
 OPTIMISM_GENESIS = Timestamp(1636666246)
 OPTIMISM_ETHERSCAN_NODE = WeightedNode(
     node_info=NodeName(
@@ -21,6 +21,7 @@ from .constants import (
     ARCHIVE_NODE_CHECK_EXPECTED_BALANCE,
     OPTIMISM_ETHERSCAN_NODE,
     OPTIMISM_ETHERSCAN_NODE_NAME,
+    OPTIMISM_MULTICALL_CONCURRENCY,
     PRUNED_NODE_CHECK_TX_HASH,
 )
 from .etherscan import OptimismEtherscan
@@ -39,6 +40,7 @@ class OptimismInquirer(DSProxyOptimismSuperchainInquirerWithCacheData):
             greenlet_manager: GreenletManager,
             database: 'DBHandler',
             rpc_timeout: int = DEFAULT_EVM_RPC_TIMEOUT,
+            multicall_concurrency: int = OPTIMISM_MULTICALL_CONCURRENCY,
     ) -> None:
         etherscan = OptimismEtherscan(
             database=database,
@@ -54,6 +56,7 @@ class OptimismInquirer(DSProxyOptimismSuperchainInquirerWithCacheData):
             etherscan_node_name=OPTIMISM_ETHERSCAN_NODE_NAME,
             contracts=contracts,
             rpc_timeout=rpc_timeout,
+            multicall_concurrency=multicall_concurrency,
             contract_multicall=contracts.contract(string_to_evm_address('0x2DC0E2aa608532Da689e89e237dF582B783E552C')),
             contract_scan=contracts.contract(string_to_evm_address('0x1e21bc42FaF802A0F115dC998e2F0d522aDb1F68')),
             dsproxy_registry=contracts.contract(string_to_evm_address('0x283Cc5C26e53D66ed2Ea252D986F094B37E6e895')),
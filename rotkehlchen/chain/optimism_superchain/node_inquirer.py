@@ -39,6 +39,7 @@ class OptimismSuperchainInquirer(EvmNodeInquirer, metaclass=ABCMeta):
             etherscan_node_name: str,
             contracts: EvmContracts,
             rpc_timeout: int,
+            multicall_concurrency: int,
             contract_scan: 'EvmContract',
             contract_multicall: 'EvmContract',
             native_token: CryptoAsset,
@@ -52,6 +53,7 @@ class OptimismSuperchainInquirer(EvmNodeInquirer, metaclass=ABCMeta):
             etherscan_node_name=etherscan_node_name,
             contracts=contracts,
             rpc_timeout=rpc_timeout,
+            multicall_concurrency=multicall_concurrency,
             contract_multicall=contract_multicall,
             contract_scan=contract_scan,
             native_token=native_token,
@@ -83,6 +85,7 @@ class DSProxyOptimismSuperchainInquirerWithCacheData(OptimismSuperchainInquirer,
             etherscan_node_name: str,
             contracts: EvmContracts,
             rpc_timeout: int,
+            multicall_concurrency: int,
             contract_scan: 'EvmContract',
             contract_multicall: 'EvmContract',
             dsproxy_registry: 'EvmContract',
@@ -98,6 +101,7 @@ class DSProxyOptimismSuperchainInquirerWithCacheData(OptimismSuperchainInquirer,
             etherscan_node_name=etherscan_node_name,
             contracts=contracts,
             rpc_timeout=rpc_timeout,
+            multicall_concurrency=multicall_concurrency,
             contract_multicall=contract_multicall,
             contract_scan=contract_scan,
             native_token=native_token,
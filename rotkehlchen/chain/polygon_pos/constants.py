@@ -4,6 +4,8 @@ from rotkehlchen.fval import FVal
 from rotkehlchen.types import SupportedBlockchain, Timestamp, deserialize_evm_tx_hash
 
 POLYGON_POS_ETHERSCAN_NODE_NAME = 'polygon pos etherscan'
+# Number of multicall chunks queried at the same time from polygon pos nodes
+POLYGON_POS_MULTICALL_CONCURRENCY = 4
 POLYGON_POS_GENESIS = Timestamp(1590824836)
 POLYGON_POS_ETHERSCAN_NODE = WeightedNode(
     node_info=NodeName(
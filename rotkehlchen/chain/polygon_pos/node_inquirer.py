@@ -19,6 +19,7 @@ from .constants import (
     ARCHIVE_NODE_CHECK_EXPECTED_BALANCE,
     POLYGON_POS_ETHERSCAN_NODE,
     POLYGON_POS_ETHERSCAN_NODE_NAME,
+    POLYGON_POS_MULTICALL_CONCURRENCY,
     PRUNED_NODE_CHECK_TX_HASH,
 )
 from .etherscan import PolygonPOSEtherscan
@@ -37,6 +38,7 @@ class PolygonPOSInquirer(EvmNodeInquirer):
             greenlet_manager: GreenletManager,
             database: 'DBHandler',
             rpc_timeout: int = DEFAULT_EVM_RPC_TIMEOUT,
+            multicall_concurrency: int = POLYGON_POS_MULTICALL_CONCURRENCY,
     ) -> None:
         etherscan = PolygonPOSEtherscan(
             database=database,
@@ -52,6 +54,7 @@ class PolygonPOSInquirer(EvmNodeInquirer):
             etherscan_node_name=POLYGON_POS_ETHERSCAN_NODE_NAME,
             contracts=contracts,
             rpc_timeout=rpc_timeout,
+            multicall_concurrency=multicall_concurrency,
             contract_multicall=contracts.contract(string_to_evm_address('0x275617327c958bD06b5D6b871E7f491D76113dd8')),
             contract_scan=contracts.contract(string_to_evm_address('0x2aB513B211C801673758D1C32815605B5289ad29')),
             native_token=A_POLYGON_POS_MATIC.resolve_to_crypto_asset(),
@@ -18,4 +18,5 @@ ENS_UPDATE_INTERVAL = DAY_IN_SECONDS
 ETH_PROTOCOLS_CACHE_REFRESH = DAY_IN_SECONDS * 3
 DATA_UPDATES_REFRESH = DAY_IN_SECONDS
 EVM_ACCOUNTS_DETECTION_REFRESH = DAY_IN_SECONDS
+DB_MAINTENANCE_REFRESH = DAY_IN_SECONDS
 ENS_AVATARS_REFRESH = DAY_IN_SECONDS
@@ -10,6 +10,7 @@ from typing import Optional
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.crypto import decrypt, encrypt
 from rotkehlchen.db.dbhandler import DBHandler
+from rotkehlchen.db.profiles import DB_CONNECTION_PROFILES, DEFAULT_DB_PROFILE, DBConnectionProfile
 from rotkehlchen.db.settings import ModifiableDBSettings
 from rotkehlchen.errors.api import AuthenticationError
 from rotkehlchen.errors.misc import SystemPermissionError
@@ -30,12 +31,14 @@ class DataHandler:
             data_directory: Path,
             msg_aggregator: MessagesAggregator,
             sql_vm_instructions_cb: int,
+            connection_profile: DBConnectionProfile = DB_CONNECTION_PROFILES[DEFAULT_DB_PROFILE],
     ):
         self.logged_in = False
         self.data_directory = data_directory
         self.username = 'no_user'
         self.msg_aggregator = msg_aggregator
         self.sql_vm_instructions_cb = sql_vm_instructions_cb
+        self.connection_profile = connection_profile
 
     def logout(self) -> None:
         if self.logged_in:
@@ -115,6 +118,7 @@ class DataHandler:
             initial_settings=initial_settings,
             sql_vm_instructions_cb=self.sql_vm_instructions_cb,
             resume_from_backup=resume_from_backup,
+            connection_profile=self.connection_profile,
         )
         self.user_data_dir = user_data_dir
         self.logged_in = True
@@ -225,6 +229,7 @@ class DataHandler:
         log.info('Decompress and decrypt DB')
         # First make a backup of the DB we are about to replace
         date = timestamp_to_date(ts=ts_now(), formatstr='%Y_%m_%d_%H_%M_%S', treat_as_local=True)
+        self.db.conn.wal_checkpoint()
         shutil.copyfile(
             self.data_directory / self.username / 'rotkehlchen.db',
             self.data_directory / self.username / f'rotkehlchen_db_{date}.backup',
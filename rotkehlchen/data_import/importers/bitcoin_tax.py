@@ -9,7 +9,6 @@ from rotkehlchen.accounting.structures.types import HistoryEventSubType, History
 from rotkehlchen.assets.converters import LOCATION_TO_ASSET_MAPPING, asset_from_common_identifier
 from rotkehlchen.constants import ZERO
 from rotkehlchen.data_import.utils import BaseExchangeImporter, UnsupportedCSVEntry, hash_csv_row
-from rotkehlchen.db.drivers.gevent import DBCursor
 from rotkehlchen.errors.asset import UnknownAsset
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.errors.serialization import DeserializationError
@@ -53,7 +52,6 @@ def determine_csv_type(csv_data: csv.DictReader) -> CSVType:
 class BitcoinTaxImporter(BaseExchangeImporter):
     def _consume_trade_event(
             self,
-            write_cursor: DBCursor,
             csv_row: dict[str, Any],
             event_identifier: str,
             timestamp: TimestampMS,
@@ -108,7 +106,7 @@ class BitcoinTaxImporter(BaseExchangeImporter):
             event_type=HistoryEventType.TRADE,
             event_subtype=HistoryEventSubType.RECEIVE,
         )
-        self.add_history_events(write_cursor, [spend_event, receive_event])
+        self.add_history_events([spend_event, receive_event])
         if fee_asset_balance is not None:
             fee_event = HistoryEvent(
                 event_identifier=event_identifier,
@@ -121,11 +119,10 @@ class BitcoinTaxImporter(BaseExchangeImporter):
                 event_type=HistoryEventType.TRADE,
                 event_subtype=HistoryEventSubType.FEE,
             )
-            self.add_history_events(write_cursor, [fee_event])
+            self.add_history_events([fee_event])
 
     def _consume_income_spending_event(
             self,
-            write_cursor: DBCursor,
             csv_row: dict[str, Any],
             event_identifier: str,
             timestamp: TimestampMS,
@@ -158,7 +155,7 @@ class BitcoinTaxImporter(BaseExchangeImporter):
             event_type=event_type,
             event_subtype=event_subtype,
         )
-        self.add_history_events(write_cursor, [event])
+        self.add_history_events([event])
         if fee_asset_balance is not None:
             fee_event = HistoryEvent(
                 event_identifier=event_identifier,
@@ -171,11 +168,10 @@ class BitcoinTaxImporter(BaseExchangeImporter):
                 event_type=HistoryEventType.SPEND,
                 event_subtype=HistoryEventSubType.FEE,
             )
-            self.add_history_events(write_cursor, [fee_event])
+            self.add_history_events([fee_event])
 
     def _consume_event(
             self,
-            write_cursor: DBCursor,
             csv_row: dict[str, Any],
             csv_type: CSVType,
             timestamp_format: str = '%Y-%m-%d %H:%M:%S %z',
@@ -209,11 +205,11 @@ class BitcoinTaxImporter(BaseExchangeImporter):
                 location = Location.COINBASEPRO
 
         asset_resolver = LOCATION_TO_ASSET_MAPPING.get(location, asset_from_common_identifier)
-        base_asset = asset_resolver(csv_row['Symbol'])
+        base_asset = self.resolve_asset(asset_resolver, csv_row['Symbol'])
         base_asset_amount = deserialize_asset_amount(csv_row['Volume'])
         fee_amount = Fee(deserialize_asset_amount(csv_row['Fee'])) if csv_row['Fee'] else Fee(ZERO)
         fee_asset = (
-            asset_resolver(csv_row['FeeCurrency'])
+            self.resolve_asset(asset_resolver, csv_row['FeeCurrency'])
             if csv_row['FeeCurrency'] and fee_amount is not None else None
         )
         action = csv_row['Action']
@@ -225,11 +221,10 @@ class BitcoinTaxImporter(BaseExchangeImporter):
             fee_asset_balance = AssetBalance(fee_asset, Balance(fee_amount, ZERO))
 
         if csv_type == 'trades':
-            quote_asset = asset_resolver(csv_row['Currency'])
+            quote_asset = self.resolve_asset(asset_resolver, csv_row['Currency'])
             quote_asset_amount = deserialize_asset_amount(csv_row['Cost/Proceeds'])
             quote_asset_balance = AssetBalance(quote_asset, Balance(quote_asset_amount, ZERO))
             self._consume_trade_event(
-                write_cursor=write_cursor,
                 csv_row=csv_row,
                 event_identifier=event_identifier,
                 timestamp=timestamp,
@@ -243,7 +238,6 @@ class BitcoinTaxImporter(BaseExchangeImporter):
             return
         # else
         self._consume_income_spending_event(
-            write_cursor=write_cursor,
             csv_row=csv_row,
             event_identifier=event_identifier,
             timestamp=timestamp,
@@ -254,7 +248,7 @@ class BitcoinTaxImporter(BaseExchangeImporter):
             memo=memo,
         )
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, filepath: Path, **kwargs: Any) -> None:
         """
         May raise:
         - InputError if one of the rows is malformed
@@ -264,7 +258,7 @@ class BitcoinTaxImporter(BaseExchangeImporter):
             csv_type = determine_csv_type(data)
             for _, row in enumerate(data):
                 try:
-                    self._consume_event(write_cursor, row, csv_type, **kwargs)
+                    self._consume_event(row, csv_type, **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During Bitcoin_Tax csv import found action with unknown '
@@ -10,7 +10,6 @@ from rotkehlchen.assets.converters import asset_from_bitstamp
 from rotkehlchen.constants import ZERO
 from rotkehlchen.data_import.importers.constants import BITSTAMP_EVENT_PREFIX
 from rotkehlchen.data_import.utils import BaseExchangeImporter
-from rotkehlchen.db.drivers.gevent import DBCursor
 from rotkehlchen.errors.asset import UnknownAsset
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.serialization.deserialize import (
@@ -25,7 +24,6 @@ from rotkehlchen.utils.misc import ts_sec_to_ms
 class BitstampTransactionsImporter(BaseExchangeImporter):
     def _consume_bitstamp_transaction(
             self,
-            write_cursor: DBCursor,
             csv_row: dict[str, Any],
             timestamp_format: str = '%b. %d, %Y, %I:%M %p',
     ) -> None:
@@ -53,15 +51,15 @@ class BitstampTransactionsImporter(BaseExchangeImporter):
             # if trade_type buy
             bought_amount = deserialize_asset_amount(amount)
             sold_amount = deserialize_asset_amount(value_amount)
-            bought_currency = asset_from_bitstamp(amount_symbol)
-            sold_currency = asset_from_bitstamp(value_symbol)
+            bought_currency = self.resolve_asset(asset_from_bitstamp, amount_symbol)
+            sold_currency = self.resolve_asset(asset_from_bitstamp, value_symbol)
 
             if trade_type == TradeType.SELL:
                 bought_amount, sold_amount = sold_amount, bought_amount
                 sold_currency, bought_currency = bought_currency, sold_currency
 
             fee_amount = deserialize_fee(fee_amount)
-            fee_currency = asset_from_bitstamp(fee_symbol)
+            fee_currency = self.resolve_asset(asset_from_bitstamp, fee_symbol)
             spend_trade_event = HistoryEvent(
                 event_identifier=event_identifier,
                 sequence_index=0,
@@ -104,14 +102,14 @@ class BitstampTransactionsImporter(BaseExchangeImporter):
                 event_type=HistoryEventType.TRADE,
                 event_subtype=HistoryEventSubType.FEE,
             )
-            self.add_history_events(write_cursor, [
+            self.add_history_events([
                 spend_trade_event,
                 receive_trade_event,
                 fee_event,
             ])
         elif csv_row['Type'] in {'Deposit', 'Withdrawal'}:
             amount = deserialize_asset_amount(amount)
-            asset = asset_from_bitstamp(amount_symbol)
+            asset = self.resolve_asset(asset_from_bitstamp, amount_symbol)
             transaction_type = csv_row['Type']
             if transaction_type == 'Deposit':
                 event_type = HistoryEventType.DEPOSIT
@@ -133,9 +131,9 @@ class BitstampTransactionsImporter(BaseExchangeImporter):
                 event_type=event_type,
                 event_subtype=event_subtype,
             )
-            self.add_history_events(write_cursor, [movement_event])
+            self.add_history_events([movement_event])
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, filepath: Path, **kwargs: Any) -> None:
         """
         Import trades from bitstamp.
         """
@@ -143,7 +141,7 @@ class BitstampTransactionsImporter(BaseExchangeImporter):
             data = csv.DictReader(csvfile)
             for row in data:
                 try:
-                    self._consume_bitstamp_transaction(write_cursor, row, **kwargs)
+                    self._consume_bitstamp_transaction(row, **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During Bitstamp CSV import found action with unknown '
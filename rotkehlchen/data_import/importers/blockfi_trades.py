@@ -6,7 +6,6 @@ from typing import Any
 from rotkehlchen.assets.converters import asset_from_blockfi
 from rotkehlchen.constants import ZERO
 from rotkehlchen.data_import.utils import BaseExchangeImporter
-from rotkehlchen.db.drivers.gevent import DBCursor
 from rotkehlchen.errors.asset import UnknownAsset
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.errors.serialization import DeserializationError
@@ -25,7 +24,6 @@ log = RotkehlchenLogsAdapter(logger)
 class BlockfiTradesImporter(BaseExchangeImporter):
     def _consume_blockfi_trade(
             self,
-            write_cursor: DBCursor,
             csv_row: dict[str, Any],
             timestamp_format: str = '%Y-%m-%d %H:%M:%S',
     ) -> None:
@@ -41,9 +39,9 @@ class BlockfiTradesImporter(BaseExchangeImporter):
             location='BlockFi',
         )
 
-        buy_asset = asset_from_blockfi(csv_row['Buy Currency'])
+        buy_asset = self.resolve_asset(asset_from_blockfi, csv_row['Buy Currency'])
         buy_amount = deserialize_asset_amount(csv_row['Buy Quantity'])
-        sold_asset = asset_from_blockfi(csv_row['Sold Currency'])
+        sold_asset = self.resolve_asset(asset_from_blockfi, csv_row['Sold Currency'])
         sold_amount = deserialize_asset_amount(csv_row['Sold Quantity'])
         if sold_amount == ZERO:
             log.debug(f'Ignoring BlockFi trade with sold_amount equal to zero. {csv_row}')
@@ -62,9 +60,9 @@ class BlockfiTradesImporter(BaseExchangeImporter):
             link='',
             notes=csv_row['Type'],
         )
-        self.add_trade(write_cursor, trade)
+        self.add_trade(trade)
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, filepath: Path, **kwargs: Any) -> None:
         """
         Information for the values that the columns can have has been obtained from
         the issue in github #1674
@@ -75,7 +73,7 @@ class BlockfiTradesImporter(BaseExchangeImporter):
             data = csv.DictReader(csvfile)
             for row in data:
                 try:
-                    self._consume_blockfi_trade(write_cursor, row, **kwargs)
+                    self._consume_blockfi_trade(row, **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During BlockFi CSV import found action with unknown '
@@ -10,7 +10,6 @@ from rotkehlchen.assets.converters import asset_from_blockfi
 from rotkehlchen.constants import ZERO
 from rotkehlchen.constants.assets import A_USD
 from rotkehlchen.data_import.utils import BaseExchangeImporter, UnsupportedCSVEntry, hash_csv_row
-from rotkehlchen.db.drivers.gevent import DBCursor
 from rotkehlchen.errors.asset import UnknownAsset
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.errors.serialization import DeserializationError
@@ -32,7 +31,6 @@ BLOCKFI_PREFIX = 'BLF_'
 class BlockfiTransactionsImporter(BaseExchangeImporter):
     def _consume_blockfi_entry(
             self,
-            write_cursor: DBCursor,
             csv_row: dict[str, Any],
             timestamp_format: str = '%Y-%m-%d %H:%M:%S',
     ) -> None:
@@ -54,7 +52,7 @@ class BlockfiTransactionsImporter(BaseExchangeImporter):
             log.debug(f'Ignoring unconfirmed BlockFi entry {csv_row}')
             return
 
-        asset = asset_from_blockfi(csv_row['Cryptocurrency'])
+        asset = self.resolve_asset(asset_from_blockfi, csv_row['Cryptocurrency'])
         raw_amount = deserialize_asset_amount(csv_row['Amount'])
         abs_amount = AssetAmount(abs(raw_amount))
         entry_type = csv_row['Transaction Type']
@@ -75,7 +73,7 @@ class BlockfiTransactionsImporter(BaseExchangeImporter):
                 fee_asset=fee_asset,
                 link='',
             )
-            self.add_asset_movement(write_cursor, asset_movement)
+            self.add_asset_movement(asset_movement)
         elif entry_type in {'Withdrawal', 'Wire Withdrawal', 'ACH Withdrawal'}:
             asset_movement = AssetMovement(
                 location=Location.BLOCKFI,
@@ -89,7 +87,7 @@ class BlockfiTransactionsImporter(BaseExchangeImporter):
                 fee_asset=fee_asset,
                 link='',
             )
-            self.add_asset_movement(write_cursor, asset_movement)
+            self.add_asset_movement(asset_movement)
         elif entry_type == 'Withdrawal Fee':
             event = HistoryEvent(
                 event_identifier=f'{BLOCKFI_PREFIX}{hash_csv_row(csv_row)}',
@@ -102,7 +100,7 @@ class BlockfiTransactionsImporter(BaseExchangeImporter):
                 asset=asset,
                 notes=f'{entry_type} from BlockFi',
             )
-            self.add_history_events(write_cursor, [event])
+            self.add_history_events([event])
         elif entry_type in {'Interest Payment', 'Bonus Payment', 'Referral Bonus'}:
             event = HistoryEvent(
                 event_identifier=f'{BLOCKFI_PREFIX}{hash_csv_row(csv_row)}',
@@ -115,7 +113,7 @@ class BlockfiTransactionsImporter(BaseExchangeImporter):
                 asset=asset,
                 notes=f'{entry_type} from BlockFi',
             )
-            self.add_history_events(write_cursor, [event])
+            self.add_history_events([event])
         elif entry_type == 'Crypto Transfer':
             category = (
                 AssetMovementCategory.WITHDRAWAL if raw_amount < ZERO
@@ -133,13 +131,13 @@ class BlockfiTransactionsImporter(BaseExchangeImporter):
                 fee_asset=fee_asset,
                 link='',
             )
-            self.add_asset_movement(write_cursor, asset_movement)
+            self.add_asset_movement(asset_movement)
         elif entry_type == 'Trade':
             pass
         else:
             raise UnsupportedCSVEntry(f'Unsuported entry {entry_type}. Data: {csv_row}')
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, filepath: Path, **kwargs: Any) -> None:
         """
         Information for the values that the columns can have has been obtained from
         https://github.com/BittyTax/BittyTax/blob/06794f51223398759852d6853bc7112ffb96129a/bittytax/conv/parsers/blockfi.py#L67
@@ -150,7 +148,7 @@ class BlockfiTransactionsImporter(BaseExchangeImporter):
             data = csv.DictReader(csvfile)
             for row in data:
                 try:
-                    self._consume_blockfi_entry(write_cursor, row, **kwargs)
+                    self._consume_blockfi_entry(row, **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During BlockFi CSV import found action with unknown '
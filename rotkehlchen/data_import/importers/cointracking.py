@@ -14,7 +14,6 @@ from rotkehlchen.constants import ZERO
 from rotkehlchen.constants.assets import A_USD
 from rotkehlchen.data_import.importers.constants import COINTRACKING_EVENT_PREFIX
 from rotkehlchen.data_import.utils import BaseExchangeImporter, UnsupportedCSVEntry
-from rotkehlchen.db.drivers.gevent import DBCursor
 from rotkehlchen.errors.asset import UnknownAsset
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.errors.serialization import DeserializationError
@@ -94,7 +93,6 @@ class CointrackingImporter(BaseExchangeImporter):
 
     def _consume_cointracking_entry(
             self,
-            write_cursor: DBCursor,
             csv_row: dict[str, Any],
             timestamp_format: str = '%d.%m.%Y %H:%M:%S',
     ) -> None:
@@ -123,11 +121,11 @@ class CointrackingImporter(BaseExchangeImporter):
         fee_currency: AssetWithOracles = self.usd
         if csv_row['Fee'] != '':
             fee = deserialize_fee(csv_row['Fee'])
-            fee_currency = asset_resolver(csv_row['Cur.Fee'])
+            fee_currency = self.resolve_asset(asset_resolver, csv_row['Cur.Fee'])
 
         if row_type in {'Gift/Tip', 'Trade', 'Income'}:
-            base_asset = asset_resolver(csv_row['Cur.Buy'])
-            quote_asset = None if csv_row['Cur.Sell'] == '' else asset_resolver(csv_row['Cur.Sell'])  # noqa: E501
+            base_asset = self.resolve_asset(asset_resolver, csv_row['Cur.Buy'])
+            quote_asset = None if csv_row['Cur.Sell'] == '' else self.resolve_asset(asset_resolver, csv_row['Cur.Sell'])  # noqa: E501
             if quote_asset is None and row_type not in {'Gift/Tip', 'Income'}:
                 raise DeserializationError('Got a trade entry with an empty quote asset')
 
@@ -157,15 +155,15 @@ class CointrackingImporter(BaseExchangeImporter):
                 link='',
                 notes=notes,
             )
-            self.add_trade(write_cursor, trade)
+            self.add_trade(trade)
         elif row_type in {'Deposit', 'Withdrawal'}:
             category = deserialize_asset_movement_category(row_type.lower())
             if category == AssetMovementCategory.DEPOSIT:
                 amount = deserialize_asset_amount(csv_row['Buy'])
-                asset = asset_resolver(csv_row['Cur.Buy'])
+                asset = self.resolve_asset(asset_resolver, csv_row['Cur.Buy'])
             else:
                 amount = deserialize_asset_amount_force_positive(csv_row['Sell'])
-                asset = asset_resolver(csv_row['Cur.Sell'])
+                asset = self.resolve_asset(asset_resolver, csv_row['Cur.Sell'])
 
             asset_movement = AssetMovement(
                 location=location,
@@ -179,12 +177,12 @@ class CointrackingImporter(BaseExchangeImporter):
                 fee_asset=fee_currency,
                 link='',
             )
-            self.add_asset_movement(write_cursor, asset_movement)
+            self.add_asset_movement(asset_movement)
         elif row_type == 'Staking':  # TODO: Not like the way duplication is checked here
             # We probably need to work on standardizing this and improving performance
-            self.flush_all(write_cursor)  # flush so that the DB check later can work and not miss unwritten events  # noqa: E501
+            self.flush_all()  # flush so that the DB check later can work and not miss unwritten events  # noqa: E501
             amount = deserialize_asset_amount(csv_row['Buy'])
-            asset = asset_resolver(csv_row['Cur.Buy'])
+            asset = self.resolve_asset(asset_resolver, csv_row['Cur.Buy'])
             timestamp_ms = ts_sec_to_ms(timestamp)
             event_type = HistoryEventType.STAKING
             event_subtype = HistoryEventSubType.REWARD
@@ -212,7 +210,7 @@ class CointrackingImporter(BaseExchangeImporter):
                 balance=Balance(amount, ZERO),
                 notes=f'Stake reward of {amount} {asset.symbol} in {location!s}',
             )
-            self.add_history_events(write_cursor, [event])
+            self.add_history_events([event])
         else:
             raise UnsupportedCSVEntry(
                 f'Unknown entry type "{row_type}" encountered during cointracking '
@@ -221,7 +219,6 @@ class CointrackingImporter(BaseExchangeImporter):
 
     def _import_csv(
             self,
-            write_cursor: DBCursor,
             filepath: Path,
             **kwargs: Any,
     ) -> None:
@@ -233,7 +230,7 @@ class CointrackingImporter(BaseExchangeImporter):
             header = remap_header(next(data))
             for row in data:
                 try:
-                    self._consume_cointracking_entry(write_cursor, dict(zip(header, row)), **kwargs)  # noqa: E501
+                    self._consume_cointracking_entry(dict(zip(header, row)), **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During cointracking CSV import found action with unknown '
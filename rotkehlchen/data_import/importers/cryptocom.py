@@ -13,7 +13,6 @@ from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.constants.assets import A_USD
 from rotkehlchen.constants.prices import ZERO_PRICE
 from rotkehlchen.data_import.utils import BaseExchangeImporter, UnsupportedCSVEntry, hash_csv_row
-from rotkehlchen.db.drivers.gevent import DBCursor
 from rotkehlchen.errors.asset import UnknownAsset
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.errors.serialization import DeserializationError
@@ -45,7 +44,6 @@ CRYPTOCOM_PREFIX = 'CCM_'
 class CryptocomImporter(BaseExchangeImporter):
     def _consume_cryptocom_entry(
             self,
-            write_cursor: DBCursor,
             csv_row: dict[str, Any],
             timestamp_format: str = '%Y-%m-%d %H:%M:%S',
     ) -> None:
@@ -95,20 +93,20 @@ class CryptocomImporter(BaseExchangeImporter):
                 'viban_purchase',
             }:
                 # trades (fiat, crypto) to (crypto, fiat)
-                base_asset = asset_from_cryptocom(to_currency)
-                quote_asset = asset_from_cryptocom(currency)
+                base_asset = self.resolve_asset(asset_from_cryptocom, to_currency)
+                quote_asset = self.resolve_asset(asset_from_cryptocom, currency)
                 if quote_asset is None:
                     raise DeserializationError('Got a trade entry with an empty quote asset')
                 base_amount_bought = deserialize_asset_amount(to_amount)
                 quote_amount_sold = deserialize_asset_amount(amount)
             elif row_type == 'card_top_up':
-                quote_asset = asset_from_cryptocom(currency)
-                base_asset = asset_from_cryptocom(native_currency)
+                quote_asset = self.resolve_asset(asset_from_cryptocom, currency)
+                base_asset = self.resolve_asset(asset_from_cryptocom, native_currency)
                 base_amount_bought = deserialize_asset_amount_force_positive(native_amount)
                 quote_amount_sold = deserialize_asset_amount_force_positive(amount)
             else:
-                base_asset = asset_from_cryptocom(currency)
-                quote_asset = asset_from_cryptocom(native_currency)
+                base_asset = self.resolve_asset(asset_from_cryptocom, currency)
+                quote_asset = self.resolve_asset(asset_from_cryptocom, native_currency)
                 base_amount_bought = deserialize_asset_amount(amount)
                 quote_amount_sold = deserialize_asset_amount(native_amount)
 
@@ -126,7 +124,7 @@ class CryptocomImporter(BaseExchangeImporter):
                 link='',
                 notes=notes,
             )
-            self.add_trade(write_cursor, trade)
+            self.add_trade(trade)
 
         elif row_type in {
             'crypto_withdrawal',
@@ -141,7 +139,7 @@ class CryptocomImporter(BaseExchangeImporter):
                 category = AssetMovementCategory.DEPOSIT
                 amount = deserialize_asset_amount(csv_row['Amount'])
 
-            asset = asset_from_cryptocom(csv_row['Currency'])
+            asset = self.resolve_asset(asset_from_cryptocom, csv_row['Currency'])
             asset_movement = AssetMovement(
                 location=Location.CRYPTOCOM,
                 category=category,
@@ -154,7 +152,7 @@ class CryptocomImporter(BaseExchangeImporter):
                 fee_asset=asset,
                 link='',
             )
-            self.add_asset_movement(write_cursor, asset_movement)
+            self.add_asset_movement(asset_movement)
         elif row_type in {
             'airdrop_to_exchange_transfer',
             'mco_stake_reward',
@@ -171,7 +169,7 @@ class CryptocomImporter(BaseExchangeImporter):
             'crypto_earn_interest_paid',
             'reimbursement',
         }:
-            asset = asset_from_cryptocom(csv_row['Currency'])
+            asset = self.resolve_asset(asset_from_cryptocom, csv_row['Currency'])
             amount = deserialize_asset_amount(csv_row['Amount'])
             event = HistoryEvent(
                 event_identifier=f'{CRYPTOCOM_PREFIX}{hash_csv_row(csv_row)}',
@@ -184,9 +182,9 @@ class CryptocomImporter(BaseExchangeImporter):
                 asset=asset,
                 notes=notes,
             )
-            self.add_history_events(write_cursor, [event])
+            self.add_history_events([event])
         elif row_type in {'crypto_payment', 'reimbursement_reverted', 'card_cashback_reverted'}:
-            asset = asset_from_cryptocom(csv_row['Currency'])
+            asset = self.resolve_asset(asset_from_cryptocom, csv_row['Currency'])
             amount = abs(deserialize_asset_amount(csv_row['Amount']))
             event = HistoryEvent(
                 event_identifier=f'{CRYPTOCOM_PREFIX}{hash_csv_row(csv_row)}',
@@ -199,9 +197,9 @@ class CryptocomImporter(BaseExchangeImporter):
                 asset=asset,
                 notes=notes,
             )
-            self.add_history_events(write_cursor, [event])
+            self.add_history_events([event])
         elif row_type == 'invest_deposit':
-            asset = asset_from_cryptocom(csv_row['Currency'])
+            asset = self.resolve_asset(asset_from_cryptocom, csv_row['Currency'])
             amount = deserialize_asset_amount(csv_row['Amount'])
             asset_movement = AssetMovement(
                 location=Location.CRYPTOCOM,
@@ -215,9 +213,9 @@ class CryptocomImporter(BaseExchangeImporter):
                 fee_asset=fee_currency,
                 link='',
             )
-            self.add_asset_movement(write_cursor, asset_movement)
+            self.add_asset_movement(asset_movement)
         elif row_type == 'invest_withdrawal':
-            asset = asset_from_cryptocom(csv_row['Currency'])
+            asset = self.resolve_asset(asset_from_cryptocom, csv_row['Currency'])
             amount = deserialize_asset_amount(csv_row['Amount'])
             asset_movement = AssetMovement(
                 location=Location.CRYPTOCOM,
@@ -231,9 +229,9 @@ class CryptocomImporter(BaseExchangeImporter):
                 fee_asset=fee_currency,
                 link='',
             )
-            self.add_asset_movement(write_cursor, asset_movement)
+            self.add_asset_movement(asset_movement)
         elif row_type == 'crypto_transfer':
-            asset = asset_from_cryptocom(csv_row['Currency'])
+            asset = self.resolve_asset(asset_from_cryptocom, csv_row['Currency'])
             amount = deserialize_asset_amount(csv_row['Amount'])
             if amount < 0:
                 event_type = HistoryEventType.SPEND
@@ -252,7 +250,7 @@ class CryptocomImporter(BaseExchangeImporter):
                 asset=asset,
                 notes=notes,
             )
-            self.add_history_events(write_cursor, [event])
+            self.add_history_events([event])
         elif row_type in {
             'crypto_earn_program_created',
             'crypto_earn_program_withdrawn',
@@ -291,7 +289,6 @@ class CryptocomImporter(BaseExchangeImporter):
 
     def _import_cryptocom_associated_entries(
             self,
-            write_cursor: DBCursor,
             data: Any,
             tx_kind: str,
             timestamp_format: str = '%Y-%m-%d %H:%M:%S',
@@ -405,8 +402,8 @@ class CryptocomImporter(BaseExchangeImporter):
                     fee = Fee(ZERO)
                     fee_currency = A_USD
 
-                    base_asset = asset_from_cryptocom(credited_row['Currency'])
-                    quote_asset = asset_from_cryptocom(debited_row['Currency'])
+                    base_asset = self.resolve_asset(asset_from_cryptocom, credited_row['Currency'])
+                    quote_asset = self.resolve_asset(asset_from_cryptocom, debited_row['Currency'])
                     part_of_total = (
                         ONE
                         if len(debited_rows) == 1
@@ -439,12 +436,12 @@ class CryptocomImporter(BaseExchangeImporter):
                         link='',
                         notes=notes,
                     )
-                    self.add_trade(write_cursor, trade)
+                    self.add_trade(trade)
 
         # Compute investments profit
         if len(investments_withdrawals) != 0:
             for asset in investments_withdrawals:
-                asset_object = asset_from_cryptocom(asset)
+                asset_object = self.resolve_asset(asset_from_cryptocom, asset)
                 if asset not in investments_deposits:
                     log.error(
                         f'Investment withdrawal without deposit at crypto.com. Ignoring '
@@ -501,9 +498,9 @@ class CryptocomImporter(BaseExchangeImporter):
                             asset=asset_object,
                             notes=f'Staking profit for {asset}',
                         )
-                        self.add_history_events(write_cursor, [event])
+                        self.add_history_events([event])
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, filepath: Path, **kwargs: Any) -> None:
         """May raise:
         - InputError if one of the rows is malformed
         """
@@ -513,7 +510,6 @@ class CryptocomImporter(BaseExchangeImporter):
                 #  Notice: Crypto.com csv export gathers all swapping entries (`lockup_swap_*`,
                 # `crypto_wallet_swap_*`, ...) into one entry named `dynamic_coin_swap_*`.
                 self._import_cryptocom_associated_entries(
-                    write_cursor=write_cursor,
                     data=data,
                     tx_kind='dynamic_coin_swap',
                     **kwargs,
@@ -524,7 +520,6 @@ class CryptocomImporter(BaseExchangeImporter):
                 next(data)
 
                 self._import_cryptocom_associated_entries(
-                    write_cursor=write_cursor,
                     data=data,
                     tx_kind='dust_conversion',
                     **kwargs,
@@ -532,11 +527,11 @@ class CryptocomImporter(BaseExchangeImporter):
                 csvfile.seek(0)
                 next(data)
 
-                self._import_cryptocom_associated_entries(write_cursor, data, 'interest_swap', **kwargs)  # noqa: E501
+                self._import_cryptocom_associated_entries(data, 'interest_swap', **kwargs)
                 csvfile.seek(0)
                 next(data)
 
-                self._import_cryptocom_associated_entries(write_cursor, data, 'invest', **kwargs)
+                self._import_cryptocom_associated_entries(data, 'invest', **kwargs)
                 csvfile.seek(0)
                 next(data)
             except KeyError as e:
@@ -546,7 +541,7 @@ class CryptocomImporter(BaseExchangeImporter):
 
             for row in data:
                 try:
-                    self._consume_cryptocom_entry(write_cursor, row, **kwargs)
+                    self._consume_cryptocom_entry(row, **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During cryptocom CSV import found action with unknown '
@@ -12,7 +12,6 @@ from rotkehlchen.data_import.utils import (
     UnsupportedCSVEntry,
     process_rotki_generic_import_csv_fields,
 )
-from rotkehlchen.db.drivers.gevent import DBCursor
 from rotkehlchen.errors.asset import UnknownAsset
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.errors.serialization import DeserializationError
@@ -33,7 +32,6 @@ GENERIC_TYPE_TO_HISTORY_EVENT_TYPE_MAPPINGS = {
 class RotkiGenericEventsImporter(BaseExchangeImporter):
     def _consume_rotki_event(
             self,
-            write_cursor: DBCursor,
             csv_row: dict[str, Any],
             sequence_index: int,
     ) -> None:
@@ -50,7 +48,7 @@ class RotkiGenericEventsImporter(BaseExchangeImporter):
         except KeyError as e:
             raise UnsupportedCSVEntry(f'Unsupported entry {csv_row["Type"]}. Data: {csv_row}') from e  # noqa: E501
         events: list[HistoryBaseEntry] = []
-        asset, fee, fee_currency, location, timestamp = process_rotki_generic_import_csv_fields(csv_row, 'Currency')  # noqa: E501
+        asset, fee, fee_currency, location, timestamp = process_rotki_generic_import_csv_fields(self, csv_row, 'Currency')  # noqa: E501
         history_event = HistoryEvent(
             event_identifier=identifier,
             sequence_index=sequence_index,
@@ -82,9 +80,9 @@ class RotkiGenericEventsImporter(BaseExchangeImporter):
                 notes=csv_row['Description'],
             )
             events.append(fee_event)
-        self.add_history_events(write_cursor, events)  # event assets are always resolved here
+        self.add_history_events(events)  # event assets are always resolved here
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, filepath: Path, **kwargs: Any) -> None:
         """May raise:
         - InputError if one of the rows is malformed
         """
@@ -93,7 +91,7 @@ class RotkiGenericEventsImporter(BaseExchangeImporter):
             for idx, row in enumerate(data):
                 try:
                     kwargs['sequence_index'] = idx
-                    self._consume_rotki_event(write_cursor, row, **kwargs)
+                    self._consume_rotki_event(row, **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During rotki generic events CSV import, found action with unknown '
@@ -9,7 +9,6 @@ from rotkehlchen.data_import.utils import (
     BaseExchangeImporter,
     process_rotki_generic_import_csv_fields,
 )
-from rotkehlchen.db.drivers.gevent import DBCursor
 from rotkehlchen.errors.asset import UnknownAsset
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.errors.serialization import DeserializationError
@@ -26,7 +25,6 @@ log = RotkehlchenLogsAdapter(logger)
 class RotkiGenericTradesImporter(BaseExchangeImporter):
     def _consume_rotki_trades(
             self,
-            write_cursor: DBCursor,
             csv_row: dict[str, Any],
     ) -> None:
         """Consume rotki generic trades import CSV file.
@@ -38,7 +36,7 @@ class RotkiGenericTradesImporter(BaseExchangeImporter):
         """
         amount_sold = deserialize_asset_amount(csv_row['Sell Amount'])
         amount_bought = deserialize_asset_amount(csv_row['Buy Amount'])
-        asset, fee, fee_currency, location, timestamp = process_rotki_generic_import_csv_fields(csv_row, 'Base Currency')  # noqa: E501
+        asset, fee, fee_currency, location, timestamp = process_rotki_generic_import_csv_fields(self, csv_row, 'Base Currency')  # noqa: E501
         trade = Trade(
             timestamp=ts_ms_to_sec(timestamp),
             location=location,
@@ -46,14 +44,14 @@ class RotkiGenericTradesImporter(BaseExchangeImporter):
             fee_currency=fee_currency,
             rate=Price(amount_sold / amount_bought),
             base_asset=asset,
-            quote_asset=symbol_to_asset_or_token(csv_row['Quote Currency']),
+            quote_asset=self.resolve_asset(symbol_to_asset_or_token, csv_row['Quote Currency']),
             trade_type=TradeType.SELL if csv_row['Type'] == 'Sell' else TradeType.BUY,
             amount=amount_bought,
             notes=csv_row['Description'],
         )
-        self.add_trade(write_cursor, trade)
+        self.add_trade(trade)
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, filepath: Path, **kwargs: Any) -> None:
         """May raise:
         - InputError if one of the rows is malformed
         """
@@ -61,7 +59,7 @@ class RotkiGenericTradesImporter(BaseExchangeImporter):
             data = csv.DictReader(csvfile)
             for row in data:
                 try:
-                    self._consume_rotki_trades(write_cursor, row)
+                    self._consume_rotki_trades(row)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During rotki generic trades CSV import, found action with unknown '
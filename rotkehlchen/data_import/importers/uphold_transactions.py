@@ -9,7 +9,6 @@ from rotkehlchen.accounting.structures.types import HistoryEventSubType, History
 from rotkehlchen.assets.converters import asset_from_uphold
 from rotkehlchen.constants import ZERO
 from rotkehlchen.data_import.utils import BaseExchangeImporter, hash_csv_row
-from rotkehlchen.db.drivers.gevent import DBCursor
 from rotkehlchen.errors.asset import UnknownAsset
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.errors.serialization import DeserializationError
@@ -34,7 +33,6 @@ UPHOLD_PREFIX = 'UPH_'
 class UpholdTransactionsImporter(BaseExchangeImporter):
     def _consume_uphold_transaction(
             self,
-            write_cursor: DBCursor,
             csv_row: dict[str, Any],
             timestamp_format: str = '%a %b %d %Y %H:%M:%S %Z%z',
     ) -> None:
@@ -51,16 +49,19 @@ class UpholdTransactionsImporter(BaseExchangeImporter):
             location='uphold',
         )
         destination = csv_row['Destination']
-        destination_asset = asset_from_uphold(csv_row['Destination Currency'])
+        destination_asset = self.resolve_asset(asset_from_uphold, csv_row['Destination Currency'])
         destination_amount = deserialize_asset_amount(csv_row['Destination Amount'])
         origin = csv_row['Origin']
-        origin_asset = asset_from_uphold(csv_row['Origin Currency'])
+        origin_asset = self.resolve_asset(asset_from_uphold, csv_row['Origin Currency'])
         origin_amount = deserialize_asset_amount(csv_row['Origin Amount'])
         if csv_row['Fee Amount'] == '':
             fee = FVal(ZERO)
         else:
             fee = deserialize_fee(csv_row['Fee Amount'])
-        fee_asset = asset_from_uphold(csv_row['Fee Currency'] or csv_row['Origin Currency'])
+        fee_asset = self.resolve_asset(
+            asset_from_uphold,
+            csv_row['Fee Currency'] or csv_row['Origin Currency'],
+        )
         transaction_type = csv_row['Type']
         notes = f"""
 Activity from uphold with uphold transaction id:
@@ -89,7 +90,7 @@ Activity from uphold with uphold transaction id:
                     asset=destination_asset,
                     notes=notes,
                 )
-                self.add_history_events(write_cursor, [event])
+                self.add_history_events([event])
             else:  # Assets or amounts differ (Trades)
                 # in uphold UI the exchanged amount includes the fee.
                 if fee_asset == destination_asset:
@@ -108,7 +109,7 @@ Activity from uphold with uphold transaction id:
                         link='',
                         notes=notes,
                     )
-                    self.add_trade(write_cursor, trade)
+                    self.add_trade(trade)
                 else:
                     log.debug(f'Ignoring trade with Destination Amount: {destination_amount}.')
         elif origin == 'uphold' and transaction_type == 'out':
@@ -125,7 +126,7 @@ Activity from uphold with uphold transaction id:
                     fee_asset=fee_asset,
                     link='',
                 )
-                self.add_asset_movement(write_cursor, asset_movement)
+                self.add_asset_movement(asset_movement)
             elif origin_amount > 0:  # Trades (sell)
                 trade = Trade(
                     timestamp=timestamp,
@@ -140,7 +141,7 @@ Activity from uphold with uphold transaction id:
                     link='',
                     notes=notes,
                 )
-                self.add_trade(write_cursor, trade)
+                self.add_trade(trade)
             else:
                 log.debug(f'Ignoring trade with Origin Amount: {origin_amount}.')
 
@@ -158,7 +159,7 @@ Activity from uphold with uphold transaction id:
                     fee_asset=fee_asset,
                     link='',
                 )
-                self.add_asset_movement(write_cursor, asset_movement)
+                self.add_asset_movement(asset_movement)
             elif destination_amount > 0:  # Trades (buy)
                 trade = Trade(
                     timestamp=timestamp,
@@ -173,11 +174,11 @@ Activity from uphold with uphold transaction id:
                     link='',
                     notes=notes,
                 )
-                self.add_trade(write_cursor, trade)
+                self.add_trade(trade)
             else:
                 log.debug(f'Ignoring trade with Destination Amount: {destination_amount}.')
 
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, filepath: Path, **kwargs: Any) -> None:
         """
         Information for the values that the columns can have has been obtained from sample CSVs
         """
@@ -185,7 +186,7 @@ Activity from uphold with uphold transaction id:
             data = csv.DictReader(csvfile)
             for row in data:
                 try:
-                    self._consume_uphold_transaction(write_cursor, row, **kwargs)
+                    self._consume_uphold_transaction(row, **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During uphold CSV import found action with unknown '
@@ -1,24 +1,40 @@
 import hashlib
 from abc import ABCMeta, abstractmethod
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 from rotkehlchen.accounting.structures.base import HistoryBaseEntry
+from rotkehlchen.api.websockets.typedefs import WSMessageType
 from rotkehlchen.assets.asset import Asset, AssetWithOracles
 from rotkehlchen.assets.converters import LOCATION_TO_ASSET_MAPPING, asset_from_common_identifier
 from rotkehlchen.db.dbhandler import DBHandler
-from rotkehlchen.db.drivers.gevent import DBCursor
 from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.exchanges.data_structures import AssetMovement, MarginPosition, Trade
 from rotkehlchen.serialization.deserialize import deserialize_asset_amount, deserialize_timestamp
 from rotkehlchen.types import Fee, Location, TimestampMS
 
+if TYPE_CHECKING:
+    from rotkehlchen.db.drivers.gevent import DBCursor
+
 ITEMS_PER_DB_WRITE = 400
+# The tables the importers write to. SQLite gives new rows a rowid after the max one of the
+# table so the rows a chunk inserted are the ones after the max rowids at its start.
+IMPORTED_TABLES = ('trades', 'margin_positions', 'asset_movements', 'history_events')
+T = TypeVar('T')
 
 
 class BaseExchangeImporter(metaclass=ABCMeta):
+    """Base class of the CSV importers
+
+    The importers stream the rows of the csv file and deserialize them into trades,
+    asset movements etc. which are buffered here. Every `ITEMS_PER_DB_WRITE` buffered
+    entries the chunk is committed in its own short write transaction, so that big imports
+    neither hold the DB write lock for long nor keep the whole file in memory. The rowids
+    each chunk inserted are recorded so that the chunks of a failed import can be deleted.
+    """
+
     def __init__(self, db: DBHandler) -> None:
         self.db = db
         self.history_db = DBHistoryEvents(self.db)
@@ -26,73 +42,145 @@ class BaseExchangeImporter(metaclass=ABCMeta):
         self._margin_trades: list[MarginPosition] = []
         self._asset_movements: list[AssetMovement] = []
         self._history_events: list[HistoryBaseEntry] = []
+        # memoized asset lookups for the duration of the import. Keyed by resolver, symbol
+        self._resolved_assets: dict[tuple[Callable, str], Any] = {}
+        self.written_entries = 0
+        # (table, first rowid, last rowid) ranges of the rows written by this import
+        self._written_rowids: list[tuple[str, int, int]] = []
 
     def import_csv(self, filepath: Path, **kwargs: Any) -> tuple[bool, str]:
+        """Imports the csv file chunk by chunk. If the import fails, for example if a
+        malformed row raises an InputError, the chunks it already wrote are deleted so that
+        nothing of the file is kept in the DB."""
         try:
-            with self.db.user_write() as write_cursor:
-                self._import_csv(write_cursor, filepath=filepath, **kwargs)
-                self.flush_all(write_cursor)
+            self._import_csv(filepath=filepath, **kwargs)
+            self.flush_all()
         except InputError as e:
+            self._delete_written()
             return False, str(e)
+        except Exception:
+            self._delete_written()
+            raise
         else:
             return True, ''
+        finally:
+            self._notify_progress(finished=True)
 
     @abstractmethod
-    def _import_csv(self, write_cursor: DBCursor, filepath: Path, **kwargs: Any) -> None:
+    def _import_csv(self, filepath: Path, **kwargs: Any) -> None:
         """The method that processes csv. Should be implemented by subclasses.
         May raise:
         - InputError if one of the rows is malformed
         """
 
-    def add_trade(self, write_cursor: DBCursor, trade: Trade) -> None:
+    def resolve_asset(self, resolver: Callable[[str], T], symbol: str) -> T:
+        """Resolves the symbol with the given resolver, memoizing the result for this import
+
+        May raise:
+        - UnknownAsset
+        - Any other error the resolver may raise
+        """
+        if (asset := self._resolved_assets.get((resolver, symbol))) is None:
+            asset = self._resolved_assets[(resolver, symbol)] = resolver(symbol)
+        return asset
+
+    def add_trade(self, trade: Trade) -> None:
         self._trades.append(trade)
-        self.maybe_flush_all(write_cursor)
+        self.maybe_flush_all()
 
-    def add_margin_trade(self, write_cursor: DBCursor, margin_trade: MarginPosition) -> None:
+    def add_margin_trade(self, margin_trade: MarginPosition) -> None:
         self._margin_trades.append(margin_trade)
-        self.maybe_flush_all(write_cursor)
+        self.maybe_flush_all()
 
-    def add_asset_movement(self, write_cursor: DBCursor, asset_movement: AssetMovement) -> None:
+    def add_asset_movement(self, asset_movement: AssetMovement) -> None:
         self._asset_movements.append(asset_movement)
-        self.maybe_flush_all(write_cursor)
+        self.maybe_flush_all()
 
-    def add_history_events(self, write_cursor: DBCursor, history_events: list[HistoryBaseEntry]) -> None:  # noqa: E501
+    def add_history_events(self, history_events: list[HistoryBaseEntry]) -> None:
         self._history_events.extend(history_events)
-        self.maybe_flush_all(write_cursor)
-
-    def maybe_flush_all(self, cursor: DBCursor) -> None:
-        if len(self._trades) + len(self._margin_trades) + len(self._asset_movements) + len(self._history_events) >= ITEMS_PER_DB_WRITE:  # noqa: E501
-            self.flush_all(cursor)
-
-    def flush_all(self, write_cursor: DBCursor) -> None:
-        self.db.add_trades(write_cursor, trades=self._trades)
-        self.db.add_margin_positions(write_cursor, margin_positions=self._margin_trades)
-        self.db.add_asset_movements(write_cursor, asset_movements=self._asset_movements)
-        self.history_db.add_history_events(write_cursor, history=self._history_events)
+        self.maybe_flush_all()
+
+    def _buffered_entries(self) -> int:
+        return len(self._trades) + len(self._margin_trades) + len(self._asset_movements) + len(self._history_events)  # noqa: E501
+
+    def maybe_flush_all(self) -> None:
+        if self._buffered_entries() >= ITEMS_PER_DB_WRITE:
+            self.flush_all()
+
+    def flush_all(self) -> None:
+        """Commits all buffered entries to the DB in one write transaction and records
+        the rowids of the rows it inserted"""
+        if (buffered := self._buffered_entries()) == 0:
+            return
+
+        with self.db.user_write() as write_cursor:
+            max_rowids = self._max_rowids(write_cursor)
+            self.db.add_trades(write_cursor, trades=self._trades)
+            self.db.add_margin_positions(write_cursor, margin_positions=self._margin_trades)
+            self.db.add_asset_movements(write_cursor, asset_movements=self._asset_movements)
+            self.history_db.add_history_events(write_cursor, history=self._history_events)
+            for table, previous_max, new_max in zip(IMPORTED_TABLES, max_rowids, self._max_rowids(write_cursor)):  # noqa: E501
+                if new_max > previous_max:
+                    self._written_rowids.append((table, previous_max + 1, new_max))
+        self._discard_buffered()
+        self.written_entries += buffered
+        self._notify_progress(finished=False)
+
+    @staticmethod
+    def _max_rowids(write_cursor: 'DBCursor') -> list[int]:
+        return [
+            write_cursor.execute(f'SELECT COALESCE(MAX(rowid), 0) FROM {table}').fetchone()[0]
+            for table in IMPORTED_TABLES
+        ]
+
+    def _delete_written(self) -> None:
+        """Deletes the rows that the chunks of this import wrote to the DB and drops the
+        buffered entries. Rows written by others in between the chunks are kept."""
+        self._discard_buffered()
+        if len(self._written_rowids) == 0:
+            return
+
+        with self.db.user_write() as write_cursor:
+            for table, first_rowid, last_rowid in self._written_rowids:
+                write_cursor.execute(
+                    f'DELETE FROM {table} WHERE rowid BETWEEN ? AND ?',
+                    (first_rowid, last_rowid),
+                )
+        self._written_rowids = []
+
+    def _discard_buffered(self) -> None:
         self._trades = []
         self._margin_trades = []
         self._asset_movements = []
         self._history_events = []
 
+    def _notify_progress(self, finished: bool) -> None:
+        self.db.msg_aggregator.add_message(
+            message_type=WSMessageType.CSV_IMPORT_STATUS,
+            data={'written_entries': self.written_entries, 'finished': finished},
+        )
+
 
 class UnsupportedCSVEntry(Exception):
     """Thrown for external exchange exported entries we can't import"""
 
 
 def process_rotki_generic_import_csv_fields(
+        importer: BaseExchangeImporter,
         csv_row: dict[str, Any],
         currency_colname: str,
 ) -> tuple[AssetWithOracles, Optional[Fee], Optional[Asset], Location, TimestampMS]:
     """
-    Process the imported csv for generic rotki trades and events
+    Process the imported csv for generic rotki trades and events. The assets are resolved
+    through the memoized lookups of the importer.
     """
     location = Location.deserialize(csv_row['Location'])
     timestamp = TimestampMS(deserialize_timestamp(csv_row['Timestamp']))
     fee = Fee(deserialize_asset_amount(csv_row['Fee'])) if csv_row['Fee'] else None
     asset_mapping = LOCATION_TO_ASSET_MAPPING.get(location, asset_from_common_identifier)
-    asset = asset_mapping(csv_row[currency_colname])
+    asset = importer.resolve_asset(asset_mapping, csv_row[currency_colname])
     fee_currency = (
-        asset_mapping(csv_row['Fee Currency'])
+        importer.resolve_asset(asset_mapping, csv_row['Fee Currency'])
         if csv_row['Fee Currency'] and fee is not None else None
     )
     return asset, fee, fee_currency, location, timestamp
@@ -41,7 +41,8 @@ def sanity_check_impl(
         minimized_schema: dict[str, str],
 ) -> None:
     """The implementation of the DB sanity check. Out of DBConnection to keep things cleaner"""
-    cursor.execute('SELECT name, sql FROM sqlite_master WHERE type="table"')
+    # sqlite's own tables such as the sqlite_stat1 of ANALYZE are not part of the schema
+    cursor.execute('SELECT name, sql FROM sqlite_master WHERE type="table" AND name NOT LIKE "sqlite_%"')  # noqa: E501
     tables_data_from_db: dict[str, tuple[str, str]] = {}
     for (name, raw_script) in cursor:
         table_properties = re.findall(
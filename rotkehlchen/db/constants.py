@@ -17,6 +17,8 @@ EVM_ACCOUNTS_DETAILS_LAST_QUERIED_TS = 'last_queried_timestamp'
 EVM_ACCOUNTS_DETAILS_TOKENS = 'tokens'
 
 LAST_DATA_UPDATES_KEY: Final = 'last_data_updates_ts'
+LAST_DB_MAINTENANCE_KEY: Final = 'last_db_maintenance_ts'
+KRAKEN_CALL_COUNTERS_KEY: Final = 'kraken_call_counters'
 
 NO_ACCOUNTING_COUNTERPARTY = 'NONE'
 LINKABLE_ACCOUNTING_SETTINGS_NAME = Literal[
@@ -51,7 +51,7 @@ from rotkehlchen.db.constants import (
     KRAKEN_ACCOUNT_TYPE_KEY,
     USER_CREDENTIAL_MAPPING_KEYS,
 )
-from rotkehlchen.db.drivers.gevent import DBConnection, DBConnectionType, DBCursor
+from rotkehlchen.db.drivers.gevent import DBConnection, DBConnectionType, DBCursor, DBReaderPool
 from rotkehlchen.db.evmtx import DBEvmTx
 from rotkehlchen.db.filtering import (
     AssetMovementsFilterQuery,
@@ -60,6 +60,7 @@ from rotkehlchen.db.filtering import (
 )
 from rotkehlchen.db.loopring import DBLoopring
 from rotkehlchen.db.misc import detect_sqlcipher_version
+from rotkehlchen.db.profiles import DB_CONNECTION_PROFILES, DEFAULT_DB_PROFILE, DBConnectionProfile
 from rotkehlchen.db.schema import DB_SCRIPT_CREATE_TABLES
 from rotkehlchen.db.schema_transient import DB_SCRIPT_CREATE_TRANSIENT_TABLES
 from rotkehlchen.db.settings import (
@@ -72,6 +73,7 @@ from rotkehlchen.db.settings import (
     db_settings_from_dict,
 )
 from rotkehlchen.db.upgrade_manager import DBUpgradeManager
+from rotkehlchen.db.upgrades.transient import upgrade_transient_db
 from rotkehlchen.db.utils import (
     DBAssetBalance,
     DBTupleType,
@@ -172,9 +174,12 @@ class DBHandler:
             initial_settings: Optional[ModifiableDBSettings],
             sql_vm_instructions_cb: int,
             resume_from_backup: bool,
+            connection_profile: DBConnectionProfile = DB_CONNECTION_PROFILES[DEFAULT_DB_PROFILE],
     ):
         """Database constructor
 
+        The connection profile tunes each connection to the user and transient DBs.
+
         May raise:
         - DBUpgradeError if the rotki DB version is newer than the software or
         there is a DB upgrade and there is an error or if the version is older
@@ -186,6 +191,7 @@ class DBHandler:
         self.msg_aggregator = msg_aggregator
         self.user_data_dir = user_data_dir
         self.sql_vm_instructions_cb = sql_vm_instructions_cb
+        self.connection_profile = connection_profile
         self.sqlcipher_version = detect_sqlcipher_version()
         self.setting_to_default_type = {
             'version': (int, ROTKEHLCHEN_DB_VERSION),
@@ -293,6 +299,7 @@ class DBHandler:
         # Run upgrades if needed
         fresh_db = DBUpgradeManager(self).run_upgrades()
         if fresh_db:  # create tables during the first run and add the DB version
+            self.conn.enable_incremental_vacuum()
             self.conn.executescript(DB_SCRIPT_CREATE_TABLES)
             cursor = self.conn.cursor()
             cursor.execute(
@@ -309,15 +316,18 @@ class DBHandler:
                 if result is not None:
                     transient_version = int(result[0])
 
-            if transient_version != ROTKEHLCHEN_TRANSIENT_DB_VERSION:
-                # "upgrade" transient DB
+            if transient_version != ROTKEHLCHEN_TRANSIENT_DB_VERSION and upgrade_transient_db(
+                connection=self.conn_transient,
+                from_version=transient_version,
+                to_version=ROTKEHLCHEN_TRANSIENT_DB_VERSION,
+            ) is False:  # no upgrade path. Recreate the transient DB
                 tables = list(cursor.execute('select name from sqlite_master where type is "table"'))  # noqa: E501
                 cursor.executescript('PRAGMA foreign_keys = OFF;')
                 cursor.executescript(';'.join([f'DROP TABLE IF EXISTS {name[0]}' for name in tables]))  # noqa: E501
                 cursor.executescript('PRAGMA foreign_keys = ON;')
             self.conn_transient.executescript(DB_SCRIPT_CREATE_TRANSIENT_TABLES)
             cursor.execute(
-                'INSERT OR IGNORE INTO settings(name, value) VALUES(?, ?)',
+                'INSERT OR REPLACE INTO settings(name, value) VALUES(?, ?)',
                 ('version', str(ROTKEHLCHEN_TRANSIENT_DB_VERSION)),
             )
             self.conn_transient.commit()
@@ -399,22 +409,59 @@ class DBHandler:
     def _connect(self, conn_attribute: Literal['conn', 'conn_transient'] = 'conn') -> None:
         """Connect to the DB using password
 
+        The user DB is journaled with WAL and gets a pool of read-only connections
+        that serve its read contexts.
+
         May raise:
         - SystemPermissionError if we are unable to open the DB file,
         probably due to permission errors
         - AuthenticationError if the given password is not the right one for the DB
         """
         if conn_attribute == 'conn':
-            fullpath = self.user_data_dir / MAIN_DB_NAME
-            connection_type = DBConnectionType.USER
+            conn = self._open_connection(
+                fullpath=self.user_data_dir / MAIN_DB_NAME,
+                connection_type=DBConnectionType.USER,
+            )
+            if conn.enable_wal() is True:  # without WAL readers would block the writer
+                self.connection_profile.apply_wal(conn)
+                conn.reader_pool = DBReaderPool(connect=self._open_reader_connection)
         else:
-            fullpath = self.user_data_dir / TRANSIENT_DB_NAME
-            connection_type = DBConnectionType.TRANSIENT
+            conn = self._open_connection(
+                fullpath=self.user_data_dir / TRANSIENT_DB_NAME,
+                connection_type=DBConnectionType.TRANSIENT,
+            )
+
+        setattr(self, conn_attribute, conn)
+
+    def _open_reader_connection(self) -> DBConnection:
+        """Opens a read-only connection to the user DB for the reader pool"""
+        conn = self._open_connection(
+            fullpath=self.user_data_dir / MAIN_DB_NAME,
+            connection_type=DBConnectionType.USER,
+            is_reader=True,
+        )
+        conn.execute('PRAGMA query_only=ON')
+        return conn
+
+    def _open_connection(
+            self,
+            fullpath: Path,
+            connection_type: DBConnectionType,
+            is_reader: bool = False,
+    ) -> DBConnection:
+        """Opens a connection to the given DB file and keys it with the user's password
+
+        May raise:
+        - SystemPermissionError if we are unable to open the DB file,
+        probably due to permission errors
+        - AuthenticationError if the given password is not the right one for the DB
+        """
         try:
             conn = DBConnection(
                 path=str(fullpath),
                 connection_type=connection_type,
                 sql_vm_instructions_cb=self.sql_vm_instructions_cb,
+                is_reader=is_reader,
             )
         except sqlcipher.OperationalError as e:  # pylint: disable=no-member
             raise SystemPermissionError(
@@ -428,17 +475,17 @@ class DBHandler:
         try:
             conn.executescript(script)
             conn.execute('PRAGMA foreign_keys=ON')
-            # Optimizations for the combined trades view
-            # the following will fail with DatabaseError in case of wrong password.
-            # If this goes away at any point it needs to be replaced by something
-            # that checks the password is correct at this same point in the code
-            conn.execute('PRAGMA cache_size = -32768')
+            # The first pragma of the profile, the cache size, will fail with DatabaseError
+            # in case of wrong password. If this goes away at any point it needs to be
+            # replaced by something that checks the password is correct at this same point
+            self.connection_profile.apply(conn, encrypted=True)
         except sqlcipher.DatabaseError as e:  # pylint: disable=no-member
+            conn.close()
             raise AuthenticationError(
                 'Wrong password or invalid/corrupt database for user',
             ) from e
 
-        setattr(self, conn_attribute, conn)
+        return conn
 
     def _change_password(
             self,
@@ -474,6 +521,8 @@ class DBHandler:
         )
         if result is True:
             self.password = new_password
+            if self.conn.reader_pool is not None:
+                self.conn.reader_pool.reset()  # readers are keyed with the old password
         return result
 
     def disconnect(self, conn_attribute: Literal['conn', 'conn_transient'] = 'conn') -> None:
@@ -2279,6 +2328,22 @@ class DBHandler:
 
         return list(results)
 
+    def get_held_asset_identifiers(self, cursor: 'DBCursor') -> set[str]:
+        """Query the DB for the identifiers of the assets the user holds or tracks
+
+        The assets are taken from:
+        - Balance snapshots
+        - Manual balances
+        - Detected tokens of the tracked EVM accounts
+        """
+        cursor.execute(
+            'SELECT currency FROM timed_balances UNION '
+            'SELECT asset FROM manually_tracked_balances UNION '
+            'SELECT value FROM evm_accounts_details WHERE key=?',
+            (EVM_ACCOUNTS_DETAILS_TOKENS,),
+        )
+        return {entry[0] for entry in cursor if entry[0] is not None}
+
     def update_owned_assets_in_globaldb(self, cursor: 'DBCursor') -> None:
         """Makes sure all owned assets of the user are in the Global DB"""
         assets = self.query_owned_assets(cursor)
@@ -2939,6 +3004,7 @@ class DBHandler:
             version = self.get_setting(cursor, 'version')
         new_db_filename = f'{ts_now()}_rotkehlchen_db_v{version}.backup'
         new_db_path = self.user_data_dir / new_db_filename
+        self.conn.wal_checkpoint()
         shutil.copyfile(
             self.user_data_dir / 'rotkehlchen.db',
             new_db_path,
@@ -2,11 +2,14 @@
  https://github.com/gilesbrown/gsqlite3/blob/fef400f1c5bcbc546772c827d3992e578ea5f905/gsqlite3.py
 but heavily modified"""
 
+import itertools
 import random
 import sqlite3
-from collections.abc import Generator, Sequence
+import time
+from collections.abc import Callable, Generator, Sequence
 from contextlib import contextmanager
 from enum import Enum, auto
+from functools import partial
 from pathlib import Path
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Literal, Optional, Union
@@ -19,15 +22,24 @@ from rotkehlchen.db.checks import sanity_check_impl
 from rotkehlchen.db.minimized_schema import MINIMIZED_USER_DB_SCHEMA
 from rotkehlchen.globaldb.minimized_schema import MINIMIZED_GLOBAL_DB_SCHEMA
 from rotkehlchen.greenlets.utils import get_greenlet_name
+from rotkehlchen.logging import TRACE
+from rotkehlchen.utils.metrics import get_request_timings
 from rotkehlchen.utils.misc import ts_now
 
 if TYPE_CHECKING:
     from rotkehlchen.logging import RotkehlchenLogger
+    from rotkehlchen.utils.metrics import RequestTimings
 
 UnderlyingCursor = Union[sqlite3.Cursor, sqlcipher.Cursor]  # pylint: disable=no-member
 UnderlyingConnection = Union[sqlite3.Connection, sqlcipher.Connection]  # pylint: disable=no-member
 
 CONTEXT_SWITCH_WAIT = 1  # seconds to wait for a status change in a DB context switch
+DEFAULT_READER_POOL_SIZE = 4  # max number of read-only connections serving read_ctx
+# Size of the prepared statement cache per connection. The python default of 128 is way
+# less than the number of distinct statements rotki uses, which leads to re-preparing them
+DEFAULT_CACHED_STATEMENTS = 1024
+# Every how many sqlite VM instructions a write slice checks if its time is over
+WRITE_SLICE_CHECK_INSTRUCTIONS = 1000
 import logging
 
 logger: 'RotkehlchenLogger' = logging.getLogger(__name__)  # type: ignore
@@ -38,13 +50,19 @@ class ContextError(Exception):
 
 
 class DBCursor:
+    __slots__ = ('_cursor', '_timings', 'connection', 'trace')
 
     def __init__(self, connection: 'DBConnection', cursor: UnderlyingCursor) -> None:
         self._cursor = cursor
         self.connection = connection
+        self.trace = connection.trace
+        # The timings of the request that executed the last statement, if it is tracked.
+        # Looked up once per statement so that fetching rows of untracked statements
+        # costs nothing extra.
+        self._timings: Optional[RequestTimings] = None
 
     def __iter__(self) -> 'DBCursor':
-        if __debug__:
+        if self.trace:
             logger.trace(f'Getting iterator for cursor {self._cursor}')
         return self
 
@@ -54,15 +72,22 @@ class DBCursor:
         too many false positives. Same as typeshed:
         https://github.com/python/typeshed/blob/a750a42c65b77963ff097b6cbb6d36cef5912eb7/stdlib/sqlite3/dbapi2.pyi#L397
         """
-        if __debug__:
+        if self.trace:
             logger.trace(f'Get next item for cursor {self._cursor}')
-        result = next(self._cursor, None)
+        if (timings := self._timings) is None:
+            result = next(self._cursor, None)
+        else:
+            start = time.perf_counter()
+            try:
+                result = next(self._cursor, None)
+            finally:
+                timings.db_seconds += time.perf_counter() - start
         if result is None:
-            if __debug__:
+            if self.trace:
                 logger.trace(f'Stopping iteration for cursor {self._cursor}')
             raise StopIteration
 
-        if __debug__:
+        if self.trace:
             logger.trace(f'Got next item for cursor {self._cursor}')
         return result
 
@@ -79,24 +104,35 @@ class DBCursor:
         return True
 
     def execute(self, statement: str, *bindings: Sequence) -> 'DBCursor':
-        if __debug__:
+        if self.trace:
             logger.trace(f'EXECUTE {statement}')
+        timings = self._timings = get_request_timings()
+        start = time.perf_counter()
         try:
             self._cursor.execute(statement, *bindings)
         except (sqlcipher.InterfaceError, sqlite3.InterfaceError):  # pylint: disable=no-member
             # Long story. Don't judge me. https://github.com/rotki/rotki/issues/5432
             logger.debug(f'{statement} with {bindings} failed due to https://github.com/rotki/rotki/issues/5432. Retrying')  # noqa: E501
             self._cursor.execute(statement, *bindings)
+        finally:
+            if timings is not None:
+                timings.db_seconds += time.perf_counter() - start
 
-        if __debug__:
+        if self.trace:
             logger.trace(f'FINISH EXECUTE {statement}')
         return self
 
     def executemany(self, statement: str, *bindings: Sequence[Sequence]) -> 'DBCursor':
-        if __debug__:
+        if self.trace:
             logger.trace(f'EXECUTEMANY {statement}')
-        self._cursor.executemany(statement, *bindings)
-        if __debug__:
+        timings = self._timings = get_request_timings()
+        start = time.perf_counter()
+        try:
+            self._cursor.executemany(statement, *bindings)
+        finally:
+            if timings is not None:
+                timings.db_seconds += time.perf_counter() - start
+        if self.trace:
             logger.trace(f'FINISH EXECUTEMANY {statement}')
         return self
 
@@ -104,10 +140,16 @@ class DBCursor:
         """Remember this always issues a COMMIT before
         https://docs.python.org/3/library/sqlite3.html#sqlite3.Cursor.executescript
         """
-        if __debug__:
+        if self.trace:
             logger.trace(f'EXECUTESCRIPT {script}')
-        self._cursor.executescript(script)
-        if __debug__:
+        timings = self._timings = get_request_timings()
+        start = time.perf_counter()
+        try:
+            self._cursor.executescript(script)
+        finally:
+            if timings is not None:
+                timings.db_seconds += time.perf_counter() - start
+        if self.trace:
             logger.trace(f'FINISH EXECUTESCRIPT {script}')
         return self
 
@@ -126,28 +168,47 @@ class DBCursor:
             self.execute('BEGIN TRANSACTION')
 
     def fetchone(self) -> Any:
-        if __debug__:
+        if self.trace:
             logger.trace('CURSOR FETCHONE')
-        result = self._cursor.fetchone()
-        if __debug__:
+        if (timings := self._timings) is None:
+            result = self._cursor.fetchone()
+        else:
+            start = time.perf_counter()
+            try:
+                result = self._cursor.fetchone()
+            finally:
+                timings.db_seconds += time.perf_counter() - start
+        if self.trace:
             logger.trace('FINISH CURSOR FETCHONE')
         return result
 
     def fetchmany(self, size: Optional[int] = None) -> list[Any]:
-        if __debug__:
+        if self.trace:
             logger.trace(f'CURSOR FETCHMANY with {size=}')
         if size is None:
             size = self._cursor.arraysize
-        result = self._cursor.fetchmany(size)
-        if __debug__:
+        timings = self._timings
+        start = time.perf_counter()
+        try:
+            result = self._cursor.fetchmany(size)
+        finally:
+            if timings is not None:
+                timings.db_seconds += time.perf_counter() - start
+        if self.trace:
             logger.trace('FINISH CURSOR FETCHMANY')
         return result
 
     def fetchall(self) -> list[Any]:
-        if __debug__:
+        if self.trace:
             logger.trace('CURSOR FETCHALL')
-        result = self._cursor.fetchall()
-        if __debug__:
+        timings = self._timings
+        start = time.perf_counter()
+        try:
+            result = self._cursor.fetchall()
+        finally:
+            if timings is not None:
+                timings.db_seconds += time.perf_counter() - start
+        if self.trace:
             logger.trace('FINISH CURSOR FETCHALL')
         return result
 
@@ -180,14 +241,13 @@ def _progress_callback(connection: Optional['DBConnection']) -> int:
     """Needs to be a static function. Cannot be a connection class method
     or sqlite breaks in funny ways. Raises random Operational errors.
     """
-    if __debug__:
-        identifier = random.random()
-        conn_type = connection.connection_type if connection else 'no connection'
-        logger.trace(f'START progress callback for {conn_type} with id {identifier}')
-
     if connection is None:
         return 0
 
+    if connection.trace:
+        identifier = random.random()
+        logger.trace(f'START progress callback for {connection.connection_type} with id {identifier}')  # noqa: E501
+
     if connection.in_callback.ready() is False:
         # This solves the bug described in test_callback_segfault_complex. This works
         # since we are single threaded and if we get here and it's locked we know that
@@ -198,10 +258,15 @@ def _progress_callback(connection: Optional['DBConnection']) -> int:
 
     # without this rotkehlchen/tests/db/test_async.py::test_async_segfault fails
     with connection.in_callback:
-        if __debug__:
+        if connection.trace:
             logger.trace(f'Got in locked section of the progress callback for {connection.connection_type} with id {identifier}')  # noqa: E501
-        gevent.sleep(0)
-        if __debug__:
+        if (timings := get_request_timings()) is None:
+            gevent.sleep(0)
+        else:  # the time other greenlets run while the statement waits is not DB time
+            start = time.perf_counter()
+            gevent.sleep(0)
+            timings.db_seconds -= time.perf_counter() - start
+        if connection.trace:
             logger.trace(f'Going out of the progress callback for {connection.connection_type} with id {identifier}')  # noqa: E501
         return 0
 
@@ -227,11 +292,24 @@ CALLBACK_MAP = {
     DBConnectionType.GLOBAL: global_callback,
 }
 
+# Pooled read-only connections can't live in CONNECTION_MAP since there are many of them
+# per connection type. Each one gets an id which is bound to its progress callback instead.
+READER_CONNECTION_MAP: dict[int, 'DBConnection'] = {}
+_reader_ids = itertools.count()
+
+
+def reader_callback(reader_id: int) -> int:
+    connection = READER_CONNECTION_MAP.get(reader_id)
+    return _progress_callback(connection)
+
 
 class DBConnection:
 
     def _set_progress_handler(self) -> None:
-        callback = CALLBACK_MAP.get(self.connection_type)
+        if self.reader_id is None:
+            callback = CALLBACK_MAP.get(self.connection_type)
+        else:
+            callback = partial(reader_callback, self.reader_id)
         self._conn.set_progress_handler(callback, self.sql_vm_instructions_cb)
 
     def __init__(
@@ -239,8 +317,24 @@ class DBConnection:
             path: Union[str, Path],
             connection_type: DBConnectionType,
             sql_vm_instructions_cb: int,
+            is_reader: bool = False,
+            cached_statements: int = DEFAULT_CACHED_STATEMENTS,
     ) -> None:
-        CONNECTION_MAP[connection_type] = self
+        """If `is_reader` is True this is one of the read-only connections of a DBReaderPool
+
+        `cached_statements` is the size of the prepared statement cache of the connection.
+        """
+        # Whether to trace log each DB operation. Decided once here since checking the log
+        # level in every execute is a measurable overhead. Always False when run with -O.
+        self.trace = __debug__ and logger.isEnabledFor(TRACE)
+        self.reader_id: Optional[int] = None
+        if is_reader is True:
+            self.reader_id = next(_reader_ids)
+            READER_CONNECTION_MAP[self.reader_id] = self
+        else:
+            CONNECTION_MAP[connection_type] = self
+        # Read-only connections that serve read_ctx. Set by the owner of the connection
+        self.reader_pool: Optional[DBReaderPool] = None
         self._conn: UnderlyingConnection
         self.in_callback = gevent.lock.Semaphore()
         self.transaction_lock = gevent.lock.Semaphore()
@@ -258,12 +352,14 @@ class DBConnection:
                 database=path,
                 check_same_thread=False,
                 isolation_level=None,
+                cached_statements=cached_statements,
             )
         else:
             self._conn = sqlcipher.connect(  # pylint: disable=no-member
                 database=path,
                 check_same_thread=False,
                 isolation_level=None,
+                cached_statements=cached_statements,
             )
         self._set_progress_handler()
         self.minimized_schema = None
@@ -273,18 +369,18 @@ class DBConnection:
             self.minimized_schema = MINIMIZED_GLOBAL_DB_SCHEMA
 
     def execute(self, statement: str, *bindings: Sequence) -> DBCursor:
-        if __debug__:
+        if self.trace:
             logger.trace(f'DB CONNECTION EXECUTE {statement}')
         underlying_cursor = self._conn.execute(statement, *bindings)
-        if __debug__:
+        if self.trace:
             logger.trace(f'FINISH DB CONNECTION EXECUTEMANY {statement}')
         return DBCursor(connection=self, cursor=underlying_cursor)
 
     def executemany(self, statement: str, *bindings: Sequence[Sequence]) -> DBCursor:
-        if __debug__:
+        if self.trace:
             logger.trace(f'DB CONNECTION EXECUTEMANY {statement}')
         underlying_cursor = self._conn.executemany(statement, *bindings)
-        if __debug__:
+        if self.trace:
             logger.trace(f'FINISH DB CONNECTION EXECUTEMANY {statement}')
         return DBCursor(connection=self, cursor=underlying_cursor)
 
@@ -292,47 +388,74 @@ class DBConnection:
         """Remember this always issues a COMMIT before
         https://docs.python.org/3/library/sqlite3.html#sqlite3.Cursor.executescript
         """
-        if __debug__:
+        if self.trace:
             logger.trace(f'DB CONNECTION EXECUTESCRIPT {script}')
         underlying_cursor = self._conn.executescript(script)
-        if __debug__:
+        if self.trace:
             logger.trace(f'DB CONNECTION EXECUTESCRIPT {script}')
         return DBCursor(connection=self, cursor=underlying_cursor)
 
     def commit(self) -> None:
         with self.in_callback:
-            if __debug__:
+            if self.trace:
                 logger.trace('START DB CONNECTION COMMIT')
             try:
                 self._conn.commit()
             finally:
-                if __debug__:
+                if self.trace:
                     logger.trace('FINISH DB CONNECTION COMMIT')
 
     def rollback(self) -> None:
         with self.in_callback:
-            if __debug__:
+            if self.trace:
                 logger.trace('START DB CONNECTION ROLLBACK')
             try:
                 self._conn.rollback()
             finally:
-                if __debug__:
+                if self.trace:
                     logger.trace('FINISH DB CONNECTION ROLLBACK')
 
     def cursor(self) -> DBCursor:
         return DBCursor(connection=self, cursor=self._conn.cursor())
 
     def close(self) -> None:
+        if self.reader_pool is not None:
+            self.reader_pool.close()
         self._conn.close()
-        CONNECTION_MAP.pop(self.connection_type, None)
+        if self.reader_id is not None:
+            READER_CONNECTION_MAP.pop(self.reader_id, None)
+        else:
+            CONNECTION_MAP.pop(self.connection_type, None)
+
+    def _read_needs_writer(self) -> bool:
+        """Reads of the greenlet that has a write transaction or savepoint open need to
+        see its uncommitted changes, so they can't be served by a pooled reader"""
+        if self._conn.in_transaction is False:
+            return False
+        if self.write_greenlet_id is None and self.savepoint_greenlet_id is None:
+            return True  # transaction not opened via a context. Can't tell whose it is
+
+        current_id = get_greenlet_name(gevent.getcurrent())
+        return current_id in (self.write_greenlet_id, self.savepoint_greenlet_id)
 
     @contextmanager
     def read_ctx(self) -> Generator['DBCursor', None, None]:
-        cursor = self.cursor()
-        try:
-            yield cursor
-        finally:
-            cursor.close()
+        """Opens a cursor for reading. If there is a reader pool the cursor comes from one
+        of its connections so that the read neither waits for nor blocks the writer"""
+        if self.reader_pool is None or self._read_needs_writer():
+            cursor = self.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+            return
+
+        with self.reader_pool.reader() as reader:
+            cursor = reader.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
 
     @contextmanager
     def write_ctx(self, commit_ts: bool = False) -> Generator['DBCursor', None, None]:
@@ -378,6 +501,35 @@ class DBConnection:
                 cursor.close()
                 self.write_greenlet_id = None
 
+    @contextmanager
+    def write_slice_ctx(self, seconds: float) -> Generator['DBCursor', None, None]:
+        """A write transaction whose statements may only run for the given seconds after
+        it got the transaction lock. A statement still running when the time is over is
+        interrupted and the whole transaction is rolled back. For background work that
+        should not keep the writer from other greenlets for long.
+
+        May raise:
+        - sqlcipher.OperationalError/sqlite3.OperationalError 'interrupted' if the time
+        of the slice was not enough
+        - ContextError if the current greenlet has open savepoints, since then this
+        would not be a transaction of its own
+        """
+        if len(self.savepoints) != 0 and self.savepoint_greenlet_id == get_greenlet_name(gevent.getcurrent()):  # noqa: E501
+            raise ContextError('A write slice can not be opened inside a savepoint')
+
+        with self.write_ctx() as cursor:
+            # write_ctx is a critical section so the greenlet switching progress handler
+            # is not set and this one can take its place until the commit
+            deadline = time.monotonic() + seconds
+            self._conn.set_progress_handler(
+                lambda: int(time.monotonic() > deadline),
+                WRITE_SLICE_CHECK_INSTRUCTIONS,
+            )
+            try:
+                yield cursor
+            finally:
+                self._conn.set_progress_handler(None, 0)
+
     @contextmanager
     def savepoint_ctx(
             self,
@@ -479,13 +631,13 @@ class DBConnection:
     @contextmanager
     def critical_section(self) -> Generator[None, None, None]:
         with self.in_callback:
-            if __debug__:
+            if self.trace:
                 logger.trace(f'entering critical section for {self.connection_type}')
             self._conn.set_progress_handler(None, 0)
         yield
 
         with self.in_callback:
-            if __debug__:
+            if self.trace:
                 logger.trace(f'exiting critical section for {self.connection_type}')
             self._set_progress_handler()
 
@@ -494,6 +646,34 @@ class DBConnection:
         with self.critical_section(), self.transaction_lock:
             yield
 
+    def enable_wal(self) -> bool:
+        """Switches the DB to WAL journaling, which persists in the DB file. The switch is
+        not possible while other connections to the DB are open. Returns whether the DB
+        is journaled with WAL."""
+        try:
+            journal_mode = self.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+        except (sqlcipher.OperationalError, sqlite3.OperationalError) as e:  # pylint: disable=no-member
+            logger.warning(f'Could not switch {self.connection_type} DB to WAL due to {e!s}')
+            return False
+
+        return journal_mode == 'wal'
+
+    def enable_incremental_vacuum(self) -> None:
+        """Switches the DB to incremental auto vacuum so that the pages freed by deletions
+        can be returned to the file system a few at a time. Switching an existing DB takes
+        a VACUUM which rewrites the whole file so it should only happen in upgrades or
+        before the tables of a new DB are created."""
+        self.execute('PRAGMA auto_vacuum=INCREMENTAL')
+        self.execute('VACUUM')
+
+    def wal_checkpoint(self) -> None:
+        """Moves all committed content of the write-ahead log into the DB file and truncates
+        the log. Needs to happen before the file of an open DB is copied."""
+        try:
+            self.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        except (sqlcipher.OperationalError, sqlite3.OperationalError) as e:  # pylint: disable=no-member
+            logger.warning(f'Could not checkpoint the {self.connection_type} DB due to {e!s}')
+
     @property
     def total_changes(self) -> int:
         """total number of database rows that have been modified, inserted,
@@ -517,3 +697,62 @@ class DBConnection:
                 db_name=self.connection_type.name.lower(),
                 minimized_schema=self.minimized_schema,
             )
+
+
+class DBReaderPool:
+    """A pool of read-only connections to a WAL journaled DB that serve `read_ctx`
+
+    Under WAL readers neither block the writer nor get blocked by it, so a long read of
+    one greenlet no longer delays the simple reads of the others. Connections are opened
+    lazily, up to `size` of them. A greenlet that already uses a reader gets the same one
+    for its nested read contexts so nesting can't exhaust the pool.
+    """
+
+    def __init__(
+            self,
+            connect: Callable[[], DBConnection],
+            size: int = DEFAULT_READER_POOL_SIZE,
+    ) -> None:
+        self.connect = connect
+        self.connections: list[DBConnection] = []
+        self.idle: list[DBConnection] = []
+        self.lent: dict[Any, DBConnection] = {}  # greenlet -> its reader
+        self.slots = gevent.lock.BoundedSemaphore(size)
+        self.closed = False
+
+    @contextmanager
+    def reader(self) -> Generator[DBConnection, None, None]:
+        current = gevent.getcurrent()
+        if (connection := self.lent.get(current)) is not None:
+            yield connection  # nested read context. Only the outermost one returns it
+            return
+
+        with self.slots:
+            connection = self.idle.pop() if len(self.idle) != 0 else self._open()
+            self.lent[current] = connection
+            try:
+                yield connection
+            finally:
+                del self.lent[current]
+                if self.closed is False and connection in self.connections:
+                    self.idle.append(connection)
+                else:  # the pool was reset or closed while the reader was lent
+                    connection.close()
+
+    def _open(self) -> DBConnection:
+        connection = self.connect()
+        self.connections.append(connection)
+        return connection
+
+    def reset(self) -> None:
+        """Closes all idle readers. Lent ones are closed when returned. New readers get
+        opened on demand. Needed when the writer changes something readers depend on,
+        like the DB key."""
+        for connection in self.idle:
+            connection.close()
+        self.idle = []
+        self.connections = []
+
+    def close(self) -> None:
+        self.closed = True
+        self.reset()
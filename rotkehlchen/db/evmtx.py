@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Optional, get_args
 
 from rotkehlchen.chain.arbitrum_one.constants import ARBITRUM_ONE_GENESIS
@@ -29,7 +30,7 @@ from rotkehlchen.types import (
     deserialize_evm_tx_hash,
 )
 from rotkehlchen.utils.hexbytes import hexstring_to_bytes
-from rotkehlchen.utils.misc import hexstr_to_int
+from rotkehlchen.utils.misc import get_chunks, hexstr_to_int
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
@@ -44,6 +45,8 @@ TRANSACTIONS_MISSING_DECODING_QUERY = (
     'evmtx_receipts AS A LEFT OUTER JOIN evm_tx_mappings AS B ON A.tx_id=B.tx_id '
     'LEFT JOIN evm_transactions AS C on A.tx_id=C.identifier '
 )
+# How many transaction hashes to look up in one query when storing receipts in bulk
+RECEIPTS_TX_IDS_CHUNK_SIZE = 500
 
 
 class DBEvmTx:
@@ -312,62 +315,101 @@ class DBEvmTx:
 
         Also need to provide the chain id.
 
-        This assumes the transaction is already in the DB.
+        This assumes the transaction is already in the DB. If it is not the receipt
+        is skipped and an error is logged.
 
         May raise:
         - Key Error if any of the expected fields are missing
         - DeserializationError if there is a problem deserializing a value
-        - pysqlcipher3.dbapi2.IntegrityError if the transaction hash is not in the DB:
-        pysqlcipher3.dbapi2.IntegrityError: FOREIGN KEY constraint failed
-        If the receipt already exists in the DB:
-        pysqlcipher3.dbapi2.IntegrityError: UNIQUE constraint failed: evmtx_receipts.tx_hash
+        - pysqlcipher3.dbapi2.IntegrityError if the receipt already exists in the DB:
+        pysqlcipher3.dbapi2.IntegrityError: UNIQUE constraint failed: evmtx_receipts.tx_id
         """
-        tx_hash_b = hexstring_to_bytes(data['transactionHash'])
-        # some nodes miss the type field for older non EIP1559 transactions. So assume legacy (0)
-        tx_type = hexstr_to_int(data.get('type', '0x0'))
-        status = data.get('status', 1)  # status may be missing for older txs. Assume 1.
-        serialized_chain_id = chain_id.serialize_for_db()
-        if status is None:
-            status = 1
+        self.add_receipts_data(write_cursor=write_cursor, chain_id=chain_id, receipts_data=[data])
 
-        contract_address = deserialize_evm_address(data['contractAddress']) if data['contractAddress'] else None  # noqa: E501
-        tx_id = write_cursor.execute(
-            'SELECT identifier from evm_transactions WHERE tx_hash=? AND chain_id=?',
-            (tx_hash_b, serialized_chain_id),
+    def add_receipts_data(
+            self,
+            write_cursor: 'DBCursor',
+            chain_id: ChainID,
+            receipts_data: Sequence[dict[str, Any]],
+    ) -> None:
+        """Add the data of many tx receipts of the given chain to the DB at once.
+
+        The identifiers of the logs are assigned here, continuing from the biggest one in
+        the DB, so that logs and topics can be inserted in bulk without having to
+        read back the identifier of each inserted log. This is safe since it all
+        happens in the same write transaction.
+
+        Same assumptions and exceptions as `add_receipt_data`. If any receipt fails
+        nothing is written, given the caller rolls back the write transaction.
+        """
+        serialized_chain_id = chain_id.serialize_for_db()
+        tx_hashes = [hexstring_to_bytes(data['transactionHash']) for data in receipts_data]
+        tx_ids: dict[bytes, int] = {}
+        for chunk in get_chunks(tx_hashes, n=RECEIPTS_TX_IDS_CHUNK_SIZE):
+            tx_ids.update((tx_hash, tx_id) for tx_id, tx_hash in write_cursor.execute(
+                f'SELECT identifier, tx_hash from evm_transactions WHERE tx_hash IN ({",".join("?" * len(chunk))}) AND chain_id=?',  # noqa: E501
+                (*chunk, serialized_chain_id),
+            ))
+
+        log_id = write_cursor.execute(
+            'SELECT COALESCE(MAX(identifier), 0) FROM evmtx_receipt_logs',
         ).fetchone()[0]
-        write_cursor.execute(
-            'INSERT INTO evmtx_receipts (tx_id, contract_address, status, type) '
-            'VALUES(?, ?, ?, ?) ',
-            (tx_id, contract_address, status, tx_type),
-        )
+        receipt_tuples: list[tuple[int, Optional[ChecksumEvmAddress], int, int]] = []
+        log_tuples: list[tuple[int, int, int, bytes, ChecksumEvmAddress, int]] = []
+        topic_tuples: list[tuple[int, bytes, int]] = []
+        log_addresses: dict[str, ChecksumEvmAddress] = {}
+        for tx_hash_b, data in zip(tx_hashes, receipts_data):
+            if (tx_id := tx_ids.get(tx_hash_b)) is None:
+                # evmtx_receipts.tx_id is the rowid so inserting NULL would attach the
+                # receipt to whatever transaction gets the next identifier
+                log.error(
+                    f'Skipping receipt of {chain_id} transaction {data["transactionHash"]} '
+                    f'since the transaction is not in the DB',
+                )
+                continue
 
-        for log_entry in data['logs']:
-            write_cursor.execute(
-                'INSERT INTO evmtx_receipt_logs (tx_id, log_index, data, address, removed) '
-                'VALUES(? ,? ,? ,? ,?)',
-                (
+            # some nodes miss the type field for older non EIP1559 transactions. So assume legacy (0)  # noqa: E501
+            tx_type = hexstr_to_int(data.get('type', '0x0'))
+            status = data.get('status', 1)  # status may be missing for older txs. Assume 1.
+            if status is None:
+                status = 1
+
+            contract_address = deserialize_evm_address(data['contractAddress']) if data['contractAddress'] else None  # noqa: E501
+            receipt_tuples.append((tx_id, contract_address, status, tx_type))
+            for log_entry in data['logs']:
+                log_id += 1
+                # checksumming is the most expensive part and a few contracts emit most logs
+                if (log_address := log_addresses.get(log_entry['address'])) is None:
+                    log_address = log_addresses[log_entry['address']] = deserialize_evm_address(log_entry['address'])  # noqa: E501
+                log_tuples.append((
+                    log_id,
                     tx_id,
                     log_entry['logIndex'],
                     hexstring_to_bytes(log_entry['data']),
-                    deserialize_evm_address(log_entry['address']),
+                    log_address,
                     int(log_entry['removed']),
-                ),
-            )
-            log_id = write_cursor.lastrowid
-            topic_tuples = []
-            for idx, topic in enumerate(log_entry['topics']):
-                topic_tuples.append((
-                    log_id,
-                    hexstring_to_bytes(topic),
-                    idx,
                 ))
-            if len(topic_tuples) != 0:
-                write_cursor.executemany(
-                    'INSERT INTO evmtx_receipt_log_topics (log, topic, topic_index) '
-                    'VALUES(? ,? ,?)',
-                    topic_tuples,
+                topic_tuples.extend(
+                    (log_id, hexstring_to_bytes(topic), idx)
+                    for idx, topic in enumerate(log_entry['topics'])
                 )
 
+        write_cursor.executemany(
+            'INSERT INTO evmtx_receipts (tx_id, contract_address, status, type) '
+            'VALUES(?, ?, ?, ?) ',
+            receipt_tuples,
+        )
+        write_cursor.executemany(
+            'INSERT INTO evmtx_receipt_logs (identifier, tx_id, log_index, data, address, removed) '  # noqa: E501
+            'VALUES(?, ? ,? ,? ,? ,?)',
+            log_tuples,
+        )
+        write_cursor.executemany(
+            'INSERT INTO evmtx_receipt_log_topics (log, topic, topic_index) '
+            'VALUES(? ,? ,?)',
+            topic_tuples,
+        )
+
     def get_receipt(
             self,
             cursor: 'DBCursor',
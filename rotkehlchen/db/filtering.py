@@ -4,10 +4,10 @@ from collections.abc import Collection
 from dataclasses import dataclass, field
 from typing import Any, Generic, Literal, NamedTuple, Optional, TypeVar, Union, cast
 
+from rotkehlchen.accounting.mixins.event import AccountingEventType
 from rotkehlchen.accounting.structures.base import HistoryBaseEntryType
 from rotkehlchen.accounting.structures.evm_event import EvmProduct
 from rotkehlchen.accounting.structures.types import HistoryEventSubType, HistoryEventType
-from rotkehlchen.accounting.types import SchemaEventType
 from rotkehlchen.api.v1.types import IncludeExcludeFilterData
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.assets.types import AssetType
@@ -241,7 +241,7 @@ class DBReportDataReportIDFilter(DBFilter):
 
 @dataclass(init=True, repr=True, eq=True, order=False, unsafe_hash=False, frozen=False)
 class DBReportDataEventTypeFilter(DBFilter):
-    event_type: Optional[Union[str, SchemaEventType]] = None
+    event_type: Optional[Union[str, AccountingEventType]] = None
 
     def prepare(self) -> tuple[list[str], list[Any]]:
         if self.event_type is None:
@@ -249,14 +249,35 @@ class DBReportDataEventTypeFilter(DBFilter):
 
         if isinstance(self.event_type, str):
             try:
-                value = SchemaEventType.deserialize_from_db(self.event_type)
+                value = AccountingEventType.deserialize(self.event_type)
             except DeserializationError as e:
                 log.error(f'Failed to filter a DB transaction query by event_type: {e!s}')
                 return [], []
         else:
             value = self.event_type
 
-        return ['event_type=?'], [str(value)]
+        return ['type=?'], [value.serialize()]
+
+
+@dataclass(init=True, repr=True, eq=True, order=False, unsafe_hash=False, frozen=False)
+class DBReportDataAfterEventFilter(DBFilter):
+    """Keyset pagination for the events of a PnL report
+
+    Returns the events that come after the event with the given identifier when
+    ordering by (timestamp, identifier). Seeking like this goes through the
+    (report_id, timestamp) index so the cost of a page does not depend on how many
+    events come before it, unlike an OFFSET.
+    """
+    identifier: int
+    ascending: bool
+
+    def prepare(self) -> tuple[list[str], list[Any]]:
+        comparison, strict = ('>=', '>') if self.ascending else ('<=', '<')
+        timestamp_query = '(SELECT timestamp FROM pnl_events WHERE identifier=?)'
+        return [
+            f'timestamp {comparison} {timestamp_query}',
+            f'(timestamp {strict} {timestamp_query} OR identifier {strict} ?)',
+        ], [self.identifier, self.identifier, self.identifier]
 
 
 @dataclass(init=True, repr=True, eq=True, order=False, unsafe_hash=False, frozen=False)
@@ -764,7 +785,7 @@ class Eth2DailyStatsFilterQuery(DBFilterQuery, FilterWithTimestamp):
 
 
 @dataclass(init=True, repr=True, eq=True, order=False, unsafe_hash=False, frozen=False)
-class ReportDataFilterQuery(DBFilterQuery, FilterWithTimestamp):
+class ReportDataFilterQuery(DBFilterQuery, FilterWithTimestamp, FilterWithLocation):
 
     @property
     def report_id_filter(self) -> Optional[DBReportDataReportIDFilter]:
@@ -774,8 +795,15 @@ class ReportDataFilterQuery(DBFilterQuery, FilterWithTimestamp):
 
     @property
     def event_type_filter(self) -> Optional[DBReportDataEventTypeFilter]:
-        if len(self.filters) >= 2 and isinstance(self.filters[1], DBReportDataEventTypeFilter):
-            return self.filters[1]
+        for fil in self.filters:
+            if isinstance(fil, DBReportDataEventTypeFilter):
+                return fil
+        return None
+
+    @property
+    def after_event_filter(self) -> Optional[DBReportDataAfterEventFilter]:
+        if len(self.filters) >= 1 and isinstance(self.filters[-1], DBReportDataAfterEventFilter):
+            return self.filters[-1]
         return None
 
     @property
@@ -786,7 +814,7 @@ class ReportDataFilterQuery(DBFilterQuery, FilterWithTimestamp):
         return report_id_filter.report_id
 
     @property
-    def event_type(self) -> Optional[Union[str, SchemaEventType]]:
+    def event_type(self) -> Optional[Union[str, AccountingEventType]]:
         event_type_filter = self.event_type_filter
         if event_type_filter is None:
             return None
@@ -799,13 +827,24 @@ class ReportDataFilterQuery(DBFilterQuery, FilterWithTimestamp):
             order_by_rules: Optional[list[tuple[str, bool]]] = None,
             limit: Optional[int] = None,
             offset: Optional[int] = None,
+            after_identifier: Optional[int] = None,
             report_id: Optional[int] = None,
-            event_type: Optional[str] = None,
+            event_type: Optional[Union[str, AccountingEventType]] = None,
+            asset: Optional[Asset] = None,
+            location: Optional[Location] = None,
             from_ts: Optional[Timestamp] = None,
             to_ts: Optional[Timestamp] = None,
     ) -> 'ReportDataFilterQuery':
+        """If `after_identifier` is given then the events after the event with that
+        identifier are returned, paginating by keyset instead of by offset"""
         if order_by_rules is None:
             order_by_rules = [('timestamp', True)]
+        # identifier breaks the ties between events of the same timestamp so that the
+        # order is total, which the keyset pagination relies on
+        ascending = order_by_rules[0][1]
+        order_by_rules = [*order_by_rules, ('identifier', ascending)]
+        if after_identifier is not None and limit is not None:
+            offset = 0
 
         filter_query = cls.create(
             and_op=and_op,
@@ -819,6 +858,11 @@ class ReportDataFilterQuery(DBFilterQuery, FilterWithTimestamp):
             filters.append(DBReportDataReportIDFilter(and_op=True, report_id=report_id))
         if event_type is not None:
             filters.append(DBReportDataEventTypeFilter(and_op=True, event_type=event_type))
+        if asset is not None:
+            filters.append(DBAssetFilter(and_op=True, asset=asset, asset_key='asset'))
+        if location is not None:
+            filter_query.location_filter = DBLocationFilter(and_op=True, location=location)
+            filters.append(filter_query.location_filter)
 
         filter_query.timestamp_filter = DBTimestampFilter(
             and_op=True,
@@ -826,6 +870,12 @@ class ReportDataFilterQuery(DBFilterQuery, FilterWithTimestamp):
             to_ts=to_ts,
         )
         filters.append(filter_query.timestamp_filter)
+        if after_identifier is not None:
+            filters.append(DBReportDataAfterEventFilter(
+                and_op=True,
+                identifier=after_identifier,
+                ascending=ascending,
+            ))
         filter_query.filters = filters
         return filter_query
 
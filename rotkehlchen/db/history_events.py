@@ -1,6 +1,8 @@
 import copy
 import logging
+from collections import defaultdict
 from collections.abc import Sequence
+from itertools import groupby
 from typing import TYPE_CHECKING, Any, Literal, Optional, Union, overload
 
 from pysqlcipher3 import dbapi2 as sqlcipher
@@ -112,13 +114,49 @@ class DBHistoryEvents:
     ) -> None:
         """Insert a list of history events in the database.
 
+        Same as calling add_history_event() for each event but with a constant number of
+        queries. The base rows are inserted with executemany, the identifiers of the
+        newly inserted ones are read back with one query and then the rows of the
+        tables that extend history_events are inserted with executemany per table.
+        Events that already exist are ignored along with all of their extra data.
+
         Check add_history_event() to see possible Exceptions
         """
-        for event in history:
-            self.add_history_event(
-                write_cursor=write_cursor,
-                event=event,
+        if len(history) == 0:
+            return
+
+        serialized = [event.serialize_for_db() for event in history]
+        # any identifier after the current max one belongs to a row inserted here
+        max_identifier = write_cursor.execute(
+            'SELECT COALESCE(MAX(identifier), 0) FROM history_events',
+        ).fetchone()[0]
+        # insert consecutive runs of the same query so identifiers follow the events' order
+        for base_query, group in groupby(serialized, key=lambda x: x[0][0]):
+            write_cursor.executemany(
+                f'INSERT OR IGNORE INTO {base_query}',
+                [entries[0][2] for entries in group],
+            )
+
+        new_identifiers = {
+            (event_identifier, sequence_index): identifier
+            for identifier, event_identifier, sequence_index in write_cursor.execute(
+                'SELECT identifier, event_identifier, sequence_index FROM history_events '
+                'WHERE identifier > ?',
+                (max_identifier,),
             )
+        }
+        extra_bindings: defaultdict[str, list[tuple]] = defaultdict(list)
+        for event, entries in zip(history, serialized):
+            # pop so that for duplicates in the given events only the first one gets extra data
+            identifier = new_identifiers.pop((event.event_identifier, event.sequence_index), None)
+            if identifier is None:
+                continue  # already existed
+
+            for insertquery, _, bindings in entries[1:]:
+                extra_bindings[insertquery].append((identifier, *bindings))
+
+        for insertquery, bindings_list in extra_bindings.items():
+            write_cursor.executemany(f'INSERT OR IGNORE INTO {insertquery}', bindings_list)
 
     def edit_history_event(self, event: HistoryBaseEntry) -> tuple[bool, str]:
         """
@@ -0,0 +1,168 @@
+import logging
+import sqlite3
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import gevent
+from pysqlcipher3 import dbapi2 as sqlcipher
+
+from rotkehlchen.db.constants import LAST_DB_MAINTENANCE_KEY
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.logging import RotkehlchenLogsAdapter
+from rotkehlchen.utils.misc import ts_now
+
+if TYPE_CHECKING:
+    from rotkehlchen.db.dbhandler import DBHandler
+    from rotkehlchen.db.drivers.gevent import DBConnection
+
+logger = logging.getLogger(__name__)
+log = RotkehlchenLogsAdapter(logger)
+
+DB_MAINTENANCE_TIME_BUDGET = 20.0  # seconds a maintenance run may take in total
+DB_MAINTENANCE_WRITE_SLICE = 0.2  # seconds the maintenance may hold the DB writer at once
+# Tables with fewer rows are not worth the time to analyze
+ANALYZE_MIN_ROWS = 10000
+# Statistics of a table are stale if its rows changed by more than this ratio since
+ANALYZE_STALE_RATIO = 0.5
+# Rows per index that an ANALYZE that did not fit in a write slice looks at instead
+ANALYZE_FALLBACK_LIMIT = 1000
+# Pages the first incremental vacuum step frees. Adjusted to the speed of the disk
+INCREMENTAL_VACUUM_PAGES = 256
+AUTO_VACUUM_INCREMENTAL = 2
+
+DB_ERRORS = (sqlite3.OperationalError, sqlcipher.OperationalError)  # pylint: disable=no-member
+
+
+class DBMaintenance:
+    """Keeps the user and global DBs fast and small in the background
+
+    For each DB it analyzes the big tables whose statistics are missing or stale, lets
+    sqlite run PRAGMA optimize and returns the free pages to the file system with
+    incremental vacuum. All the work happens in write slices that are rolled back if
+    they take longer than `write_slice` seconds so that the writer is never held for
+    long, and the whole run stops once `time_budget` seconds have passed.
+    """
+
+    def __init__(
+            self,
+            database: 'DBHandler',
+            time_budget: float = DB_MAINTENANCE_TIME_BUDGET,
+            write_slice: float = DB_MAINTENANCE_WRITE_SLICE,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.database = database
+        self.time_budget = time_budget
+        self.write_slice = write_slice
+        self.clock = clock
+        self.deadline = 0.0
+
+    def _remaining(self) -> float:
+        return self.deadline - self.clock()
+
+    def _run_slice(self, conn: 'DBConnection', statements: list[str]) -> bool:
+        """Runs the statements in a write slice. Returns whether they completed in time"""
+        if (seconds := min(self.write_slice, self._remaining())) <= 0:
+            return False
+
+        try:
+            with conn.write_slice_ctx(seconds) as write_cursor:
+                for statement in statements:
+                    write_cursor.execute(statement).fetchall()
+        except DB_ERRORS as e:
+            log.debug(f'DB maintenance of {conn.connection_type} did not complete {statements} due to {e!s}')  # noqa: E501
+            return False
+        finally:
+            gevent.sleep(0)  # let other greenlets use the DB between slices
+
+        return True
+
+    def _stale_tables(self, conn: 'DBConnection') -> list[str]:
+        """Returns the big tables of the DB whose statistics are missing or stale. Counting
+        the rows of a table scans it, so once the time budget is over the tables that were
+        not counted yet are left for the next run."""
+        with conn.read_ctx() as cursor:
+            tables = [x[0] for x in cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'",
+            )]
+            analyzed_rows: dict[str, int] = {}
+            if cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE name='sqlite_stat1'").fetchone()[0] == 1:  # noqa: E501
+                for table, stat in cursor.execute('SELECT tbl, stat FROM sqlite_stat1'):
+                    rows = int(stat.split(' ', maxsplit=1)[0])
+                    analyzed_rows[table] = max(rows, analyzed_rows.get(table, 0))
+
+            stale_tables = []
+            for table in tables:
+                if self._remaining() <= 0:
+                    break
+
+                rows = cursor.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+                if rows < ANALYZE_MIN_ROWS:
+                    continue
+                if (
+                    (analyzed := analyzed_rows.get(table)) is None or
+                    abs(rows - analyzed) > analyzed * ANALYZE_STALE_RATIO
+                ):
+                    stale_tables.append(table)
+
+        return stale_tables
+
+    def _analyze(self, conn: 'DBConnection') -> None:
+        for table in self._stale_tables(conn):
+            if self._run_slice(conn, [f'ANALYZE "{table}"']) is True:
+                continue
+
+            # approximate statistics from a sample of each index fit in a slice
+            if self._run_slice(conn, [
+                f'PRAGMA analysis_limit={ANALYZE_FALLBACK_LIMIT}',
+                f'ANALYZE "{table}"',
+            ]) is False:
+                log.debug(f'Could not analyze {table} of {conn.connection_type} in a write slice')
+            conn.execute('PRAGMA analysis_limit=0')
+            if self._remaining() <= 0:
+                return
+
+    def _incremental_vacuum(self, conn: 'DBConnection') -> None:
+        with conn.read_ctx() as cursor:
+            if cursor.execute('PRAGMA auto_vacuum').fetchone()[0] != AUTO_VACUUM_INCREMENTAL:
+                return  # DB not switched to incremental vacuum in an upgrade
+
+        pages = INCREMENTAL_VACUUM_PAGES
+        while self._remaining() > 0:
+            with conn.read_ctx() as cursor:
+                if cursor.execute('PRAGMA freelist_count').fetchone()[0] == 0:
+                    return
+
+            start = self.clock()
+            if self._run_slice(conn, [f'PRAGMA incremental_vacuum({pages})']) is False:
+                if pages == 1:
+                    return  # can't free even a single page in a slice
+
+                pages //= 2
+            elif self.clock() - start < self.write_slice / 2:
+                pages *= 2
+
+    def _maintain(self, conn: 'DBConnection') -> None:
+        self._analyze(conn)
+        self._run_slice(conn, ['PRAGMA optimize'])
+        self._incremental_vacuum(conn)
+
+    def run(self) -> bool:
+        """Maintains the user and the global DB. Returns whether all of it fit in the time
+        budget. Only then the run is recorded so that an unfinished one resumes at the
+        next idle moment instead of the next day."""
+        start = self.clock()
+        self.deadline = start + self.time_budget
+        for conn in (self.database.conn, GlobalDBHandler().conn):
+            self._maintain(conn)
+
+        if (finished := self._remaining() > 0) is True:
+            # not a user_write since maintenance changes no data that should be synced
+            with self.database.conn.write_ctx() as write_cursor:
+                write_cursor.execute(
+                    'INSERT OR REPLACE INTO settings(name, value) VALUES(?, ?)',
+                    (LAST_DB_MAINTENANCE_KEY, str(ts_now())),
+                )
+
+        log.debug(f'DB maintenance {"finished" if finished else "ran out of time"} after {self.clock() - start:.2f} seconds')  # noqa: E501
+        return finished
@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal, Optional
+
+if TYPE_CHECKING:
+    from rotkehlchen.db.drivers.gevent import DBConnection
+
+DBProfileName = Literal['default', 'low-memory', 'throughput']
+
+
+@dataclass(frozen=True)
+class DBConnectionProfile:
+    """The pragmas with which each connection to a DB is tuned after it is opened.
+
+    A None value leaves the SQLite/SQLCipher default in place. The cache size is per
+    connection, so the user DB uses it once for the writer and once per pooled reader.
+
+    The page size is not part of a profile. For an encrypted DB the cipher page size has to
+    be the one the DB was created with for it to be readable at all, so it can't change
+    per connection. tools/scripts/benchmark_db_profiles.py can measure it for new DBs.
+    """
+    name: DBProfileName
+    # Page cache size. Negative values are KiB and positive values are pages
+    cache_size: int
+    # Where temporary tables and indices of sorts and groupings live
+    temp_store: Optional[Literal['FILE', 'MEMORY']] = None
+    # Bytes of the DB file to memory map. SQLCipher can't memory map an encrypted DB
+    # so this only affects the unencrypted global DB.
+    mmap_size: Optional[int] = None
+    # NORMAL is safe from corruption with WAL but may lose the last commits on power loss.
+    # Without WAL it may corrupt the DB so it is only applied to DBs journaled with WAL.
+    synchronous: Optional[Literal['NORMAL', 'FULL']] = None
+    # Whether SQLCipher wipes and locks the memory it allocates. Costs speed.
+    cipher_memory_security: Optional[bool] = None
+
+    def pragmas(self, encrypted: bool) -> list[str]:
+        """The pragma statements of the profile for an encrypted or a plain connection,
+        apart from those that are only safe with WAL"""
+        pragmas = [f'PRAGMA cache_size = {self.cache_size}']
+        if self.temp_store is not None:
+            pragmas.append(f'PRAGMA temp_store = {self.temp_store}')
+        if self.mmap_size is not None and encrypted is False:
+            pragmas.append(f'PRAGMA mmap_size = {self.mmap_size}')
+        if self.cipher_memory_security is not None and encrypted is True:
+            pragmas.append(f'PRAGMA cipher_memory_security = {"ON" if self.cipher_memory_security else "OFF"}')  # noqa: E501
+        return pragmas
+
+    def apply(self, conn: 'DBConnection', encrypted: bool) -> None:
+        """Applies the profile to a newly opened connection. For an encrypted connection
+        it has to happen after keying it and the first statement fails with DatabaseError
+        if the key is wrong.
+
+        May raise:
+        - sqlcipher.DatabaseError if the key of an encrypted connection is wrong
+        """
+        for pragma in self.pragmas(encrypted=encrypted):
+            conn.execute(pragma)
+
+    def apply_wal(self, conn: 'DBConnection') -> None:
+        """Applies the pragmas of the profile that are only safe for a DB journaled with WAL.
+        Should be called once the connection switched the DB to WAL."""
+        if self.synchronous is not None:
+            conn.execute(f'PRAGMA synchronous = {self.synchronous}')
+
+
+DB_CONNECTION_PROFILES: dict[DBProfileName, DBConnectionProfile] = {
+    # The bigger page cache that rotki always used for the views of the user DB. It is
+    # also used for the global DB, whose asset and price lookups are read all the time.
+    'default': DBConnectionProfile(name='default', cache_size=-32768),
+    # For machines short on memory. SQLite's default cache size and temp files on disk
+    'low-memory': DBConnectionProfile(
+        name='low-memory',
+        cache_size=-2000,
+        temp_store='FILE',
+        mmap_size=0,
+    ),
+    # For big DBs. Large sorted reads such as those of the history events and the
+    # timed balances stay in memory and commits to the user DB don't wait for an fsync
+    'throughput': DBConnectionProfile(
+        name='throughput',
+        cache_size=-131072,
+        temp_store='MEMORY',
+        mmap_size=268435456,
+        synchronous='NORMAL',
+        cipher_memory_security=False,
+    ),
+}
+DEFAULT_DB_PROFILE: DBProfileName = 'default'
@@ -1,5 +1,6 @@
+import json
 import logging
-from copy import deepcopy
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union, overload
 
 from pysqlcipher3 import dbapi2 as sqlcipher
@@ -7,6 +8,8 @@ from pysqlcipher3 import dbapi2 as sqlcipher
 from rotkehlchen.accounting.constants import FREE_PNL_EVENTS_LIMIT, FREE_REPORTS_LOOKUP_LIMIT
 from rotkehlchen.accounting.pnl import PnlTotals
 from rotkehlchen.accounting.structures.processed_event import ProcessedAccountingEvent
+from rotkehlchen.accounting.types import AccountingCheckpoint
+from rotkehlchen.constants import ZERO
 from rotkehlchen.db.settings import DBSettings
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.errors.serialization import DeserializationError
@@ -60,6 +63,23 @@ def _get_reports_or_events_maybe_limit(
     return entries[:returning_entries_length], entries_found
 
 
+def report_settings(settings: DBSettings) -> list[tuple[str, str, Any]]:
+    """The (name, type, value) of the settings that affect the result of a PnL report"""
+    return [
+        ('profit_currency', 'string', settings.main_currency.identifier),
+        ('taxfree_after_period', 'integer', settings.taxfree_after_period),
+        ('include_crypto2crypto', 'bool', settings.include_crypto2crypto),
+        ('calculate_past_cost_basis', 'bool', settings.calculate_past_cost_basis),
+        ('include_gas_costs', 'bool', settings.include_gas_costs),
+        ('account_for_assets_movements', 'bool', settings.account_for_assets_movements),
+        ('cost_basis_method', 'string', settings.cost_basis_method.serialize()),
+        ('eth_staking_taxable_after_withdrawal_enabled', 'bool', settings.eth_staking_taxable_after_withdrawal_enabled),  # noqa: E501
+        ('include_fees_in_cost_basis', 'bool', settings.include_fees_in_cost_basis),
+        # disabled merging is saved as -1, same as the setting is given by the user
+        ('acquisitions_merge_tolerance', 'string', '-1' if settings.acquisitions_merge_tolerance is None else str(settings.acquisitions_merge_tolerance)),  # noqa: E501
+    ]
+
+
 class DBAccountingReports:
 
     def __init__(self, database: 'DBHandler'):
@@ -90,17 +110,8 @@ class DBAccountingReports:
             cursor.executemany(
                 'INSERT OR IGNORE INTO pnl_report_settings(report_id, name, type, value) '
                 'VALUES(?, ?, ?, ?)',
-                [
-                    (report_id, 'profit_currency', 'string', settings.main_currency.identifier),
-                    (report_id, 'taxfree_after_period', 'integer', settings.taxfree_after_period),
-                    (report_id, 'include_crypto2crypto', 'bool', settings.include_crypto2crypto),
-                    (report_id, 'calculate_past_cost_basis', 'bool', settings.calculate_past_cost_basis),  # noqa: E501
-                    (report_id, 'include_gas_costs', 'bool', settings.include_gas_costs),
-                    (report_id, 'account_for_assets_movements', 'bool', settings.account_for_assets_movements),  # noqa: E501
-                    (report_id, 'cost_basis_method', 'string', settings.cost_basis_method.serialize()),  # noqa: E501
-                    (report_id, 'eth_staking_taxable_after_withdrawal_enabled', 'bool', settings.eth_staking_taxable_after_withdrawal_enabled),  # noqa: E501
-                    (report_id, 'include_fees_in_cost_basis', 'bool', settings.include_fees_in_cost_basis),  # noqa: E501
-                ])
+                [(report_id, *entry) for entry in report_settings(settings)],
+            )
 
         return report_id
 
@@ -137,6 +148,14 @@ class DBAccountingReports:
                 tuples,
             )
 
+    def add_report_timings(self, report_id: int, timings: dict[str, Any]) -> None:
+        """Saves the timings of the generation of the report"""
+        with self.db.transient_write() as cursor:
+            cursor.execute(
+                'UPDATE pnl_reports SET timings=? WHERE identifier=?',
+                (json.dumps(timings), report_id),
+            )
+
     def get_reports(
             self,
             report_id: Optional[int],
@@ -184,6 +203,7 @@ class DBAccountingReports:
                         'last_processed_timestamp': report[5],
                         'processed_actions': report[6],
                         'total_actions': report[7],
+                        'timings': None if report[8] is None else json.loads(report[8]),
                         'overview': overview,
                         'settings': settings,
                     })
@@ -213,6 +233,67 @@ class DBAccountingReports:
                     f'Could not delete PnL report {report_id} from the DB. Report was not found',
                 )
 
+    def get_checkpoints(
+            self,
+            settings_hash: str,
+            version: int,
+            to_ts: Timestamp,
+    ) -> list[AccountingCheckpoint]:
+        """Returns the checkpoints saved for the given settings hash and state version
+        up to `to_ts` ordered by ascending timestamp"""
+        with self.db.conn_transient.read_ctx() as cursor:
+            cursor.execute(
+                'SELECT timestamp, events_num, processed_actions, events_digest '
+                'FROM pnl_checkpoints WHERE settings_hash=? AND version=? AND timestamp <= ? '
+                'ORDER BY timestamp ASC',
+                (settings_hash, version, to_ts),
+            )
+            return [AccountingCheckpoint(*entry) for entry in cursor]
+
+    def get_checkpoint_state(self, settings_hash: str, timestamp: Timestamp) -> Optional[str]:
+        """Returns the serialized state of a checkpoint or None if it does not exist"""
+        with self.db.conn_transient.read_ctx() as cursor:
+            result = cursor.execute(
+                'SELECT state FROM pnl_checkpoints WHERE settings_hash=? AND timestamp=?',
+                (settings_hash, timestamp),
+            ).fetchone()
+        return None if result is None else result[0]
+
+    def add_checkpoint(
+            self,
+            settings_hash: str,
+            version: int,
+            checkpoint: AccountingCheckpoint,
+            state: str,
+    ) -> None:
+        """Saves a checkpoint replacing any other at the same timestamp for the settings"""
+        with self.db.transient_write() as cursor:
+            cursor.execute(
+                'INSERT OR REPLACE INTO pnl_checkpoints(settings_hash, timestamp, version, '
+                'events_num, processed_actions, events_digest, state) '
+                'VALUES(?, ?, ?, ?, ?, ?, ?)',
+                (settings_hash, checkpoint.timestamp, version, checkpoint.events_num,
+                 checkpoint.processed_actions, checkpoint.events_digest, state),
+            )
+
+    def delete_checkpoints(
+            self,
+            settings_hash: str,
+            version: int,
+            timestamps: list[Timestamp],
+    ) -> None:
+        """Deletes the checkpoints saved for other settings or versions and the
+        given checkpoints of these settings"""
+        with self.db.transient_write() as cursor:
+            cursor.execute(
+                'DELETE FROM pnl_checkpoints WHERE settings_hash != ? OR version != ?',
+                (settings_hash, version),
+            )
+            cursor.executemany(
+                'DELETE FROM pnl_checkpoints WHERE settings_hash=? AND timestamp=?',
+                [(settings_hash, timestamp) for timestamp in timestamps],
+            )
+
     def add_report_data(
             self,
             report_id: int,
@@ -228,12 +309,22 @@ class DBAccountingReports:
         data = event.serialize_for_db(ts_converter)
         query = """
         INSERT INTO pnl_events(
-            report_id, timestamp, data
+            report_id, timestamp, type, asset, location, taxable, pnl_taxable, pnl_free, data
         )
-        VALUES(?, ?, ?);"""
+        VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?);"""
         with self.db.transient_write() as cursor:
             try:
-                cursor.execute(query, (report_id, time, data))
+                cursor.execute(query, (
+                    report_id,
+                    time,
+                    event.type.serialize(),
+                    event.asset.identifier,
+                    event.location.serialize_for_db(),
+                    event.taxable_amount != ZERO,
+                    str(event.pnl.taxable),
+                    str(event.pnl.free),
+                    data,
+                ))
             except sqlcipher.IntegrityError as e:  # pylint: disable=no-member
                 raise InputError(
                     f'Could not write {event} data to the DB due to {e!s}. '
@@ -262,13 +353,13 @@ class DBAccountingReports:
             )
 
         query, bindings = filter_.prepare()
-        query = 'SELECT timestamp, data FROM pnl_events ' + query
+        query = 'SELECT identifier, timestamp, data FROM pnl_events ' + query
         cursor.execute(query, bindings)
 
         records = []
         for result in cursor:
             try:
-                record = ProcessedAccountingEvent.deserialize_from_db(result[0], result[1])
+                record = ProcessedAccountingEvent.deserialize_from_db(result[1], result[2])
             except DeserializationError as e:
                 self.db.msg_aggregator.add_error(
                     f'Error deserializing AccountingEvent from the DB. Skipping it.'
@@ -276,12 +367,16 @@ class DBAccountingReports:
                 )
                 continue
 
+            record.identifier = result[0]
             records.append(record)
 
         if filter_.pagination is not None:
-            no_pagination_filter = deepcopy(filter_)
-            no_pagination_filter.pagination = None
-            query, bindings = no_pagination_filter.prepare()
+            # count all the events of the filter, not only the ones after the page's key
+            count_filter = replace(
+                filter_,
+                filters=[x for x in filter_.filters if x is not filter_.after_event_filter],
+            )
+            query, bindings = count_filter.prepare(with_pagination=False, with_order=False)
             query = 'SELECT COUNT(*) FROM pnl_events ' + query
             results = cursor.execute(query, bindings).fetchone()
             total_filter_count = results[0]
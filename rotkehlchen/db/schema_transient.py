@@ -10,7 +10,8 @@ CREATE TABLE IF NOT EXISTS pnl_reports (
     first_processed_timestamp INTEGER,
     last_processed_timestamp INTEGER NOT NULL,
     processed_actions INTEGER NOT NULL,
-    total_actions INTEGER NOT NULL
+    total_actions INTEGER NOT NULL,
+    timings TEXT
 );
 """
 
@@ -37,16 +38,44 @@ CREATE TABLE IF NOT EXISTS pnl_report_settings (
 """
 
 # Many records for events related through foreign key to each PnL report.
+# The fields that the events are filtered by are also kept in their own columns
+# so that they can be queried without deserializing the data of each event.
 DB_CREATE_PNL_EVENTS = """
 CREATE TABLE IF NOT EXISTS pnl_events (
     identifier INTEGER NOT NULL PRIMARY KEY,
     report_id INTEGER NOT NULL,
     timestamp INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    asset TEXT NOT NULL,
+    location CHAR(1) NOT NULL DEFAULT('A'),
+    taxable INTEGER NOT NULL CHECK (taxable IN (0, 1)),
+    pnl_taxable TEXT NOT NULL,
+    pnl_free TEXT NOT NULL,
     data TEXT NOT NULL,
     FOREIGN KEY (report_id) REFERENCES pnl_reports(identifier) ON DELETE CASCADE ON UPDATE CASCADE
 );
 """
 
+DB_CREATE_PNL_EVENTS_INDICES = """
+CREATE INDEX IF NOT EXISTS idx_pnl_events_report_timestamp ON pnl_events(report_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_pnl_events_report_type ON pnl_events(report_id, type);
+"""
+
+# Checkpoints of the history processing state so that PnL reports can resume
+# processing from them. Only valid for the same accounting settings and events before them.
+DB_CREATE_PNL_CHECKPOINTS = """
+CREATE TABLE IF NOT EXISTS pnl_checkpoints (
+    settings_hash TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    events_num INTEGER NOT NULL,
+    processed_actions INTEGER NOT NULL,
+    events_digest TEXT NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY(settings_hash, timestamp)
+);
+"""
+
 DB_CREATE_SETTINGS = """
 CREATE TABLE IF NOT EXISTS settings (
     name VARCHAR[24] NOT NULL PRIMARY KEY,
@@ -61,6 +90,8 @@ BEGIN TRANSACTION;
 {DB_CREATE_REPORT_SETTINGS}
 {DB_CREATE_REPORT_TOTALS}
 {DB_CREATE_PNL_EVENTS}
+{DB_CREATE_PNL_EVENTS_INDICES}
+{DB_CREATE_PNL_CHECKPOINTS}
 {DB_CREATE_SETTINGS}
 COMMIT;
 PRAGMA foreign_keys=on;
@@ -8,9 +8,15 @@ from rotkehlchen.chain.constants import LAST_EVM_ACCOUNTS_DETECT_KEY
 from rotkehlchen.constants.assets import A_USD
 from rotkehlchen.constants.timing import YEAR_IN_SECONDS
 from rotkehlchen.data_migrations.constants import LAST_DATA_MIGRATION
-from rotkehlchen.db.constants import LAST_DATA_UPDATES_KEY, UpdateType
+from rotkehlchen.db.constants import (
+    KRAKEN_CALL_COUNTERS_KEY,
+    LAST_DATA_UPDATES_KEY,
+    LAST_DB_MAINTENANCE_KEY,
+    UpdateType,
+)
 from rotkehlchen.db.utils import str_to_bool
 from rotkehlchen.errors.serialization import DeserializationError
+from rotkehlchen.fval import FVal
 from rotkehlchen.history.types import DEFAULT_HISTORICAL_PRICE_ORACLES_ORDER, HistoricalPriceOracle
 from rotkehlchen.oracles.structures import DEFAULT_CURRENT_PRICE_ORACLES_ORDER, CurrentPriceOracle
 from rotkehlchen.types import (
@@ -26,7 +32,7 @@ from rotkehlchen.types import (
 from rotkehlchen.user_messages import MessagesAggregator
 
 ROTKEHLCHEN_DB_VERSION = 40
-ROTKEHLCHEN_TRANSIENT_DB_VERSION = 1
+ROTKEHLCHEN_TRANSIENT_DB_VERSION = 3
 DEFAULT_TAXFREE_AFTER_PERIOD = YEAR_IN_SECONDS
 DEFAULT_INCLUDE_CRYPTO2CRYPTO = True
 DEFAULT_INCLUDE_GAS_COSTS = True
@@ -51,6 +57,7 @@ DEFAULT_COST_BASIS_METHOD = CostBasisMethod.FIFO
 DEFAULT_TREAT_ETH2_AS_ETH = True
 DEFAULT_ETH_STAKING_TAXABLE_AFTER_WITHDRAWAL_ENABLED = True
 DEFAULT_INCLUDE_FEES_IN_COST_BASIS = True
+DEFAULT_ACQUISITIONS_MERGE_TOLERANCE = None  # If set, acquisitions of an asset with close enough rates are merged into one  # noqa: E501
 DEFAULT_INFER_ZERO_TIMED_BALANCES = False  # If True the asset amount and value chart shows the 0 balance periods for an asset  # noqa: E501
 DEFAULT_QUERY_RETRY_LIMIT = 5
 DEFAULT_CONNECT_TIMEOUT = 30
@@ -95,7 +102,7 @@ STRING_KEYS = (
     'frontend_settings',
 )
 TIMESTAMP_KEYS = ('last_write_ts', 'last_data_upload_ts', 'last_balance_save')
-IGNORED_KEYS = (LAST_EVM_ACCOUNTS_DETECT_KEY, LAST_DATA_UPDATES_KEY) + tuple(x.serialize() for x in UpdateType)  # noqa: E501
+IGNORED_KEYS = (LAST_EVM_ACCOUNTS_DETECT_KEY, LAST_DATA_UPDATES_KEY, LAST_DB_MAINTENANCE_KEY, KRAKEN_CALL_COUNTERS_KEY) + tuple(x.serialize() for x in UpdateType)  # noqa: E501
 
 
 CachedDBSettingsFieldNames = Literal[
@@ -193,6 +200,7 @@ class DBSettings:
     query_retry_limit: int = DEFAULT_QUERY_RETRY_LIMIT
     connect_timeout: int = DEFAULT_CONNECT_TIMEOUT
     read_timeout: int = DEFAULT_READ_TIMEOUT
+    acquisitions_merge_tolerance: Optional[FVal] = DEFAULT_ACQUISITIONS_MERGE_TOLERANCE
 
     def serialize(self) -> dict[str, Any]:
         settings_dict = {}
@@ -245,6 +253,7 @@ class ModifiableDBSettings(NamedTuple):
     query_retry_limit: Optional[int] = None
     connect_timeout: Optional[int] = None
     read_timeout: Optional[int] = None
+    acquisitions_merge_tolerance: Optional[FVal] = None
 
     def serialize(self) -> dict[str, Any]:
         settings_dict = {}
@@ -300,6 +309,9 @@ def db_settings_from_dict(
                     int_value = None  # type: ignore[assignment]  # we do it on purpose
                 specified_args[key] = int_value
 
+        elif key == 'acquisitions_merge_tolerance':
+            # can also be None, to signify disabled setting
+            specified_args[key] = None if value is None else FVal(value)
         elif key == 'main_currency':
             specified_args[key] = Asset(str(value)).resolve_to_asset_with_oracles()
         elif key in TIMESTAMP_KEYS:
@@ -345,6 +357,9 @@ def serialize_db_setting(
     # taxfree_after_period of -1 by the user means disable the setting
     elif setting == 'taxfree_after_period' and value == -1 and is_modifiable is True:
         value = None
+    # acquisitions_merge_tolerance of -1 by the user means disable the setting
+    elif setting == 'acquisitions_merge_tolerance':
+        value = None if value == -1 and is_modifiable is True else str(value)
     elif setting == 'active_modules' and is_modifiable is True:
         value = json.dumps(value)
     elif setting in {'main_currency', 'cost_basis_method'}:
@@ -1,10 +1,10 @@
 import logging
 import os
-import shutil
 import traceback
-from tempfile import TemporaryDirectory
+from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
+import gevent
 from pysqlcipher3 import dbapi2 as sqlcipher
 
 from rotkehlchen.api.websockets.typedefs import WSMessageType
@@ -33,6 +33,7 @@ if TYPE_CHECKING:
     from rotkehlchen.db.dbhandler import DBHandler
 
 MIN_SUPPORTED_USER_DB_VERSION = 26
+DB_COPY_CHUNK_SIZE = 16 * 1024 * 1024  # bytes of the DB copied between yields to other greenlets
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
@@ -98,6 +99,31 @@ UPGRADES_LIST = [
 ]
 
 
+def _copy_db_file(
+        source: Path,
+        destination: Path,
+        progress_handler: Optional['DBUpgradeProgressHandler'] = None,
+) -> None:
+    """Copies a DB file in chunks, yielding to other greenlets between them so that a big
+    DB does not block the backend while it is copied, and syncs the copy to disk.
+
+    If a progress handler is given each chunk is reported as a step of its current round.
+    The DB must have no pending changes in its write-ahead log.
+    """
+    chunks = max(1, -(-source.stat().st_size // DB_COPY_CHUNK_SIZE))
+    if progress_handler is not None:
+        progress_handler.set_total_steps(chunks)
+    with open(source, 'rb') as source_file, open(destination, 'wb') as destination_file:
+        while len(chunk := source_file.read(DB_COPY_CHUNK_SIZE)) != 0:
+            destination_file.write(chunk)
+            if progress_handler is not None:
+                progress_handler.new_step('Backing up the database')
+            gevent.sleep(0)
+
+        destination_file.flush()
+        os.fsync(destination_file.fileno())
+
+
 class DBUpgradeProgressHandler(ProgressUpdater):
     """Class to notify users through websockets about progress of upgrading the database."""
 
@@ -155,58 +181,52 @@ class DBUpgradeManager:
                     'Please only use the latest version of the software.',
                 )
 
-        progress_handler = DBUpgradeProgressHandler(
-            messages_aggregator=self.db.msg_aggregator,
-            target_version=ROTKEHLCHEN_DB_VERSION,
-        )
-        for upgrade in UPGRADES_LIST:
-            self._perform_single_upgrade(upgrade, progress_handler)
+        pending_upgrades = [x for x in UPGRADES_LIST if x.from_version >= our_version]
+        if len(pending_upgrades) != 0:
+            self._perform_upgrades(from_version=our_version, upgrades=pending_upgrades)
 
         # Finally make sure to always have latest version in the DB
         with self.db.user_write() as cursor:
             self.db.set_setting(cursor, name='version', value=ROTKEHLCHEN_DB_VERSION)
         return False
 
-    def _perform_single_upgrade(
-            self,
-            upgrade: UpgradeRecord,
-            progress_handler: DBUpgradeProgressHandler,
-    ) -> None:
+    def _perform_upgrades(self, from_version: int, upgrades: list[UpgradeRecord]) -> None:
         """
-        This is the wrapper function that performs each DB upgrade
+        This is the wrapper function that performs the consecutive DB upgrades that are
+        pending from the given version
 
         The logic is:
-            1. Check version, if not at from_version get out.
-            2. If at from_version make a DB backup before performing the upgrade
-            3. Perform the upgrade action
-            4. If something went wrong during upgrade restore backup and quit
-            5. If all went well set version and delete the backup
+            1. Make a single backup of the DB before the first upgrade
+            2. Perform the upgrades in order and set the version after each of them
+            3. If something went wrong during any upgrade restore the backup and quit
+            4. If all went well keep the backup of the DB before the upgrades
 
+        May raise:
+        - DBUpgradeError if any of the upgrades fails
         """
-        with self.db.conn.read_ctx() as cursor:
-            current_version = self.db.get_setting(cursor, 'version')
-        if current_version != upgrade.from_version:
-            return
-        to_version = upgrade.from_version + 1
-        progress_handler.new_round(version=to_version)
-
-        # First make a backup of the DB
-        with TemporaryDirectory() as tmpdirname:
-            tmp_db_filename = f'{ts_now()}_rotkehlchen_db_v{upgrade.from_version}.backup'
-            tmp_db_path = os.path.join(tmpdirname, tmp_db_filename)
-            shutil.copyfile(
-                os.path.join(self.db.user_data_dir, 'rotkehlchen.db'),
-                tmp_db_path,
+        progress_handler = DBUpgradeProgressHandler(
+            messages_aggregator=self.db.msg_aggregator,
+            target_version=ROTKEHLCHEN_DB_VERSION,
+        )
+        # The backup stays in the user's directory so that it can also be resumed from
+        # if the upgrade is interrupted, since the DB is then left in a half-upgraded state
+        db_path = self.db.user_data_dir / 'rotkehlchen.db'
+        backup_path = self.db.user_data_dir / f'{ts_now()}_rotkehlchen_db_v{from_version}.backup'
+        progress_handler.new_round(version=upgrades[0].from_version + 1)
+        self.db.conn.wal_checkpoint()
+        _copy_db_file(source=db_path, destination=backup_path, progress_handler=progress_handler)
+
+        # Add a flag to the db that an upgrade is happening
+        with self.db.user_write() as write_cursor:
+            self.db.set_setting(
+                write_cursor=write_cursor,
+                name='ongoing_upgrade_from_version',
+                value=from_version,
             )
 
-            # Add a flag to the db that an upgrade is happening
-            with self.db.user_write() as write_cursor:
-                self.db.set_setting(
-                    write_cursor=write_cursor,
-                    name='ongoing_upgrade_from_version',
-                    value=upgrade.from_version,
-                )
-
+        for upgrade in upgrades:
+            to_version = upgrade.from_version + 1
+            progress_handler.new_round(version=to_version)
             try:
                 kwargs = upgrade.kwargs if upgrade.kwargs is not None else {}
                 upgrade.function(db=self.db, progress_handler=progress_handler, **kwargs)
@@ -218,19 +238,14 @@ class DBUpgradeManager:
                 )
                 stacktrace = traceback.format_exc()
                 log.error(f'{error_message}\n{stacktrace}')
-                shutil.copyfile(
-                    tmp_db_path,
-                    os.path.join(self.db.user_data_dir, 'rotkehlchen.db'),
-                )
+                # empty the write-ahead log so it is not replayed on top of the backup
+                self.db.conn.wal_checkpoint()
+                _copy_db_file(source=backup_path, destination=db_path)
                 raise DBUpgradeError(error_message) from e
 
-            # even for success keep the backup of the previous db
-            shutil.copyfile(
-                tmp_db_path,
-                os.path.join(self.db.user_data_dir, tmp_db_filename),
-            )
+            with self.db.user_write() as cursor:
+                self.db.set_setting(write_cursor=cursor, name='version', value=to_version)
 
         # Upgrade success all is good
         with self.db.user_write() as cursor:
             cursor.execute('DELETE FROM settings WHERE name=?', ('ongoing_upgrade_from_version',))
-            self.db.set_setting(write_cursor=cursor, name='version', value=to_version)
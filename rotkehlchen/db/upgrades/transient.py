@@ -0,0 +1,108 @@
+import json
+import logging
+from typing import TYPE_CHECKING, Any, Optional
+
+from rotkehlchen.constants import ZERO
+from rotkehlchen.errors.serialization import DeserializationError
+from rotkehlchen.logging import RotkehlchenLogsAdapter
+from rotkehlchen.serialization.deserialize import deserialize_fval
+from rotkehlchen.types import Location
+
+if TYPE_CHECKING:
+    from rotkehlchen.db.drivers.gevent import DBConnection
+
+logger = logging.getLogger(__name__)
+log = RotkehlchenLogsAdapter(logger)
+
+PNL_EVENTS_BATCH_SIZE = 5000
+
+
+def _pnl_event_columns_from_data(data: str) -> Optional[tuple[Any, ...]]:
+    """Extracts the typed columns of a pnl event from its serialized data.
+    Returns None if the data can't be read"""
+    try:
+        event = json.loads(data)
+        return (
+            event['type'],
+            event['asset'],
+            Location.deserialize(event['location']).serialize_for_db(),
+            deserialize_fval(event['taxable_amount'], name='taxable_amount', location='transient upgrade') != ZERO,  # noqa: E501
+            event['pnl_taxable'],
+            event['pnl_free'],
+        )
+    except (json.decoder.JSONDecodeError, KeyError, DeserializationError) as e:
+        log.error(f'Could not read pnl event {data} during the transient DB upgrade due to {e!s}. Dropping it')  # noqa: E501
+        return None
+
+
+def _upgrade_transient_v1_to_v2(connection: 'DBConnection') -> None:
+    """Moves the fields of the pnl events that are filtered by out of the data json and
+    into their own columns and indexes them"""
+    cursor = connection.cursor()
+    write_cursor = connection.cursor()
+    cursor.execute("""
+    CREATE TABLE pnl_events_new (
+        identifier INTEGER NOT NULL PRIMARY KEY,
+        report_id INTEGER NOT NULL,
+        timestamp INTEGER NOT NULL,
+        type TEXT NOT NULL,
+        asset TEXT NOT NULL,
+        location CHAR(1) NOT NULL DEFAULT('A'),
+        taxable INTEGER NOT NULL CHECK (taxable IN (0, 1)),
+        pnl_taxable TEXT NOT NULL,
+        pnl_free TEXT NOT NULL,
+        data TEXT NOT NULL,
+        FOREIGN KEY (report_id) REFERENCES pnl_reports(identifier) ON DELETE CASCADE ON UPDATE CASCADE
+    );""")  # noqa: E501
+    cursor.execute('SELECT identifier, report_id, timestamp, data FROM pnl_events')
+    while len(rows := cursor.fetchmany(PNL_EVENTS_BATCH_SIZE)) != 0:
+        new_rows = []
+        for identifier, report_id, timestamp, data in rows:
+            if (columns := _pnl_event_columns_from_data(data)) is not None:
+                new_rows.append((identifier, report_id, timestamp, *columns, data))
+
+        write_cursor.executemany(
+            'INSERT INTO pnl_events_new(identifier, report_id, timestamp, type, asset, '
+            'location, taxable, pnl_taxable, pnl_free, data) '
+            'VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            new_rows,
+        )
+
+    write_cursor.execute('DROP TABLE pnl_events')
+    write_cursor.execute('ALTER TABLE pnl_events_new RENAME TO pnl_events')
+
+
+def _upgrade_transient_v2_to_v3(connection: 'DBConnection') -> None:
+    """Adds the column for the timings of the generation of a report"""
+    cursor = connection.cursor()
+    if 'timings' not in {x[1] for x in cursor.execute('PRAGMA table_info(pnl_reports)')}:
+        cursor.execute('ALTER TABLE pnl_reports ADD COLUMN timings TEXT')
+
+
+# Transient DB version -> the upgrade to the next version. Versions without an
+# upgrade are recreated from scratch
+TRANSIENT_UPGRADES = {
+    1: _upgrade_transient_v1_to_v2,
+    2: _upgrade_transient_v2_to_v3,
+}
+
+
+def upgrade_transient_db(connection: 'DBConnection', from_version: int, to_version: int) -> bool:
+    """Upgrades the transient DB keeping the saved reports.
+
+    Returns False if there is no upgrade path in which case the caller should recreate it
+    """
+    if from_version > to_version or not all(
+        version in TRANSIENT_UPGRADES for version in range(from_version, to_version)
+    ):
+        return False
+
+    connection.executescript('PRAGMA foreign_keys = OFF;')
+    try:
+        with connection.write_ctx():
+            for version in range(from_version, to_version):
+                log.debug(f'Upgrading transient DB from version {version} to {version + 1}')
+                TRANSIENT_UPGRADES[version](connection)
+    finally:
+        connection.executescript('PRAGMA foreign_keys = ON;')
+    return True
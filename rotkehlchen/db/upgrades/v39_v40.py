@@ -340,6 +340,7 @@ def upgrade_v39_to_v40(db: 'DBHandler', progress_handler: 'DBUpgradeProgressHand
         - Migrate rotki events that were broken due to https://github.com/rotki/rotki/issues/6550
         - Purge kraken events
         - Create new tables
+        - Switch the DB to incremental auto vacuum
     """
     log.debug('Entered userdb v39->v40 upgrade')
     progress_handler.set_total_steps(8)
@@ -359,7 +360,7 @@ def upgrade_v39_to_v40(db: 'DBHandler', progress_handler: 'DBUpgradeProgressHand
         _migrate_ledger_actions(write_cursor, db.conn)
         progress_handler.new_step()
 
-    db.conn.execute('VACUUM;')
+    db.conn.enable_incremental_vacuum()  # also VACUUMs the DB after the migrations
     progress_handler.new_step()
 
     log.debug('Finished userdb v39->v40 upgrade')
@@ -33,7 +33,8 @@ from rotkehlchen.assets.converters import asset_from_kraken
 from rotkehlchen.constants import KRAKEN_API_VERSION, KRAKEN_BASE_URL, ZERO
 from rotkehlchen.constants.assets import A_ETH2, A_KFEE, A_USD
 from rotkehlchen.constants.prices import ZERO_PRICE
-from rotkehlchen.db.constants import KRAKEN_ACCOUNT_TYPE_KEY
+from rotkehlchen.constants.timing import HOUR_IN_SECONDS
+from rotkehlchen.db.constants import KRAKEN_ACCOUNT_TYPE_KEY, KRAKEN_CALL_COUNTERS_KEY
 from rotkehlchen.db.filtering import HistoryEventFilterQuery
 from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.db.ranges import DBQueryRanges
@@ -71,6 +72,7 @@ from rotkehlchen.utils.misc import pairwise, ts_ms_to_sec, ts_now
 from rotkehlchen.utils.mixins.cacheable import cache_response_timewise
 from rotkehlchen.utils.mixins.enums import SerializableEnumNameMixin
 from rotkehlchen.utils.mixins.lockable import protect_with_lock
+from rotkehlchen.utils.rate_limiter import LeakyBucket
 from rotkehlchen.utils.serialization import jsonloads_dict
 
 if TYPE_CHECKING:
@@ -86,7 +88,16 @@ KRAKEN_DELISTED = ('XDAO', 'XXVN', 'ZKRW', 'XNMC', 'BSV', 'XICN')
 KRAKEN_PUBLIC_METHODS = ('AssetPairs', 'Assets')
 KRAKEN_QUERY_TRIES = 8
 KRAKEN_BACKOFF_DIVIDEND = 15
-MAX_CALL_COUNTER_INCREASE = 2  # Trades and Ledger produce the max increase
+KRAKEN_RATE_LIMITED = 'Rate limited exceeded'
+# Methods that increase the call counter by 2 instead of 1
+KRAKEN_COSTLY_METHODS = ('Ledgers', 'TradesHistory')
+# Persisted call counters that have not been updated for that long are fully decayed
+KRAKEN_CALL_COUNTER_MAX_AGE = HOUR_IN_SECONDS
+# Minimum seconds between two saves of a call counter when getting rate limited
+KRAKEN_CALL_COUNTER_PERSIST_INTERVAL = 60
+# The call counters shared by all Kraken instances using the same API key and account type.
+# Keyed by the fingerprint of the key and the account type
+KRAKEN_CALL_COUNTERS: dict[str, LeakyBucket] = {}
 
 
 def kraken_ledger_entry_type_to_ours(value: str) -> HistoryEventType:
@@ -145,7 +156,7 @@ def _check_and_get_response(response: Response, method: str) -> Union[str, dict]
 
         if 'Rate limit exceeded' in error:
             log.debug(f'Kraken: Got rate limit exceeded error: {error}')
-            return 'Rate limited exceeded'
+            return KRAKEN_RATE_LIMITED
 
         # else
         raise RemoteError(error)
@@ -167,6 +178,13 @@ class KrakenAccountType(SerializableEnumNameMixin):
 
 
 DEFAULT_KRAKEN_ACCOUNT_TYPE = KrakenAccountType.STARTER
+# Maximum call counter and seconds it takes to decrease it by one per account type
+# https://docs.kraken.com/rest/#section/Rate-Limits/REST-API-Rate-Limits
+KRAKEN_ACCOUNT_TYPE_LIMITS: dict[KrakenAccountType, tuple[int, int]] = {
+    KrakenAccountType.STARTER: (15, 3),
+    KrakenAccountType.INTERMEDIATE: (20, 2),
+    KrakenAccountType.PRO: (20, 1),
+}
 
 
 class Kraken(ExchangeInterface, ExchangeWithExtras):
@@ -188,30 +206,100 @@ class Kraken(ExchangeInterface, ExchangeWithExtras):
         )
         self.msg_aggregator = msg_aggregator
         self.session.headers.update({'API-Key': self.api_key})
+        self.call_counter_persisted_ts = 0.0
         self.set_account_type(kraken_account_type)
-        self.call_counter = 0
-        self.last_query_ts = 0
         self.history_events_db = DBHistoryEvents(self.db)
 
+    @property
+    def call_limit(self) -> int:
+        return int(self.call_counter.capacity)
+
+    @property
+    def reduction_every_secs(self) -> float:
+        """Seconds it takes for the call counter to decrease by one"""
+        return 1 / self.call_counter.leak_rate
+
+    def _call_counter_fingerprint(self) -> str:
+        """Identifies the call counter of the API key and account type without storing
+        the key itself"""
+        return f'{hashlib.sha256(self.api_key.encode()).hexdigest()[:16]}_{self.account_type!s}'
+
+    def _get_call_counter(self) -> LeakyBucket:
+        """Returns the call counter of the API key and account type. It is shared by all
+        Kraken instances with the same key and account type and is never modified with the
+        limits of another account type. Its persisted state is restored at the first query."""
+        self.call_counter_restored = False
+        fingerprint = self._call_counter_fingerprint()
+        if (call_counter := KRAKEN_CALL_COUNTERS.get(fingerprint)) is None:
+            call_limit, reduction_every_secs = KRAKEN_ACCOUNT_TYPE_LIMITS[self.account_type]
+            call_counter = KRAKEN_CALL_COUNTERS[fingerprint] = LeakyBucket(
+                capacity=call_limit,
+                leak_rate=1 / reduction_every_secs,
+            )
+        return call_counter
+
+    def _maybe_restore_call_counter(self) -> None:
+        """Restores the state of the call counter persisted before a restart, if newer"""
+        if self.call_counter_restored is True:
+            return
+
+        with self.db.conn.read_ctx() as cursor:
+            persisted = self._read_persisted_call_counters(cursor)
+        if (state := persisted.get(self._call_counter_fingerprint())) is not None:
+            self.call_counter.restore(level=state[0], level_ts=state[1])
+        self.call_counter_restored = True
+
+    @staticmethod
+    def _read_persisted_call_counters(cursor: 'DBCursor') -> dict[str, list[float]]:
+        cursor.execute('SELECT value FROM settings WHERE name=?', (KRAKEN_CALL_COUNTERS_KEY,))
+        if (result := cursor.fetchone()) is None:
+            return {}
+        try:
+            return json.loads(result[0])
+        except json.JSONDecodeError:
+            log.error(f'Could not decode persisted kraken call counters {result[0]}')
+            return {}
+
+    def persist_call_counter(self) -> None:
+        """Saves the state of the call counter so that it is not lost on restart. Called
+        when rate limited and at logout, not at every query, to keep DB writes off the
+        query path."""
+        level, level_ts = self.call_counter.serialize()
+        if level_ts == 0:  # never used
+            return
+
+        self.call_counter_persisted_ts = level_ts
+        with self.db.conn.write_ctx() as write_cursor:
+            persisted = {
+                fingerprint: state
+                for fingerprint, state in self._read_persisted_call_counters(write_cursor).items()
+                if level_ts - state[1] < KRAKEN_CALL_COUNTER_MAX_AGE
+            }
+            persisted[self._call_counter_fingerprint()] = [level, level_ts]
+            write_cursor.execute(
+                'INSERT OR REPLACE INTO settings(name, value) VALUES(?, ?)',
+                (KRAKEN_CALL_COUNTERS_KEY, json.dumps(persisted)),
+            )
+
+    def _maybe_persist_call_counter(self) -> None:
+        """Persists the call counter unless this instance did so in the last
+        KRAKEN_CALL_COUNTER_PERSIST_INTERVAL seconds"""
+        level_ts = self.call_counter.serialize()[1]
+        if level_ts - self.call_counter_persisted_ts >= KRAKEN_CALL_COUNTER_PERSIST_INTERVAL:
+            self.persist_call_counter()
+
     def set_account_type(self, account_type: Optional[KrakenAccountType]) -> None:
         if account_type is None:
             account_type = DEFAULT_KRAKEN_ACCOUNT_TYPE
 
         self.account_type = account_type
-        if self.account_type == KrakenAccountType.STARTER:
-            self.call_limit = 15
-            self.reduction_every_secs = 3
-        elif self.account_type == KrakenAccountType.INTERMEDIATE:
-            self.call_limit = 20
-            self.reduction_every_secs = 2
-        else:  # Pro
-            self.call_limit = 20
-            self.reduction_every_secs = 1
+        self.call_counter = self._get_call_counter()
 
     def edit_exchange_credentials(self, credentials: ExchangeAuthCredentials) -> bool:
         changed = super().edit_exchange_credentials(credentials)
         if credentials.api_key is not None:
             self.session.headers.update({'API-Key': self.api_key})
+            self.set_account_type(self.account_type)
 
         return changed
 
@@ -282,13 +370,6 @@ class Kraken(ExchangeInterface, ExchangeWithExtras):
     def first_connection(self) -> None:
         self.first_connection_made = True
 
-    def _manage_call_counter(self, method: str) -> None:
-        self.last_query_ts = ts_now()
-        if method in {'Ledgers', 'TradesHistory'}:
-            self.call_counter += 2
-        else:
-            self.call_counter += 1
-
     def _query_public(self, method: str, req: Optional[dict] = None) -> Union[dict, str]:
         """API queries that do not require a valid key/secret pair.
 
@@ -304,7 +385,6 @@ class Kraken(ExchangeInterface, ExchangeWithExtras):
         except requests.exceptions.RequestException as e:
             raise RemoteError(f'Kraken API request failed due to {e!s}') from e
 
-        self._manage_call_counter(method)
         return _check_and_get_response(response, method)
 
     def api_query(self, method: str, req: Optional[dict] = None) -> dict:
@@ -312,34 +392,28 @@ class Kraken(ExchangeInterface, ExchangeWithExtras):
         query_method = (
             self._query_public if method in KRAKEN_PUBLIC_METHODS else self._query_private
         )
+        cost = 2 if method in KRAKEN_COSTLY_METHODS else 1
+        self._maybe_restore_call_counter()
         while tries > 0:
-            if self.call_counter + MAX_CALL_COUNTER_INCREASE > self.call_limit:
-                # If we are close to the limit, check how much our call counter reduced
-                # https://www.kraken.com/features/api#api-call-rate-limit
-                secs_since_last_call = ts_now() - self.last_query_ts
-                self.call_counter = max(
-                    0,
-                    self.call_counter - int(secs_since_last_call / self.reduction_every_secs),
+            # https://docs.kraken.com/rest/#section/Rate-Limits/REST-API-Rate-Limits
+            if (slept := self.call_counter.acquire(cost)) != 0:
+                log.debug(
+                    f'Waited {slept:.2f} seconds for the Kraken call counter to decrease '
+                    f'enough for a {method} query',
                 )
-                # If still at limit, sleep for an amount big enough for smallest tier reduction
-                if self.call_counter + MAX_CALL_COUNTER_INCREASE > self.call_limit:
-                    backoff_in_seconds = self.reduction_every_secs * 2
-                    log.debug(
-                        f'Doing a Kraken API call would now exceed our call counter limit. '
-                        f'Backing off for {backoff_in_seconds} seconds',
-                        call_counter=self.call_counter,
-                    )
-                    tries -= 1
-                    gevent.sleep(backoff_in_seconds)
-                    continue
-
             log.debug(
                 'Kraken API query',
                 method=method,
                 data=req,
-                call_counter=self.call_counter,
+                call_counter=self.call_counter.level(),
             )
             result = query_method(method, req)
+            if result == KRAKEN_RATE_LIMITED:
+                # Kraken's counter is higher than we thought. Next try waits until it decays
+                tries -= 1
+                self.call_counter.fill()
+                self._maybe_persist_call_counter()
+                continue
             if isinstance(result, str):
                 # Got a recoverable error
                 backoff_in_seconds = int(KRAKEN_BACKOFF_DIVIDEND / tries)
@@ -391,7 +465,6 @@ class Kraken(ExchangeInterface, ExchangeWithExtras):
             )
         except requests.exceptions.RequestException as e:
             raise RemoteError(f'Kraken API request failed due to {e!s}') from e
-        self._manage_call_counter(method)
 
         return _check_and_get_response(response, method)
 
@@ -167,7 +167,12 @@ class ExchangeManager:
         return True, ''
 
     def delete_all_exchanges(self) -> None:
-        """Deletes all exchanges from the manager. Not from the DB"""
+        """Deletes all exchanges from the manager. Not from the DB
+
+        The Kraken call counters are saved first so that they survive a logout or restart.
+        """
+        for kraken in self.connected_exchanges.get(Location.KRAKEN, []):
+            kraken.persist_call_counter()  # type: ignore  # we know this is kraken here
         self.connected_exchanges.clear()
 
     def get_connected_exchanges_info(self) -> list[dict[str, Any]]:
@@ -1,12 +1,15 @@
 import logging
 import os
 from collections import deque
+from collections.abc import Iterator
+from functools import partial
 from json.decoder import JSONDecodeError
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, Optional
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
 import gevent
 import requests
+from gevent.pool import Pool
 
 from rotkehlchen.assets.asset import Asset, AssetWithOracles
 from rotkehlchen.constants import ZERO
@@ -46,14 +49,19 @@ from rotkehlchen.errors.price import NoPriceForGivenTimestamp, PriceQueryUnsuppo
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.externalapis.interface import ExternalServiceWithApiKey
 from rotkehlchen.fval import FVal
+from rotkehlchen.globaldb.cache import (
+    globaldb_get_unique_cache_value,
+    globaldb_set_unique_cache_value,
+)
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.history.deserialization import deserialize_price
 from rotkehlchen.history.types import HistoricalPrice, HistoricalPriceOracle
 from rotkehlchen.interfaces import HistoricalPriceOracleInterface
 from rotkehlchen.logging import RotkehlchenLogsAdapter
-from rotkehlchen.types import ExternalService, Price, Timestamp
+from rotkehlchen.types import CacheType, ExternalService, Price, Timestamp
 from rotkehlchen.utils.misc import pairwise, set_user_agent, ts_now
 from rotkehlchen.utils.mixins.penalizable_oracle import PenalizablePriceOracleMixin
+from rotkehlchen.utils.network import create_session
 from rotkehlchen.utils.serialization import jsonloads_dict, rlk_jsondumps
 
 if TYPE_CHECKING:
@@ -160,6 +168,8 @@ CRYPTOCOMPARE_SPECIAL_CASES_MAPPING = {
 }
 CRYPTOCOMPARE_SPECIAL_CASES = CRYPTOCOMPARE_SPECIAL_CASES_MAPPING.keys()
 CRYPTOCOMPARE_HOURQUERYLIMIT = 2000
+# How many histohour queries of a time range run at the same time
+CRYPTOCOMPARE_HISTOHOUR_CONCURRENCY = 4
 
 
 def _multiply_str_nums(a: str, b: str) -> str:
@@ -190,6 +200,27 @@ def _check_hourly_data_sanity(
         index += 2
 
 
+def _histohour_query_timestamps(
+        from_timestamp: Timestamp,
+        to_timestamp: Timestamp,
+) -> list[Timestamp]:
+    """Returns the toTs of each histohour query needed to go backwards in time from
+    from_timestamp to to_timestamp, newest first. Each query returns the
+    CRYPTOCOMPARE_HOURQUERYLIMIT hours before its toTs."""
+    query_timestamps = [from_timestamp]
+    while query_timestamps[-1] - CRYPTOCOMPARE_HOURQUERYLIMIT * 3600 - to_timestamp > 3600:
+        query_timestamps.append(Timestamp(query_timestamps[-1] - CRYPTOCOMPARE_HOURQUERYLIMIT * 3600))  # noqa: E501
+
+    return query_timestamps
+
+
+def _histohour_start_cache_key(
+        from_asset: AssetWithOracles,
+        to_asset: AssetWithOracles,
+) -> tuple[Literal[CacheType.CRYPTOCOMPARE_HISTOHOUR_START], str, str]:
+    return CacheType.CRYPTOCOMPARE_HISTOHOUR_START, from_asset.identifier, to_asset.identifier
+
+
 class Cryptocompare(ExternalServiceWithApiKey, HistoricalPriceOracleInterface, PenalizablePriceOracleMixin):  # noqa: E501
     def __init__(self, data_directory: Path, database: Optional['DBHandler']) -> None:
         HistoricalPriceOracleInterface.__init__(self, oracle_name='cryptocompare')
@@ -200,7 +231,7 @@ class Cryptocompare(ExternalServiceWithApiKey, HistoricalPriceOracleInterface, P
         )
         PenalizablePriceOracleMixin.__init__(self)
         self.data_directory = data_directory
-        self.session = requests.session()
+        self.session = create_session()
         set_user_agent(self.session)
         self.last_histohour_query_ts = 0
         self.last_rate_limit = 0
@@ -538,6 +569,93 @@ class Cryptocompare(ExternalServiceWithApiKey, HistoricalPriceOracleInterface, P
 
         return Price(FVal(result[cc_from_asset_symbol][cc_to_asset_symbol]))
 
+    def _query_histohour_window(
+            self,
+            from_asset: AssetWithOracles,
+            to_asset: AssetWithOracles,
+            to_timestamp: Timestamp,
+    ) -> Union[list[dict[str, Any]], RemoteError, PriceQueryUnsupportedAsset]:
+        """Queries the histohour entries of the CRYPTOCOMPARE_HOURQUERYLIMIT hours up to
+        to_timestamp. Errors are returned instead of raised so that the greenlet running
+        the query does not die with them."""
+        log.debug(
+            'Querying cryptocompare for hourly historical price',
+            from_asset=from_asset,
+            to_asset=to_asset,
+            cryptocompare_hourquerylimit=CRYPTOCOMPARE_HOURQUERYLIMIT,
+            end_date=to_timestamp,
+        )
+        try:
+            return self.query_endpoint_histohour(
+                from_asset=from_asset,
+                to_asset=to_asset,
+                limit=CRYPTOCOMPARE_HOURQUERYLIMIT,
+                to_timestamp=to_timestamp,
+            )['Data']
+        except (RemoteError, PriceQueryUnsupportedAsset) as e:
+            return e
+
+    def _iterate_histohour_data_for_range(
+            self,
+            from_asset: AssetWithOracles,
+            to_asset: AssetWithOracles,
+            from_timestamp: Timestamp,
+            to_timestamp: Timestamp,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Query histohour data from cryptocompare for a time range going backwards in time
+
+        The queries of the range are known in advance and run CRYPTOCOMPARE_HISTOHOUR_CONCURRENCY
+        at a time. Yields the histohour entries of each query, newest query first. The entries
+        of each have increasing timestamps, are after to_timestamp and are before the entries
+        yielded already.
+
+        Will stop when to_timestamp is reached OR when no more prices are returned
+
+        May raise:
+        - RemoteError if there is problems with the query
+        - PriceQueryUnsupportedAsset if from/to assets are not known to cryptocompare
+        """
+        msg = '_get_histohour_data_for_range from_timestamp should be bigger than to_timestamp'
+        assert from_timestamp >= to_timestamp, msg
+
+        pool = Pool(size=CRYPTOCOMPARE_HISTOHOUR_CONCURRENCY)
+        results = pool.imap(  # keeps the order of the queries
+            partial(self._query_histohour_window, from_asset, to_asset),
+            _histohour_query_timestamps(from_timestamp, to_timestamp),
+            maxsize=CRYPTOCOMPARE_HISTOHOUR_CONCURRENCY,
+        )
+        earliest_ts: Optional[int] = None
+        try:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+
+                if all(FVal(x['close']) == ZERO for x in result):
+                    # all prices zero Means we have reached the end of available prices
+                    break
+
+                # skip the entries already yielded for the newer query and those before the range
+                data = [
+                    x for x in result
+                    if to_timestamp < x['time'] and (earliest_ts is None or x['time'] < earliest_ts)  # noqa: E501
+                ]
+                if len(data) == 0:
+                    continue
+
+                _check_hourly_data_sanity(data, from_asset, to_asset)
+                if earliest_ts is not None and earliest_ts - data[-1]['time'] != 3600:
+                    raise RemoteError(
+                        'Unexpected data format in cryptocompare query_endpoint_histohour. '
+                        'Expected to find the previous date timestamp during '
+                        'cryptocompare historical data fetching',
+                    )
+
+                earliest_ts = data[0]['time']
+                yield data
+        finally:  # stop starting and running queries for data that is not needed
+            results.kill()
+            pool.kill()
+
     def _get_histohour_data_for_range(
             self,
             from_asset: AssetWithOracles,
@@ -554,67 +672,16 @@ class Cryptocompare(ExternalServiceWithApiKey, HistoricalPriceOracleInterface, P
 
         May raise:
         - RemoteError if there is problems with the query
+        - PriceQueryUnsupportedAsset if from/to assets are not known to cryptocompare
         """
-        msg = '_get_histohour_data_for_range from_timestamp should be bigger than to_timestamp'
-        assert from_timestamp >= to_timestamp, msg
-
         calculated_history: deque[dict[str, Any]] = deque()
-        end_date = from_timestamp
-        while True:
-            log.debug(
-                'Querying cryptocompare for hourly historical price',
-                from_asset=from_asset,
-                to_asset=to_asset,
-                cryptocompare_hourquerylimit=CRYPTOCOMPARE_HOURQUERYLIMIT,
-                end_date=end_date,
-            )
-            resp = self.query_endpoint_histohour(
+        for data in self._iterate_histohour_data_for_range(
                 from_asset=from_asset,
                 to_asset=to_asset,
-                limit=2000,
-                to_timestamp=end_date,
-            )
-            if all(FVal(x['close']) == ZERO for x in resp['Data']):
-                # all prices zero Means we have reached the end of available prices
-                break
-
-            end_date = Timestamp(end_date - (CRYPTOCOMPARE_HOURQUERYLIMIT * 3600))
-            if end_date != resp['TimeFrom']:
-                # If we get more than we needed, since we are close to the now_ts
-                # then skip all the already included entries
-                diff = abs(end_date - resp['TimeFrom'])
-                # If the start date has less than 3600 secs difference from previous
-                # end date then do nothing. If it has more skip all already included entries
-                if diff >= 3600:
-                    if resp['Data'][diff // 3600]['time'] != end_date:
-                        raise RemoteError(
-                            'Unexpected data format in cryptocompare query_endpoint_histohour. '
-                            'Expected to find the previous date timestamp during '
-                            'cryptocompare historical data fetching',
-                        )
-                    # just add only the part from the previous timestamp and on
-                    resp['Data'] = resp['Data'][diff // 3600:]
-
-            # If last time slot and first new are the same, skip the first new slot
-            last_entry_equal_to_first = (
-                len(calculated_history) != 0 and
-                calculated_history[0]['time'] == resp['Data'][-1]['time']
-            )
-            if last_entry_equal_to_first:
-                resp['Data'] = resp['Data'][:-1]
-            if len(calculated_history) != 0:
-                calculated_history.extendleft(reversed(resp['Data']))
-            else:
-                calculated_history = deque(resp['Data'])
-
-            if end_date - to_timestamp <= 3600:
-                # Ending the loop query. Also pop any extra timestamps
-                while (
-                        len(calculated_history) != 0 and
-                        calculated_history[0]['time'] <= to_timestamp
-                ):
-                    calculated_history.popleft()
-                break
+                from_timestamp=from_timestamp,
+                to_timestamp=to_timestamp,
+        ):
+            calculated_history.extendleft(reversed(data))
 
         return calculated_history
 
@@ -641,7 +708,10 @@ class Cryptocompare(ExternalServiceWithApiKey, HistoricalPriceOracleInterface, P
             to_asset=to_asset,
             source=HistoricalPriceOracle.CRYPTOCOMPARE,
         )
-        if data_range and now - data_range[1] < 3600 and not purge_old:
+        if (
+                data_range and now - data_range[1] < 3600 and not purge_old and
+                self.is_histohour_start_cached(from_asset, to_asset, data_range[0]) is True
+        ):
             log.debug(
                 'Did not create new cache since we got cache until 1 hour ago',
                 from_asset=from_asset,
@@ -690,43 +760,88 @@ class Cryptocompare(ExternalServiceWithApiKey, HistoricalPriceOracleInterface, P
             source=HistoricalPriceOracle.CRYPTOCOMPARE,
         )
 
-        if range_result is not None:
-            first_cached_ts, last_cached_ts = range_result
-            if timestamp > last_cached_ts:
-                # We have a cache but the requested timestamp does not hit it
-                new_data = self._get_histohour_data_for_range(
+        if range_result is not None and timestamp > range_result[1]:
+            # We have a cache but the requested timestamp does not hit it. The missing
+            # hours are written together so that an interruption can't leave a gap in the cache
+            self._store_histohour_data(
+                from_asset=from_asset,
+                to_asset=to_asset,
+                entries=list(self._get_histohour_data_for_range(
                     from_asset=from_asset,
                     to_asset=to_asset,
                     from_timestamp=now_ts,
-                    to_timestamp=last_cached_ts,
-                )
-            else:
-                # only other possibility, timestamp < cached start_time
-                new_data = self._get_histohour_data_for_range(
+                    to_timestamp=range_result[1],
+                )),
+            )
+
+        if range_result is None or self.is_histohour_start_cached(from_asset, to_asset, range_result[0]) is False:  # noqa: E501
+            # Go back to the start of the prices. The entries of each query are written as
+            # they arrive, so the cache grows backwards and an interrupted query resumes
+            # from the earliest cached price the next time.
+            for entries in self._iterate_histohour_data_for_range(
                     from_asset=from_asset,
                     to_asset=to_asset,
-                    from_timestamp=first_cached_ts,
+                    from_timestamp=now_ts if range_result is None else range_result[0],
                     to_timestamp=Timestamp(0),
-                )
+            ):
+                self._store_histohour_data(from_asset=from_asset, to_asset=to_asset, entries=entries)  # noqa: E501
 
-        else:
-            new_data = self._get_histohour_data_for_range(
-                from_asset=from_asset,
-                to_asset=to_asset,
-                from_timestamp=now_ts,
-                to_timestamp=Timestamp(0),
+            self._set_histohour_start_cached(from_asset, to_asset)
+
+        self.last_histohour_query_ts = ts_now()  # also save when last query finished
+
+    @staticmethod
+    def is_histohour_start_cached(
+            from_asset: AssetWithOracles,
+            to_asset: AssetWithOracles,
+            first_cached_ts: Timestamp,
+    ) -> bool:
+        """Whether the histohour prices of the pair are cached back to their start. That is
+        if a past query reached the start of the prices and nothing changed the first
+        cached price since then"""
+        with GlobalDBHandler().conn.read_ctx() as cursor:
+            start_ts = globaldb_get_unique_cache_value(
+                cursor=cursor,
+                key_parts=_histohour_start_cache_key(from_asset, to_asset),
             )
+        return start_ts == str(first_cached_ts)
 
-        calculated_history = list(new_data)
+    @staticmethod
+    def _set_histohour_start_cached(
+            from_asset: AssetWithOracles,
+            to_asset: AssetWithOracles,
+    ) -> None:
+        """Remembers that the histohour prices of the pair are cached back to their start"""
+        range_result = GlobalDBHandler().get_historical_price_range(
+            from_asset=from_asset,
+            to_asset=to_asset,
+            source=HistoricalPriceOracle.CRYPTOCOMPARE,
+        )
+        if range_result is None:
+            return
+
+        with GlobalDBHandler().conn.write_ctx() as write_cursor:
+            globaldb_set_unique_cache_value(
+                write_cursor=write_cursor,
+                key_parts=_histohour_start_cache_key(from_asset, to_asset),
+                value=str(range_result[0]),
+            )
 
-        if len(calculated_history) == 0:
+    @staticmethod
+    def _store_histohour_data(
+            from_asset: AssetWithOracles,
+            to_asset: AssetWithOracles,
+            entries: list[dict[str, Any]],
+    ) -> None:
+        """Turns the given histohour entries into historical prices and writes them in the DB"""
+        if len(entries) == 0:
             return
 
         # Let's always check for data sanity for the hourly prices.
-        _check_hourly_data_sanity(calculated_history, from_asset, to_asset)
+        _check_hourly_data_sanity(entries, from_asset, to_asset)
         # Turn them into the format we will enter in the DB
         prices = []
-        for entry in calculated_history:
+        for entry in entries:
             try:
                 price = Price((deserialize_price(entry['high']) + deserialize_price(entry['low'])) / 2)  # noqa: E501
                 if price == ZERO_PRICE:
@@ -749,7 +864,6 @@ class Cryptocompare(ExternalServiceWithApiKey, HistoricalPriceOracleInterface, P
                 continue
 
         GlobalDBHandler().add_historical_prices(prices)
-        self.last_histohour_query_ts = ts_now()  # also save when last query finished
 
     def query_historical_price(
             self,
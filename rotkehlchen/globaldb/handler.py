@@ -23,6 +23,7 @@ from rotkehlchen.chain.evm.types import string_to_evm_address
 from rotkehlchen.constants.assets import A_ETH, A_ETH2
 from rotkehlchen.constants.misc import DEFAULT_SQL_VM_INSTRUCTIONS_CB, NFT_DIRECTIVE
 from rotkehlchen.db.drivers.gevent import DBConnection, DBConnectionType, DBCursor
+from rotkehlchen.db.profiles import DB_CONNECTION_PROFILES, DEFAULT_DB_PROFILE, DBConnectionProfile
 from rotkehlchen.errors.asset import UnknownAsset, WrongAssetType
 from rotkehlchen.errors.misc import DBUpgradeError, InputError
 from rotkehlchen.errors.serialization import DeserializationError
@@ -37,7 +38,7 @@ from rotkehlchen.types import (
     Price,
     Timestamp,
 )
-from rotkehlchen.utils.misc import timestamp_to_date, ts_now
+from rotkehlchen.utils.misc import get_chunks, timestamp_to_date, ts_now
 from rotkehlchen.utils.serialization import (
     deserialize_asset_with_oracles_from_db,
     deserialize_generic_asset_from_db,
@@ -55,6 +56,10 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+# Identifiers per query when resolving assets in bulk. Each one is bound 3 times and
+# older sqlite versions allow at most 999 bound variables per statement.
+RESOLVE_ASSETS_CHUNK_SIZE = 300
+
 
 _ALL_ASSETS_TABLES_JOINS = """
 FROM {dbprefix}assets LEFT JOIN {dbprefix}common_asset_details on {dbprefix}assets.identifier={dbprefix}common_asset_details.identifier
@@ -133,12 +138,14 @@ def initialize_globaldb(
         global_dir: Path,
         db_filename: str,
         sql_vm_instructions_cb: int,
+        connection_profile: DBConnectionProfile = DB_CONNECTION_PROFILES[DEFAULT_DB_PROFILE],
 ) -> tuple[DBConnection, bool]:
     """Initialize globaldb.
 
     - global_dir: The directory in which to find the global.db to initialize
     - db_filename: The filename of the DB. Almost always: global.db.
     - sql_vm_instructions_cb is a connection setting. Check DBConnection for details.
+    - connection_profile: The pragmas with which to tune the connection.
 
     May raise DBSchemaError if GlobalDB's schema is malformed.
     """
@@ -153,7 +160,9 @@ def initialize_globaldb(
         db_filename=db_filename,
     )
     connection.executescript('PRAGMA foreign_keys=on;')
+    connection_profile.apply(connection, encrypted=False)
     if is_fresh_db is True:
+        connection.enable_incremental_vacuum()
         connection.executescript(DB_SCRIPT_CREATE_TABLES)
         with connection.write_ctx() as cursor:
             cursor.executemany(
@@ -169,6 +178,7 @@ def initialize_globaldb(
 def _initialize_global_db_directory(
         data_dir: Path,
         sql_vm_instructions_cb: int,
+        connection_profile: DBConnectionProfile,
 ) -> tuple[DBConnection, bool]:
     """Initialize globaldb directory. May raise DBSchemaError if GlobalDB's schema is malformed.
 
@@ -186,6 +196,7 @@ def _initialize_global_db_directory(
         global_dir=global_dir,
         db_filename=GLOBAL_DB_FILENAME,
         sql_vm_instructions_cb=sql_vm_instructions_cb,
+        connection_profile=connection_profile,
     )
 
 
@@ -202,12 +213,14 @@ class GlobalDBHandler:
             cls,
             data_dir: Optional[Path] = None,
             sql_vm_instructions_cb: Optional[int] = None,
+            connection_profile: DBConnectionProfile = DB_CONNECTION_PROFILES[DEFAULT_DB_PROFILE],
     ) -> 'GlobalDBHandler':
         """
         Initializes the GlobalDB.
 
         If the data dir is given it uses the already existing global DB in that directory,
-        of if there is none copies the built-in one there.
+        of if there is none copies the built-in one there. The connection profile tunes
+        the connection to it.
         May raise:
         - DBSchemaError if GlobalDB's schema is malformed
         """
@@ -217,7 +230,7 @@ class GlobalDBHandler:
         assert sql_vm_instructions_cb is not None, 'First instantiation of GlobalDBHandler should have a sql_vm_instructions_cb'  # noqa: E501
         GlobalDBHandler.__instance = object.__new__(cls)
         GlobalDBHandler.__instance._data_directory = data_dir
-        GlobalDBHandler.__instance.conn, GlobalDBHandler.__instance.used_backup = _initialize_global_db_directory(data_dir, sql_vm_instructions_cb)  # noqa: E501
+        GlobalDBHandler.__instance.conn, GlobalDBHandler.__instance.used_backup = _initialize_global_db_directory(data_dir, sql_vm_instructions_cb, connection_profile)  # noqa: E501
         GlobalDBHandler.__instance.packaged_db_lock = Semaphore()
         return GlobalDBHandler.__instance
 
@@ -1097,6 +1110,11 @@ class GlobalDBHandler:
                     f'due to a constraint being hit. Make sure the new values are valid.',
                 ) from e
 
+    @staticmethod
+    def count_user_owned_assets() -> int:
+        with GlobalDBHandler().conn.read_ctx() as cursor:
+            return cursor.execute('SELECT COUNT(*) FROM user_owned_assets').fetchone()[0]
+
     @staticmethod
     def add_user_owned_assets(assets: list['Asset']) -> None:
         """Make sure all assets in the list are included in the user owned assets
@@ -1819,6 +1837,70 @@ class GlobalDBHandler:
                 underlying_tokens=underlying_tokens,
             )
 
+    @staticmethod
+    def resolve_assets(identifiers: list[str]) -> dict[str, AssetWithNameAndType]:
+        """Bulk version of `resolve_asset`. Resolves all the given identifiers with one query
+        per chunk of identifiers and one query for all the underlying tokens.
+
+        Returns a mapping of the lowercased identifier to the resolved asset. Identifiers
+        that are not in the DB are missing from the result.
+        """
+        result: dict[str, AssetWithNameAndType] = {}
+        to_query = []
+        for identifier in identifiers:
+            if identifier.startswith(NFT_DIRECTIVE):
+                result[identifier.lower()] = Nft(identifier)
+            else:
+                to_query.append(identifier)
+
+        rows = []
+        with GlobalDBHandler().conn.read_ctx() as cursor:
+            for chunk in get_chunks(to_query, n=RESOLVE_ASSETS_CHUNK_SIZE):
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(
+                    f"""
+                    SELECT A.identifier, A.type, B.address, B.decimals, A.name, C.symbol, C.started, null, C.swapped_for, C.coingecko, C.cryptocompare, B.protocol, B.chain, B.token_kind, null, null FROM assets as A JOIN evm_tokens as B
+                    ON B.identifier = A.identifier JOIN common_asset_details AS C ON C.identifier = B.identifier WHERE A.type = ? AND A.identifier IN ({placeholders})
+                    UNION ALL
+                    SELECT A.identifier, A.type, null, null, A.name, B.symbol, B.started, B.forked, B.swapped_for, B.coingecko, B.cryptocompare, null, null, null, null, null from assets as A JOIN common_asset_details as B
+                    ON B.identifier = A.identifier WHERE A.type != ? AND A.type != ? AND A.identifier IN ({placeholders})
+                    UNION ALL
+                    SELECT A.identifier, A.type, null, null, A.name, null, null, null, null, null, null, null, null, null, B.notes, B.type FROM assets AS A JOIN custom_assets AS B on A.identifier=B.identifier WHERE A.identifier IN ({placeholders})
+                    """,  # noqa: E501
+                    (
+                        AssetType.EVM_TOKEN.serialize_for_db(),
+                        *chunk,
+                        AssetType.EVM_TOKEN.serialize_for_db(),
+                        AssetType.CUSTOM_ASSET.serialize_for_db(),
+                        *chunk,
+                        *chunk,
+                    ),
+                )
+                rows.extend(cursor.fetchall())
+
+            evm_token_ids = [
+                row[0] for row in rows if row[1] == AssetType.EVM_TOKEN.serialize_for_db()
+            ]
+            underlying_tokens: dict[str, list[UnderlyingToken]] = defaultdict(list)
+            for chunk in get_chunks(evm_token_ids, n=RESOLVE_ASSETS_CHUNK_SIZE):
+                cursor.execute(
+                    'SELECT A.parent_token_entry, B.address, B.token_kind, A.weight FROM '
+                    'underlying_tokens_list AS A JOIN evm_tokens as B ON '
+                    f'A.identifier=B.identifier WHERE A.parent_token_entry IN ({",".join("?" * len(chunk))})',  # noqa: E501
+                    chunk,
+                )
+                for entry in cursor:
+                    underlying_tokens[entry[0]].append(UnderlyingToken.deserialize_from_db(entry[1:]))
+
+        for row in rows:
+            result[row[0].lower()] = deserialize_generic_asset_from_db(
+                asset_type=AssetType.deserialize_from_db(row[1]),
+                asset_data=row,
+                underlying_tokens=underlying_tokens.get(row[0]),
+            )
+
+        return result
+
     def resolve_asset_from_packaged_and_store(self, identifier: str) -> AssetWithNameAndType:
         """
         Reads an asset from the packaged globaldb and adds it to the database if missing or edits
@@ -2,7 +2,6 @@ import json
 import logging
 import re
 import sqlite3
-from contextlib import suppress
 from enum import Enum, auto
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -13,6 +12,7 @@ import requests
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.assets.resolver import AssetResolver
 from rotkehlchen.assets.types import AssetData, AssetType
+from rotkehlchen.constants.misc import NFT_DIRECTIVE
 from rotkehlchen.db.drivers.gevent import DBCursor
 from rotkehlchen.db.settings import CachedSettings
 from rotkehlchen.errors.asset import UnknownAsset
@@ -21,10 +21,10 @@ from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import deserialize_evm_address
 from rotkehlchen.types import ChainID, ChecksumEvmAddress, EvmTokenKind, Timestamp
-from rotkehlchen.utils.misc import is_production
+from rotkehlchen.utils.misc import get_chunks, is_production
 from rotkehlchen.utils.network import query_file
 
-from .handler import GlobalDBHandler, initialize_globaldb
+from .handler import RESOLVE_ASSETS_CHUNK_SIZE, GlobalDBHandler, initialize_globaldb
 
 if TYPE_CHECKING:
     from rotkehlchen.db.drivers.gevent import DBConnection
@@ -38,6 +38,8 @@ ASSETS_UPDATES_URL = 'https://raw.githubusercontent.com/rotki/assets/{branch}/up
 ASSET_COLLECTIONS_UPDATES_URL = 'https://raw.githubusercontent.com/rotki/assets/{branch}/updates/{version}/asset_collections_updates.sql'
 ASSET_COLLECTIONS_MAPPINGS_UPDATES_URL = 'https://raw.githubusercontent.com/rotki/assets/{branch}/updates/{version}/asset_collections_mappings_updates.sql'
 FIRST_VERSION_WITH_COLLECTIONS = 16
+# Assets of an update applied in a single savepoint
+ASSETS_UPDATE_CHUNK_SIZE = 1000
 
 
 class UpdateFileType(Enum):
@@ -112,6 +114,31 @@ class ParsedAssetData(NamedTuple):
     forked: Optional[str]
 
 
+class AssetUpdate(NamedTuple):
+    action: str
+    full_insert: str
+    remote_asset_data: AssetData
+
+
+def _existing_asset_identifiers(identifiers: list[str]) -> dict[str, str]:
+    """Bulk version of `Asset.check_existence` without querying the packaged DB. Maps each
+    of the given identifiers that exists in the global DB to the identifier it has there,
+    with one query per chunk of identifiers."""
+    result = {x: x for x in identifiers if x.startswith(NFT_DIRECTIVE)}
+    with GlobalDBHandler().conn.read_ctx() as cursor:
+        for chunk in get_chunks(identifiers, n=RESOLVE_ASSETS_CHUNK_SIZE):
+            # compared with the NOCASE collation of the assets identifier like a lookup by id
+            cursor.execute(
+                f'WITH ids(id) AS (VALUES {",".join(["(?)"] * len(chunk))}) '
+                'SELECT ids.id, assets.identifier FROM ids INNER JOIN assets '
+                'ON assets.identifier = ids.id',
+                chunk,
+            )
+            result.update(cursor)
+
+    return result
+
+
 class AssetsUpdater:
 
     def __init__(self, msg_aggregator: 'MessagesAggregator') -> None:
@@ -412,20 +439,17 @@ class AssetsUpdater:
             self,
             connection: 'DBConnection',
             remote_asset_data: AssetData,
+            local_asset: Optional[Asset],
             assets_conflicts: Optional[dict[Asset, Literal['remote', 'local']]],
             action: str,
             full_insert: str,
             version: int,
     ) -> None:
         """
-        Given the already processed information for an asset try to store it in the globaldb
+        Given the already processed information for an asset and the asset with its
+        identifier in the globaldb, if it exists there, try to store it in the globaldb
         and if it is not possible due to conflicts mark it to resolve later.
         """
-        local_asset: Optional[Asset] = None
-        with suppress(UnknownAsset):
-            # we avoid querying the packaged db to prevent the copy of constant assets
-            local_asset = Asset(remote_asset_data.identifier).check_existence(query_packaged_db=False)  # noqa: E501
-
         try:
             with connection.savepoint_ctx() as cursor:
                 executeall(cursor, action)
@@ -473,6 +497,88 @@ class AssetsUpdater:
             )[0]
             self.conflicts.append((local_data, remote_asset_data))
 
+    def _apply_assets_in_bulk(
+            self,
+            connection: 'DBConnection',
+            updates: list[AssetUpdate],
+    ) -> int:
+        """Applies the actions of the given asset updates in order in a single savepoint and
+        returns how many of them were applied. Stops at the first action that fails and
+        leaves only the ones before it applied."""
+        applied = 0
+        try:
+            with connection.savepoint_ctx() as cursor:
+                for update in updates:
+                    executeall(cursor, update.action)
+                    applied += 1
+        except sqlite3.Error:
+            # the savepoint was rolled back so apply again the ones that were fine
+            with connection.savepoint_ctx() as cursor:
+                for update in updates[:applied]:
+                    executeall(cursor, update.action)
+
+        return applied
+
+    def _apply_assets_update(
+            self,
+            connection: 'DBConnection',
+            version: int,
+            actions: list[tuple[str, str]],
+            assets_conflicts: Optional[dict[Asset, Literal['remote', 'local']]],
+    ) -> None:
+        """Applies the actions of an assets update file.
+
+        All of its assets are parsed first and those that already exist are found with one
+        query per chunk. Then the actions are applied in bulk, one savepoint per chunk of
+        assets, and only an asset whose action fails goes through `_handle_asset_update`
+        to be inserted or have its conflict resolved.
+        """
+        updates: list[AssetUpdate] = []
+        for action, full_insert in actions:
+            try:
+                remote_asset_data = self._parse_full_insert_assets(full_insert)
+            except DeserializationError as e:
+                log.error(
+                    f'Failed to add asset with action {action} during update to v{version}',
+                )
+                self.msg_aggregator.add_warning(
+                    f'Skipping entry during assets update to v{version} due '
+                    f'to a deserialization error. {e!s}',
+                )
+                continue
+
+            updates.append(AssetUpdate(action, full_insert, remote_asset_data))
+
+        # we avoid querying the packaged db to prevent the copy of constant assets
+        local_identifiers = _existing_asset_identifiers([x.remote_asset_data.identifier for x in updates])  # noqa: E501
+        bulk_applied_identifiers: list[str] = []
+        for updates_chunk in get_chunks(updates, n=ASSETS_UPDATE_CHUNK_SIZE):
+            chunk = updates_chunk
+            while len(chunk) != 0:
+                applied = self._apply_assets_in_bulk(connection=connection, updates=chunk)
+                bulk_applied_identifiers.extend(
+                    local_identifier for x in chunk[:applied]
+                    if (local_identifier := local_identifiers.get(x.remote_asset_data.identifier)) is not None  # noqa: E501
+                )
+                if applied == len(chunk):
+                    break
+
+                failed = chunk[applied]
+                local_identifier = local_identifiers.get(failed.remote_asset_data.identifier)
+                self._handle_asset_update(
+                    connection=connection,
+                    remote_asset_data=failed.remote_asset_data,
+                    local_asset=Asset(local_identifier) if local_identifier is not None else None,
+                    assets_conflicts=assets_conflicts,
+                    action=failed.action,
+                    full_insert=failed.full_insert,
+                    version=version,
+                )
+                chunk = chunk[applied + 1:]
+
+        for identifier in bulk_applied_identifiers:
+            AssetResolver().clean_memory_cache(identifier=identifier)
+
     def _apply_single_version_update(
             self,
             connection: 'DBConnection',
@@ -489,61 +595,48 @@ class AssetsUpdater:
         errors are caught and the user is warned about them.
         """
         lines = text.splitlines()
+        actions: list[tuple[str, str]] = []
         for action, full_insert in zip(*[iter(lines)] * 2):
-            if full_insert.strip() == '*':
-                full_insert = action  # noqa: PLW2901
+            actions.append((action, action if full_insert.strip() == '*' else full_insert))
 
-            if update_file_type == UpdateFileType.ASSETS:
-                remote_asset_data = None
-                try:
-                    remote_asset_data = self._parse_full_insert_assets(full_insert)
-                except DeserializationError as e:
-                    log.error(
-                        f'Failed to add asset with action {action} during update to v{version}',
-                    )
-                    self.msg_aggregator.add_warning(
-                        f'Skipping entry during assets update to v{version} due '
-                        f'to a deserialization error. {e!s}',
-                    )
-
-                if remote_asset_data is not None:
-                    self._handle_asset_update(
-                        connection=connection,
-                        remote_asset_data=remote_asset_data,
-                        assets_conflicts=assets_conflicts,
-                        action=action,
-                        full_insert=full_insert,
-                        version=version,
-                    )
-            elif update_file_type == UpdateFileType.ASSET_COLLECTIONS:
-                try:
-                    self._process_asset_collection(
-                        connection=connection,
-                        action=action,
-                        full_insert=full_insert,
-                    )
-                except DeserializationError as e:
-                    self.msg_aggregator.add_warning(
-                        f'Skipping entry during assets collection update to v{version} due '
-                        f'to a deserialization error. {e!s}',
-                    )
-            else:
-                assert update_file_type == UpdateFileType.ASSET_COLLECTIONS_MAPPINGS
-                try:
-                    self._process_multiasset_mapping(
-                        connection=connection,
-                        action=action,
-                        full_insert=full_insert,
-                    )
-                except DeserializationError as e:
-                    self.msg_aggregator.add_warning(
-                        f'Skipping entry during assets collection multimapping update to '
-                        f'v{version} due to a deserialization error. {e!s}',
-                    )
-                except UnknownAsset as e:
-                    self.msg_aggregator.add_warning(
-                        f'Tried to add unknown asset {e.identifier} to collection of assets. Skipping',  # noqa: E501
-                    )
+        if update_file_type == UpdateFileType.ASSETS:
+            self._apply_assets_update(
+                connection=connection,
+                version=version,
+                actions=actions,
+                assets_conflicts=assets_conflicts,
+            )
+        else:
+            for action, full_insert in actions:
+                if update_file_type == UpdateFileType.ASSET_COLLECTIONS:
+                    try:
+                        self._process_asset_collection(
+                            connection=connection,
+                            action=action,
+                            full_insert=full_insert,
+                        )
+                    except DeserializationError as e:
+                        self.msg_aggregator.add_warning(
+                            f'Skipping entry during assets collection update to v{version} due '
+                            f'to a deserialization error. {e!s}',
+                        )
+                else:
+                    assert update_file_type == UpdateFileType.ASSET_COLLECTIONS_MAPPINGS
+                    try:
+                        self._process_multiasset_mapping(
+                            connection=connection,
+                            action=action,
+                            full_insert=full_insert,
+                        )
+                    except DeserializationError as e:
+                        self.msg_aggregator.add_warning(
+                            f'Skipping entry during assets collection multimapping update to '
+                            f'v{version} due to a deserialization error. {e!s}',
+                        )
+                    except UnknownAsset as e:
+                        self.msg_aggregator.add_warning(
+                            f'Tried to add unknown asset {e.identifier} to collection of assets. Skipping',  # noqa: E501
+                        )
 
         # at the very end update the current version in the DB
         connection.execute(
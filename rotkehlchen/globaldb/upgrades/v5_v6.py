@@ -104,6 +104,7 @@ def migrate_to_v6(connection: 'DBConnection') -> None:
     - Adds the `unique_cache` table.
     - Fixes the multiassets mappings ids to use checksummed addresses
     - Upgrades the multiasset_mappings to have unique collection_id+asset
+    - Switches the DB to incremental auto vacuum
 
     This upgrade takes place in v1.31.0
     """
@@ -113,3 +114,5 @@ def migrate_to_v6(connection: 'DBConnection') -> None:
         _create_and_populate_unique_cache_table(cursor)
         _fix_asset_in_multiasset_mappings(cursor)
         _update_multiasset_mappings(cursor)
+
+    connection.enable_incremental_vacuum()
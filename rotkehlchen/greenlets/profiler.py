@@ -0,0 +1,161 @@
+import logging
+import sys
+import time
+from collections import defaultdict
+from types import FrameType
+from typing import Any, Final, Literal, Optional
+
+import gevent
+import greenlet
+from gevent.monkey import get_original
+
+from rotkehlchen.greenlets.utils import get_greenlet_task_name
+from rotkehlchen.logging import RotkehlchenLogsAdapter
+
+logger = logging.getLogger(__name__)
+log = RotkehlchenLogsAdapter(logger)
+
+ProfileFormat = Literal['collapsed', 'speedscope']
+
+MAX_PROFILE_DURATION: Final = 60.0  # seconds
+DEFAULT_PROFILE_INTERVAL: Final = 0.01  # seconds between two samples
+MIN_PROFILE_INTERVAL: Final = 0.001
+MAX_PROFILE_INTERVAL: Final = 1.0
+# Caps of the memory of a profile. Samples of new stacks after the cap are counted in
+# one stack per task and only the innermost frames of deeper stacks are kept
+MAX_PROFILE_STACKS: Final = 5000
+MAX_STACK_DEPTH: Final = 128
+OTHER_STACKS: Final = '[other stacks]'
+TRUNCATED_FRAMES: Final = '[truncated]'
+
+# The sampler runs in a real thread so that it samples even while a greenlet hogs the CPU
+_sleep = get_original('time', 'sleep')
+_get_ident = get_original('_thread', 'get_ident')
+
+
+def frame_format(frame: FrameType) -> str:
+    block_name = frame.f_code.co_name
+    module_name = frame.f_globals.get('__name__')
+    return f'{block_name}({module_name})'
+
+
+def collect_frames(frame: FrameType) -> list[str]:
+    callstack = []
+    optional_frame: Optional[FrameType] = frame
+    while optional_frame is not None:
+        callstack.append(frame_format(optional_frame))
+        optional_frame = optional_frame.f_back
+
+    callstack.reverse()
+    return callstack
+
+
+class SamplingProfiler:
+    """Samples the stack of the running greenlet on a timer for a bounded duration
+
+    The running greenlet is followed with a greenlet trace function and each sample is
+    attributed to its task name, which for background tasks is the one they were given
+    at the GreenletManager. The stacks are sampled from a thread of the gevent threadpool
+    since a CPU bound greenlet would never let a sampling greenlet run.
+
+    Nothing is installed or running outside of `profile()`.
+    """
+
+    def __init__(self, interval: float = DEFAULT_PROFILE_INTERVAL) -> None:
+        self.interval = interval
+        self.stacks: defaultdict[tuple[str, ...], int] = defaultdict(int)
+        self.samples = 0
+        self.current: Optional[greenlet.greenlet] = None
+        self.hub: Optional[gevent.Hub] = None
+        self.previous_trace: Optional[Any] = None
+        self.thread_id = 0
+        self.start = self.end = 0.0
+
+    def _trace(self, event: str, args: Any) -> None:
+        if event in ('switch', 'throw'):
+            self.current = args[1]  # (origin, target)
+        if self.previous_trace is not None:
+            self.previous_trace(event, args)
+
+    def _sample(self) -> None:
+        frame = sys._current_frames().get(self.thread_id)  # pylint: disable=protected-access
+        if frame is None or (current := self.current) is None:
+            return
+
+        if current is self.hub:
+            task_name = 'gevent hub'
+        else:
+            task_name = get_greenlet_task_name(current)
+        callstack = collect_frames(frame)
+        if len(callstack) > MAX_STACK_DEPTH:
+            callstack = [TRUNCATED_FRAMES, *callstack[-MAX_STACK_DEPTH:]]
+        stack = (task_name, *callstack)
+        if stack not in self.stacks and len(self.stacks) >= MAX_PROFILE_STACKS:
+            stack = (task_name, OTHER_STACKS)
+        self.stacks[stack] += 1
+        self.samples += 1
+
+    def _run_sampler(self, deadline: float) -> None:
+        """Runs in a thread of the threadpool until the deadline"""
+        while (now := time.monotonic()) < deadline:
+            _sleep(min(self.interval, deadline - now))
+            self._sample()
+
+    def profile(self, duration: float) -> None:
+        """Samples the greenlets of the calling thread for `duration` seconds. The calling
+        greenlet waits cooperatively so the other greenlets keep running meanwhile."""
+        self.thread_id = _get_ident()
+        self.hub = gevent.get_hub()
+        self.current = greenlet.getcurrent()
+        self.previous_trace = greenlet.settrace(self._trace)
+        self.start = time.monotonic()
+        try:
+            self.hub.threadpool.spawn(
+                self._run_sampler,
+                min(self.start + duration, self.start + MAX_PROFILE_DURATION),
+            ).get()
+        finally:
+            greenlet.settrace(self.previous_trace)
+            self.end = time.monotonic()
+        log.debug(f'Sampled {self.samples} stacks in {self.end - self.start:.2f} seconds')
+
+    def to_collapsed(self) -> str:
+        """The profile in the collapsed stack format of flamegraph.pl and speedscope"""
+        return '\n'.join(
+            f'{";".join(stack)} {count}' for stack, count in sorted(self.stacks.items())
+        )
+
+    def to_speedscope(self) -> dict[str, Any]:
+        """The profile as a sampled profile of the speedscope file format where each
+        distinct stack is one sample weighted by the seconds it was sampled for"""
+        frame_indices: dict[str, int] = {}
+        samples, weights = [], []
+        for stack, count in self.stacks.items():
+            samples.append([frame_indices.setdefault(x, len(frame_indices)) for x in stack])
+            weights.append(count * self.interval)
+
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'exporter': 'rotki',
+            'name': 'rotki sampling profile',
+            'activeProfileIndex': 0,
+            'shared': {'frames': [{'name': x} for x in frame_indices]},
+            'profiles': [{
+                'type': 'sampled',
+                'name': 'greenlets',
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': sum(weights),
+                'samples': samples,
+                'weights': weights,
+            }],
+        }
+
+    def serialize(self, profile_format: ProfileFormat) -> dict[str, Any]:
+        return {
+            'format': profile_format,
+            'duration': round(self.end - self.start, 3),
+            'interval': self.interval,
+            'samples': self.samples,
+            'profile': self.to_collapsed() if profile_format == 'collapsed' else self.to_speedscope(),  # noqa: E501
+        }
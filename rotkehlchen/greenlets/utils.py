@@ -13,3 +13,13 @@ def get_greenlet_name(greenlet: Union['gevent.Greenlet', 'gevent.greenlet']) ->
         except AttributeError:  # means it's a raw greenlet
             greenlet_name = f'Greenlet with id {id(greenlet)}'
     return greenlet_name
+
+
+def get_greenlet_task_name(greenlet: Union['gevent.Greenlet', 'gevent.greenlet']) -> str:
+    """The name of the task a greenlet runs. That of the GreenletManager for background
+    tasks, the task id for async API queries and the greenlet's name otherwise"""
+    if (task_name := getattr(greenlet, 'task_name', None)) is not None:
+        return task_name
+    if (task_id := getattr(greenlet, 'task_id', None)) is not None:
+        return f'API task {task_id}'
+    return get_greenlet_name(greenlet)
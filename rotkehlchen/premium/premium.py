@@ -28,6 +28,7 @@ from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.types import Timestamp
 from rotkehlchen.utils.misc import set_user_agent
+from rotkehlchen.utils.network import create_session
 from rotkehlchen.utils.serialization import jsonloads_dict
 
 logger = logging.getLogger(__name__)
@@ -165,7 +166,7 @@ class Premium:
 
     def __init__(self, credentials: PremiumCredentials, username: str):
         self.status = SubscriptionStatus.UNKNOWN
-        self.session = requests.session()
+        self.session = create_session()
         # Make sure to have 3 retries on read/connect/other errors for all requests
         # The reason for this is that we have noticed that in unstable/slow connections
         # rotki.com server will close/cause the connection to result to a read timeout
@@ -6,6 +6,7 @@ import logging.config
 import os
 import time
 from collections import defaultdict
+from functools import partial
 from pathlib import Path
 from types import FunctionType
 from typing import TYPE_CHECKING, Any, Literal, Optional, Union, cast, overload
@@ -14,9 +15,11 @@ import gevent
 
 from rotkehlchen.accounting.accountant import Accountant
 from rotkehlchen.accounting.structures.balance import Balance, BalanceType
+from rotkehlchen.accounting.timings import PnlTimings
 from rotkehlchen.api.websockets.notifier import RotkiNotifier
 from rotkehlchen.api.websockets.typedefs import WSMessageType
 from rotkehlchen.assets.asset import Asset, AssetWithOracles, CryptoAsset
+from rotkehlchen.assets.resolver import AssetResolver
 from rotkehlchen.balances.manual import (
     account_for_manually_tracked_asset_balances,
     get_manually_tracked_balances,
@@ -35,6 +38,7 @@ from rotkehlchen.chain.evm.contracts import EvmContracts
 from rotkehlchen.chain.evm.nodes import populate_rpc_nodes_in_database
 from rotkehlchen.chain.gnosis.manager import GnosisManager
 from rotkehlchen.chain.gnosis.node_inquirer import GnosisInquirer
+from rotkehlchen.chain.lazy_manager import LazyChainManager
 from rotkehlchen.chain.optimism.manager import OptimismManager
 from rotkehlchen.chain.optimism.node_inquirer import OptimismInquirer
 from rotkehlchen.chain.polygon_pos.manager import PolygonPOSManager
@@ -50,6 +54,7 @@ from rotkehlchen.data_handler import DataHandler
 from rotkehlchen.data_import.manager import CSVDataImporter
 from rotkehlchen.data_migrations.manager import DataMigrationManager
 from rotkehlchen.db.filtering import NFTFilterQuery
+from rotkehlchen.db.profiles import DB_CONNECTION_PROFILES
 from rotkehlchen.db.settings import CachedSettings, DBSettings, ModifiableDBSettings
 from rotkehlchen.db.updates import RotkiDataUpdater
 from rotkehlchen.errors.api import PremiumAuthenticationError
@@ -117,6 +122,14 @@ ICONS_BATCH_SIZE = 3
 ICONS_QUERY_SLEEP = 60
 
 
+def _time_unlock_phase(timings: dict[str, float], phase: str, start: float) -> float:
+    """Records the seconds the given phase of unlocking a user took since `start` and
+    returns the start of the next phase"""
+    now = time.perf_counter()
+    timings[phase] = round(now - start, 3)
+    return now
+
+
 class Rotkehlchen:
     def __init__(self, args: argparse.Namespace) -> None:
         """Initialize the Rotkehlchen object
@@ -152,9 +165,11 @@ class Rotkehlchen:
         self.msg_aggregator.rotki_notifier = self.rotki_notifier
         self.exchange_manager = ExchangeManager(msg_aggregator=self.msg_aggregator)
         # Initialize the GlobalDBHandler singleton. Has to be initialized BEFORE asset resolver
+        connection_profile = DB_CONNECTION_PROFILES[self.args.db_profile]
         globaldb = GlobalDBHandler(
             data_dir=self.data_dir,
             sql_vm_instructions_cb=self.args.sqlite_instructions,
+            connection_profile=connection_profile,
         )
         if globaldb.used_backup is True:
             self.msg_aggregator.add_warning(
@@ -165,6 +180,7 @@ class Rotkehlchen:
             self.data_dir,
             self.msg_aggregator,
             sql_vm_instructions_cb=args.sqlite_instructions,
+            connection_profile=connection_profile,
         )
         self.cryptocompare = Cryptocompare(data_directory=self.data_dir, database=None)
         self.coingecko = Coingecko()
@@ -231,6 +247,14 @@ class Rotkehlchen:
         self.data.logout()
         CachedSettings().reset()
 
+    def _warm_up_asset_cache(self) -> None:
+        """Sizes the asset memory cache after the user's assets and loads the ones they hold
+        so that the first balance query and PnL report don't resolve them one by one"""
+        AssetResolver.auto_size_cache(GlobalDBHandler.count_user_owned_assets())
+        with self.data.db.conn.read_ctx() as cursor:
+            identifiers = self.data.db.get_held_asset_identifiers(cursor)
+        AssetResolver.prewarm_cache(identifiers)
+
     def _perform_new_db_actions(self) -> None:
         """Actions to perform at creation of a new DB"""
         with (
@@ -276,6 +300,8 @@ class Rotkehlchen:
             initial_settings=initial_settings,
             resume_from_backup=resume_from_backup,
         )
+        unlock_timings: dict[str, float] = {}
+        phase_start = unlock_start = time.perf_counter()
 
         # unlock or create the DB
         self.user_directory = self.data.unlock(
@@ -293,8 +319,15 @@ class Rotkehlchen:
             exception_is_error=False,
             method=self.data.db.ensure_data_integrity,
         )
+        self.greenlet_manager.spawn_and_track(
+            after_seconds=None,
+            task_name='warm up asset cache',
+            exception_is_error=False,
+            method=self._warm_up_asset_cache,
+        )
         if create_new:
             self._perform_new_db_actions()
+        phase_start = _time_unlock_phase(unlock_timings, 'database', phase_start)
 
         self.data_importer = CSVDataImporter(db=self.data.db)
         self.premium_sync_manager = PremiumSyncManager(
@@ -329,6 +362,7 @@ class Rotkehlchen:
             )
             # else let's just continue. User signed in succesfully, but he just
             # has unauthenticable/invalid premium credentials remaining in his DB
+        phase_start = _time_unlock_phase(unlock_timings, 'premium', phase_start)
 
         with self.data.db.conn.read_ctx() as cursor:
             settings = self.get_settings(cursor)
@@ -357,70 +391,83 @@ class Rotkehlchen:
             )
             blockchain_accounts = self.data.db.get_blockchain_accounts(cursor)
 
-        # Initialize blockchain querying modules
-        ethereum_inquirer = EthereumInquirer(
-            greenlet_manager=self.greenlet_manager,
-            database=self.data.db,
-        )
-        ethereum_manager = EthereumManager(ethereum_inquirer)
-        optimism_inquirer = OptimismInquirer(
-            greenlet_manager=self.greenlet_manager,
-            database=self.data.db,
-        )
-        optimism_manager = OptimismManager(optimism_inquirer)
-        polygon_pos_inquirer = PolygonPOSInquirer(
-            greenlet_manager=self.greenlet_manager,
-            database=self.data.db,
-        )
-        polygon_pos_manager = PolygonPOSManager(polygon_pos_inquirer)
-        arbitrum_one_inquirer = ArbitrumOneInquirer(
-            greenlet_manager=self.greenlet_manager,
-            database=self.data.db,
-        )
-        arbitrum_one_manager = ArbitrumOneManager(arbitrum_one_inquirer)
-        base_inquirer = BaseInquirer(
-            greenlet_manager=self.greenlet_manager,
-            database=self.data.db,
-        )
-        base_manager = BaseManager(base_inquirer)
-        gnosis_inquirer = GnosisInquirer(
-            greenlet_manager=self.greenlet_manager,
-            database=self.data.db,
-        )
-        gnosis_manager = GnosisManager(gnosis_inquirer)
-        kusama_manager = SubstrateManager(
-            chain=SupportedBlockchain.KUSAMA,
-            msg_aggregator=self.msg_aggregator,
-            greenlet_manager=self.greenlet_manager,
-            connect_at_start=KUSAMA_NODES_TO_CONNECT_AT_START,
-            connect_on_startup=len(blockchain_accounts.ksm) != 0,
-            own_rpc_endpoint=settings.ksm_rpc_endpoint,
-        )
-        polkadot_manager = SubstrateManager(
-            chain=SupportedBlockchain.POLKADOT,
-            msg_aggregator=self.msg_aggregator,
-            greenlet_manager=self.greenlet_manager,
-            connect_at_start=POLKADOT_NODES_TO_CONNECT_AT_START,
-            connect_on_startup=len(blockchain_accounts.dot) != 0,
-            own_rpc_endpoint=settings.dot_rpc_endpoint,
-        )
+        phase_start = _time_unlock_phase(unlock_timings, 'settings_and_exchanges', phase_start)
+
+        # Initialize blockchain querying modules. A chain manager is only constructed the
+        # first time it's used and those of the chains with accounts are constructed now
+        # concurrently, so that chains the user does not use don't slow down the login
+        database, greenlet_manager = self.data.db, self.greenlet_manager
         self.covalent_avalanche = Covalent(
-            database=self.data.db,
+            database=database,
             msg_aggregator=self.msg_aggregator,
             chain_id=chains_id['avalanche'],
         )
-        avalanche_manager = AvalancheManager(
-            avaxrpc_endpoint='https://api.avax.network/ext/bc/C/rpc',
-            covalent=self.covalent_avalanche,
-            msg_aggregator=self.msg_aggregator,
-        )
+        chain_managers: dict[SupportedBlockchain, LazyChainManager] = {
+            SupportedBlockchain.ETHEREUM: LazyChainManager(
+                SupportedBlockchain.ETHEREUM,
+                lambda: EthereumManager(EthereumInquirer(greenlet_manager=greenlet_manager, database=database)),  # noqa: E501
+            ),
+            SupportedBlockchain.OPTIMISM: LazyChainManager(
+                SupportedBlockchain.OPTIMISM,
+                lambda: OptimismManager(OptimismInquirer(greenlet_manager=greenlet_manager, database=database)),  # noqa: E501
+            ),
+            SupportedBlockchain.POLYGON_POS: LazyChainManager(
+                SupportedBlockchain.POLYGON_POS,
+                lambda: PolygonPOSManager(PolygonPOSInquirer(greenlet_manager=greenlet_manager, database=database)),  # noqa: E501
+            ),
+            SupportedBlockchain.ARBITRUM_ONE: LazyChainManager(
+                SupportedBlockchain.ARBITRUM_ONE,
+                lambda: ArbitrumOneManager(ArbitrumOneInquirer(greenlet_manager=greenlet_manager, database=database)),  # noqa: E501
+            ),
+            SupportedBlockchain.BASE: LazyChainManager(
+                SupportedBlockchain.BASE,
+                lambda: BaseManager(BaseInquirer(greenlet_manager=greenlet_manager, database=database)),  # noqa: E501
+            ),
+            SupportedBlockchain.GNOSIS: LazyChainManager(
+                SupportedBlockchain.GNOSIS,
+                lambda: GnosisManager(GnosisInquirer(greenlet_manager=greenlet_manager, database=database)),  # noqa: E501
+            ),
+            # the arguments are bound now as they can change before the manager is needed
+            SupportedBlockchain.KUSAMA: LazyChainManager(SupportedBlockchain.KUSAMA, partial(
+                SubstrateManager,
+                chain=SupportedBlockchain.KUSAMA,
+                msg_aggregator=self.msg_aggregator,
+                greenlet_manager=greenlet_manager,
+                connect_at_start=KUSAMA_NODES_TO_CONNECT_AT_START,
+                connect_on_startup=len(blockchain_accounts.ksm) != 0,
+                own_rpc_endpoint=settings.ksm_rpc_endpoint,
+            )),
+            SupportedBlockchain.POLKADOT: LazyChainManager(SupportedBlockchain.POLKADOT, partial(
+                SubstrateManager,
+                chain=SupportedBlockchain.POLKADOT,
+                msg_aggregator=self.msg_aggregator,
+                greenlet_manager=greenlet_manager,
+                connect_at_start=POLKADOT_NODES_TO_CONNECT_AT_START,
+                connect_on_startup=len(blockchain_accounts.dot) != 0,
+                own_rpc_endpoint=settings.dot_rpc_endpoint,
+            )),
+            SupportedBlockchain.AVALANCHE: LazyChainManager(SupportedBlockchain.AVALANCHE, partial(
+                AvalancheManager,
+                avaxrpc_endpoint='https://api.avax.network/ext/bc/C/rpc',
+                covalent=self.covalent_avalanche,
+                msg_aggregator=self.msg_aggregator,
+            )),
+        }
+        gevent.joinall([  # ethereum is always needed by the price oracles and the eth modules
+            gevent.spawn(chain_manager.initialize_manager)
+            for blockchain, chain_manager in chain_managers.items()
+            if blockchain == SupportedBlockchain.ETHEREUM or len(blockchain_accounts.get(blockchain)) != 0  # noqa: E501
+        ], raise_error=True)
+        ethereum_manager = cast(EthereumManager, chain_managers[SupportedBlockchain.ETHEREUM])
+        optimism_manager = cast(OptimismManager, chain_managers[SupportedBlockchain.OPTIMISM])
+        phase_start = _time_unlock_phase(unlock_timings, 'chain_managers', phase_start)
 
         Inquirer().inject_evm_managers([
             (ChainID.ETHEREUM, ethereum_manager),
             (ChainID.OPTIMISM, optimism_manager),
         ])
-        uniswap_v2_oracle = UniswapV2Oracle(ethereum_inquirer)
-        uniswap_v3_oracle = UniswapV3Oracle(ethereum_inquirer)
+        uniswap_v2_oracle = UniswapV2Oracle(ethereum_manager.node_inquirer)
+        uniswap_v3_oracle = UniswapV3Oracle(ethereum_manager.node_inquirer)
         Inquirer().add_defi_oracles(
             uniswap_v2=uniswap_v2_oracle,
             uniswap_v3=uniswap_v3_oracle,
@@ -431,13 +478,13 @@ class Rotkehlchen:
             blockchain_accounts=blockchain_accounts,
             ethereum_manager=ethereum_manager,
             optimism_manager=optimism_manager,
-            polygon_pos_manager=polygon_pos_manager,
-            arbitrum_one_manager=arbitrum_one_manager,
-            base_manager=base_manager,
-            gnosis_manager=gnosis_manager,
-            kusama_manager=kusama_manager,
-            polkadot_manager=polkadot_manager,
-            avalanche_manager=avalanche_manager,
+            polygon_pos_manager=cast(PolygonPOSManager, chain_managers[SupportedBlockchain.POLYGON_POS]),  # noqa: E501
+            arbitrum_one_manager=cast(ArbitrumOneManager, chain_managers[SupportedBlockchain.ARBITRUM_ONE]),  # noqa: E501
+            base_manager=cast(BaseManager, chain_managers[SupportedBlockchain.BASE]),
+            gnosis_manager=cast(GnosisManager, chain_managers[SupportedBlockchain.GNOSIS]),
+            kusama_manager=cast(SubstrateManager, chain_managers[SupportedBlockchain.KUSAMA]),
+            polkadot_manager=cast(SubstrateManager, chain_managers[SupportedBlockchain.POLKADOT]),
+            avalanche_manager=cast(AvalancheManager, chain_managers[SupportedBlockchain.AVALANCHE]),  # noqa: E501
             msg_aggregator=self.msg_aggregator,
             database=self.data.db,
             greenlet_manager=self.greenlet_manager,
@@ -447,6 +494,7 @@ class Rotkehlchen:
             beaconchain=self.beaconchain,
             btc_derivation_gap_limit=settings.btc_derivation_gap_limit,
         )
+        phase_start = _time_unlock_phase(unlock_timings, 'chains_aggregator', phase_start)
 
         self.accountant = Accountant(
             db=self.data.db,
@@ -481,8 +529,10 @@ class Rotkehlchen:
             data_updater=self.data_updater,
             username=user,
         )
+        phase_start = _time_unlock_phase(unlock_timings, 'accounting_and_tasks', phase_start)
 
         self.migration_manager.maybe_migrate_data()
+        _time_unlock_phase(unlock_timings, 'migrations', phase_start)
         self.greenlet_manager.spawn_and_track(
             after_seconds=5,
             task_name='periodically_query_icons_until_all_cached',
@@ -501,7 +551,11 @@ class Rotkehlchen:
         )
 
         self.user_is_logged_in = True
-        log.debug('User unlocking complete')
+        log.debug(
+            'User unlocking complete',
+            total_seconds=round(time.perf_counter() - unlock_start, 3),
+            phase_seconds=unlock_timings,
+        )
 
     def _logout(self) -> None:
         if not self.user_is_logged_in:
@@ -838,16 +892,20 @@ class Rotkehlchen:
             self,
             start_ts: Timestamp,
             end_ts: Timestamp,
+            measure_timings: bool = False,
     ) -> tuple[int, str]:
-        error_or_empty, events = self.events_historian.get_history(
-            start_ts=start_ts,
-            end_ts=end_ts,
-            has_premium=self.premium is not None,
-        )
+        timings = PnlTimings(enabled=measure_timings)
+        with timings.measure('history'):
+            error_or_empty, events = self.events_historian.get_history(
+                start_ts=start_ts,
+                end_ts=end_ts,
+                has_premium=self.premium is not None,
+            )
         report_id = self.accountant.process_history(
             start_ts=start_ts,
             end_ts=end_ts,
             events=events,
+            timings=timings,
         )
         return report_id, error_or_empty
 
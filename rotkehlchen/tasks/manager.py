@@ -1,7 +1,7 @@
 import logging
 import random
 from collections import defaultdict
-from typing import TYPE_CHECKING, Callable, NamedTuple
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 
 import gevent
 
@@ -21,13 +21,15 @@ from rotkehlchen.chain.ethereum.utils import should_update_protocol_cache
 from rotkehlchen.constants.timing import (
     DATA_UPDATES_REFRESH,
     DAY_IN_SECONDS,
+    DB_MAINTENANCE_REFRESH,
     EVM_ACCOUNTS_DETECTION_REFRESH,
     HOUR_IN_SECONDS,
 )
-from rotkehlchen.db.constants import LAST_DATA_UPDATES_KEY
+from rotkehlchen.db.constants import LAST_DATA_UPDATES_KEY, LAST_DB_MAINTENANCE_KEY
 from rotkehlchen.db.evmtx import DBEvmTx
 from rotkehlchen.db.filtering import EvmTransactionsFilterQuery, HistoryEventFilterQuery
 from rotkehlchen.db.history_events import DBHistoryEvents
+from rotkehlchen.db.maintenance import DBMaintenance
 from rotkehlchen.errors.api import PremiumAuthenticationError
 from rotkehlchen.errors.asset import UnknownAsset, WrongAssetType
 from rotkehlchen.errors.misc import RemoteError
@@ -35,6 +37,7 @@ from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.history.types import HistoricalPriceOracle
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.premium.premium import Premium, premium_create_and_verify
+from rotkehlchen.tasks.scheduler import TaskCost, TaskPriority, TaskProperties, TaskScheduler
 from rotkehlchen.tasks.utils import query_missing_prices_of_base_entries, should_run_periodic_task
 from rotkehlchen.types import (
     EVM_CHAINS_WITH_TRANSACTIONS,
@@ -77,6 +80,29 @@ TX_RECEIPTS_QUERY_LIMIT = 500
 TX_DECODING_LIMIT = 500
 PREMIUM_CHECK_RETRY_LIMIT = 3
 
+# Scheduling properties of the periodic tasks, keyed by the task name which is the name of
+# the scheduling method without the `_maybe_` prefix. Tasks not in here use the defaults.
+TASK_PROPERTIES: dict[str, TaskProperties] = {
+    'update_snapshot_balances': TaskProperties(TaskPriority.HIGH, 0, TaskCost.LIGHT),
+    'decode_evm_transactions': TaskProperties(TaskPriority.HIGH, 0, TaskCost.LIGHT),
+    'schedule_evm_txreceipts': TaskProperties(TaskPriority.NORMAL, 60, TaskCost.HEAVY),
+    'query_evm_transactions': TaskProperties(TaskPriority.NORMAL, 60, TaskCost.HEAVY),
+    'schedule_xpub_derivation': TaskProperties(TaskPriority.NORMAL, 60, TaskCost.LIGHT),
+    'check_premium_status': TaskProperties(TaskPriority.NORMAL, 60, TaskCost.LIGHT),
+    'check_data_updates': TaskProperties(TaskPriority.NORMAL, 300, TaskCost.LIGHT),
+    'run_events_processing': TaskProperties(TaskPriority.NORMAL, 300, TaskCost.LIGHT),
+    'schedule_db_upload': TaskProperties(TaskPriority.NORMAL, 60, TaskCost.LIGHT),
+    'schedule_exchange_history_query': TaskProperties(TaskPriority.LOW, 60, TaskCost.HEAVY),
+    'schedule_cryptocompare_query': TaskProperties(TaskPriority.LOW, 60, TaskCost.HEAVY),
+    'query_missing_prices': TaskProperties(TaskPriority.LOW, 120, TaskCost.HEAVY),
+    'detect_evm_accounts': TaskProperties(TaskPriority.LOW, 300, TaskCost.HEAVY),
+    'query_produced_blocks': TaskProperties(TaskPriority.LOW, 300, TaskCost.HEAVY),
+    'query_withdrawals': TaskProperties(TaskPriority.LOW, 300, TaskCost.HEAVY),
+    'update_yearn_vaults': TaskProperties(TaskPriority.LOW, 300, TaskCost.LIGHT),
+    'update_ilk_cache': TaskProperties(TaskPriority.LOW, 300, TaskCost.LIGHT),
+    'run_db_maintenance': TaskProperties(TaskPriority.LOW, 600, TaskCost.HEAVY),
+}
+
 
 def exchange_fail_cb(error: str) -> None:
     log.error(error)
@@ -149,9 +175,11 @@ class TaskManager:
             self._maybe_query_produced_blocks,
             self._maybe_query_withdrawals,
             self._maybe_run_events_processing,
+            self._maybe_run_db_maintenance,
         ]
         if self.premium_sync_manager is not None:
             self.potential_tasks.append(self._maybe_schedule_db_upload)
+        self.scheduler = TaskScheduler(properties=TASK_PROPERTIES)
         self.schedule_lock = gevent.lock.Semaphore()
 
     def _maybe_schedule_db_upload(self) -> Optional[list[gevent.Greenlet]]:
@@ -205,8 +233,12 @@ class TaskManager:
                 to_asset=main_currency,
                 source=HistoricalPriceOracle.CRYPTOCOMPARE,
             )
-            if data_range is not None and now_ts - data_range[1] < CRYPTOCOMPARE_QUERY_AFTER_SECS:
-                continue
+            if (
+                    data_range is not None and
+                    now_ts - data_range[1] < CRYPTOCOMPARE_QUERY_AFTER_SECS and
+                    self.cryptocompare.is_histohour_start_cached(asset, main_currency, data_range[0]) is True  # noqa: E501
+            ):
+                continue  # the prices are recent and an earlier query did not stop halfway
 
             self.cryptocompare_queries.add(CCHistoQuery(from_asset=asset, to_asset=main_currency))
 
@@ -652,6 +684,25 @@ class TaskManager:
 
         return None
 
+    def _maybe_run_db_maintenance(self) -> Optional[list[gevent.Greenlet]]:
+        """Schedules the maintenance of the DBs if it did not finish in the last
+        DB_MAINTENANCE_REFRESH seconds. Only when no other task of the task manager
+        and no task of the API is running so that it uses the DBs when nobody else does.
+        """
+        if (
+            len(self.running_greenlets) != 0 or
+            any(greenlet.dead is False for greenlet in self.api_task_greenlets) or
+            should_run_periodic_task(self.database, LAST_DB_MAINTENANCE_KEY, DB_MAINTENANCE_REFRESH) is False  # noqa: E501
+        ):
+            return None
+
+        return [self.greenlet_manager.spawn_and_track(
+            after_seconds=None,
+            task_name='DB maintenance',
+            exception_is_error=True,
+            method=DBMaintenance(database=self.database).run,
+        )]
+
     def _schedule(self) -> None:
         """Schedules background tasks"""
         self.greenlet_manager.clear_finished()
@@ -662,29 +713,39 @@ class TaskManager:
             if not all(greenlet.dead for greenlet in greenlets)
         }
         current_greenlets = len(self.greenlet_manager.greenlets) + len(self.api_task_greenlets)
-        not_proceed = current_greenlets >= self.max_tasks_num
+        free_slots = self.max_tasks_num - current_greenlets
         log.debug(
             f'At task scheduling. Current greenlets: {current_greenlets} '
             f'Max greenlets: {self.max_tasks_num}. '
-            f'{"Will not schedule" if not_proceed else "Will schedule"}.',
+            f'{"Will not schedule" if free_slots <= 0 else "Will schedule"}.',
+        )
+        # heavy tasks can never take the last slot so that cheap tasks are not starved by them
+        heavy_slots = max(1, self.max_tasks_num - 1) - sum(
+            self.scheduler.get_properties(method).cost == TaskCost.HEAVY
+            for method in self.running_greenlets
         )
-        if not_proceed:
-            return  # too busy
-
-        random.shuffle(self.potential_tasks)
-        max_tasks = min(self.max_tasks_num - current_greenlets, len(self.potential_tasks))
-
-        spawned_new = 0
-        for scheduling_fn in self.potential_tasks:
-            if spawned_new >= max_tasks:
-                break  # no more task slots left
-            if scheduling_fn in self.running_greenlets:
-                continue  # the specified task is already running
+        now = self.scheduler.clock()
+        due_tasks = self.scheduler.due_tasks(
+            candidates=[x for x in self.potential_tasks if x not in self.running_greenlets],
+            now=now,
+        )
+        for scheduling_fn in due_tasks:
+            is_heavy = self.scheduler.get_properties(scheduling_fn).cost == TaskCost.HEAVY
+            if free_slots <= 0 or (is_heavy and heavy_slots <= 0):
+                self.scheduler.record_skip(scheduling_fn)
+                continue  # no slot left for this task. Keep going to count the skips
+
             new_greenlets = scheduling_fn()
+            self.scheduler.record_check(scheduling_fn, now=now, greenlets=new_greenlets)
             if new_greenlets is None:
                 continue  # The scheduling function for the specific task decided to not schedule it  # noqa: E501
             self.running_greenlets[scheduling_fn] = new_greenlets
-            spawned_new += 1
+            free_slots -= 1
+            heavy_slots -= is_heavy
+
+    def get_tasks_stats(self) -> dict[str, dict[str, Any]]:
+        """Returns scheduling properties and run statistics of the periodic tasks"""
+        return self.scheduler.serialize()
 
     def schedule(self) -> None:
         """Schedules background task while holding the scheduling lock
@@ -0,0 +1,160 @@
+import heapq
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, NamedTuple, Optional
+
+import gevent
+
+from rotkehlchen.utils.mixins.enums import SerializableEnumNameMixin
+
+# After how many consecutive schedule rounds in which a due task did not get a slot
+# it is promoted to the highest priority so that it can not starve
+STARVATION_SKIPS = 5
+
+
+class TaskPriority(SerializableEnumNameMixin):
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+
+
+class TaskCost(SerializableEnumNameMixin):
+    """Estimated cost of a task. Heavy tasks never take the last free task slot"""
+    LIGHT = 1
+    HEAVY = 2
+
+
+class TaskProperties(NamedTuple):
+    priority: TaskPriority
+    # Minimum seconds between two checks of a task if the last check did not spawn anything
+    min_interval: int
+    cost: TaskCost
+
+
+DEFAULT_TASK_PROPERTIES = TaskProperties(
+    priority=TaskPriority.NORMAL,
+    min_interval=0,
+    cost=TaskCost.LIGHT,
+)
+
+
+@dataclass(init=True, repr=True, eq=False, order=False, unsafe_hash=False, frozen=False)
+class TaskStats:
+    run_count: int = 0
+    skip_count: int = 0
+    consecutive_skips: int = 0
+    last_check: Optional[float] = None
+    last_check_spawned: bool = False
+    last_start: Optional[float] = None
+    last_duration: Optional[float] = None
+
+    def serialize(self) -> dict[str, Any]:
+        return {
+            'run_count': self.run_count,
+            'skip_count': self.skip_count,
+            'last_duration': self.last_duration,
+        }
+
+
+def task_name(scheduling_fn: Callable) -> str:
+    """The name of a task as shown in the stats. For `_maybe_xyz` methods it's `xyz`"""
+    return getattr(scheduling_fn, '__name__', str(scheduling_fn)).removeprefix('_maybe_')
+
+
+class TaskScheduler:
+    """Decides the order in which the task manager checks its periodic tasks
+
+    A task is due when its minimum interval since the last check has passed, or right
+    away if the last check spawned greenlets. Due tasks are ordered in a heap by
+    priority and then by deadline so overdue high priority tasks always get the next
+    free slot. A task that was due but got no slot for `STARVATION_SKIPS` consecutive
+    rounds is promoted to high priority so low priority tasks can not starve.
+    """
+
+    def __init__(
+            self,
+            properties: dict[str, TaskProperties],
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.properties = properties
+        self.clock = clock
+        self.stats: dict[str, TaskStats] = {}
+
+    def get_properties(self, scheduling_fn: Callable) -> TaskProperties:
+        return self.properties.get(task_name(scheduling_fn), DEFAULT_TASK_PROPERTIES)
+
+    def get_stats(self, scheduling_fn: Callable) -> TaskStats:
+        name = task_name(scheduling_fn)
+        if (stats := self.stats.get(name)) is None:
+            stats = self.stats[name] = TaskStats()
+        return stats
+
+    def due_tasks(self, candidates: Sequence[Callable], now: float) -> list[Callable]:
+        """Returns the due tasks out of the candidates in the order they should be checked"""
+        heap: list[tuple[int, float, int, int, Callable]] = []
+        for idx, scheduling_fn in enumerate(candidates):
+            properties = self.get_properties(scheduling_fn)
+            stats = self.get_stats(scheduling_fn)
+            if stats.last_check is None:
+                deadline = 0.0  # never checked so it is overdue
+            elif stats.last_check_spawned:
+                deadline = stats.last_check
+            else:
+                deadline = stats.last_check + properties.min_interval
+
+            if deadline > now:
+                continue
+
+            priority = properties.priority.value
+            if stats.consecutive_skips >= STARVATION_SKIPS:
+                priority = TaskPriority.HIGH.value
+
+            # idx keeps the order stable and avoids comparing the callables
+            heapq.heappush(heap, (priority, deadline, properties.cost.value, idx, scheduling_fn))
+
+        return [heapq.heappop(heap)[-1] for _ in range(len(heap))]
+
+    def record_skip(self, scheduling_fn: Callable) -> None:
+        """A due task could not be checked since there was no free slot for it"""
+        stats = self.get_stats(scheduling_fn)
+        stats.skip_count += 1
+        stats.consecutive_skips += 1
+
+    def record_check(
+            self,
+            scheduling_fn: Callable,
+            now: float,
+            greenlets: Optional[list[gevent.Greenlet]],
+    ) -> None:
+        """A task was checked and possibly spawned the given greenlets"""
+        stats = self.get_stats(scheduling_fn)
+        stats.last_check = now
+        stats.consecutive_skips = 0
+        stats.last_check_spawned = greenlets is not None
+        if greenlets is None:
+            return
+
+        stats.run_count += 1
+        stats.last_start = now
+        name = task_name(scheduling_fn)
+        for greenlet in greenlets:
+            greenlet.link(lambda _, name=name: self._record_finish(name))
+
+    def _record_finish(self, name: str) -> None:
+        """Called for each finished greenlet of a task. The last one to finish sets the duration"""
+        stats = self.stats[name]
+        if stats.last_start is not None:
+            stats.last_duration = self.clock() - stats.last_start
+
+    def serialize(self) -> dict[str, dict[str, Any]]:
+        result = {}
+        for name, stats in self.stats.items():
+            properties = self.properties.get(name, DEFAULT_TASK_PROPERTIES)
+            result[name] = {
+                'priority': properties.priority.serialize(),
+                'cost': properties.cost.serialize(),
+                'min_interval': properties.min_interval,
+                **stats.serialize(),
+            }
+        return result
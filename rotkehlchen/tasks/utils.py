@@ -21,7 +21,7 @@ log = RotkehlchenLogsAdapter(logger)
 
 def should_run_periodic_task(
         database: 'DBHandler',
-        key_name: Literal['last_data_updates_ts', 'last_evm_accounts_detect_ts'],
+        key_name: Literal['last_data_updates_ts', 'last_evm_accounts_detect_ts', 'last_db_maintenance_ts'],  # noqa: E501
         refresh_period: int,
 ) -> bool:
     """
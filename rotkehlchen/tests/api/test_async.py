@@ -144,3 +144,26 @@ def test_query_async_task_that_died(rotkehlchen_api_server_with_exchanges):
     assert result['outcome']['result'] is None
     msg = 'The backend query task died unexpectedly: BOOM!'
     assert result['outcome']['message'] == msg
+
+
+@pytest.mark.parametrize('max_tasks_num', [5])
+def test_query_periodic_tasks_stats(rotkehlchen_api_server):
+    """Test that the periodic tasks statistics are returned by the api"""
+    rotki = rotkehlchen_api_server.rest_api.rotkehlchen
+    response = requests.get(api_url_for(rotkehlchen_api_server, 'periodictasksresource'))
+    assert assert_proper_response_with_result(response) == {}
+
+    rotki.task_manager.potential_tasks = [rotki.task_manager._maybe_check_premium_status]
+    rotki.task_manager.should_schedule = True
+    rotki.task_manager.schedule()
+    response = requests.get(api_url_for(rotkehlchen_api_server, 'periodictasksresource'))
+    assert assert_proper_response_with_result(response) == {
+        'check_premium_status': {
+            'priority': 'normal',
+            'cost': 'light',
+            'min_interval': 60,
+            'run_count': 0,
+            'skip_count': 0,
+            'last_duration': None,
+        },
+    }
@@ -2,7 +2,7 @@ import random
 from contextlib import ExitStack
 from http import HTTPStatus
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -86,7 +86,7 @@ def test_query_history(rotkehlchen_api_server_with_exchanges, start_ts, end_ts):
     assert report_result['entries_found'] == 1
     assert report_result['entries_limit'] == FREE_REPORTS_LOOKUP_LIMIT
     report = report_result['entries'][0]
-    assert len(report) == 10  # 10 entries in the report api endpoint
+    assert len(report) == 11  # 11 entries in the report api endpoint
     assert report['first_processed_timestamp'] == 1428994442
     assert report['last_processed_timestamp'] == end_ts if end_ts == 1539713238 else 1566572401
     assert report['identifier'] == report_id
@@ -108,7 +108,7 @@ def test_query_history(rotkehlchen_api_server_with_exchanges, start_ts, end_ts):
     assert overview[str(AccountingEventType.TRADE)] is not None
 
     settings = report['settings']
-    assert len(settings) == 9
+    assert len(settings) == 10
     assert settings['profit_currency'] == 'EUR'
     assert settings['account_for_assets_movements'] is True
     assert settings['calculate_past_cost_basis'] is True
@@ -118,6 +118,7 @@ def test_query_history(rotkehlchen_api_server_with_exchanges, start_ts, end_ts):
     assert settings['cost_basis_method'] == 'fifo'
     assert settings['eth_staking_taxable_after_withdrawal_enabled'] is True
     assert settings['include_fees_in_cost_basis'] == fees_in_cost_basis
+    assert settings['acquisitions_merge_tolerance'] == '-1'
 
     assert events_result['entries_limit'] == FREE_PNL_EVENTS_LIMIT
     entries_length = 43 if start_ts == 0 else 40
@@ -248,7 +249,8 @@ def test_query_history_errors(rotkehlchen_api_server):
 @pytest.mark.parametrize('ethereum_accounts', [[]])
 @pytest.mark.parametrize('mocked_price_queries', [prices])
 def test_query_history_external_exchanges(rotkehlchen_api_server):
-    """Test that history is processed for external exchanges too"""
+    """Test that history is processed for external exchanges too and that the timings
+    of the report are returned if asked for"""
     start_ts = 0
     end_ts = 1631455982
 
@@ -269,8 +271,13 @@ def test_query_history_external_exchanges(rotkehlchen_api_server):
         start_ts=start_ts,
         end_ts=end_ts,
         prepare_mocks=False,
+        measure_timings=True,
     )
     assert len(events_result['entries']) == 2
+    timings = report_result['entries'][0]['timings']
+    assert timings['total'] > 0
+    assert {'history', 'processing', 'events', 'db_writes'} <= set(timings['stages'])
+    assert timings['event_types'][str(AccountingEventType.TRADE)]['calls'] == 1
     overview = report_result['entries'][0]['overview']
     assert FVal('4645.8444065096').is_close(FVal(overview[str(AccountingEventType.TRADE)]['taxable']))  # noqa: E501
 
@@ -347,6 +354,31 @@ def test_query_pnl_report_events_pagination_filtering(
         else:
             assert x['timestamp'] >= events[idx + 1]['timestamp']
 
+    # paginating by keyset returns the same events as paginating by offset
+    keyset_events: list[dict[str, Any]] = []
+    pagination: dict[str, Any] = {'offset': 0}
+    while True:
+        response = requests.post(
+            api_url_for(
+                rotkehlchen_api_server_with_exchanges,
+                'per_report_data_resource',
+                report_id=report_id,
+            ),
+            json={
+                'limit': 10,
+                'order_by_attributes': ['timestamp'],
+                'ascending': [ascending_timestamp],
+            } | pagination,
+        )
+        events_result = assert_proper_response_with_result(response)
+        assert events_result['entries_found'] == 43
+        if len(events_result['entries']) == 0:
+            break
+        keyset_events.extend(events_result['entries'])
+        pagination = {'after_identifier': events_result['entries'][-1]['identifier']}
+
+    assert keyset_events == events
+
 
 @pytest.mark.parametrize('ethereum_accounts', [[]])
 @pytest.mark.parametrize('have_decoders', [[True]])
@@ -0,0 +1,124 @@
+import re
+import time
+from http import HTTPStatus
+from unittest.mock import patch
+
+import gevent
+import requests
+
+from rotkehlchen.api.metrics import PROMETHEUS_CONTENT_TYPE
+from rotkehlchen.utils.metrics import (
+    TimedSession,
+    get_request_timings,
+    stop_request_timings,
+    track_request_timings,
+)
+
+SLOW_QUERY = 'WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 300000) SELECT x FROM c WHERE x % 1000 = 0'  # noqa: E501
+
+
+def parse_metrics(text: str) -> dict[str, float]:
+    """Maps each sample line of the prometheus text format to its value"""
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith('#') or line == '':
+            continue
+        name, value = line.rsplit(' ', maxsplit=1)
+        samples[name] = float(value)
+    return samples
+
+
+def test_request_metrics(rotkehlchen_api_server):
+    """Test that the latency, size and DB time of the requests are aggregated per route
+    and that most of the time of a route that waits on the DB is counted as DB time"""
+    rotki = rotkehlchen_api_server.rest_api.rotkehlchen
+    original_get_settings = rotki.get_settings
+
+    def slow_get_settings(cursor):
+        # execute only steps to the first row, the rest of the work is done while fetching
+        cursor.execute(SLOW_QUERY)
+        assert cursor.fetchone() == (1000,)
+        assert len(list(cursor)) == 299
+        return original_get_settings(cursor)
+
+    client = rotkehlchen_api_server.flask_app.test_client()
+    with patch.object(rotki, 'get_settings', side_effect=slow_get_settings):
+        for _ in range(3):
+            assert client.get('/api/1/settings').status_code == HTTPStatus.OK
+    assert client.get('/api/1/no_such_route').status_code == HTTPStatus.NOT_FOUND
+
+    response = client.get('/api/1/metrics')
+    assert response.status_code == HTTPStatus.OK
+    assert response.content_type == PROMETHEUS_CONTENT_TYPE
+    samples = parse_metrics(response.get_data(as_text=True))
+    settings = 'method="GET",route="/api/1/settings"'
+    assert samples[f'rotki_api_responses_total{{{settings},status="200"}}'] == 3
+    assert samples[f'rotki_api_request_duration_seconds_count{{{settings}}}'] == 3
+    assert samples[f'rotki_api_request_duration_seconds_bucket{{{settings},le="+Inf"}}'] == 3
+    assert samples[f'rotki_api_response_size_bytes_count{{{settings}}}'] == 3
+    assert samples[f'rotki_api_response_size_bytes_sum{{{settings}}}'] > 3 * 100
+    assert samples[f'rotki_api_requests_in_flight{{{settings}}}'] == 0
+    assert samples['rotki_api_responses_total{method="GET",route="unmatched",status="404"}'] == 1
+    # the metrics request itself is in flight while the metrics are rendered
+    assert samples['rotki_api_requests_in_flight{method="GET",route="/api/1/metrics"}'] == 1
+
+    duration = samples[f'rotki_api_request_duration_seconds_sum{{{settings}}}']
+    db_seconds = samples[f'rotki_api_request_db_seconds_total{{{settings}}}']
+    assert 0.5 < db_seconds / duration <= 1
+    assert samples[f'rotki_api_request_remote_seconds_total{{{settings}}}'] == 0
+    # buckets are cumulative
+    buckets = [
+        value for name, value in samples.items()
+        if re.match(rf'rotki_api_request_duration_seconds_bucket{{{re.escape(settings)},', name)
+    ]
+    assert buckets == sorted(buckets)
+
+
+def test_remote_time_is_counted():
+    """Test that the time of the requests of a timed session is counted in the timings
+    of the context that made them"""
+    def slow_send(*args, **kwargs):  # pylint: disable=unused-argument
+        response = requests.Response()
+        response.status_code = HTTPStatus.OK
+        gevent.sleep(0.05)
+        return response
+
+    session = TimedSession()
+    with patch('requests.adapters.HTTPAdapter.send', side_effect=slow_send):
+        session.get('https://example.com')  # outside of any request, nothing to count
+        with track_request_timings() as timings:
+            session.get('https://example.com')
+            session.get('https://example.com')
+    assert 0.1 <= timings.remote_seconds < 1
+    assert timings.db_seconds == 0
+
+
+def test_db_time_excludes_other_greenlets(database):
+    """Test that the time other greenlets run while a statement yields from the progress
+    handler is not counted in the DB time of the request that runs the statement"""
+    def busy() -> None:  # keeps the event loop busy, as a CPU heavy greenlet would
+        end = time.perf_counter() + 0.2
+        while time.perf_counter() < end:
+            pass
+
+    with database.conn.read_ctx() as cursor, track_request_timings() as timings:
+        greenlet = gevent.spawn(busy)
+        start = time.perf_counter()
+        cursor.execute(SLOW_QUERY)
+        assert len(cursor.fetchall()) == 300
+        duration = time.perf_counter() - start
+    greenlet.join()
+    assert duration >= 0.2
+    assert 0 < timings.db_seconds < duration - 0.15
+
+
+def test_request_timings_of_other_greenlets():
+    """Test that the timings of a greenlet are not seen by the others, and that stopping
+    the timings of a greenlet that has none does not affect the ones being counted"""
+    stop_request_timings()  # a request that failed before its timings were started
+    with track_request_timings() as timings:
+        assert get_request_timings() is timings
+        assert gevent.spawn(get_request_timings).get() is None
+        gevent.spawn(stop_request_timings).join()
+        assert get_request_timings() is timings
+    assert get_request_timings() is None
@@ -44,6 +44,7 @@ def generate_expected_info(
             'max_logfiles_num': 3,
             'max_size_in_mb_all_logs': 300,
             'sqlite_instructions': 5000,
+            'db_profile': 'default',
         },
     }
     return result
@@ -414,6 +415,7 @@ def test_configuration(rotkehlchen_api_server):
     assert result['max_logfiles_num']['value'] == DEFAULT_MAX_LOG_BACKUP_FILES
     assert result['sqlite_instructions']['is_default'] is True
     assert result['sqlite_instructions']['value'] == DEFAULT_SQL_VM_INSTRUCTIONS_CB
+    assert result['db_profile'] == {'value': 'default', 'is_default': True}
 
 
 def test_query_all_chain_ids(rotkehlchen_api_server):
@@ -0,0 +1,104 @@
+import time
+from http import HTTPStatus
+
+import gevent
+import pytest
+import requests
+from gevent.event import Event
+
+from rotkehlchen.greenlets.profiler import MAX_PROFILE_DURATION
+from rotkehlchen.tests.utils.api import (
+    api_url_for,
+    assert_error_response,
+    assert_ok_async_response,
+    assert_proper_response_with_result,
+    wait_for_async_task_with_result,
+)
+
+BUSY_TASK_NAME = 'profiling_test_busy_task'
+
+
+def burn_cpu(stop: Event) -> None:
+    """A CPU bound task that only yields every 20ms so that the API keeps responding"""
+    while not stop.is_set():
+        deadline = time.perf_counter() + 0.02
+        while time.perf_counter() < deadline:
+            sum(x * x for x in range(1000))
+        gevent.sleep(0)
+
+
+def test_profile_cpu_bound_task(rotkehlchen_api_server):
+    """Test that a profile captured while a CPU bound task runs attributes most samples
+    to the frames of that task, under the name it has at the greenlet manager"""
+    rotki = rotkehlchen_api_server.rest_api.rotkehlchen
+    stop = Event()
+    rotki.greenlet_manager.spawn_and_track(
+        after_seconds=None,
+        task_name=BUSY_TASK_NAME,
+        exception_is_error=True,
+        method=burn_cpu,
+        stop=stop,
+    )
+    try:
+        response = requests.get(
+            api_url_for(rotkehlchen_api_server, 'profilingresource'),
+            json={'duration': 1, 'interval': 0.005},
+        )
+    finally:
+        stop.set()
+
+    result = assert_proper_response_with_result(response)
+    assert result['format'] == 'collapsed'
+    assert result['samples'] > 50
+    busy_samples = 0
+    for line in result['profile'].split('\n'):
+        stack, count = line.rsplit(' ', maxsplit=1)
+        frames = stack.split(';')
+        if frames[0] == BUSY_TASK_NAME:
+            assert 'burn_cpu(rotkehlchen.tests.api.test_profiling)' in frames
+            busy_samples += int(count)
+    assert busy_samples > result['samples'] / 2
+    assert sum(int(x.rsplit(' ', maxsplit=1)[1]) for x in result['profile'].split('\n')) == result['samples']  # noqa: E501
+
+
+def test_profile_speedscope_and_limits(rotkehlchen_api_server):
+    """Test the speedscope format with an async query and that the duration, interval and
+    format of a profile are validated and only one profile is captured at a time"""
+    async_query = requests.get(
+        api_url_for(rotkehlchen_api_server, 'profilingresource'),
+        json={'duration': 0.3, 'format': 'speedscope', 'async_query': True},
+    )
+    task_id = assert_ok_async_response(async_query)
+    response = requests.get(  # while the async profile is being captured
+        api_url_for(rotkehlchen_api_server, 'profilingresource'),
+        json={'duration': 0.1},
+    )
+    assert_error_response(
+        response=response,
+        contained_in_msg='Another profile is being captured',
+        status_code=HTTPStatus.CONFLICT,
+    )
+
+    result = wait_for_async_task_with_result(rotkehlchen_api_server, task_id)
+    assert result['format'] == 'speedscope'
+    profile = result['profile']
+    assert len(profile['profiles']) == 1
+    sampled = profile['profiles'][0]
+    assert sampled['type'] == 'sampled'
+    assert len(sampled['samples']) == len(sampled['weights']) != 0
+    frames_num = len(profile['shared']['frames'])
+    assert all(0 <= x < frames_num for sample in sampled['samples'] for x in sample)
+    assert sampled['endValue'] == pytest.approx(result['samples'] * result['interval'])
+
+    for data, error in (
+        ({}, 'Missing data for required field'),
+        ({'duration': 0}, 'Profiling duration must be more than 0'),
+        ({'duration': MAX_PROFILE_DURATION + 1}, 'Profiling duration must be more than 0'),
+        ({'duration': 1, 'interval': 0}, 'Sampling interval must be between'),
+        ({'duration': 1, 'format': 'pprof'}, 'Must be one of'),
+    ):
+        response = requests.get(
+            api_url_for(rotkehlchen_api_server, 'profilingresource'),
+            json=data,
+        )
+        assert_error_response(response=response, contained_in_msg=error)
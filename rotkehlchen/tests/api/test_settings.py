@@ -167,6 +167,8 @@ def test_set_settings(rotkehlchen_api_server):
             value = CostBasisMethod.LIFO.serialize()
         elif setting == 'address_name_priority':
             value = ['hardcoded_mappings', 'ethereum_tokens']
+        elif setting == 'acquisitions_merge_tolerance':
+            value = '0.01'
         else:
             raise AssertionError(f'Unexpected settting {setting} encountered')
 
@@ -296,6 +298,27 @@ def test_disable_taxfree_after_period(rotkehlchen_api_server):
     )
 
 
+def test_set_acquisitions_merge_tolerance(rotkehlchen_api_server):
+    """Test that the acquisitions merge tolerance can be set, validated and disabled with -1"""
+    for value, expected in (('0', '0'), ('0.005', '0.005'), (-1, None)):
+        response = requests.put(
+            api_url_for(rotkehlchen_api_server, 'settingsresource'),
+            json={'settings': {'acquisitions_merge_tolerance': value}},
+        )
+        assert assert_proper_response_with_result(response)['acquisitions_merge_tolerance'] == expected  # noqa: E501
+
+    for value in ('-0.5', '1', 'foo'):
+        response = requests.put(
+            api_url_for(rotkehlchen_api_server, 'settingsresource'),
+            json={'settings': {'acquisitions_merge_tolerance': value}},
+        )
+        assert_error_response(
+            response=response,
+            contained_in_msg='acquisitions_merge_tolerance',
+            status_code=HTTPStatus.BAD_REQUEST,
+        )
+
+
 def test_set_unknown_settings(rotkehlchen_api_server):
     """Test that setting an unknown setting results in an error
 
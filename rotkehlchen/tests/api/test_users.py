@@ -4,7 +4,7 @@ import shutil
 from contextlib import ExitStack
 from http import HTTPStatus
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, get_args
 from unittest import mock
 
 import pytest
@@ -12,6 +12,7 @@ import requests
 from pysqlcipher3 import dbapi2 as sqlcipher
 
 from rotkehlchen.api.server import APIServer
+from rotkehlchen.chain.lazy_manager import LazyChainManager
 from rotkehlchen.db.drivers.gevent import DBConnection, DBConnectionType
 from rotkehlchen.db.settings import ROTKEHLCHEN_DB_VERSION, DBSettings
 from rotkehlchen.premium.premium import PremiumCredentials
@@ -26,12 +27,13 @@ from rotkehlchen.tests.utils.api import (
     wait_for_async_task,
     wait_for_async_task_with_result,
 )
+from rotkehlchen.tests.utils.factories import make_evm_address
 from rotkehlchen.tests.utils.premium import (
     VALID_PREMIUM_KEY,
     VALID_PREMIUM_SECRET,
     create_patched_premium,
 )
-from rotkehlchen.types import Timestamp
+from rotkehlchen.types import CHAINS_WITH_CHAIN_MANAGER, ChainID, SupportedBlockchain, Timestamp
 from rotkehlchen.utils.misc import ts_now
 
 
@@ -778,6 +780,41 @@ def test_user_login(rotkehlchen_api_server, username, db_password, data_dir):
         )
 
 
+@pytest.mark.parametrize('ethereum_accounts', [[make_evm_address()]])
+def test_user_login_builds_only_used_chain_managers(rotkehlchen_api_server, username, db_password):
+    """Test that logging in a user who only has ethereum accounts constructs only the
+    ethereum manager and that the decoders of the other chains are never built"""
+    rotki = rotkehlchen_api_server.rest_api.rotkehlchen
+    response = requests.patch(
+        api_url_for(rotkehlchen_api_server, 'usersbynameresource', name=username),
+        json={'action': 'logout'},
+    )
+    assert_simple_ok_response(response)
+
+    with ExitStack() as stack:
+        patch_no_op_unlock(rotki, stack)
+        decoder_init = stack.enter_context(mock.patch(
+            'rotkehlchen.chain.evm.decoding.decoder.EVMTransactionDecoder.__init__',
+            side_effect=lambda **kwargs: None,
+        ))
+        response = requests.post(
+            api_url_for(rotkehlchen_api_server, 'usersbynameresource', name=username),
+            json={'password': db_password, 'sync_approval': 'unknown'},
+        )
+        check_proper_unlock_result(assert_proper_response_with_result(response))
+
+        assert [x.kwargs['evm_inquirer'].chain_id for x in decoder_init.call_args_list] == [ChainID.ETHEREUM]  # noqa: E501
+        for blockchain in get_args(CHAINS_WITH_CHAIN_MANAGER):
+            chain_manager = rotki.chains_aggregator.get_chain_manager(blockchain)
+            assert isinstance(chain_manager, LazyChainManager)
+            assert chain_manager.manager_is_initialized() is (blockchain == SupportedBlockchain.ETHEREUM)  # noqa: E501
+
+        # and a manager is constructed once it is used
+        assert rotki.chains_aggregator.gnosis.node_inquirer.chain_id == ChainID.GNOSIS
+        assert rotki.chains_aggregator.gnosis.manager_is_initialized() is True
+        assert decoder_init.call_args_list[-1].kwargs['evm_inquirer'].chain_id == ChainID.GNOSIS
+
+
 def test_user_set_premium_credentials(rotkehlchen_api_server: APIServer, username: str):
     """Test that setting the premium credentials endpoint works.
 
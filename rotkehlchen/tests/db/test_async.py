@@ -2,12 +2,14 @@ from random import randint
 from uuid import uuid4
 
 import gevent
+import gevent.event
 import pytest
 
 from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.accounting.structures.base import HistoryEvent
 from rotkehlchen.accounting.structures.types import HistoryEventSubType, HistoryEventType
 from rotkehlchen.constants.assets import A_ETH
+from rotkehlchen.db.drivers.gevent import DEFAULT_READER_POOL_SIZE
 from rotkehlchen.db.filtering import HistoryEventFilterQuery
 from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.fval import FVal
@@ -151,3 +153,59 @@ def test_can_disable_callback(database):  # pylint: disable=unused-argument
     This is a regression test since setting to 0 was hitting an assertion before
     """
     assert True  # no need to do anything. Test would fail at fixture setup
+
+
+def test_readers_not_blocked_by_write(database):
+    """Test that while a long write transaction is open, reads of other greenlets are
+    served by the reader pool without waiting for the write and only see committed data"""
+    write_events(database, 10)
+    with database.conn.read_ctx() as cursor:
+        committed = cursor.execute('SELECT COUNT(*) FROM history_events').fetchone()[0]
+    write_started, write_can_finish = gevent.event.Event(), gevent.event.Event()
+
+    def long_write():
+        with database.user_write() as write_cursor:
+            DBHistoryEvents(database).add_history_events(
+                write_cursor=write_cursor,
+                history=[make_history_event() for _ in range(5)],
+            )
+            write_started.set()
+            write_can_finish.wait(timeout=10)
+
+    def read():
+        write_started.wait()
+        assert database.conn.transaction_lock.locked() is True
+        with database.conn.read_ctx() as cursor:
+            assert cursor.connection.reader_id is not None
+            return cursor.execute('SELECT COUNT(*) FROM history_events').fetchone()[0]
+
+    writer = gevent.spawn(long_write)
+    readers = [gevent.spawn(read) for _ in range(DEFAULT_READER_POOL_SIZE + 2)]
+    gevent.joinall(readers, timeout=5, raise_error=True)
+    assert all(reader.successful() for reader in readers)
+    assert writer.ready() is False  # the write transaction is still open
+    assert [reader.value for reader in readers] == [committed] * len(readers)
+    assert len(database.conn.reader_pool.connections) <= DEFAULT_READER_POOL_SIZE
+
+    write_can_finish.set()
+    writer.get(timeout=5)
+    with database.conn.read_ctx() as cursor:
+        assert cursor.execute('SELECT COUNT(*) FROM history_events').fetchone()[0] == committed + 5
+
+
+@pytest.mark.parametrize('sql_vm_instructions_cb', [100])
+def test_reader_yields_in_progress_handler(database):
+    """Test that a long read on a pooled reader context switches via the progress handler"""
+    order = []
+
+    def long_read():
+        with database.conn.read_ctx() as cursor:
+            assert cursor.connection.reader_id is not None
+            cursor.execute(
+                'WITH RECURSIVE cnt(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM cnt '
+                'WHERE x < 100000) SELECT COUNT(*) FROM cnt',
+            ).fetchone()
+        order.append('read')
+
+    gevent.joinall([gevent.spawn(long_read), gevent.spawn(order.append, 'other')])
+    assert order == ['other', 'read']
@@ -29,6 +29,7 @@ from rotkehlchen.data_handler import DataHandler
 from rotkehlchen.db.dbhandler import DBHandler
 from rotkehlchen.db.filtering import AssetMovementsFilterQuery, TradesFilterQuery
 from rotkehlchen.db.misc import detect_sqlcipher_version
+from rotkehlchen.db.profiles import DB_CONNECTION_PROFILES
 from rotkehlchen.db.queried_addresses import QueriedAddresses
 from rotkehlchen.db.schema import DB_CREATE_ETH2_DAILY_STAKING_DETAILS
 from rotkehlchen.db.settings import (
@@ -184,6 +185,30 @@ def test_data_init_and_password(data_dir, username, sql_vm_instructions_cb):
         data.unlock(username, '1234', create_new=False, resume_from_backup=False)
 
 
+def test_connection_profile(data_dir, username, sql_vm_instructions_cb):
+    """Test that the connections to the user and transient DBs are tuned by the profile,
+    that synchronous is only relaxed for the user DB which is journaled with WAL and that
+    a wrong password is still detected when connecting with a profile"""
+    profile = DB_CONNECTION_PROFILES['throughput']
+    data = DataHandler(data_dir, MessagesAggregator(), sql_vm_instructions_cb, profile)
+    data.unlock(username, '123', create_new=True, resume_from_backup=False)
+    for conn, journal_mode, synchronous in (
+            (data.db.conn, 'wal', 1),  # NORMAL
+            (data.db.conn_transient, 'delete', 2),  # FULL, the default
+    ):
+        assert conn.execute('PRAGMA cache_size').fetchone()[0] == profile.cache_size
+        assert conn.execute('PRAGMA temp_store').fetchone()[0] == 2  # MEMORY
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == journal_mode
+        assert conn.execute('PRAGMA synchronous').fetchone()[0] == synchronous
+    with data.db.conn.read_ctx() as cursor:  # a connection of the reader pool
+        assert cursor.execute('PRAGMA cache_size').fetchone()[0] == profile.cache_size
+    data.logout()
+
+    data = DataHandler(data_dir, MessagesAggregator(), sql_vm_instructions_cb, profile)
+    with pytest.raises(AuthenticationError):
+        data.unlock(username, '1234', create_new=False, resume_from_backup=False)
+
+
 def test_add_remove_exchange(user_data_dir, sql_vm_instructions_cb):
     """Tests that adding and removing an exchange in the DB works.
 
@@ -460,6 +485,7 @@ def test_writing_fetching_data(data_dir, username, sql_vm_instructions_cb):
         'query_retry_limit': DEFAULT_QUERY_RETRY_LIMIT,
         'connect_timeout': DEFAULT_CONNECT_TIMEOUT,
         'read_timeout': DEFAULT_READ_TIMEOUT,
+        'acquisitions_merge_tolerance': None,
     }
     assert len(expected_dict) == len(dataclasses.fields(DBSettings)), 'One or more settings are missing'  # noqa: E501
 
@@ -0,0 +1,143 @@
+import sqlite3
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+import pytest
+
+from rotkehlchen.db.constants import LAST_DB_MAINTENANCE_KEY
+from rotkehlchen.db.drivers.gevent import DBConnection, DBConnectionType, DBCursor
+from rotkehlchen.db.maintenance import DBMaintenance
+
+if TYPE_CHECKING:
+    from rotkehlchen.db.dbhandler import DBHandler
+    from rotkehlchen.globaldb.handler import GlobalDBHandler
+
+MAINTENANCE_TABLE_ROWS = 200000
+WRITE_SLICE = 0.02
+# Commits and rollbacks of a slice are not interrupted so a slice may take longer. Generous
+# so that a slow or busy machine does not fail the tests
+WRITE_SLICE_TOLERANCE = 0.5
+
+
+class SteppingClock:
+    """A clock that advances by `step` seconds every time it is read"""
+
+    def __init__(self, step: float) -> None:
+        self.now = 1000.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+def _track_write_holds(conn: DBConnection, holds: list[float]) -> None:
+    """Records for how many seconds each write transaction of the connection is held"""
+    write_ctx = conn.write_ctx
+
+    @contextmanager
+    def timed_write_ctx(commit_ts: bool = False) -> Generator[DBCursor, None, None]:
+        with write_ctx(commit_ts=commit_ts) as cursor:
+            start = time.monotonic()
+            try:
+                yield cursor
+            finally:
+                holds.append(time.monotonic() - start)
+
+    conn.write_ctx = timed_write_ctx  # type: ignore[method-assign]
+
+
+def _fill_and_trim_table(database: 'DBHandler') -> None:
+    """Creates a big indexed table and deletes most of it so that it leaves free pages"""
+    with database.conn.write_ctx() as write_cursor:
+        write_cursor.execute('CREATE TABLE maintenance_test(id INTEGER PRIMARY KEY, a TEXT, b INTEGER)')  # noqa: E501
+        write_cursor.execute('CREATE INDEX idx_maintenance_test_a ON maintenance_test(a)')
+        write_cursor.execute('CREATE INDEX idx_maintenance_test_b ON maintenance_test(b)')
+        write_cursor.executemany(
+            'INSERT INTO maintenance_test(a, b) VALUES(?, ?)',
+            [(f'value{x}' * 3, x % 1000) for x in range(MAINTENANCE_TABLE_ROWS)],
+        )
+    with database.conn.write_ctx() as write_cursor:
+        write_cursor.execute('DELETE FROM maintenance_test WHERE id % 4 != 0')
+
+
+def test_write_slice_ctx():
+    """Test that a write slice that runs out of time rolls back and that the connection
+    works normally afterwards"""
+    conn = DBConnection(path=':memory:', connection_type=DBConnectionType.GLOBAL, sql_vm_instructions_cb=0)  # noqa: E501
+    with conn.write_slice_ctx(1) as write_cursor:
+        write_cursor.execute('CREATE TABLE a(b INTEGER)')
+        write_cursor.execute('INSERT INTO a VALUES(1)')
+
+    def write_endlessly() -> None:
+        with conn.write_slice_ctx(0.01) as write_cursor:
+            write_cursor.execute('INSERT INTO a VALUES(2)')
+            write_cursor.execute(  # an endless query
+                'WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) SELECT MAX(x) FROM c',  # noqa: E501
+            ).fetchall()
+
+    start = time.monotonic()
+    with pytest.raises(sqlite3.OperationalError, match='interrupted'):
+        write_endlessly()
+    assert time.monotonic() - start < WRITE_SLICE_TOLERANCE
+
+    with conn.read_ctx() as cursor:  # the write of the interrupted slice was rolled back
+        assert cursor.execute('SELECT b FROM a').fetchall() == [(1,)]
+    with conn.write_ctx() as write_cursor:  # and the slice's progress handler is gone
+        write_cursor.execute(
+            'WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 2000000) SELECT MAX(x) FROM c',  # noqa: E501
+        ).fetchall()
+
+
+def test_db_maintenance(database: 'DBHandler', globaldb: 'GlobalDBHandler'):
+    """Test that the DB maintenance analyzes big tables and returns free pages to the
+    file system without ever holding the writer of a DB for longer than a write slice"""
+    with database.conn.read_ctx() as cursor:  # new DBs use incremental auto vacuum
+        assert cursor.execute('PRAGMA auto_vacuum').fetchone()[0] == 2
+    _fill_and_trim_table(database)
+    with database.conn.read_ctx() as cursor:
+        free_pages_before = cursor.execute('PRAGMA freelist_count').fetchone()[0]
+    assert free_pages_before > 1000
+
+    holds: list[float] = []
+    for conn in (database.conn, globaldb.conn):
+        _track_write_holds(conn, holds)
+    maintenance = DBMaintenance(database=database, time_budget=30, write_slice=WRITE_SLICE)
+    assert maintenance.run() is True
+    assert len(holds) > 1
+    assert max(holds) < WRITE_SLICE + WRITE_SLICE_TOLERANCE
+
+    with database.conn.read_ctx() as cursor:
+        assert cursor.execute('PRAGMA freelist_count').fetchone()[0] == 0
+        assert cursor.execute(
+            'SELECT COUNT(*) FROM sqlite_stat1 WHERE tbl=?', ('maintenance_test',),
+        ).fetchone()[0] == 2
+        assert cursor.execute(
+            'SELECT COUNT(*) FROM settings WHERE name=?', (LAST_DB_MAINTENANCE_KEY,),
+        ).fetchone()[0] == 1
+
+    # the analyzed table is no longer stale so another run has nothing to do for it
+    assert maintenance._stale_tables(database.conn) == []
+    database.conn.schema_sanity_check()  # sqlite_stat1 is not an unexpected table
+
+
+def test_db_maintenance_time_budget(database: 'DBHandler', globaldb: 'GlobalDBHandler'):  # pylint: disable=unused-argument
+    """Test that a maintenance run stops when its time budget is over, also while looking
+    for the tables to analyze, and that it is then not recorded as done so that it
+    continues at the next chance"""
+    _fill_and_trim_table(database)
+    clock = SteppingClock(step=1)
+    maintenance = DBMaintenance(database=database, time_budget=5, write_slice=WRITE_SLICE, clock=clock)  # noqa: E501
+    maintenance.deadline = clock.now + 1000
+    assert 'maintenance_test' in maintenance._stale_tables(database.conn)
+    maintenance.deadline = clock.now
+    assert maintenance._stale_tables(database.conn) == []  # no table is counted
+
+    assert maintenance.run() is False
+    with database.conn.read_ctx() as cursor:
+        assert cursor.execute('PRAGMA freelist_count').fetchone()[0] != 0
+        assert cursor.execute(
+            'SELECT COUNT(*) FROM settings WHERE name=?', (LAST_DB_MAINTENANCE_KEY,),
+        ).fetchone()[0] == 0
@@ -1,7 +1,10 @@
 import json
 import shutil
+from collections.abc import Callable
 from contextlib import ExitStack, contextmanager
+from functools import partial
 from pathlib import Path
+from typing import Any, Optional
 from unittest.mock import patch
 
 import pytest
@@ -26,6 +29,8 @@ from rotkehlchen.db.utils import table_exists
 from rotkehlchen.errors.misc import DBUpgradeError
 from rotkehlchen.oracles.structures import CurrentPriceOracle
 from rotkehlchen.tests.utils.database import (
+    _grow_prepared_db,
+    _init_upgraded_db,
     _use_prepared_db,
     mock_db_schema_sanity_check,
     mock_dbhandler_sync_globaldb_assets,
@@ -35,6 +40,7 @@ from rotkehlchen.types import Location, deserialize_evm_tx_hash
 from rotkehlchen.user_messages import MessagesAggregator
 from rotkehlchen.utils.hexbytes import HexBytes
 from rotkehlchen.utils.misc import ts_now
+from rotkehlchen.utils.upgrades import UpgradeRecord
 
 
 def make_serialized_event_identifier(location: Location, raw_event_identifier: bytes) -> str:
@@ -1856,6 +1862,7 @@ def test_upgrade_db_39_to_40(user_data_dir):  # pylint: disable=unused-argument
     # check settings in db for ledger accounting contains the airdrop type
     cursor.execute('SELECT value FROM settings where name=?', ('taxable_ledger_actions',))
     assert 'airdrop' in json.loads(cursor.fetchone()[0])
+    assert cursor.execute('PRAGMA auto_vacuum').fetchone()[0] == 0
 
     cursor.close()
     db_v39.logout()
@@ -1933,6 +1940,8 @@ def test_upgrade_db_39_to_40(user_data_dir):  # pylint: disable=unused-argument
         count_cost_basis_pnl=False,
         accounting_treatment=None,
     ).serialize() == TxEventSettings.deserialize_from_db(accounting_row[4:]).serialize()
+    # check that the DB was switched to incremental auto vacuum
+    assert cursor.execute('PRAGMA auto_vacuum').fetchone()[0] == 2
 
 
 def test_latest_upgrade_correctness(user_data_dir):
@@ -2130,3 +2139,50 @@ def test_unfinished_upgrades(user_data_dir):
         assert db.get_setting(cursor, 'ongoing_upgrade_from_version') is None
         # Check that the backup was used
         assert cursor.execute('SELECT value FROM settings WHERE name="is_backup"').fetchone()[0] == 'Yes'  # noqa: E501
+
+
+def _failing_upgrades(failing_step: Optional[int]) -> list[UpgradeRecord]:
+    """The upgrades from v37 where the upgrade at the given index fails after it is done"""
+    def fail_after(function: Callable, **kwargs: Any) -> None:
+        function(**kwargs)
+        raise ValueError('upgrade failed')
+
+    upgrades = [x for x in UPGRADES_LIST if x.from_version >= 37]
+    if failing_step is not None:
+        upgrades[failing_step] = upgrades[failing_step]._replace(
+            function=partial(fail_after, upgrades[failing_step].function),
+        )
+    return upgrades
+
+
+@pytest.mark.parametrize('failing_step', [None, 0, 1, 2])
+def test_upgrades_use_single_backup(user_data_dir, failing_step):
+    """Test that upgrading a DB multiple versions makes a single backup and that a failure
+    at any of the upgrades restores the DB as it was before the upgrades byte for byte"""
+    original_db = _grow_prepared_db(user_data_dir, 'v37_rotkehlchen.db', megabytes=5)
+    msg_aggregator = MessagesAggregator()
+    with (
+        patch('rotkehlchen.db.upgrade_manager.DB_COPY_CHUNK_SIZE', new=1024 * 1024),
+        patch('rotkehlchen.db.upgrade_manager.UPGRADES_LIST', new=_failing_upgrades(failing_step)),
+        patch.object(DBUpgradeProgressHandler, '_notify_frontend', autospec=True) as notify,
+    ):
+        if failing_step is None:
+            db = _init_upgraded_db(user_data_dir, msg_aggregator)
+        else:
+            with pytest.raises(DBUpgradeError, match=f'from version {37 + failing_step} to'):
+                _init_upgraded_db(user_data_dir, msg_aggregator)
+
+    backups = list(user_data_dir.glob('*_rotkehlchen_db_v*.backup'))
+    assert len(backups) == 1
+    assert backups[0].name.endswith('_rotkehlchen_db_v37.backup')
+    assert backups[0].read_bytes() == original_db
+    # the backup of the 6 chunks of the DB is reported as the steps of the first upgrade
+    assert [x.args[1] for x in notify.call_args_list[1:7]] == ['Backing up the database'] * 6
+    if failing_step is not None:
+        assert (user_data_dir / 'rotkehlchen.db').read_bytes() == original_db
+        return
+
+    with db.conn.read_ctx() as cursor:
+        assert db.get_setting(cursor, 'version') == ROTKEHLCHEN_DB_VERSION
+        assert db.get_setting(cursor, 'ongoing_upgrade_from_version') is None
+        assert cursor.execute('SELECT COUNT(*) FROM filler').fetchone()[0] == 5
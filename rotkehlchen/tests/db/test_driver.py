@@ -0,0 +1,28 @@
+from rotkehlchen.constants.misc import DEFAULT_SQL_VM_INSTRUCTIONS_CB
+from rotkehlchen.db.drivers.gevent import CONNECTION_MAP, DBConnection, DBConnectionType
+
+
+def test_point_queries_through_wrapper():
+    """Test that many distinct point inserts and selects through the DB driver wrapper,
+    with the progress handler of a real connection, read back what was written. The
+    timing comparison with raw sqlite3 is in the benchmarks"""
+    previous_connection = CONNECTION_MAP.get(DBConnectionType.GLOBAL)
+    connection = DBConnection(
+        path=':memory:',
+        connection_type=DBConnectionType.GLOBAL,
+        sql_vm_instructions_cb=DEFAULT_SQL_VM_INSTRUCTIONS_CB,
+    )
+    try:
+        cursor = connection.cursor()
+        cursor.execute('CREATE TABLE bench(id INTEGER PRIMARY KEY, value TEXT)')
+        cursor.execute('BEGIN TRANSACTION')
+        for i in range(1000):
+            cursor.execute('INSERT INTO bench(id, value) VALUES(?, ?)', (i, str(i)))
+        cursor.execute('COMMIT')
+        for i in range(1000):
+            assert cursor.execute('SELECT value FROM bench WHERE id=?', (i,)).fetchone()[0] == str(i)  # noqa: E501
+        assert cursor.execute('SELECT COUNT(*) FROM bench').fetchone()[0] == 1000
+    finally:
+        connection.close()
+        if previous_connection is not None:
+            CONNECTION_MAP[DBConnectionType.GLOBAL] = previous_connection
@@ -1,6 +1,14 @@
+import dataclasses
+
+import pytest
+from pysqlcipher3 import dbapi2 as sqlcipher
+
 from rotkehlchen.chain.accounts import BlockchainAccountData
+from rotkehlchen.chain.evm.structures import EvmTxReceipt, EvmTxReceiptLog
 from rotkehlchen.chain.evm.types import EvmAccount
+from rotkehlchen.constants import ZERO
 from rotkehlchen.data_handler import DataHandler
+from rotkehlchen.db.dbhandler import DBHandler
 from rotkehlchen.db.evmtx import DBEvmTx
 from rotkehlchen.db.filtering import EvmTransactionsFilterQuery
 from rotkehlchen.fval import FVal
@@ -10,6 +18,7 @@ from rotkehlchen.tests.utils.constants import (
     ETH_ADDRESS3,
     MOCK_INPUT_DATA,
 )
+from rotkehlchen.tests.utils.ethereum import txreceipt_to_data
 from rotkehlchen.tests.utils.factories import make_evm_address, make_evm_tx_hash
 from rotkehlchen.types import (
     ChainID,
@@ -307,3 +316,103 @@ def test_query_also_internal_evm_transactions(data_dir, username, sql_vm_instruc
             has_premium=True,
         )
         assert result == [tx1, tx3, tx4]
+
+
+def _make_synthetic_receipts(
+        database: DBHandler,
+        number: int,
+        logs_per_receipt: int,
+) -> list[EvmTxReceipt]:
+    """Adds `number` transactions to the DB and returns a receipt for each of them with up to
+    `logs_per_receipt` logs with a varying number of topics, without adding the receipts"""
+    receipts, transactions = [], []
+    for idx in range(number):
+        tx_hash = make_evm_tx_hash()
+        transactions.append(EvmTransaction(
+            tx_hash=tx_hash,
+            chain_id=ChainID.ETHEREUM,
+            timestamp=Timestamp(1451606400 + idx),
+            block_number=idx,
+            from_address=ETH_ADDRESS1,
+            to_address=make_evm_address(),
+            value=ZERO,
+            gas=FVal(21000),
+            gas_price=FVal(1),
+            gas_used=FVal(21000),
+            input_data=b'',
+            nonce=idx,
+        ))
+        receipts.append(EvmTxReceipt(
+            tx_hash=tx_hash,
+            chain_id=ChainID.ETHEREUM,
+            contract_address=make_evm_address() if idx % 10 == 0 else None,
+            status=idx % 7 != 0,
+            type=idx % 3,
+            logs=[EvmTxReceiptLog(
+                log_index=log_index * 2,
+                data=log_index.to_bytes(32, 'big'),
+                address=ETH_ADDRESS2,
+                removed=False,
+                topics=[idx.to_bytes(32, 'big') for _ in range(log_index % 5)],
+            ) for log_index in range(idx % (logs_per_receipt + 1))],
+        ))
+
+    with database.user_write() as write_cursor:
+        DBEvmTx(database).add_evm_transactions(write_cursor, transactions, relevant_address=ETH_ADDRESS1)  # noqa: E501
+    return receipts
+
+
+def test_add_receipts_data(database):
+    """Test that receipts stored in bulk or one by one are read back the same"""
+    dbevmtx = DBEvmTx(database)
+    receipts = _make_synthetic_receipts(database=database, number=40, logs_per_receipt=12)
+    with database.user_write() as write_cursor:
+        dbevmtx.add_receipts_data(
+            write_cursor=write_cursor,
+            chain_id=ChainID.ETHEREUM,
+            receipts_data=[txreceipt_to_data(x) for x in receipts[:30]],
+        )
+        for receipt in receipts[30:]:
+            dbevmtx.add_receipt_data(write_cursor, ChainID.ETHEREUM, txreceipt_to_data(receipt))
+
+    with database.conn.read_ctx() as cursor:
+        for receipt in receipts:
+            assert dbevmtx.get_receipt(cursor, receipt.tx_hash, ChainID.ETHEREUM) == receipt
+        assert cursor.execute('SELECT COUNT(*) FROM evmtx_receipt_log_topics').fetchone()[0] == sum(len(y.topics) for x in receipts for y in x.logs)  # noqa: E501
+
+    # a receipt already in the DB fails the entire write
+    new_receipt = _make_synthetic_receipts(database=database, number=1, logs_per_receipt=3)[0]
+    with pytest.raises(sqlcipher.IntegrityError, match='UNIQUE constraint failed: evmtx_receipts.tx_id'), database.user_write() as write_cursor:  # noqa: E501
+        dbevmtx.add_receipts_data(
+            write_cursor=write_cursor,
+            chain_id=ChainID.ETHEREUM,
+            receipts_data=[txreceipt_to_data(new_receipt), txreceipt_to_data(receipts[0])],
+        )
+
+    with database.conn.read_ctx() as cursor:
+        assert dbevmtx.get_receipt(cursor, new_receipt.tx_hash, ChainID.ETHEREUM) is None
+
+
+def test_add_receipts_data_missing_transaction(database):
+    """Test that the receipts of transactions not in the DB are skipped and not attached to
+    another transaction, while the rest of the receipts are stored"""
+    dbevmtx = DBEvmTx(database)
+    receipts = _make_synthetic_receipts(database=database, number=3, logs_per_receipt=3)
+    missing_tx_receipts = [  # with and without logs
+        dataclasses.replace(receipts[idx], tx_hash=make_evm_tx_hash()) for idx in (0, 2)
+    ]
+    assert len(missing_tx_receipts[0].logs) == 0 and len(missing_tx_receipts[1].logs) != 0
+    with database.user_write() as write_cursor:
+        dbevmtx.add_receipts_data(
+            write_cursor=write_cursor,
+            chain_id=ChainID.ETHEREUM,
+            receipts_data=[txreceipt_to_data(x) for x in (*missing_tx_receipts, receipts[0])],
+        )
+
+    with database.conn.read_ctx() as cursor:
+        assert dbevmtx.get_receipt(cursor, receipts[0].tx_hash, ChainID.ETHEREUM) == receipts[0]
+        # the other transactions did not get the receipts of the missing transactions
+        for receipt in (*receipts[1:], *missing_tx_receipts):
+            assert dbevmtx.get_receipt(cursor, receipt.tx_hash, ChainID.ETHEREUM) is None
+        assert cursor.execute('SELECT COUNT(*) FROM evmtx_receipts').fetchone()[0] == 1
+        assert cursor.execute('SELECT COUNT(*) FROM evmtx_receipt_logs').fetchone()[0] == 0
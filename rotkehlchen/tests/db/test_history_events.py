@@ -1,6 +1,10 @@
 from rotkehlchen.accounting.structures.balance import Balance
 from rotkehlchen.accounting.structures.base import HistoryBaseEntryType, HistoryEvent
-from rotkehlchen.accounting.structures.eth2 import EthWithdrawalEvent
+from rotkehlchen.accounting.structures.eth2 import (
+    EthBlockEvent,
+    EthDepositEvent,
+    EthWithdrawalEvent,
+)
 from rotkehlchen.accounting.structures.evm_event import EvmEvent, EvmProduct
 from rotkehlchen.accounting.structures.types import HistoryEventSubType, HistoryEventType
 from rotkehlchen.api.v1.types import IncludeExcludeFilterData
@@ -212,3 +216,70 @@ def test_delete_last_event(database):
     assert 'was the last event of a transaction' in msg
     with db.db.conn.read_ctx() as cursor:
         assert len(db.get_history_events(cursor, HistoryEventFilterQuery.make(), True)) == 1, 'EVM event should be left'  # noqa: E501
+
+
+def test_add_history_events_bulk_matches_single(database):
+    """Test that the bulk insert path of add_history_events leaves the DB in the exact same
+    state as adding each event on its own, including ignoring already existing events"""
+    tx_hash = make_evm_tx_hash()
+    existing = make_ethereum_event(index=0, tx_hash=tx_hash, asset=A_ETH)
+    events = [
+        HistoryEvent(
+            event_identifier='kraken_1',
+            sequence_index=0,
+            timestamp=TimestampMS(1),
+            location=Location.KRAKEN,
+            event_type=HistoryEventType.TRADE,
+            event_subtype=HistoryEventSubType.SPEND,
+            asset=A_ETH,
+            balance=Balance(1),
+        ),
+        existing,  # already in the DB so it along with its evm data is ignored
+        make_ethereum_event(index=1, tx_hash=tx_hash, asset=A_ETH, counterparty='uniswap'),
+        EthWithdrawalEvent(
+            validator_index=1,
+            timestamp=TimestampMS(2),
+            balance=Balance(1),
+            withdrawal_address=make_evm_address(),
+            is_exit=True,
+        ),
+        EthBlockEvent(
+            validator_index=2,
+            timestamp=TimestampMS(3),
+            balance=Balance(1),
+            fee_recipient=make_evm_address(),
+            block_number=42,
+            is_mev_reward=False,
+        ),
+        EthDepositEvent(
+            tx_hash=make_evm_tx_hash(),
+            validator_index=3,
+            sequence_index=0,
+            timestamp=TimestampMS(4),
+            balance=Balance(32),
+            depositor=make_evm_address(),
+        ),
+        # same event_identifier and sequence_index as an earlier event of the list
+        make_ethereum_event(index=1, tx_hash=tx_hash, asset=A_ETH, counterparty='curve'),
+    ]
+    db = DBHistoryEvents(database)
+
+    def add_and_dump(bulk: bool) -> list[list[tuple]]:
+        with database.user_write() as write_cursor:
+            write_cursor.execute('DELETE FROM history_events')
+            db.add_history_event(write_cursor, existing)
+            if bulk:
+                db.add_history_events(write_cursor, events)
+            else:
+                for event in events:
+                    db.add_history_event(write_cursor, event)
+
+        with database.conn.read_ctx() as cursor:
+            return [
+                cursor.execute(f'SELECT * FROM {table} ORDER BY identifier').fetchall()
+                for table in ('history_events', 'evm_events_info', 'eth_staking_events_info')
+            ]
+
+    single_contents = add_and_dump(bulk=False)
+    assert [len(x) for x in single_contents] == [6, 3, 3]
+    assert add_and_dump(bulk=True) == single_contents
@@ -1,7 +1,16 @@
-from rotkehlchen.accounting.pnl import PnlTotals
+
+from rotkehlchen.accounting.mixins.event import AccountingEventType
+from rotkehlchen.accounting.pnl import PNL, PnlTotals
+from rotkehlchen.accounting.structures.processed_event import ProcessedAccountingEvent
+from rotkehlchen.constants import ONE, ZERO
+from rotkehlchen.constants.assets import A_BTC, A_ETH
+from rotkehlchen.db.dbhandler import DBHandler
+from rotkehlchen.db.filtering import ReportDataFilterQuery
 from rotkehlchen.db.reports import DBAccountingReports
-from rotkehlchen.db.settings import DBSettings
+from rotkehlchen.db.settings import ROTKEHLCHEN_TRANSIENT_DB_VERSION, DBSettings
+from rotkehlchen.fval import FVal
 from rotkehlchen.tests.utils.constants import A_GBP
+from rotkehlchen.types import Location, Price, Timestamp
 
 
 def test_report_settings(database):
@@ -47,7 +56,7 @@ def test_report_settings(database):
     assert report['total_actions'] == total_actions
 
     returned_settings = report['settings']
-    assert len(returned_settings) == 9
+    assert len(returned_settings) == 10
     for x in ('account_for_assets_movements', 'calculate_past_cost_basis', 'include_crypto2crypto', 'include_gas_costs', 'profit_currency', 'taxfree_after_period', 'cost_basis_method', 'eth_staking_taxable_after_withdrawal_enabled', 'include_fees_in_cost_basis'):  # noqa: E501
         setting_name = 'main_currency' if x == 'profit_currency' else x
         if setting_name == 'cost_basis_method':
@@ -55,3 +64,157 @@ def test_report_settings(database):
         else:
             value = getattr(settings, setting_name)
         assert returned_settings[x] == value
+    assert returned_settings['acquisitions_merge_tolerance'] == '-1'  # merging is disabled
+
+
+def _add_report(dbreport: DBAccountingReports) -> int:
+    return dbreport.add_report(
+        first_processed_timestamp=Timestamp(1),
+        start_ts=Timestamp(0),
+        end_ts=Timestamp(100),
+        settings=DBSettings(),
+    )
+
+
+def _make_event(idx: int) -> ProcessedAccountingEvent:
+    return ProcessedAccountingEvent(
+        type=AccountingEventType.TRADE if idx % 3 != 0 else AccountingEventType.FEE,
+        notes=f'event {idx}',
+        location=Location.KRAKEN if idx % 2 == 0 else Location.EXTERNAL,
+        timestamp=Timestamp(idx // 4),  # a few events share each timestamp
+        asset=A_BTC if idx % 2 == 0 else A_ETH,
+        free_amount=ONE,
+        taxable_amount=ZERO if idx % 5 == 0 else ONE,
+        price=Price(FVal(10)),
+        pnl=PNL(taxable=FVal(idx), free=ZERO),
+        cost_basis=None,
+        index=idx,
+    )
+
+
+def test_report_events_typed_columns_and_keyset_pagination(database):
+    """Test that the filtered fields of the report events are stored in their own columns
+    and that paginating by keyset returns the same events as querying them all"""
+    dbreport = DBAccountingReports(database)
+    report_id = _add_report(dbreport)
+    events = [_make_event(idx) for idx in range(30)]
+    for event in events:
+        dbreport.add_report_data(report_id=report_id, time=event.timestamp, ts_converter=str, event=event)  # noqa: E501
+
+    with database.conn_transient.read_ctx() as cursor:
+        assert cursor.execute(
+            'SELECT type, asset, location, taxable, pnl_taxable, pnl_free FROM pnl_events '
+            'WHERE report_id=? ORDER BY identifier LIMIT 2',
+            (report_id,),
+        ).fetchall() == [
+            ('fee', A_BTC.identifier, 'B', 0, '0', '0'),
+            ('trade', A_ETH.identifier, 'A', 1, '1', '0'),
+        ]
+
+    for ascending in (True, False):
+        all_events, entries_found = dbreport.get_report_data(
+            filter_=ReportDataFilterQuery.make(report_id=report_id, order_by_rules=[('timestamp', ascending)]),  # noqa: E501
+            with_limit=False,
+        )
+        assert entries_found == 30
+        assert all_events == sorted(events, key=lambda x: (x.timestamp, x.index), reverse=not ascending)  # noqa: E501
+
+        paged_events: list[ProcessedAccountingEvent] = []
+        after_identifier = None
+        while True:
+            page, entries_found = dbreport.get_report_data(
+                filter_=ReportDataFilterQuery.make(
+                    report_id=report_id,
+                    order_by_rules=[('timestamp', ascending)],
+                    limit=7,
+                    offset=0 if after_identifier is None else None,
+                    after_identifier=after_identifier,
+                ),
+                with_limit=False,
+            )
+            assert entries_found == 30  # the count is not affected by the page
+            if len(page) == 0:
+                break
+            paged_events.extend(page)
+            after_identifier = page[-1].identifier
+
+        assert paged_events == all_events
+
+    for filter_args, expected in (
+        ({'event_type': AccountingEventType.FEE}, [x for x in events if x.index % 3 == 0]),
+        ({'asset': A_ETH}, [x for x in events if x.index % 2 == 1]),
+        ({'location': Location.KRAKEN}, [x for x in events if x.index % 2 == 0]),
+    ):
+        filtered_events, entries_found = dbreport.get_report_data(
+            filter_=ReportDataFilterQuery.make(report_id=report_id, limit=100, offset=0, **filter_args),  # noqa: E501
+            with_limit=False,
+        )
+        assert entries_found == len(expected)
+        assert filtered_events == expected
+
+    # make sure that the pages are found through the index and not by scanning the table
+    query, bindings = ReportDataFilterQuery.make(
+        report_id=report_id,
+        limit=7,
+        after_identifier=10,
+    ).prepare()
+    with database.conn_transient.read_ctx() as cursor:
+        plan = ' '.join(str(x) for x in cursor.execute(
+            f'EXPLAIN QUERY PLAN SELECT identifier, timestamp, data FROM pnl_events {query}',
+            bindings,
+        ))
+    assert 'idx_pnl_events_report_timestamp (report_id=? AND timestamp>?)' in plan
+    assert 'TEMP B-TREE' not in plan
+
+
+def test_transient_db_upgrade_keeps_reports(database, user_data_dir, sql_vm_instructions_cb):
+    """Test that upgrading the transient DB from version 1 moves the filtered fields of
+    the saved report events into their own columns without losing the reports"""
+    dbreport = DBAccountingReports(database)
+    report_id = _add_report(dbreport)
+    events = [_make_event(idx) for idx in range(5)]
+    with database.transient_write() as write_cursor:  # recreate the v1 schema
+        write_cursor.execute('DROP TABLE pnl_events')
+        write_cursor.execute("""
+        CREATE TABLE pnl_events (
+            identifier INTEGER NOT NULL PRIMARY KEY,
+            report_id INTEGER NOT NULL,
+            timestamp INTEGER NOT NULL,
+            data TEXT NOT NULL,
+            FOREIGN KEY (report_id) REFERENCES pnl_reports(identifier) ON DELETE CASCADE ON UPDATE CASCADE
+        );""")  # noqa: E501
+        write_cursor.executemany(
+            'INSERT INTO pnl_events(report_id, timestamp, data) VALUES(?, ?, ?)',
+            [(report_id, x.timestamp, x.serialize_for_db(str)) for x in events] +
+            [(report_id, 10, '{"broken": "json"}')],
+        )
+        write_cursor.execute("UPDATE settings SET value='1' WHERE name='version'")
+
+    msg_aggregator = database.msg_aggregator
+    database.logout()
+    database = DBHandler(
+        user_data_dir=user_data_dir,
+        password='123',
+        msg_aggregator=msg_aggregator,
+        initial_settings=None,
+        sql_vm_instructions_cb=sql_vm_instructions_cb,
+        resume_from_backup=False,
+    )
+    with database.conn_transient.read_ctx() as cursor:
+        assert cursor.execute("SELECT value FROM settings WHERE name='version'").fetchone()[0] == str(ROTKEHLCHEN_TRANSIENT_DB_VERSION)  # noqa: E501
+        assert {x[1] for x in cursor.execute("SELECT * FROM sqlite_master WHERE type='index'")} >= {'idx_pnl_events_report_timestamp', 'idx_pnl_events_report_type'}  # noqa: E501
+        assert cursor.execute(
+            'SELECT type, asset, location, taxable FROM pnl_events ORDER BY identifier',
+        ).fetchall() == [
+            (x.type.serialize(), x.asset.identifier, x.location.serialize_for_db(), int(x.taxable_amount != ZERO))  # noqa: E501
+            for x in events
+        ]  # the broken event is dropped
+
+    dbreport = DBAccountingReports(database)
+    assert dbreport.get_reports(report_id=report_id, with_limit=False)[1] == 1
+    saved_events, _ = dbreport.get_report_data(
+        filter_=ReportDataFilterQuery.make(report_id=report_id, order_by_rules=[('timestamp', True)]),  # noqa: E501
+        with_limit=False,
+    )
+    assert saved_events == events
+    database.logout()
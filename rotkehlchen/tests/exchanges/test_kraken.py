@@ -38,7 +38,13 @@ from rotkehlchen.db.settings import ModifiableDBSettings
 from rotkehlchen.errors.asset import UnknownAsset, UnprocessableTradePair
 from rotkehlchen.errors.serialization import DeserializationError
 from rotkehlchen.exchanges.data_structures import Trade
-from rotkehlchen.exchanges.kraken import KRAKEN_DELISTED, Kraken
+from rotkehlchen.exchanges.kraken import (
+    KRAKEN_CALL_COUNTER_PERSIST_INTERVAL,
+    KRAKEN_CALL_COUNTERS,
+    KRAKEN_DELISTED,
+    Kraken,
+    KrakenAccountType,
+)
 from rotkehlchen.fval import FVal
 from rotkehlchen.serialization.deserialize import deserialize_timestamp_from_floatstr
 from rotkehlchen.tests.utils.api import (
@@ -177,14 +183,14 @@ def test_querying_trade_history(kraken):
         assert isinstance(kraken_trade, Trade)
 
 
-def test_querying_rate_limit_exhaustion(kraken, database):
+def test_querying_rate_limit_exhaustion(kraken, database, monkeypatch):
     """Test that if kraken api rates limit us we don't get stuck in an infinite loop
     and also that we return what we managed to retrieve until rate limit occured.
 
     Regression test for https://github.com/rotki/rotki/issues/3629
     """
     kraken.use_original_kraken = True
-    kraken.reduction_every_secs = 0.05
+    monkeypatch.setattr(kraken.call_counter, 'leak_rate', 20)
 
     count = 0
 
@@ -225,6 +231,158 @@ def test_querying_rate_limit_exhaustion(kraken, database):
     assert to_ts == 1638529919, 'should have saved only until the last trades timestamp'
 
 
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def use_fake_clock(monkeypatch, kraken, clock: FakeClock) -> None:
+    """Makes the call counter of kraken, which is shared by kraken instances, use the
+    given clock with an empty counter until the end of the test"""
+    monkeypatch.setattr(kraken.call_counter, 'clock', clock)
+    monkeypatch.setattr(kraken.call_counter, 'sleep', clock.sleep)
+    monkeypatch.setattr(kraken.call_counter, '_level', 0.0)
+    monkeypatch.setattr(kraken.call_counter, '_level_ts', clock())
+
+
+class KrakenStubServer:
+    """Stub of the Kraken API that enforces the documented call counter limits"""
+
+    def __init__(self, clock: FakeClock, limit: int, decay_secs: float) -> None:
+        self.clock = clock
+        self.limit = limit
+        self.decay_secs = decay_secs
+        self.counter = 0.0
+        self.last_ts = clock()
+        self.rate_limited = 0
+        self.served = 0
+
+    def post(self, url, **kwargs):  # pylint: disable=unused-argument
+        now = self.clock()
+        self.counter = max(0.0, self.counter - (now - self.last_ts) / self.decay_secs)
+        self.last_ts = now
+        cost = 2 if 'Ledgers' in url or 'TradesHistory' in url else 1
+        if self.counter + cost > self.limit:
+            self.rate_limited += 1
+            return MockResponse(200, '{"error": ["EAPI:Rate limit exceeded"]}')
+        self.counter += cost
+        self.served += 1
+        return MockResponse(200, '{"error": [], "result": {}}')
+
+
+@pytest.mark.parametrize(('account_type', 'limit', 'decay_secs'), [
+    (KrakenAccountType.STARTER, 15, 3),
+    (KrakenAccountType.INTERMEDIATE, 20, 2),
+    (KrakenAccountType.PRO, 20, 1),
+])
+def test_call_counter_respects_tier_limits(
+        kraken,
+        monkeypatch,
+        account_type,
+        limit,
+        decay_secs,
+):
+    """Test that the call counter never lets us exceed the tier limits of the Kraken API and
+    that it waits only as much as needed for the counter to decay"""
+    clock = FakeClock(now=1700000000)
+    kraken.use_original_kraken = True
+    kraken.set_account_type(account_type)
+    use_fake_clock(monkeypatch, kraken, clock)
+    server = KrakenStubServer(clock=clock, limit=limit, decay_secs=decay_secs)
+
+    calls = 50
+    with patch.object(kraken.session, 'post', side_effect=server.post):
+        for _ in range(calls):
+            kraken.api_query('Ledgers', {})
+
+    assert server.rate_limited == 0
+    assert server.served == calls
+    # burst until the limit and then one call every 2 decays. No oversleeping
+    expected_duration = (calls * 2 - limit) * decay_secs
+    assert clock() - 1700000000 == pytest.approx(expected_duration)
+
+
+def test_call_counter_persisted_and_shared(kraken, database, monkeypatch):
+    """Test that the call counter is not saved at every query but is restored from the DB
+    after a logout and restart, and that it is shared only by Kraken instances using the
+    same API key and account type"""
+    clock = FakeClock(now=ts_now())
+    kraken.use_original_kraken = True
+    use_fake_clock(monkeypatch, kraken, clock)
+    server = KrakenStubServer(clock=clock, limit=15, decay_secs=3)
+    with patch.object(kraken.session, 'post', side_effect=server.post):
+        for _ in range(5):
+            kraken.api_query('Ledgers', {})
+
+    with database.conn.read_ctx() as cursor:
+        assert kraken._read_persisted_call_counters(cursor) == {}
+
+    other = Kraken(
+        name='other',
+        api_key=kraken.api_key,
+        secret=kraken.secret,
+        database=database,
+        msg_aggregator=kraken.msg_aggregator,
+    )
+    assert other.call_counter is kraken.call_counter
+    other_tier = Kraken(
+        name='other tier',
+        api_key=kraken.api_key,
+        secret=kraken.secret,
+        database=database,
+        msg_aggregator=kraken.msg_aggregator,
+        kraken_account_type=KrakenAccountType.PRO,
+    )
+    assert other_tier.call_counter is not kraken.call_counter
+    assert (other_tier.call_limit, other_tier.reduction_every_secs) == (20, 1)
+    assert (kraken.call_limit, kraken.reduction_every_secs) == (15, 3)
+
+    kraken.persist_call_counter()  # as done at logout
+    KRAKEN_CALL_COUNTERS.clear()  # simulate a restart
+    restarted = Kraken(
+        name='restarted',
+        api_key=kraken.api_key,
+        secret=kraken.secret,
+        database=database,
+        msg_aggregator=kraken.msg_aggregator,
+    )
+    assert restarted.call_counter is not kraken.call_counter
+    restarted._maybe_restore_call_counter()
+    assert restarted.call_counter.serialize() == kraken.call_counter.serialize()
+    assert restarted.call_counter.level(now=clock()) == 10
+
+
+def test_call_counter_persisted_when_rate_limited(kraken, database, monkeypatch):
+    """Test that the call counter is saved when kraken rate limits us, at most once every
+    KRAKEN_CALL_COUNTER_PERSIST_INTERVAL seconds"""
+    clock = FakeClock(now=ts_now())
+    kraken.use_original_kraken = True
+    use_fake_clock(monkeypatch, kraken, clock)
+    server = KrakenStubServer(clock=clock, limit=15, decay_secs=3)
+    server.counter = 15  # kraken's counter is full because of another client of the key
+    with patch.object(kraken.session, 'post', side_effect=server.post):
+        kraken.api_query('Ledgers', {})
+    assert server.rate_limited == 1
+
+    with database.conn.read_ctx() as cursor:
+        persisted = kraken._read_persisted_call_counters(cursor)
+    assert persisted == {kraken._call_counter_fingerprint(): [15, kraken.call_counter_persisted_ts]}  # noqa: E501
+
+    clock.now += KRAKEN_CALL_COUNTER_PERSIST_INTERVAL / 2
+    server.counter, server.last_ts = 15, clock()
+    patch_post = patch.object(kraken.session, 'post', side_effect=server.post)
+    with patch_post, patch.object(kraken, 'persist_call_counter') as persist:
+        kraken.api_query('Ledgers', {})
+    assert server.rate_limited == 2
+    assert persist.call_count == 0
+
+
 def test_querying_deposits_withdrawals(kraken):
     kraken.random_ledgers_data = False
     now = ts_now()
@@ -704,12 +862,12 @@ def test_trade_from_kraken_unexpected_data(kraken):
     query_kraken_and_test(input_trades, expected_warnings_num=0, expected_errors_num=2)
 
 
-def test_emptry_kraken_balance_response():
+def test_emptry_kraken_balance_response(database):
     """Balance api query returns a response without a result
 
     Regression test for: https://github.com/rotki/rotki/issues/2443
     """
-    kraken = Kraken('kraken1', 'a', b'YW55IGNhcm5hbCBwbGVhc3VyZS4=', object(), object())
+    kraken = Kraken('kraken1', 'a', b'YW55IGNhcm5hbCBwbGVhc3VyZS4=', database, object())
 
     def mock_post(url, data, **kwargs):  # pylint: disable=unused-argument
         return MockResponse(200, '{"error":[]}')
@@ -1,8 +1,15 @@
 import datetime
+import json
 import os
+from collections.abc import Iterator
+from typing import Any, Callable, Optional
 from unittest.mock import patch
+from urllib.parse import parse_qs
 
+import gevent
 import pytest
+import requests
+from gevent.pywsgi import WSGIServer
 
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.constants.assets import (
@@ -18,9 +25,11 @@ from rotkehlchen.constants.assets import (
     A_EUR,
     A_USD,
 )
+from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.externalapis.cryptocompare import (
     CRYPTOCOMPARE_HOURQUERYLIMIT,
     CRYPTOCOMPARE_SPECIAL_CASES_MAPPING,
+    RATE_LIMIT_MSG,
     Cryptocompare,
 )
 from rotkehlchen.fval import FVal
@@ -28,6 +37,7 @@ from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.history.types import HistoricalPrice, HistoricalPriceOracle
 from rotkehlchen.tests.utils.constants import A_DAO, A_SNGLS, A_XMR
 from rotkehlchen.types import Price, Timestamp
+from rotkehlchen.utils.misc import ts_now
 
 
 @pytest.mark.skip('They are updating their systems & cleaning inactive pairs. Check again soon')
@@ -342,3 +352,109 @@ def test_cryptocompare_query_with_api_key(cryptocompare):
         match_main_currency=False,
     )
     assert price is not None
+
+
+class HistohourStandIn:
+    """Local HTTP stand-in of the cryptocompare histohour endpoint. Serves deterministic
+    hourly prices that start at `start_ts`, rate limits the first query it gets and fails
+    the queries of data before `fail_before_ts` if it is set"""
+
+    def __init__(self, start_ts: int) -> None:
+        self.start_ts = start_ts
+        self.fail_before_ts: Optional[int] = None
+        self.rate_limit_next = True
+        self.queried_to_ts: list[int] = []
+        self.running = self.max_running = 0
+
+    @staticmethod
+    def price(timestamp: int, start_ts: int) -> str:
+        return '0' if timestamp < start_ts else f'{(timestamp - start_ts) // 3600 % 1000 + 1}.5'
+
+    def __call__(self, environ: dict[str, Any], start_response: Callable) -> list[bytes]:
+        query = parse_qs(environ['QUERY_STRING'])
+        to_ts, limit = int(query['toTs'][0]), int(query['limit'][0])
+        rate_limited, self.rate_limit_next = self.rate_limit_next, False
+        self.queried_to_ts.append(to_ts)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        gevent.sleep(0.05)  # take a while so that concurrent queries overlap
+        self.running -= 1
+        time_to = to_ts // 3600 * 3600
+        if rate_limited:
+            response = {'Response': 'Error', 'Message': RATE_LIMIT_MSG}
+        elif self.fail_before_ts is not None and to_ts < self.fail_before_ts:
+            response = {'Response': 'Error', 'Message': 'Service unavailable'}
+        else:
+            response = {'Response': 'Success', 'Data': {
+                'Aggregated': False,
+                'TimeFrom': time_to - limit * 3600,
+                'TimeTo': time_to,
+                'Data': [{
+                    'time': timestamp,
+                    'high': (price := self.price(timestamp, self.start_ts)),
+                    'low': price,
+                    'open': price,
+                    'close': price,
+                    'volumefrom': 1,
+                    'volumeto': 1,
+                    'conversionType': 'direct',
+                    'conversionSymbol': '',
+                } for timestamp in range(time_to - limit * 3600, time_to + 1, 3600)],
+            }}
+
+        start_response('200 OK', [('Content-Type', 'application/json')])
+        return [json.dumps(response).encode()]
+
+
+@pytest.fixture(name='histohour_stand_in')
+def fixture_histohour_stand_in(cryptocompare: Cryptocompare) -> Iterator[HistohourStandIn]:
+    """Serves the cryptocompare queries of the `cryptocompare` fixture from a local server"""
+    stand_in = HistohourStandIn(start_ts=(ts_now() // 3600 - 5500) * 3600)
+    server = WSGIServer(('127.0.0.1', 0), stand_in, log=None)
+    server.start()
+    local_url = f'http://127.0.0.1:{server.server_port}'
+    with patch.object(
+        cryptocompare.session,
+        'get',
+        new=lambda url, **kwargs: requests.get(url.replace('https://min-api.cryptocompare.com', local_url), **kwargs),  # noqa: E501
+    ):
+        yield stand_in
+    server.stop()
+
+
+def test_histohour_backfill_is_concurrent_and_resumes(
+        cryptocompare: Cryptocompare,
+        histohour_stand_in: HistohourStandIn,
+) -> None:
+    """Test that the histohour queries of a backfill run concurrently, that the prices of
+    each query are written as they arrive and that a failed backfill resumes from the
+    earliest cached price instead of querying everything again"""
+    from_asset, to_asset = A_ETH.resolve_to_asset_with_oracles(), A_USD.resolve_to_asset_with_oracles()  # noqa: E501
+    globaldb = GlobalDBHandler()
+    globaldb.delete_historical_prices(from_asset, to_asset, HistoricalPriceOracle.CRYPTOCOMPARE)
+    # the first two queries succeed and the third fails after being rate limited once
+    histohour_stand_in.fail_before_ts = ts_now() - 3000 * 3600
+    with pytest.raises(RemoteError):
+        cryptocompare.query_and_store_historical_data(from_asset, to_asset, ts_now())
+
+    assert cryptocompare.last_rate_limit != 0
+    assert histohour_stand_in.max_running > 1
+    first_cached_ts, last_cached_ts = globaldb.get_historical_price_range(from_asset, to_asset, HistoricalPriceOracle.CRYPTOCOMPARE)  # type: ignore  # noqa: E501
+    assert last_cached_ts - first_cached_ts == 2 * CRYPTOCOMPARE_HOURQUERYLIMIT * 3600
+
+    histohour_stand_in.fail_before_ts = None
+    histohour_stand_in.queried_to_ts = []
+    cryptocompare.query_and_store_historical_data(from_asset, to_asset, ts_now())
+    # only the hours after the cached ones and the ones before them are queried
+    assert all(x <= first_cached_ts or x >= last_cached_ts for x in histohour_stand_in.queried_to_ts)  # noqa: E501
+    assert len(histohour_stand_in.queried_to_ts) <= 1 + 2 + 4  # 4 concurrent at the end of the prices  # noqa: E501
+    result = get_globaldb_cache_entries(from_asset=from_asset, to_asset=to_asset)
+    assert result[0].timestamp == histohour_stand_in.start_ts
+    assert [x.timestamp for x in result] == list(range(result[0].timestamp, result[-1].timestamp + 1, 3600))  # noqa: E501
+    assert all(x.price == FVal(HistohourStandIn.price(x.timestamp, histohour_stand_in.start_ts)) for x in result)  # noqa: E501
+
+    # with all the prices cached back to their start only the latest hours are queried
+    histohour_stand_in.queried_to_ts = []
+    cryptocompare.query_and_store_historical_data(from_asset, to_asset, ts_now())
+    assert all(x >= result[-1].timestamp for x in histohour_stand_in.queried_to_ts)
+    assert len(histohour_stand_in.queried_to_ts) <= 1
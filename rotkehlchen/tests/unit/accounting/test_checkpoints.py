@@ -0,0 +1,151 @@
+import dataclasses
+from typing import TYPE_CHECKING
+
+import pytest
+
+from rotkehlchen.accounting.checkpoints import PNL_CHECKPOINT_VERSION
+from rotkehlchen.accounting.pnl import PnlTotals
+from rotkehlchen.constants import ONE
+from rotkehlchen.constants.assets import A_BTC, A_ETH, A_EUR
+from rotkehlchen.constants.timing import DAY_IN_SECONDS
+from rotkehlchen.db.settings import ModifiableDBSettings
+from rotkehlchen.exchanges.data_structures import Trade
+from rotkehlchen.fval import FVal
+from rotkehlchen.history.types import HistoricalPrice, HistoricalPriceOracle
+from rotkehlchen.types import AssetAmount, CostBasisMethod, Location, Price, Timestamp, TradeType
+
+if TYPE_CHECKING:
+    from rotkehlchen.accounting.accountant import Accountant
+    from rotkehlchen.accounting.structures.processed_event import ProcessedAccountingEvent
+
+HISTORY_START_TS = Timestamp(1500000000)
+
+
+def _make_trades(number: int, period: int = DAY_IN_SECONDS) -> list[Trade]:
+    """Creates a history of ETH and BTC buys and sells for EUR, one every `period`"""
+    trades = []
+    for idx in range(number):
+        trade_type = TradeType.BUY if idx % 6 < 4 else TradeType.SELL
+        trades.append(Trade(
+            timestamp=Timestamp(HISTORY_START_TS + idx * period),
+            location=Location.KRAKEN,
+            base_asset=A_ETH if idx % 2 == 0 else A_BTC,
+            quote_asset=A_EUR,
+            trade_type=trade_type,
+            amount=AssetAmount(FVal(3) if trade_type == TradeType.BUY else FVal(4)),
+            rate=Price(FVal(100 + (idx * 37) % 101)),
+            fee=None,
+            fee_currency=None,
+            link=None,
+        ))
+    return trades
+
+
+def _process(
+        accountant: 'Accountant',
+        start_ts: Timestamp,
+        events: list[Trade],
+) -> tuple[PnlTotals, list['ProcessedAccountingEvent']]:
+    """Processes the history and returns the totals and the processed events in the range"""
+    accountant.process_history(
+        start_ts=start_ts,
+        end_ts=Timestamp(events[-1].timestamp + 1),
+        events=events,  # type: ignore[arg-type]  # trades are accounting events
+    )
+    pot = accountant.pots[0]
+    return (
+        PnlTotals(dict(pot.pnls.items())),
+        [x for x in pot.processed_events if x.timestamp >= start_ts],
+    )
+
+
+def _checkpoints_num(accountant: 'Accountant') -> int:
+    with accountant.db.conn_transient.read_ctx() as cursor:
+        return cursor.execute(
+            'SELECT COUNT(*) FROM pnl_checkpoints WHERE version=?', (PNL_CHECKPOINT_VERSION,),
+        ).fetchone()[0]
+
+
+@pytest.mark.parametrize('cost_basis_method', list(CostBasisMethod))
+@pytest.mark.parametrize('default_mock_price_value', [ONE])
+def test_resumed_processing_equals_full_replay(accountant: 'Accountant', cost_basis_method):
+    """Test that processing resumed from a checkpoint gives the same totals and events as a
+    full replay of the history and that checkpoints are invalidated by history changes"""
+    with accountant.db.user_write() as write_cursor:
+        accountant.db.set_settings(write_cursor, ModifiableDBSettings(cost_basis_method=cost_basis_method))  # noqa: E501
+    events = _make_trades(300)
+    accountant.checkpoints.period = DAY_IN_SECONDS * 20
+    last_month_ts = Timestamp(events[-30].timestamp)
+    middle_ts = Timestamp(events[150].timestamp)
+
+    expected = {}
+    for start_ts in (middle_ts, last_month_ts):
+        accountant.checkpoints.period = None
+        expected[start_ts] = _process(accountant, start_ts, events)
+        assert accountant.pots[0].processed_events_offset == 0
+
+    accountant.checkpoints.period = DAY_IN_SECONDS * 20
+    assert _process(accountant, HISTORY_START_TS, events)[0].taxable != 0
+    assert accountant.pots[0].processed_events_offset == 0
+    assert _checkpoints_num(accountant) == 15
+
+    for start_ts in (middle_ts, last_month_ts, middle_ts):
+        assert _process(accountant, start_ts, events) == expected[start_ts]
+        pot = accountant.pots[0]
+        assert 0 < start_ts - DAY_IN_SECONDS * 20 < pot.processed_events[0].timestamp <= start_ts
+        assert pot.processed_events[0].index == pot.processed_events_offset > 0
+
+    # edit a trade early in the history. Resuming must now give the new full replay totals
+    events[10] = dataclasses.replace(events[10], amount=AssetAmount(FVal(5)))
+    accountant.checkpoints.period = None
+    expected_edited = _process(accountant, last_month_ts, events)
+    if cost_basis_method in (CostBasisMethod.FIFO, CostBasisMethod.ACB):
+        # the other methods only use the recent acquisitions in the last month
+        assert expected_edited != expected[last_month_ts]
+    accountant.checkpoints.period = DAY_IN_SECONDS * 20
+    assert _process(accountant, last_month_ts, events) == expected_edited
+    assert accountant.pots[0].processed_events_offset == 0  # all checkpoints were stale
+    assert _process(accountant, last_month_ts, events) == expected_edited
+    assert accountant.pots[0].processed_events_offset > 0
+
+    # checkpoints of other settings are not used and get deleted
+    with accountant.db.user_write() as write_cursor:
+        accountant.db.set_settings(write_cursor, ModifiableDBSettings(taxfree_after_period=DAY_IN_SECONDS * 100))  # noqa: E501
+    _process(accountant, last_month_ts, events)
+    assert accountant.pots[0].processed_events_offset == 0
+    with accountant.db.conn_transient.read_ctx() as cursor:
+        assert cursor.execute('SELECT COUNT(DISTINCT settings_hash) FROM pnl_checkpoints').fetchone()[0] == 1  # noqa: E501
+
+
+@pytest.mark.parametrize('default_mock_price_value', [ONE])
+def test_price_changes_invalidate_checkpoints(accountant: 'Accountant', globaldb):
+    """Test that checkpoints are not used after the manual historical prices or the order
+    of the historical price oracles change"""
+    events = _make_trades(100)
+    last_month_ts = Timestamp(events[-30].timestamp)
+    accountant.checkpoints.period = DAY_IN_SECONDS * 20
+    _process(accountant, HISTORY_START_TS, events)
+    _process(accountant, last_month_ts, events)
+    assert accountant.pots[0].processed_events_offset > 0
+
+    manual_price = HistoricalPrice(
+        from_asset=A_ETH,
+        to_asset=A_EUR,
+        source=HistoricalPriceOracle.MANUAL,
+        timestamp=Timestamp(events[5].timestamp),
+        price=Price(FVal(150)),
+    )
+    for change_prices in (
+            lambda _: globaldb.add_single_historical_price(manual_price),
+            lambda _: globaldb.edit_manual_price(manual_price._replace(price=Price(FVal(160)))),
+            lambda write_cursor: accountant.db.set_settings(
+                write_cursor,
+                ModifiableDBSettings(historical_price_oracles=[HistoricalPriceOracle.COINGECKO, HistoricalPriceOracle.MANUAL]),  # noqa: E501
+            ),
+    ):
+        with accountant.db.user_write() as write_cursor:
+            assert change_prices(write_cursor) is not False
+        _process(accountant, last_month_ts, events)
+        assert accountant.pots[0].processed_events_offset == 0
+        _process(accountant, last_month_ts, events)  # checkpoints of the new prices are used
+        assert accountant.pots[0].processed_events_offset > 0
@@ -0,0 +1,157 @@
+import dataclasses
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+from zipfile import ZipFile
+
+import pytest
+
+from rotkehlchen.accounting.cost_basis.base import (
+    AssetAcquisitionEvent,
+    CostBasisInfo,
+    MatchedAcquisition,
+)
+from rotkehlchen.accounting.export.csv import FILENAME_ALL_CSV, CSVExporter
+from rotkehlchen.accounting.mixins.event import AccountingEventType
+from rotkehlchen.accounting.pnl import PNL, PnlTotals
+from rotkehlchen.accounting.structures.processed_event import ProcessedAccountingEvent
+from rotkehlchen.constants import ONE, ZERO
+from rotkehlchen.constants.assets import A_ETH
+from rotkehlchen.fval import FVal
+from rotkehlchen.types import Location, Price, Timestamp
+from rotkehlchen.utils.version_check import VersionCheckResult
+
+EXPECTED_CSV_DIR = Path(__file__).resolve().parent.parent.parent / 'data' / 'pnl_csv'
+
+
+def _make_events(number: int) -> Iterator[ProcessedAccountingEvent]:
+    """Lazily creates a report of alternating acquisitions and spends of ETH"""
+    for idx in range(number):
+        timestamp = Timestamp(1600000000 + idx * 60)
+        if idx % 2 == 0:
+            yield ProcessedAccountingEvent(
+                type=AccountingEventType.TRADE,
+                notes=f'Buy ETH {idx}',
+                location=Location.KRAKEN,
+                timestamp=timestamp,
+                asset=A_ETH,
+                free_amount=ZERO,
+                taxable_amount=ONE,
+                price=Price(FVal(1000 + idx)),
+                pnl=PNL(),
+                cost_basis=None,
+                index=idx,
+            )
+            continue
+
+        event = ProcessedAccountingEvent(
+            type=AccountingEventType.TRANSACTION_EVENT,
+            notes=f'Spend ETH {idx}',
+            location=Location.ETHEREUM,
+            timestamp=timestamp,
+            asset=A_ETH,
+            free_amount=FVal('0.25'),
+            taxable_amount=FVal('0.75'),
+            price=Price(FVal(1100 + idx)),
+            pnl=PNL(taxable=FVal(75 + idx), free=FVal(25)),
+            cost_basis=CostBasisInfo(
+                taxable_amount=FVal('0.75'),
+                taxable_bought_cost=FVal(750),
+                taxfree_bought_cost=FVal(250),
+                matched_acquisitions=[
+                    MatchedAcquisition(
+                        amount=FVal('0.75'),
+                        event=AssetAcquisitionEvent(amount=ONE, timestamp=timestamp, rate=Price(FVal(1000)), index=idx - 1),  # noqa: E501
+                        taxable=True,
+                    ),
+                    MatchedAcquisition(
+                        amount=FVal('0.25'),
+                        event=AssetAcquisitionEvent(amount=ONE, timestamp=timestamp, rate=Price(FVal(1000)), index=idx - 1),  # noqa: E501
+                        taxable=False,
+                    ),
+                ],
+                is_complete=True,
+            ),
+            index=idx,
+            extra_data={'tx_hash': f'0x{idx:064x}'},
+        )
+        event.count_entire_amount_spend = idx % 4 == 1
+        event.count_cost_basis_pnl = True
+        yield event
+
+
+def _make_pnls() -> PnlTotals:
+    pnls = PnlTotals()
+    pnls[AccountingEventType.TRANSACTION_EVENT] = PNL(taxable=FVal(100), free=FVal(25))
+    pnls[AccountingEventType.FEE] = PNL(taxable=FVal(-5), free=ZERO)
+    return pnls
+
+
+@pytest.mark.parametrize('with_formulas', [True, False])
+def test_zip_export_matches_directory_export(database, tmp_path: Path, with_formulas: bool):
+    """Test that the CSV streamed into the zip is the same as the one exported to a directory
+    and that the summary rows sum over all the streamed events"""
+    exporter = CSVExporter(database)
+    exporter.reset(start_ts=Timestamp(1600000000 + 60 * 10), end_ts=Timestamp(1700000000))
+    exporter.settings = dataclasses.replace(exporter.settings, pnl_csv_with_formulas=with_formulas, pnl_csv_have_summary=True)  # noqa: E501
+    assert exporter.export(events=_make_events(40), pnls=_make_pnls(), directory=tmp_path) == (True, '')  # noqa: E501
+    success, zip_path = exporter.create_zip(events=_make_events(40), pnls=_make_pnls())
+    assert success is True
+    with ZipFile(zip_path) as csv_zip:
+        assert csv_zip.namelist() == [FILENAME_ALL_CSV]
+        assert csv_zip.read(FILENAME_ALL_CSV) == (tmp_path / FILENAME_ALL_CSV).read_bytes()
+
+    lines = (tmp_path / FILENAME_ALL_CSV).read_text(encoding='utf8').splitlines()
+    assert len(lines) == 1 + 40 + 2 + 1 + 2 + 1 + 2 + 1 + 6  # header, events and summary
+    if with_formulas:
+        assert ',,,,,transaction event total,"=SUMIF(A2:A41;""transaction event"";I2:I41)","=SUMIF(A2:A41;""transaction event"";J2:J41)",,,,' in lines  # noqa: E501
+        assert ',,,,,TOTAL,=SUM(G45:G46),=SUM(H45:H46),,,,' in lines
+
+
+@pytest.mark.parametrize('with_formulas', [True, False])
+@pytest.mark.parametrize('have_summary', [True, False])
+def test_export_matches_previous_output(
+        database,
+        tmp_path: Path,
+        with_formulas: bool,
+        have_summary: bool,
+):
+    """Test that the streamed directory and zip exports are byte for byte the same as the
+    files that the exporter created before it was made to stream the report"""
+    exporter = CSVExporter(database)
+    exporter.reset(start_ts=Timestamp(1600000000 + 60 * 10), end_ts=Timestamp(1700000000))
+    exporter.settings = dataclasses.replace(exporter.settings, pnl_csv_with_formulas=with_formulas, pnl_csv_have_summary=have_summary)  # noqa: E501
+    with patch(
+        'rotkehlchen.accounting.export.csv.get_current_version',
+        return_value=VersionCheckResult(our_version='1.0.0'),
+    ):
+        assert exporter.export(events=_make_events(40), pnls=_make_pnls(), directory=tmp_path) == (True, '')  # noqa: E501
+        success, zip_path = exporter.create_zip(events=_make_events(40), pnls=_make_pnls())
+
+    assert success is True
+    expected = (EXPECTED_CSV_DIR / f"pnl_{'formulas' if with_formulas else 'values'}{'_summary' if have_summary else ''}.csv").read_bytes()  # noqa: E501
+    assert (tmp_path / FILENAME_ALL_CSV).read_bytes() == expected
+    with ZipFile(zip_path) as csv_zip:
+        assert csv_zip.read(FILENAME_ALL_CSV) == expected
+
+
+def test_export_memory_is_flat(database, tmp_path: Path):
+    """Test that exporting a report streams it so the peak memory does not grow with the
+    number of events"""
+    exporter = CSVExporter(database)
+    exporter.settings = dataclasses.replace(exporter.settings, pnl_csv_with_formulas=True, pnl_csv_have_summary=True)  # noqa: E501
+    peaks = []
+    for events_num in (2000, 8000):
+        for export in (
+            lambda num: exporter.export(events=_make_events(num), pnls=_make_pnls(), directory=tmp_path),  # noqa: E501
+            lambda num: exporter.create_zip(events=_make_events(num), pnls=_make_pnls()),
+        ):
+            tracemalloc.start()
+            assert export(events_num)[0] is True
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+    small_directory, small_zip, big_directory, big_zip = peaks
+    assert big_directory < small_directory * 1.5
+    assert big_zip < small_zip * 1.5
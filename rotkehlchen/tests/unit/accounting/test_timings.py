@@ -0,0 +1,69 @@
+import time
+from unittest.mock import patch
+
+import gevent
+import pytest
+
+from rotkehlchen.accounting.timings import PnlTimings
+from rotkehlchen.constants import ONE
+from rotkehlchen.constants.assets import A_BTC, A_ETH, A_EUR
+from rotkehlchen.db.reports import DBAccountingReports
+from rotkehlchen.exchanges.data_structures import Trade
+from rotkehlchen.fval import FVal
+from rotkehlchen.history.price import PriceHistorian
+from rotkehlchen.types import AssetAmount, Location, Price, Timestamp, TradeType
+
+PRICE_QUERY_DELAY = 0.001
+
+
+def _slow_price_query(*args, **kwargs) -> Price:  # pylint: disable=unused-argument
+    time.sleep(PRICE_QUERY_DELAY)
+    return Price(ONE)
+
+
+@pytest.mark.parametrize('default_mock_price_value', [ONE])
+def test_stage_timings_add_up(accountant):
+    """Test that the measured time of the stages of a PnL report adds up to the total time
+    of the report and that the timings are saved with the report"""
+    events = [Trade(
+        timestamp=Timestamp(1600000000 + idx * 3600),
+        location=Location.KRAKEN,
+        base_asset=A_ETH if idx % 2 == 0 else A_BTC,
+        quote_asset=A_EUR,
+        trade_type=TradeType.BUY if idx % 3 != 2 else TradeType.SELL,
+        amount=AssetAmount(ONE),
+        rate=Price(FVal(100 + idx)),
+        fee=None,
+        fee_currency=None,
+        link=None,
+    ) for idx in range(300)]
+    dbpnl = DBAccountingReports(accountant.db)
+    report_id = accountant.process_history(
+        start_ts=Timestamp(0),
+        end_ts=Timestamp(1700000000),
+        events=events,
+    )
+    assert dbpnl.get_reports(report_id=report_id, with_limit=False)[0][0]['timings'] is None
+
+    timings = PnlTimings(enabled=True)
+    with timings.measure('history'):
+        gevent.sleep(0.05)  # stands in for querying the history
+    with patch.object(PriceHistorian(), 'query_historical_price', side_effect=_slow_price_query):
+        report_id = accountant.process_history(
+            start_ts=Timestamp(0),
+            end_ts=Timestamp(1700000000),
+            events=events,
+            timings=timings,
+        )
+
+    saved = dbpnl.get_reports(report_id=report_id, with_limit=False)[0][0]['timings']
+    assert saved == timings.serialize()
+    stages = saved['stages']
+    assert set(stages) == {'history', 'processing', 'events', 'prices', 'cost_basis', 'db_writes', 'yield'}  # noqa: E501
+    assert sum(x['time'] for x in stages.values()) == pytest.approx(saved['total'], rel=0.05)
+    assert stages['history']['time'] >= 0.05
+    assert stages['prices']['calls'] > 0
+    assert stages['prices']['time'] >= stages['prices']['calls'] * PRICE_QUERY_DELAY
+    assert stages['events']['calls'] == saved['event_types']['trade']['calls'] == len(events)
+    # the time of an event type includes the time of the stages done to process its events
+    assert saved['event_types']['trade']['time'] > stages['prices']['time'] + stages['events']['time']  # noqa: E501
@@ -14,6 +14,8 @@ from rotkehlchen.chain.ethereum.constants import CPT_KRAKEN
 from rotkehlchen.chain.ethereum.transactions import EthereumTransactions
 from rotkehlchen.chain.evm.constants import GENESIS_HASH, ZERO_ADDRESS
 from rotkehlchen.chain.evm.decoding.constants import CPT_GAS
+from rotkehlchen.chain.evm.decoding.decoder import walk_decoder_modules
+from rotkehlchen.chain.evm.decoding.decoders_manifest import DECODER_MODULES
 from rotkehlchen.chain.evm.decoding.utils import maybe_reshuffle_events
 from rotkehlchen.chain.evm.structures import EvmTxReceipt, EvmTxReceiptLog
 from rotkehlchen.chain.evm.types import string_to_evm_address
@@ -28,6 +30,7 @@ from rotkehlchen.tests.utils.constants import A_OPTIMISM_USDT
 from rotkehlchen.tests.utils.ethereum import INFURA_ETH_NODE, get_decoded_events_of_transaction
 from rotkehlchen.tests.utils.factories import make_ethereum_event
 from rotkehlchen.types import (
+    EVM_CHAINS_WITH_TRANSACTIONS,
     ChainID,
     EvmTransaction,
     Location,
@@ -152,6 +155,25 @@ def test_decoders_initialization(ethereum_transaction_decoder: 'EthereumTransact
     }
 
 
+def test_decoders_initialized_lazily(ethereum_transaction_decoder: 'EthereumTransactionDecoder'):
+    """Test that the decoders are only initialized at the first access of their rules"""
+    assert ethereum_transaction_decoder._rules is None
+    assert ethereum_transaction_decoder._decoders == {}
+    rules = ethereum_transaction_decoder.rules
+    assert ethereum_transaction_decoder.rules is rules
+    assert 'Uniswapv3' in ethereum_transaction_decoder._decoders
+    assert set(ethereum_transaction_decoder._decoders) <= {x[0] for x in DECODER_MODULES['ethereum']} | {'Safemultisig', 'Oneinchv5'}  # noqa: E501
+
+
+def test_decoders_manifest():
+    """Test that the manifest of the decoder modules matches a fresh walk of the packages
+    of the modules of each chain. If not tools/scripts/generate_decoders_manifest.py
+    needs to run again"""
+    assert set(DECODER_MODULES) == {x.name.lower() for x in EVM_CHAINS_WITH_TRANSACTIONS}
+    for chain_name, decoder_modules in DECODER_MODULES.items():
+        assert list(decoder_modules) == walk_decoder_modules(f'rotkehlchen.chain.{chain_name}.modules')  # noqa: E501
+
+
 @pytest.mark.parametrize('ethereum_accounts', [['0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045']])
 def test_no_logs_and_zero_eth(
         database,
@@ -1,17 +1,26 @@
 import json
-from typing import Optional
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Literal, Optional
 from unittest.mock import patch
 
 import pytest
 
+from rotkehlchen.assets.asset import Asset
 from rotkehlchen.assets.types import AssetData, AssetType
 from rotkehlchen.chain.evm.types import string_to_evm_address
 from rotkehlchen.constants.assets import A_BTC, A_ETH
 from rotkehlchen.errors.serialization import DeserializationError
-from rotkehlchen.globaldb.handler import GlobalDBHandler
-from rotkehlchen.globaldb.updates import ASSETS_VERSION_KEY, AssetsUpdater, UpdateFileType
+from rotkehlchen.globaldb.handler import GlobalDBHandler, initialize_globaldb
+from rotkehlchen.globaldb.updates import (
+    ASSETS_VERSION_KEY,
+    AssetsUpdater,
+    UpdateFileType,
+    _replace_assets_from_db,
+)
 from rotkehlchen.tests.utils.mock import MockResponse
 from rotkehlchen.types import ChainID, EvmTokenKind, Timestamp
+from rotkehlchen.user_messages import MessagesAggregator
 
 VALID_ASSET_MAPPINGS = """INSERT INTO multiasset_mappings(collection_id, asset) VALUES (99999999, "ETH");
     *
@@ -471,3 +480,97 @@ def test_asset_update(assets_updater: AssetsUpdater):
     assert warnings == [
         f'Skipping assets update 998 since it requires a min schema of 4 and max schema of 4 while the local DB schema version is {GlobalDBHandler().get_schema_version()}. You will have to follow an alternative method to obtain the assets of this update. Easiest would be to reset global DB.',  # noqa: E501
     ]
+
+
+def _asset_update_lines(
+        identifier: str,
+        name: str,
+        swapped_for: str = 'NULL',
+        action: Optional[str] = None,
+) -> str:
+    """The lines of an asset in an assets update file. Without an action the action is the
+    full insert of the asset"""
+    full_insert = f'INSERT INTO assets(identifier, name, type) VALUES("{identifier}", "{name}", "Y"); INSERT INTO common_asset_details(identifier, symbol, coingecko, cryptocompare, forked, started, swapped_for) VALUES("{identifier}", "{name}", "", "", NULL, NULL, {swapped_for});'  # noqa: E501
+    return f'{full_insert}\n*\n' if action is None else f'{action}\n{full_insert}\n'
+
+
+def _apply_update_to_copy(
+        directory: Path,
+        update_text: str,
+        assets_conflicts: dict[Asset, Literal['remote', 'local']],
+        sequential: bool,
+) -> tuple[dict[str, list[tuple]], list[str], list[tuple[AssetData, AssetData]]]:
+    """Applies the assets update to a copy of the global DB like `perform_update` does, either
+    in bulk or asset by asset, and returns the resulting assets tables, the warnings and the
+    conflicts"""
+    directory.mkdir()
+    connection, _ = initialize_globaldb(
+        global_dir=directory,
+        db_filename='temp.db',
+        sql_vm_instructions_cb=GlobalDBHandler().conn.sql_vm_instructions_cb,
+    )
+    _replace_assets_from_db(connection, GlobalDBHandler().filepath())
+    assets_updater = AssetsUpdater(MessagesAggregator())
+    with ExitStack() as stack:
+        if sequential:  # every asset is applied on its own as if its action failed in bulk
+            stack.enter_context(patch.object(AssetsUpdater, '_apply_assets_in_bulk', return_value=0))  # noqa: E501
+        with connection.write_ctx():
+            assets_updater._apply_single_version_update(
+                connection=connection,
+                version=999,  # doesn't matter
+                text=update_text,
+                assets_conflicts=assets_conflicts,
+                update_file_type=UpdateFileType.ASSETS,
+            )
+
+    with connection.read_ctx() as cursor:
+        tables = {
+            table: cursor.execute(f'SELECT * FROM {table} ORDER BY 1, 2').fetchall()
+            for table in ('assets', 'common_asset_details', 'evm_tokens', 'underlying_tokens_list')
+        }
+    connection.close()
+    return tables, assets_updater.msg_aggregator.consume_warnings(), assets_updater.conflicts
+
+
+@pytest.mark.parametrize('chunk_size', [1000, 2])
+def test_bulk_assets_update_same_as_sequential(tmp_path: Path, chunk_size: int) -> None:
+    """Applying an assets update in bulk should leave the global DB, the warnings and the
+    conflicts exactly as applying each asset on its own does. Also when some of the actions
+    fail in the middle of a chunk and need to be inserted or have their conflict resolved"""
+    update_text = (
+        _asset_update_lines('NEW-ASSET-1', 'new1') +
+        _asset_update_lines('BTC', 'btc updated') +  # existing asset updated
+        _asset_update_lines('ETH', 'eth updated', swapped_for='"NONEXISTENT"') +  # fails to update and to resolve  # noqa: E501
+        _asset_update_lines('NEW-ASSET-2', 'new2', swapped_for='"LOLKEK"') +  # fails to insert
+        _asset_update_lines('NEW-ASSET-3', 'new3') +
+        'INSERT INTO assets(identifier, name, type) VALUES("BROKEN", "broken", "Y");\nnot parseable\n' +  # noqa: E501
+        _asset_update_lines('NEW-ASSET-4', 'new4') +
+        _asset_update_lines('NEW-ASSET-3', 'new3 again') +  # conflicts only with the update
+        _asset_update_lines('NEW-ASSET-5', 'new5')
+    )
+    # existing assets whose action is a plain insertion are a conflict with the local asset
+    update_text += ''.join(
+        _asset_update_lines(
+            identifier=identifier,
+            name='conflict',
+            action=f'INSERT INTO assets(identifier, name, type) VALUES("{identifier}", "conflict", "Y");',  # noqa: E501
+        ) for identifier in ('XMR', 'DASH', 'LTC')
+    )
+    assets_conflicts: dict[Asset, Literal['remote', 'local']] = {A_ETH: 'remote', A_BTC: 'remote', Asset('DASH'): 'local', Asset('LTC'): 'remote'}  # noqa: E501
+    with patch('rotkehlchen.globaldb.updates.ASSETS_UPDATE_CHUNK_SIZE', new=chunk_size):
+        bulk_result = _apply_update_to_copy(tmp_path / 'bulk', update_text, assets_conflicts, sequential=False)  # noqa: E501
+        sequential_result = _apply_update_to_copy(tmp_path / 'sequential', update_text, assets_conflicts, sequential=True)  # noqa: E501
+
+    assert bulk_result == sequential_result
+    tables, warnings, conflicts = bulk_result
+    names = {x[0]: x[1] for x in tables['assets']}
+    assert names['BTC'] == 'btc updated'
+    assert names['ETH'] == 'Ethereum'
+    assert names['LTC'] == 'conflict'
+    assert names['DASH'] != 'conflict'
+    assert names['NEW-ASSET-3'] == 'new3'
+    assert {'NEW-ASSET-1', 'NEW-ASSET-4', 'NEW-ASSET-5'} <= names.keys()
+    assert 'NEW-ASSET-2' not in names
+    # the broken entry, the failed insertions and the failed resolution
+    assert len(warnings) == 4
+    assert [x[0].identifier for x in conflicts] == ['XMR']
@@ -30,6 +30,7 @@ from rotkehlchen.constants.misc import NFT_DIRECTIVE
 from rotkehlchen.constants.resolver import ethaddress_to_identifier, evm_address_to_identifier
 from rotkehlchen.db.custom_assets import DBCustomAssets
 from rotkehlchen.db.filtering import CustomAssetsFilterQuery
+from rotkehlchen.db.profiles import DB_CONNECTION_PROFILES
 from rotkehlchen.errors.asset import UnknownAsset
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.exchanges.data_structures import Trade
@@ -40,7 +41,7 @@ from rotkehlchen.globaldb.cache import (
     globaldb_set_general_cache_values,
     globaldb_set_unique_cache_value,
 )
-from rotkehlchen.globaldb.handler import GLOBAL_DB_VERSION, GlobalDBHandler
+from rotkehlchen.globaldb.handler import GLOBAL_DB_VERSION, GlobalDBHandler, initialize_globaldb
 from rotkehlchen.history.types import HistoricalPrice, HistoricalPriceOracle
 from rotkehlchen.serialization.deserialize import deserialize_asset_amount
 from rotkehlchen.tests.fixtures.globaldb import create_globaldb
@@ -551,6 +552,24 @@ def test_globaldb_pragma_foreign_keys(globaldb):
     assert cursor.fetchone()[0] == 1
 
 
+def test_globaldb_connection_profile(tmpdir_factory, globaldb):
+    """Test that the global DB connection is tuned by the profile apart from synchronous,
+    which is only relaxed for DBs journaled with WAL"""
+    profile = DB_CONNECTION_PROFILES['throughput']
+    new_global_dir = Path(tmpdir_factory.mktemp('global_data'))
+    connection, _ = initialize_globaldb(
+        global_dir=new_global_dir,
+        db_filename='global.db',
+        sql_vm_instructions_cb=globaldb.conn.sql_vm_instructions_cb,
+        connection_profile=profile,
+    )
+    assert connection.execute('PRAGMA cache_size').fetchone()[0] == profile.cache_size
+    assert connection.execute('PRAGMA mmap_size').fetchone()[0] == profile.mmap_size
+    assert connection.execute('PRAGMA journal_mode').fetchone()[0] != 'wal'
+    assert connection.execute('PRAGMA synchronous').fetchone()[0] == 2  # FULL, the default
+    connection.close()
+
+
 def test_global_db_restore(globaldb, database):
     """
     Check that the user can recreate assets information from the packaged
@@ -394,6 +394,7 @@ def test_upgrade_v5_v6(globaldb: GlobalDBHandler):
             ('unique_cache',),
         )
         assert cursor.fetchone()[0] == 0
+        assert cursor.execute('PRAGMA auto_vacuum').fetchone()[0] == 0
         # get number of entries in general_cache before upgrade
         cursor.execute('SELECT COUNT(*) FROM general_cache')
         gen_cache_content_before = cursor.fetchone()[0]
@@ -494,6 +495,8 @@ def test_upgrade_v5_v6(globaldb: GlobalDBHandler):
         assert set(cursor.execute(
             'SELECT * FROM multiasset_mappings ORDER BY collection_id, asset',
         )) == old_multiasset_mappings
+        # check that the DB was switched to incremental auto vacuum
+        assert cursor.execute('PRAGMA auto_vacuum').fetchone()[0] == 2
 
 
 @pytest.mark.parametrize('custom_globaldb', ['v2_global.db'])
@@ -2,6 +2,7 @@ import pytest
 
 from rotkehlchen.args import app_args
 from rotkehlchen.constants.misc import DEFAULT_SQL_VM_INSTRUCTIONS_CB
+from rotkehlchen.db.profiles import DEFAULT_DB_PROFILE
 
 
 @pytest.fixture(name='argparser')
@@ -28,3 +29,13 @@ def test_arg_sql_vm_instructions_cb(argparser):
     assert args.sqlite_instructions == 200
     args = argparser.parse_args(['--sqlite-instructions', '0'])
     assert args.sqlite_instructions == 0
+
+
+def test_arg_db_profile(argparser):
+    with pytest.raises(SystemExit):
+        argparser.parse_args(['--db-profile', 'fastest'])
+
+    args = argparser.parse_args(['--data-dir', 'foo'])
+    assert args.db_profile == DEFAULT_DB_PROFILE
+    args = argparser.parse_args(['--db-profile', 'low-memory'])
+    assert args.db_profile == 'low-memory'
@@ -10,6 +10,11 @@ import pytest
 from eth_utils import is_checksum_address
 
 from rotkehlchen.assets.asset import Asset, CryptoAsset, CustomAsset, EvmToken, FiatAsset, Nft
+from rotkehlchen.assets.resolver import (
+    DEFAULT_ASSETS_CACHE_SIZE,
+    MAX_ASSETS_CACHE_SIZE,
+    AssetResolver,
+)
 from rotkehlchen.assets.types import AssetType
 from rotkehlchen.assets.utils import get_or_create_evm_token, symbol_to_evm_token
 from rotkehlchen.constants.assets import A_DAI, A_USDT
@@ -788,3 +793,63 @@ def test_load_from_packaged_db(globaldb: GlobalDBHandler):
         with globaldb._packaged_db_conn.cursor() as cursor:
             cursor.execute('SELECT name FROM assets WHERE identifier="ETH"')
             assert cursor.fetchone()[0] == 'my eth'
+
+
+def test_resolve_many(globaldb: GlobalDBHandler, database):
+    """Test that resolving assets in bulk gives the same assets as resolving them one by one
+    while issuing a constant number of queries to the globaldb"""
+    db_custom_assets = DBCustomAssets(database)
+    db_custom_assets.add_custom_asset(CustomAsset.initialize(
+        identifier='xyz',
+        name='custom name',
+        custom_asset_type='lolkek',
+    ))
+    identifiers = [
+        'ETH',
+        'btc',  # case should not matter
+        'EUR',
+        A_DAI.identifier,
+        'eip155:1/erc20:0x00e8Eb340f8AF587EEA6200D2081E31dC87285ac',  # has underlying tokens
+        '_nft_foo',
+        'xyz',
+    ]
+    AssetResolver.clean_memory_cache()
+    expected = {x: AssetResolver.resolve_asset(x) for x in identifiers}
+    assert expected[identifiers[4]].underlying_tokens is not None  # type: ignore
+
+    AssetResolver.clean_memory_cache()
+    statements: list[str] = []
+    globaldb.conn._conn.set_trace_callback(statements.append)
+    try:
+        resolved = AssetResolver.resolve_many(identifiers)
+        assert len(statements) == 2  # one for all the assets and one for underlying tokens
+        statements.clear()
+        assert AssetResolver.resolve_many(identifiers) == resolved
+        assert len(statements) == 0  # all served from the cache
+    finally:
+        globaldb.conn._conn.set_trace_callback(None)
+
+    assert list(resolved) == identifiers
+    for identifier, asset in resolved.items():
+        assert type(asset) is type(expected[identifier])
+        assert vars(asset) == vars(expected[identifier])
+
+    with pytest.raises(UnknownAsset):
+        AssetResolver.resolve_many(['ETH', 'i-dont-exist'])
+
+
+def test_assets_cache_size():
+    AssetResolver.auto_size_cache(10)
+    assert AssetResolver().assets_cache.maxsize == DEFAULT_ASSETS_CACHE_SIZE
+    AssetResolver.auto_size_cache(2000)
+    assert AssetResolver().assets_cache.maxsize == 4000
+    AssetResolver.auto_size_cache(10**6)
+    assert AssetResolver().assets_cache.maxsize == MAX_ASSETS_CACHE_SIZE
+
+    AssetResolver.clean_memory_cache()
+    AssetResolver.prewarm_cache(['ETH', 'BTC', 'i-dont-exist'])
+    assert set(AssetResolver().assets_cache.cache) == {'eth', 'btc'}
+    AssetResolver().assets_cache.get('ETH')
+    AssetResolver.set_cache_size(1)  # shrinking evicts the least recently used entries
+    assert set(AssetResolver().assets_cache.cache) == {'eth'}
+    AssetResolver.set_cache_size(DEFAULT_ASSETS_CACHE_SIZE)
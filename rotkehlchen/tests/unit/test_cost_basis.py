@@ -1,4 +1,5 @@
 import csv
+import dataclasses
 import tempfile
 from itertools import zip_longest
 from pathlib import Path
@@ -22,6 +23,7 @@ from rotkehlchen.chain.ethereum.modules.uniswap.constants import CPT_UNISWAP_V2
 from rotkehlchen.chain.evm.accounting.structures import TxAccountingTreatment, TxEventSettings
 from rotkehlchen.constants import ONE, ZERO
 from rotkehlchen.constants.assets import A_3CRV, A_BTC, A_ETH, A_EUR, A_WETH
+from rotkehlchen.db.reports import DBAccountingReports
 from rotkehlchen.db.settings import DBSettings
 from rotkehlchen.exchanges.data_structures import Trade
 from rotkehlchen.fval import FVal
@@ -47,6 +49,97 @@ EXAMPLE_TIMESTAMP = Timestamp(1675483017)
 ONE_PRICE = Price(ONE)
 
 
+def _process_rewards(
+        pot: AccountingPot,
+        settings: DBSettings,
+        rewards_num: int,
+) -> tuple[PnlTotals, int]:
+    """Adds `rewards_num` tiny ETH rewards, each 50 of which have the same price, and then
+    sells most of them. Returns the PnL totals and the number of acquisitions left"""
+    end_ts = Timestamp(EXAMPLE_TIMESTAMP * 2)
+    report_id = DBAccountingReports(pot.database).add_report(
+        first_processed_timestamp=EXAMPLE_TIMESTAMP,
+        start_ts=Timestamp(0),
+        end_ts=end_ts,
+        settings=settings,
+    )
+    pot.reset(settings=settings, start_ts=Timestamp(0), end_ts=end_ts, report_id=report_id)
+    for idx in range(rewards_num):
+        pot.add_in_event(
+            event_type=AccountingEventType.TRANSACTION_EVENT,
+            notes='Staking reward',
+            location=Location.BLOCKCHAIN,
+            timestamp=Timestamp(EXAMPLE_TIMESTAMP + idx * 60),
+            asset=A_ETH,
+            amount=FVal('0.001'),
+            taxable=True,
+            given_price=Price(FVal(1000 + idx // 50 % 3)),
+        )
+
+    pot.add_out_event(
+        event_type=AccountingEventType.TRADE,
+        notes='Sell ETH',
+        location=Location.KRAKEN,
+        timestamp=Timestamp(EXAMPLE_TIMESTAMP + rewards_num * 60),
+        asset=A_ETH,
+        amount=FVal('0.001') * rewards_num * FVal('0.9') + FVal('0.0005'),
+        taxable=True,
+        given_price=Price(FVal(1200)),
+    )
+    return (
+        PnlTotals(dict(pot.pnls.items())),
+        len(pot.cost_basis.get_events(A_ETH).acquisitions_manager),
+    )
+
+
+@pytest.mark.parametrize('cost_basis_method', list(CostBasisMethod))
+def test_merged_acquisitions_same_pnl(accountant: Accountant, cost_basis_method: CostBasisMethod):
+    """Test that merging acquisitions with a zero tolerance keeps the same PnL totals while
+    keeping a lot fewer acquisitions and that with a tax free period only acquisitions that
+    become tax free at about the same time are merged"""
+    pot = accountant.pots[0]
+    settings = DBSettings(cost_basis_method=cost_basis_method, taxfree_after_period=None)
+    expected_pnls, acquisitions_num = _process_rewards(pot, settings, rewards_num=1000)
+    assert acquisitions_num == 100
+    assert expected_pnls.taxable != ZERO
+
+    pnls, acquisitions_num = _process_rewards(
+        pot=pot,
+        settings=dataclasses.replace(settings, acquisitions_merge_tolerance=ZERO),
+        rewards_num=1000,
+    )
+    assert pnls == expected_pnls
+    assert acquisitions_num == 2
+
+    pnls, acquisitions_num = _process_rewards(
+        pot=pot,
+        settings=dataclasses.replace(settings, acquisitions_merge_tolerance=ZERO, taxfree_after_period=3600),  # noqa: E501
+        rewards_num=1000,
+    )
+    assert acquisitions_num == 100
+
+    # with a tolerance all rewards are merged in a single acquisition and only the order
+    # in which they are used changes. So the average cost basis stays the same.
+    pnls, acquisitions_num = _process_rewards(
+        pot=pot,
+        settings=dataclasses.replace(settings, acquisitions_merge_tolerance=FVal('0.01')),
+        rewards_num=1000,
+    )
+    assert acquisitions_num == 1
+    if cost_basis_method == CostBasisMethod.ACB:
+        assert pnls.taxable.is_close(expected_pnls.taxable)
+
+    # with a tax free period only acquisitions within the tolerance of the period are merged
+    pnls, acquisitions_num = _process_rewards(
+        pot=pot,
+        settings=dataclasses.replace(settings, acquisitions_merge_tolerance=FVal('0.01'), taxfree_after_period=3600 * 100),  # noqa: E501
+        rewards_num=1000,
+    )
+    assert 1 < acquisitions_num < 100  # the rewards of each hour are merged
+    if cost_basis_method == CostBasisMethod.ACB:
+        assert pnls.taxable.is_close(expected_pnls.taxable)
+
+
 def add_in_event(
         pot: AccountingPot,
         amount: FVal,
@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import pytest
+
+from rotkehlchen.data_import.importers.rotki_trades import RotkiGenericTradesImporter
+from rotkehlchen.data_import.utils import ITEMS_PER_DB_WRITE
+from rotkehlchen.db.dbhandler import DBHandler
+from rotkehlchen.db.filtering import TradesFilterQuery
+from rotkehlchen.tests.utils.dataimport import SYNTHETIC_TRADE_PAIRS, generate_rotki_trades_csv
+from rotkehlchen.tests.utils.factories import make_random_trades
+
+
+def test_import_writes_in_chunks(database: DBHandler, tmpdir_factory: pytest.TempdirFactory):
+    """Test that a csv import is committed in chunks, each in its own write transaction,
+    and that asset lookups are only done once per symbol"""
+    rows = ITEMS_PER_DB_WRITE * 2 + 5
+    filepath = Path(tmpdir_factory.mktemp('csv')) / 'trades.csv'
+    generate_rotki_trades_csv(filepath=filepath, rows=rows)
+
+    importer = RotkiGenericTradesImporter(database)
+    commits = []
+    original_flush_all = importer.flush_all
+
+    def flush_all() -> None:
+        original_flush_all()
+        assert database.conn.write_greenlet_id is None  # the write lock is released
+        with database.conn.read_ctx() as cursor:
+            commits.append(cursor.execute('SELECT COUNT(*) FROM trades').fetchone()[0])
+
+    importer.flush_all = flush_all  # type: ignore[method-assign]
+    assert importer.import_csv(filepath=filepath) == (True, '')
+
+    assert importer.written_entries == rows
+    assert commits[:3] == [ITEMS_PER_DB_WRITE, ITEMS_PER_DB_WRITE * 2, rows]
+    bases, quotes = ({pair[idx] for pair in SYNTHETIC_TRADE_PAIRS} for idx in (0, 1))
+    # base and fee assets are resolved with the location's resolver, quote assets by symbol
+    assert len(importer._resolved_assets) == len(bases | quotes) + len(quotes)
+    with database.conn.read_ctx() as cursor:
+        assert len(database.get_trades(
+            cursor=cursor,
+            filter_query=TradesFilterQuery.make(),
+            has_premium=True,
+        )) == rows
+
+
+def test_import_malformed_row_keeps_nothing(
+        database: DBHandler,
+        tmpdir_factory: pytest.TempdirFactory,
+):
+    """Test that a malformed row after some chunks were already committed deletes the
+    rows of the import, while the ones written by others in between the chunks are kept"""
+    rows = ITEMS_PER_DB_WRITE * 2 + 5
+    filepath = Path(tmpdir_factory.mktemp('csv')) / 'trades.csv'
+    generate_rotki_trades_csv(filepath=filepath, rows=rows)
+    importer = RotkiGenericTradesImporter(database)
+    original_consume = importer._consume_rotki_trades
+    existing_trade, concurrent_trade = make_random_trades(2)
+    with database.user_write() as write_cursor:
+        database.add_trades(write_cursor, trades=[existing_trade])
+
+    def consume(csv_row):
+        if csv_row['Description'] == f'Synthetic trade {ITEMS_PER_DB_WRITE + 1}':
+            with database.user_write() as write_cursor:  # as if another greenlet wrote
+                database.add_trades(write_cursor, trades=[concurrent_trade])
+        if csv_row['Description'] == f'Synthetic trade {rows - 1}':
+            raise KeyError('Buy Amount')  # as if the last row missed a column
+        original_consume(csv_row)
+
+    importer._consume_rotki_trades = consume  # type: ignore[method-assign]
+    success, msg = importer.import_csv(filepath=filepath)
+    assert success is False
+    assert 'Could not find key' in msg
+    assert importer.written_entries == ITEMS_PER_DB_WRITE * 2
+    assert database.conn.write_greenlet_id is None
+    with database.conn.read_ctx() as cursor:
+        assert {x[0] for x in cursor.execute('SELECT id FROM trades')} == {
+            existing_trade.identifier,
+            concurrent_trade.identifier,
+        }
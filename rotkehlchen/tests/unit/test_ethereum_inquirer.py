@@ -1,13 +1,22 @@
+from typing import Any
 from unittest.mock import patch
 
+import gevent
 import pytest
+from web3 import Web3
+from web3.providers.base import BaseProvider
 
 from rotkehlchen.chain.accounts import BlockchainAccountData
 from rotkehlchen.chain.ethereum.constants import ETHEREUM_ETHERSCAN_NODE_NAME
+from rotkehlchen.chain.ethereum.node_inquirer import EthereumInquirer
 from rotkehlchen.chain.evm.constants import ZERO_ADDRESS
 from rotkehlchen.chain.evm.decoding.constants import ERC20_OR_ERC721_TRANSFER
 from rotkehlchen.chain.evm.structures import EvmTxReceipt, EvmTxReceiptLog
-from rotkehlchen.chain.evm.types import string_to_evm_address
+from rotkehlchen.chain.evm.types import NodeName, Web3Node, WeightedNode, string_to_evm_address
+from rotkehlchen.chain.gnosis.constants import GNOSIS_MULTICALL_CONCURRENCY
+from rotkehlchen.chain.gnosis.node_inquirer import GnosisInquirer
+from rotkehlchen.chain.optimism.node_inquirer import OptimismInquirer
+from rotkehlchen.constants import ONE
 from rotkehlchen.db.evmtx import DBEvmTx
 from rotkehlchen.errors.misc import EventNotInABI
 from rotkehlchen.tests.utils.checks import assert_serialized_dicts_equal
@@ -430,3 +439,104 @@ def test_get_contract_deployed_block(ethereum_inquirer):
     """
     assert ethereum_inquirer.get_contract_deployed_block('0x5a464C28D19848f44199D003BeF5ecc87d090F87') == 12251871  # noqa: E501
     assert ethereum_inquirer.get_contract_deployed_block('0x9531C059098e3d194fF87FebB587aB07B30B1306') is None  # noqa: E501
+
+
+class MulticallRPCStub(BaseProvider):
+    """Local JSON-RPC stub answering multicall aggregate() calls
+
+    Every call returns its own calldata so that the order of the results can be checked.
+    Requests whose calldata is bigger than `max_calldata_size` bytes fail with an out of
+    gas error and every accepted request takes `latency` seconds.
+    """
+
+    def __init__(self, multicall_abi: list, max_calldata_size: int, latency: float) -> None:
+        super().__init__()
+        self.contract = Web3().eth.contract(abi=multicall_abi)
+        self.max_calldata_size = max_calldata_size
+        self.latency = latency
+        self.served_chunk_sizes: list[int] = []
+        self.rejected_requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def make_request(self, method: str, params: Any) -> dict[str, Any]:
+        if method == 'eth_chainId':
+            return {'jsonrpc': '2.0', 'id': 1, 'result': '0x1'}
+        assert method == 'eth_call'
+        calldata = params[0]['data']
+        if (len(calldata) - 2) // 2 > self.max_calldata_size:
+            self.rejected_requests += 1
+            return {'jsonrpc': '2.0', 'id': 1, 'error': {'code': -32000, 'message': 'out of gas'}}
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        gevent.sleep(self.latency)
+        self.in_flight -= 1
+        _, arguments = self.contract.decode_function_input(calldata)
+        calls = next(iter(arguments.values()))
+        self.served_chunk_sizes.append(len(calls))
+        encoded = Web3().codec.encode_abi(['uint256', 'bytes[]'], [1, [data for _, data in calls]])
+        return {'jsonrpc': '2.0', 'id': 1, 'result': '0x' + encoded.hex()}
+
+
+@pytest.mark.parametrize('ethereum_manager_connect_at_start', [[]])
+def test_multicall_concurrent_adaptive_chunks(ethereum_inquirer):
+    """Test that multicall queries chunks concurrently, adapts the chunk size to what
+    the node accepts and keeps the order of the results as in the given calls"""
+    stub = MulticallRPCStub(
+        multicall_abi=ethereum_inquirer.contract_multicall.abi,
+        max_calldata_size=2000,  # ~10 abi encoded calls of 36 bytes each
+        latency=0.01,
+    )
+    node = NodeName(
+        name='multicall stub',
+        endpoint='http://localhost:8545',
+        owned=False,
+        blockchain=SupportedBlockchain.ETHEREUM,
+    )
+    ethereum_inquirer.web3_mapping[node] = Web3Node(
+        web3_instance=Web3(stub),
+        is_pruned=False,
+        is_archive=True,
+    )
+    call_order = [WeightedNode(node_info=node, active=True, weight=ONE)]
+    contract = ethereum_inquirer.contracts.contract(string_to_evm_address('0x5BA1e12693Dc8F9c48aAD8770482f4739bEeD696'))  # noqa: E501
+    calls = [(contract.address, '0x' + idx.to_bytes(36, 'big').hex()) for idx in range(500)]
+    expected = [bytes.fromhex(calldata[2:]) for _, calldata in calls]
+
+    result = ethereum_inquirer.multicall(calls=calls, call_order=call_order, calls_chunk_size=100)
+    assert result == expected
+    assert stub.rejected_requests > 0
+    assert sum(stub.served_chunk_sizes) == len(calls)
+    assert 1 < stub.max_in_flight <= ethereum_inquirer.multicall_concurrency
+    learned_size = ethereum_inquirer.multicall_chunk_sizes[node.name]
+    assert learned_size < 100
+
+    # a second query starts from the learned chunk size so it hits the node limit less
+    first_rejected_requests, stub.rejected_requests = stub.rejected_requests, 0
+    result = ethereum_inquirer.multicall(calls=calls, call_order=call_order, calls_chunk_size=100)
+    assert result == expected
+    assert stub.rejected_requests < first_rejected_requests
+
+    # sequential execution gives the same result
+    ethereum_inquirer.multicall_concurrency = 1
+    stub.max_in_flight = 0
+    result = ethereum_inquirer.multicall(calls=calls, call_order=call_order, calls_chunk_size=100)
+    assert result == expected
+    assert stub.max_in_flight == 1
+
+
+def test_multicall_concurrency_per_chain(database, greenlet_manager):
+    """Test that each chain sets its own multicall concurrency and that it can be overridden
+    through the intermediate inquirer classes of the chains"""
+    assert GnosisInquirer(
+        greenlet_manager=greenlet_manager,
+        database=database,
+    ).multicall_concurrency == GNOSIS_MULTICALL_CONCURRENCY
+    for inquirer_class in (EthereumInquirer, OptimismInquirer, GnosisInquirer):
+        inquirer = inquirer_class(
+            greenlet_manager=greenlet_manager,
+            database=database,
+            multicall_concurrency=2,
+        )
+        assert inquirer.multicall_concurrency == 2
@@ -0,0 +1,104 @@
+import json
+import tracemalloc
+
+import gevent
+
+from rotkehlchen.api.websockets.notifier import WS_COALESCE_WINDOW, RotkiNotifier
+from rotkehlchen.api.websockets.typedefs import TransactionStatusStep, WSMessageType
+
+
+class SlowWebSocket:
+    """A fake websocket whose sends take some time, like a slow frontend"""
+
+    def __init__(self, send_delay: float) -> None:
+        self.send_delay = send_delay
+        self.closed = False
+        self.sent: list[dict] = []
+
+    def send(self, message: str) -> None:
+        gevent.sleep(self.send_delay)
+        self.sent.append(json.loads(message))
+
+
+def _tx_status(address: str, end_ts: int, status: TransactionStatusStep) -> dict:
+    return {
+        'address': address,
+        'evm_chain': 'ethereum',
+        'period': [0, end_ts],
+        'status': str(status),
+    }
+
+
+def test_coalescing_keeps_latest_status_and_order():
+    """Test that progress updates waiting to be sent are merged to the latest one while the
+    start/finish statuses and all other messages are sent in order"""
+    notifier = RotkiNotifier()
+    websocket = SlowWebSocket(send_delay=0.001)
+    notifier.subscribe(websocket)  # type: ignore[arg-type]  # fake websocket
+
+    notifier.broadcast(WSMessageType.EVM_TRANSACTION_STATUS, _tx_status('0xA', 0, TransactionStatusStep.QUERYING_TRANSACTIONS_STARTED))  # noqa: E501
+    for end_ts in range(1, 1001):
+        notifier.broadcast(WSMessageType.EVM_TRANSACTION_STATUS, _tx_status('0xA', end_ts, TransactionStatusStep.QUERYING_TRANSACTIONS))  # noqa: E501
+        notifier.broadcast(WSMessageType.EVM_TRANSACTION_STATUS, _tx_status('0xB', end_ts, TransactionStatusStep.QUERYING_TRANSACTIONS))  # noqa: E501
+    notifier.broadcast(WSMessageType.LEGACY, {'verbosity': 'warning', 'value': 'a warning'})
+    notifier.broadcast(WSMessageType.EVM_TRANSACTION_STATUS, _tx_status('0xA', 1000, TransactionStatusStep.QUERYING_TRANSACTIONS_FINISHED))  # noqa: E501
+
+    gevent.sleep(WS_COALESCE_WINDOW * 3)
+    assert [(x['type'], x['data'].get('address'), x['data'].get('status')) for x in websocket.sent] == [  # noqa: E501
+        ('evm_transaction_status', '0xA', 'querying_transactions_started'),
+        ('evm_transaction_status', '0xA', 'querying_transactions'),
+        ('evm_transaction_status', '0xB', 'querying_transactions'),
+        ('legacy', None, None),
+        ('evm_transaction_status', '0xA', 'querying_transactions_finished'),
+    ]
+    assert websocket.sent[1]['data'] == _tx_status('0xA', 1000, TransactionStatusStep.QUERYING_TRANSACTIONS)  # noqa: E501
+    assert websocket.sent[2]['data'] == _tx_status('0xB', 1000, TransactionStatusStep.QUERYING_TRANSACTIONS)  # noqa: E501
+    assert notifier.stats() == [{'queued': 0, 'sent': 5, 'coalesced': 1998, 'dropped': 0}]
+    notifier.unsubscribe(websocket)  # type: ignore[arg-type]  # fake websocket
+
+
+def test_slow_subscriber_bounded_queue():
+    """Test that with a slow subscriber the outbound queue stays bounded, the oldest messages
+    are dropped and reported via the failure callback and the final state is sent"""
+    notifier = RotkiNotifier()
+    websocket = SlowWebSocket(send_delay=0.01)
+    notifier.subscribe(websocket)  # type: ignore[arg-type]  # fake websocket
+    sender = notifier.senders[websocket]  # type: ignore[index]  # fake websocket
+    sender.maxsize = 50
+    failed = []
+
+    def on_failure(idx: int) -> None:
+        failed.append(idx)
+
+    tracemalloc.start()
+    for idx in range(5000):
+        notifier.broadcast(
+            message_type=WSMessageType.LEGACY,
+            to_send_data={'verbosity': 'error', 'value': f'error {idx}'},
+            failure_callback=on_failure,
+            failure_callback_args={'idx': idx},
+        )
+        notifier.broadcast(WSMessageType.CSV_IMPORT_STATUS, {'written_entries': idx, 'finished': False})  # noqa: E501
+        assert len(sender.queue) <= sender.maxsize
+        if idx % 500 == 0:
+            gevent.sleep(0)  # let the sender run from time to time
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    with gevent.Timeout(5):
+        while (stats := notifier.stats()[0])['sent'] + stats['dropped'] + stats['coalesced'] != 10000:  # noqa: E501
+            gevent.sleep(0.05)
+
+    assert stats['queued'] == 0
+    assert stats['dropped'] >= len(failed) > 0
+    assert len(failed) == 5000 - len([x for x in websocket.sent if x['type'] == 'legacy'])
+    assert stats['sent'] == len(websocket.sent)
+    assert peak_memory < 5 * 1024 * 1024  # the queue is bounded so memory stays low
+    # whatever was dropped, the latest state is sent
+    assert [x['data'] for x in websocket.sent if x['type'] == 'csv_import_status'][-1] == {
+        'written_entries': 4999,
+        'finished': False,
+    }
+    assert websocket.sent[-1]['data']['value'] == 'error 4999'
+    assert failed == sorted(failed)  # the oldest are dropped first
+    notifier.unsubscribe(websocket)  # type: ignore[arg-type]  # fake websocket
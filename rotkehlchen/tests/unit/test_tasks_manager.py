@@ -7,13 +7,15 @@ import pytest
 from rotkehlchen.chain.bitcoin.hdkey import HDKey
 from rotkehlchen.chain.bitcoin.xpub import XpubData
 from rotkehlchen.constants.timing import DATA_UPDATES_REFRESH
-from rotkehlchen.db.constants import LAST_DATA_UPDATES_KEY
+from rotkehlchen.db.constants import LAST_DATA_UPDATES_KEY, LAST_DB_MAINTENANCE_KEY
 from rotkehlchen.db.evmtx import DBEvmTx
+from rotkehlchen.db.maintenance import DBMaintenance
 from rotkehlchen.db.settings import ModifiableDBSettings
 from rotkehlchen.db.updates import RotkiDataUpdater
 from rotkehlchen.errors.misc import RemoteError
 from rotkehlchen.premium.premium import Premium, PremiumCredentials, SubscriptionStatus
 from rotkehlchen.tasks.manager import PREMIUM_STATUS_CHECK, TaskManager
+from rotkehlchen.tasks.scheduler import STARVATION_SKIPS, TaskCost, TaskPriority, TaskProperties
 from rotkehlchen.tasks.utils import should_run_periodic_task
 from rotkehlchen.tests.utils.ethereum import (
     TEST_ADDR1,
@@ -449,3 +451,189 @@ def test_maybe_kill_running_tx_query_tasks(rotkehlchen_api_server, ethereum_acco
         rotki.task_manager.potential_tasks = []
         rotki.task_manager.schedule()
         assert len(rotki.task_manager.running_greenlets) == 0
+
+
+class FakeClock:
+    """A controllable clock for the task scheduler"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _setup_fake_clock(task_manager: TaskManager) -> FakeClock:
+    """Gives the scheduler a fake clock and frees all task slots"""
+    gevent.killall(task_manager.greenlet_manager.greenlets)
+    task_manager.greenlet_manager.clear_finished()
+    clock = FakeClock()
+    task_manager.scheduler.clock = clock
+    return clock
+
+
+def _make_fake_task(task_manager: TaskManager, name: str, calls: list[str]):
+    """Creates a scheduling function that records its calls and spawns a greenlet
+    that stays alive until `_finish_task` is called for it"""
+    finish_event = gevent.event.Event()
+
+    def fake_task():
+        calls.append(name)
+        return [task_manager.greenlet_manager.spawn_and_track(
+            method=finish_event.wait,
+            after_seconds=None,
+            task_name=f'fake {name}',
+            exception_is_error=True,
+        )]
+
+    fake_task.__name__ = f'_maybe_{name}'
+    fake_task.finish_event = finish_event  # type: ignore[attr-defined]
+    return fake_task
+
+
+def _finish_task(task_manager: TaskManager, fake_task) -> None:
+    fake_task.finish_event.set()
+    gevent.joinall(task_manager.running_greenlets.get(fake_task, []))
+    fake_task.finish_event.clear()
+    task_manager.greenlet_manager.clear_finished()
+
+
+@pytest.mark.parametrize('max_tasks_num', [1])
+def test_scheduler_priority_and_fairness(task_manager: TaskManager) -> None:
+    """Test that overdue high priority tasks get the free slot first and that lower
+    priority tasks still run once they have been skipped too many times in a row"""
+    clock = _setup_fake_clock(task_manager)
+    calls: list[str] = []
+    high = _make_fake_task(task_manager, 'high', calls)
+    normal = _make_fake_task(task_manager, 'normal', calls)
+    low = _make_fake_task(task_manager, 'low', calls)
+    task_manager.scheduler.properties = {
+        'high': TaskProperties(TaskPriority.HIGH, 0, TaskCost.LIGHT),
+        'normal': TaskProperties(TaskPriority.NORMAL, 0, TaskCost.LIGHT),
+        'low': TaskProperties(TaskPriority.LOW, 0, TaskCost.LIGHT),
+    }
+    task_manager.potential_tasks = [low, normal, high]
+
+    for _ in range(STARVATION_SKIPS):
+        task_manager.schedule()
+        clock.now += 10
+        _finish_task(task_manager, high)
+
+    # the high priority task always took the only slot while the others were skipped
+    assert calls == ['high'] * STARVATION_SKIPS
+    stats = task_manager.get_tasks_stats()
+    assert stats['normal']['skip_count'] == stats['low']['skip_count'] == STARVATION_SKIPS
+    assert stats['normal']['run_count'] == stats['low']['run_count'] == 0
+
+    # now both starved tasks are promoted and the oldest deadline goes first
+    task_manager.schedule()
+    assert calls[-1] == 'low'
+    clock.now += 10
+    _finish_task(task_manager, low)
+    task_manager.schedule()
+    assert calls[-1] == 'normal'
+    clock.now += 10
+    _finish_task(task_manager, normal)
+    task_manager.schedule()
+    assert calls[-1] == 'high'
+    stats = task_manager.get_tasks_stats()
+    assert stats['low']['run_count'] == stats['normal']['run_count'] == 1
+    assert stats['low']['last_duration'] == stats['normal']['last_duration'] == 10
+    assert stats['high'] == {
+        'priority': 'high',
+        'cost': 'light',
+        'min_interval': 0,
+        'run_count': STARVATION_SKIPS + 1,
+        'skip_count': 2,  # when the two starved tasks took the slot
+        'last_duration': 10,
+    }
+
+
+def test_scheduler_min_interval(task_manager: TaskManager) -> None:
+    """Test that a task that did not schedule anything is not checked again before its
+    minimum interval passes, while a task that ran is checked again right away"""
+    clock = _setup_fake_clock(task_manager)
+    calls: list[str] = []
+    spawning_task = _make_fake_task(task_manager, 'spawning', calls)
+
+    def idle_task():
+        calls.append('idle')
+
+    idle_task.__name__ = '_maybe_idle'
+    task_manager.scheduler.properties = {
+        'idle': TaskProperties(TaskPriority.HIGH, 60, TaskCost.LIGHT),
+        'spawning': TaskProperties(TaskPriority.LOW, 60, TaskCost.LIGHT),
+    }
+    task_manager.potential_tasks = [spawning_task, idle_task]
+
+    task_manager.schedule()
+    assert calls == ['idle', 'spawning']
+    _finish_task(task_manager, spawning_task)
+    clock.now += 59
+    task_manager.schedule()
+    assert calls == ['idle', 'spawning', 'spawning']
+    _finish_task(task_manager, spawning_task)
+    clock.now += 1
+    task_manager.schedule()
+    assert calls == ['idle', 'spawning', 'spawning', 'idle', 'spawning']
+    _finish_task(task_manager, spawning_task)
+
+
+@pytest.mark.parametrize('max_tasks_num', [2])
+def test_scheduler_heavy_tasks_leave_a_slot(task_manager: TaskManager) -> None:
+    """Test that heavy tasks never take the last free slot"""
+    _setup_fake_clock(task_manager)
+    calls: list[str] = []
+    heavy_1 = _make_fake_task(task_manager, 'heavy_1', calls)
+    heavy_2 = _make_fake_task(task_manager, 'heavy_2', calls)
+    light = _make_fake_task(task_manager, 'light', calls)
+    task_manager.scheduler.properties = {
+        'heavy_1': TaskProperties(TaskPriority.HIGH, 0, TaskCost.HEAVY),
+        'heavy_2': TaskProperties(TaskPriority.HIGH, 0, TaskCost.HEAVY),
+        'light': TaskProperties(TaskPriority.LOW, 0, TaskCost.LIGHT),
+    }
+    task_manager.potential_tasks = [heavy_1, heavy_2]
+    task_manager.schedule()
+    assert calls == ['heavy_1']
+    assert task_manager.get_tasks_stats()['heavy_2']['skip_count'] == 1
+
+    task_manager.potential_tasks = [heavy_1, heavy_2, light]
+    task_manager.schedule()
+    assert calls == ['heavy_1', 'light']
+    assert task_manager.get_tasks_stats()['heavy_2']['skip_count'] == 2
+    for fake_task in (heavy_1, light):
+        _finish_task(task_manager, fake_task)
+
+
+def test_db_maintenance_only_runs_when_idle(task_manager: TaskManager, api_task_greenlets: list) -> None:  # noqa: E501
+    """Test that the DB maintenance task is only scheduled when no other task runs
+    and when it did not finish in the last day"""
+    clock = _setup_fake_clock(task_manager)
+    calls: list[str] = []
+    other_task = _make_fake_task(task_manager, 'other', calls)
+    maintenance_task = task_manager._maybe_run_db_maintenance
+    task_manager.potential_tasks = [other_task, maintenance_task]
+    with patch.object(DBMaintenance, 'run') as run_mock:
+        task_manager.schedule()  # another task of the task manager is running
+        assert calls == ['other']
+        assert maintenance_task not in task_manager.running_greenlets
+        _finish_task(task_manager, other_task)
+
+        task_manager.potential_tasks = [maintenance_task]
+        api_task_greenlets.append(api_greenlet := gevent.spawn(gevent.sleep, 10))
+        clock.now += 600
+        task_manager.schedule()  # a task of the API is running
+        assert maintenance_task not in task_manager.running_greenlets
+        api_greenlet.kill()
+
+        clock.now += 600
+        task_manager.schedule()
+        gevent.joinall(task_manager.running_greenlets[maintenance_task])
+        assert run_mock.call_count == 1
+
+    with task_manager.database.conn.write_ctx() as write_cursor:
+        write_cursor.execute(
+            'INSERT INTO settings(name, value) VALUES (?, ?)',
+            (LAST_DB_MAINTENANCE_KEY, str(ts_now())),
+        )
+    assert task_manager._maybe_run_db_maintenance() is None  # it finished recently
@@ -5,6 +5,7 @@ from rotkehlchen.constants.misc import (
     DEFAULT_MAX_LOG_SIZE_IN_MB,
     DEFAULT_SQL_VM_INSTRUCTIONS_CB,
 )
+from rotkehlchen.db.profiles import DEFAULT_DB_PROFILE, DBProfileName
 
 
 class ConfigurationArgs(NamedTuple):
@@ -17,6 +18,7 @@ class ConfigurationArgs(NamedTuple):
     max_size_in_mb_all_logs: int = DEFAULT_MAX_LOG_SIZE_IN_MB
     max_logfiles_num: int = DEFAULT_MAX_LOG_BACKUP_FILES
     sqlite_instructions: int = DEFAULT_SQL_VM_INSTRUCTIONS_CB
+    db_profile: DBProfileName = DEFAULT_DB_PROFILE
 
 
 def default_args(
@@ -33,6 +35,7 @@ def default_args(
         max_size_in_mb_all_logs=max_size_in_mb_all_logs,
         max_logfiles_num=DEFAULT_MAX_LOG_BACKUP_FILES,
         sqlite_instructions=DEFAULT_SQL_VM_INSTRUCTIONS_CB,
+        db_profile=DEFAULT_DB_PROFILE,
         logfile=None,
         logtarget=None,
     )
@@ -12,7 +12,9 @@ from rotkehlchen.assets.asset import Asset
 from rotkehlchen.balances.manual import ManuallyTrackedBalance
 from rotkehlchen.chain.accounts import BlockchainAccountData, BlockchainAccounts
 from rotkehlchen.chain.evm.nodes import populate_rpc_nodes_in_database
+from rotkehlchen.constants.misc import DEFAULT_SQL_VM_INSTRUCTIONS_CB
 from rotkehlchen.db.dbhandler import DBHandler
+from rotkehlchen.db.drivers.gevent import DBConnection, DBConnectionType
 from rotkehlchen.db.settings import ModifiableDBSettings
 from rotkehlchen.errors.misc import InputError
 from rotkehlchen.globaldb.handler import GlobalDBHandler
@@ -23,6 +25,7 @@ from rotkehlchen.types import (
     ExternalServiceApiCredentials,
     SupportedBlockchain,
 )
+from rotkehlchen.user_messages import MessagesAggregator
 
 
 def maybe_include_etherscan_key(db: DBHandler, include_etherscan_key: bool) -> None:
@@ -176,6 +179,41 @@ def _use_prepared_db(user_data_dir: Path, filename: str) -> None:
     )
 
 
+def _grow_prepared_db(user_data_dir: Path, filename: str, megabytes: int) -> bytes:
+    """Uses the given prepared DB after adding a table of random data of the given size to it
+    and returns the contents of the DB file"""
+    _use_prepared_db(user_data_dir, filename)
+    conn = DBConnection(
+        path=str(user_data_dir / 'rotkehlchen.db'),
+        connection_type=DBConnectionType.USER,
+        sql_vm_instructions_cb=0,
+    )
+    conn.executescript('PRAGMA key="123"')
+    conn.enable_wal()  # as the DBHandler does, so that opening it does not change the file
+    with conn.write_ctx() as write_cursor:
+        write_cursor.execute('CREATE TABLE filler(data BLOB)')
+        write_cursor.executemany(
+            'INSERT INTO filler(data) VALUES(?)',
+            [(os.urandom(1024 * 1024),) for _ in range(megabytes)],
+        )
+    conn.wal_checkpoint()
+    conn.close()
+    return (user_data_dir / 'rotkehlchen.db').read_bytes()
+
+
+def _init_upgraded_db(user_data_dir: Path, msg_aggregator: MessagesAggregator) -> DBHandler:
+    """Opens the DB in the directory running the upgrades of UPGRADES_LIST as it is"""
+    with mock_db_schema_sanity_check():
+        return DBHandler(
+            user_data_dir=user_data_dir,
+            password='123',
+            msg_aggregator=msg_aggregator,
+            initial_settings=None,
+            sql_vm_instructions_cb=DEFAULT_SQL_VM_INSTRUCTIONS_CB,
+            resume_from_backup=False,
+        )
+
+
 def perform_new_db_unlock_actions(db: DBHandler, new_db_unlock_actions: tuple[str]) -> None:
     """Decide actions to perform at new DB unlock for a specific test depending on arguments"""
     if 'rpc_nodes' in new_db_unlock_actions:
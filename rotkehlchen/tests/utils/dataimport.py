@@ -1,3 +1,5 @@
+import csv
+from pathlib import Path
 from typing import Literal
 
 from rotkehlchen.accounting.structures.balance import Balance
@@ -2330,3 +2332,31 @@ def assert_bitstamp_trades_import_results(rotki: Rotkehlchen):
 
     for actual, expected in zip(history_events, expected_history_events):
         assert_is_equal_history_event(actual=actual, expected=expected)
+
+
+SYNTHETIC_TRADE_PAIRS = (('BTC', 'EUR'), ('ETH', 'BTC'), ('LTC', 'USD'), ('XMR', 'ETH'))
+
+
+def generate_rotki_trades_csv(filepath: Path, rows: int) -> None:
+    """Writes a synthetic rotki generic trades csv file with the given number of rows.
+    Each row is a different trade. Used to benchmark big csv imports."""
+    with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow((
+            'Location', 'Base Currency', 'Quote Currency', 'Type', 'Buy Amount',
+            'Sell Amount', 'Fee', 'Fee Currency', 'Description', 'Timestamp',
+        ))
+        for idx in range(rows):
+            base, quote = SYNTHETIC_TRADE_PAIRS[idx % len(SYNTHETIC_TRADE_PAIRS)]
+            writer.writerow((
+                'kraken',
+                base,
+                quote,
+                'Buy' if idx % 2 == 0 else 'Sell',
+                f'{1 + idx % 100}.5',
+                f'{2 + idx % 50}.25',
+                '0.1' if idx % 3 == 0 else '',
+                quote if idx % 3 == 0 else '',
+                f'Synthetic trade {idx}',
+                1600000000000 + idx * 1000,
+            ))
@@ -35,6 +35,7 @@ from rotkehlchen.tests.utils.mock import MockResponse
 from rotkehlchen.types import AssetMovementCategory, Fee, Location, Timestamp
 
 if TYPE_CHECKING:
+    from rotkehlchen.accounting.timings import PnlTimings
     from rotkehlchen.assets.asset import Asset
 
 TEST_END_TS = 1559427707
@@ -271,6 +272,7 @@ def check_result_of_history_creation_for_remote_errors(  # type: ignore[return]
         start_ts: Timestamp,  # pylint: disable=unused-argument
         end_ts: Timestamp,  # pylint: disable=unused-argument
         events: list[AccountingEventMixin],
+        timings: Optional['PnlTimings'] = None,  # pylint: disable=unused-argument
 ) -> Optional[int]:
     assert len(events) == 0
 
@@ -752,6 +754,7 @@ def mock_history_processing(
             start_ts: Timestamp,
             end_ts: Timestamp,
             events: list[AccountingEventMixin],
+            timings: Optional['PnlTimings'] = None,  # pylint: disable=unused-argument
     ) -> Optional[int]:
         """This function offers some simple assertions on the result of the
         created history. The entire processing part of the history is mocked
@@ -868,6 +871,7 @@ def mock_history_processing(
             start_ts: Timestamp,
             end_ts: Timestamp,
             events: list[AccountingEventMixin],
+            timings: Optional['PnlTimings'] = None,
     ) -> Optional[int]:
         """Checks results of history creation but also proceeds to normal history processing"""
         check_result_of_history_creation(
@@ -879,6 +883,7 @@ def mock_history_processing(
             start_ts=start_ts,
             end_ts=end_ts,
             events=events,
+            timings=timings,
         )
 
     if should_mock_history_processing is True:
@@ -22,6 +22,7 @@ def query_api_create_and_get_report(
         events_offset: Optional[int] = None,
         events_limit: Optional[int] = None,
         events_ascending_timestamp: bool = False,
+        measure_timings: bool = False,
 ):
     async_query = random.choice([False, True])
     rotki = server.rest_api.rotkehlchen
@@ -41,7 +42,12 @@ def query_api_create_and_get_report(
                 stack.enter_context(manager)
         response = requests.get(
             api_url_for(server, 'historyprocessingresource'),
-            json={'from_timestamp': start_ts, 'to_timestamp': end_ts, 'async_query': async_query},
+            json={
+                'from_timestamp': start_ts,
+                'to_timestamp': end_ts,
+                'async_query': async_query,
+                'measure_timings': measure_timings,
+            },
         )
         if async_query:
             task_id = assert_ok_async_response(response)
@@ -998,6 +998,7 @@ class CacheType(Enum):
     ENS_LABELHASH = auto()  # map ENS labelhash -> ens name
     CONVEX_POOL_ADDRESS = auto()  # get convex pool addr
     CONVEX_POOL_NAME = auto()  # map convex pool rewards address -> pool name
+    CRYPTOCOMPARE_HISTOHOUR_START = auto()  # first ts of a pair's fully cached histohour prices
 
     def serialize(self) -> str:
         # Using custom serialize method instead of SerializableEnumMixin since mixin replaces
@@ -1017,6 +1018,7 @@ UniqueCacheType = Literal[
     CacheType.ENS_NAMEHASH,
     CacheType.ENS_LABELHASH,
     CacheType.CONVEX_POOL_NAME,
+    CacheType.CRYPTOCOMPARE_HISTOHOUR_START,
 ]
 
 UNIQUE_CACHE_KEYS: tuple[UniqueCacheType, ...] = typing.get_args(UniqueCacheType)
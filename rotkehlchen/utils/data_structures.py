@@ -32,6 +32,12 @@ class LRUCacheWithRemove(Generic[KT, VT]):
         """Delete all entries in the cache"""
         self.cache.clear()
 
+    def resize(self, maxsize: int) -> None:
+        """Change the capacity of the cache evicting the least recently used entries"""
+        self.maxsize = maxsize
+        while len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+
 
 class LRUCacheLowerKey(LRUCacheWithRemove[str, VT]):
     """Create an LRU cache with string key which is always considered as lowercase"""
@@ -0,0 +1,78 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, Optional
+
+import requests
+from gevent.local import local
+
+
+class RequestTimings:
+    """Seconds an API request or async task spent in the DB and in remote queries.
+
+    The DB time is the time spent inside sqlite. The time other greenlets run while a
+    statement yields to them from the progress handler is not counted in it.
+    """
+    __slots__ = ('db_seconds', 'remote_seconds')
+
+    def __init__(self) -> None:
+        self.db_seconds = 0.0
+        self.remote_seconds = 0.0
+
+
+# Greenlet local so that each request counts only the time of the greenlet serving it.
+# The time of greenlets spawned by a request is not counted in it.
+_context = local()
+
+
+class _TrackedGreenlets:
+    """Number of greenlets whose time is being counted. Looking up the greenlet local costs
+    about as much as a point query, so the DB driver skips it when nothing is counted"""
+    count = 0
+
+
+def get_request_timings() -> Optional[RequestTimings]:
+    if _TrackedGreenlets.count == 0:
+        return None
+    return getattr(_context, 'timings', None)
+
+
+def start_request_timings() -> RequestTimings:
+    """Starts counting the time of the current greenlet in a new RequestTimings"""
+    if getattr(_context, 'timings', None) is None:
+        _TrackedGreenlets.count += 1
+    timings = _context.timings = RequestTimings()
+    return timings
+
+
+def stop_request_timings() -> None:
+    if getattr(_context, 'timings', None) is not None:
+        _TrackedGreenlets.count -= 1
+    _context.timings = None
+
+
+@contextmanager
+def track_request_timings() -> Iterator[RequestTimings]:
+    timings = start_request_timings()
+    try:
+        yield timings
+    finally:
+        stop_request_timings()
+
+
+def add_remote_time(start: float) -> None:
+    """Counts the time since `start` in the remote time of the current request, if any"""
+    if (timings := getattr(_context, 'timings', None)) is not None:
+        timings.remote_seconds += time.perf_counter() - start
+
+
+class TimedSession(requests.Session):
+    """A requests session that counts the time of its requests in the remote time of the
+    API request or async task that made them"""
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        start = time.perf_counter()
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            add_remote_time(start)
@@ -10,11 +10,18 @@ from rotkehlchen.constants import GLOBAL_REQUESTS_TIMEOUT
 from rotkehlchen.db.settings import CachedSettings
 from rotkehlchen.errors.misc import RemoteError, UnableToDecryptRemoteData
 from rotkehlchen.logging import RotkehlchenLogsAdapter
+from rotkehlchen.utils.metrics import TimedSession
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
 
+def create_session() -> requests.Session:
+    """The session for the queries of an external API client. Its time is counted in the
+    remote time of the API request that made the queries"""
+    return TimedSession()
+
+
 def request_get(
         url: str,
         timeout: int = GLOBAL_REQUESTS_TIMEOUT,
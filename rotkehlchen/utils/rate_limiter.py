@@ -0,0 +1,72 @@
+import time
+from collections.abc import Callable
+from typing import Any, Optional
+
+import gevent
+
+
+class LeakyBucket:
+    """A leaky bucket rate limiter
+
+    Every call adds its cost to the level of the bucket and the level decays
+    continuously by `leak_rate` units per second. A call can be made only if after
+    adding its cost the level does not exceed the capacity. This is how for example
+    Kraken's API call counter works.
+
+    The timestamps are wall clock timestamps so that the state can be persisted
+    and restored after a restart.
+    """
+
+    def __init__(
+            self,
+            capacity: float,
+            leak_rate: float,
+            clock: Callable[[], float] = time.time,
+            sleep: Callable[[float], Any] = gevent.sleep,
+    ) -> None:
+        self.capacity = capacity
+        self.leak_rate = leak_rate
+        self.clock = clock
+        self.sleep = sleep
+        self._level = 0.0
+        self._level_ts = 0.0
+
+    def level(self, now: Optional[float] = None) -> float:
+        """The level of the bucket after decaying until `now`"""
+        if now is None:
+            now = self.clock()
+        return max(0.0, self._level - max(0.0, now - self._level_ts) * self.leak_rate)
+
+    def wait_time(self, cost: float) -> float:
+        """Seconds until a call with the given cost can be made"""
+        overflow = self.level() + cost - self.capacity
+        return max(0.0, overflow / self.leak_rate)
+
+    def acquire(self, cost: float) -> float:
+        """Sleeps exactly until there is capacity for a call with the given cost and adds
+        the cost to the bucket. Returns the number of seconds slept"""
+        slept = 0.0
+        while (wait := self.wait_time(cost)) > 0:
+            self.sleep(wait)
+            slept += wait
+
+        now = self.clock()
+        self._level = self.level(now) + cost
+        self._level_ts = now
+        return slept
+
+    def fill(self) -> None:
+        """Mark the bucket as full. To be used when the remote tells us that we are rate
+        limited, which means that its counter is higher than our estimation"""
+        self._level = self.capacity
+        self._level_ts = self.clock()
+
+    def serialize(self) -> tuple[float, float]:
+        return self._level, self._level_ts
+
+    def restore(self, level: float, level_ts: float) -> None:
+        """Restores a previously serialized state. A state older than the current one
+        or from the future is ignored"""
+        if self._level_ts < level_ts <= self.clock():
+            self._level = level
+            self._level_ts = level_ts
@@ -11,6 +11,8 @@ import greenlet
 import objgraph
 import psutil
 
+from rotkehlchen.greenlets.profiler import collect_frames
+
 from .constants import INTERVAL_SECONDS, MEGA
 from .timer import TIMER, TIMER_SIGNAL, Timer
 
@@ -23,23 +25,6 @@ FlameStack = NewType('FlameStack', str)
 FlameGraph = dict[FlameStack, float]
 
 
-def frame_format(frame: FrameType) -> str:
-    block_name = frame.f_code.co_name
-    module_name = frame.f_globals.get('__name__')
-    return f'{block_name}({module_name})'
-
-
-def collect_frames(frame: FrameType) -> list[str]:
-    callstack = []
-    optional_frame: Optional[FrameType] = frame
-    while optional_frame is not None:
-        callstack.append(frame_format(optional_frame))
-        optional_frame = optional_frame.f_back
-
-    callstack.reverse()
-    return callstack
-
-
 def flamegraph_format(stack_count: FlameGraph) -> str:
     return '\n'.join('%s %d' % (key, value) for key, value in sorted(stack_count.items()))
 
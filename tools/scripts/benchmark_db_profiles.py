@@ -0,0 +1,205 @@
+"""
+This script benchmarks the DB connection profiles of rotkehlchen/db/profiles.py so that
+their values can be chosen from data. It builds a synthetic encrypted user DB with
+--events history events and a tenth as many timed balances, once per given cipher page
+size, and then times representative reads and writes under each profile.
+
+The built DBs are kept in --directory and reused in later runs with the same arguments.
+Run from the root of the repository, for example:
+
+PYTHONPATH=. python tools/scripts/benchmark_db_profiles.py --directory /tmp/dbbench
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable, Iterator
+from functools import partial
+from pathlib import Path
+
+from rotkehlchen.assets.asset import Asset
+from rotkehlchen.db.drivers.gevent import DBConnection, DBConnectionType, DBCursor
+from rotkehlchen.db.filtering import ALL_EVENTS_DATA_JOIN, HistoryEventFilterQuery
+from rotkehlchen.db.history_events import (
+    ETH_STAKING_EVENT_FIELDS,
+    EVM_EVENT_FIELDS,
+    HISTORY_BASE_ENTRY_FIELDS,
+)
+from rotkehlchen.db.misc import detect_sqlcipher_version
+from rotkehlchen.db.profiles import DB_CONNECTION_PROFILES, DBConnectionProfile
+from rotkehlchen.db.schema import DB_SCRIPT_CREATE_TABLES
+from rotkehlchen.db.utils import protect_password_sqlcipher
+from rotkehlchen.types import Timestamp
+
+PASSWORD = protect_password_sqlcipher('123')
+ASSETS = ['ETH', 'BTC', 'eip155:1/erc20:0x6B175474E89094C44Da98b954EedeAC495271d0F'] + [f'ASSET{x}' for x in range(47)]  # noqa: E501
+EVENT_TYPES = [('receive', 'none'), ('spend', 'fee'), ('trade', 'spend'), ('staking', 'reward')]
+START_TS_MS = 1500000000000
+WRITE_TRANSACTIONS = 200  # number of commits of the write benchmark
+
+
+def connect(path: Path, cipher_page_size: int) -> DBConnection:
+    conn = DBConnection(path=str(path), connection_type=DBConnectionType.USER, sql_vm_instructions_cb=0)  # noqa: E501
+    script = f'PRAGMA key="{PASSWORD}";'
+    if detect_sqlcipher_version() == 3:
+        script += 'PRAGMA kdf_iter=64000;'
+    script += f'PRAGMA cipher_page_size={cipher_page_size};'
+    conn.executescript(script)
+    return conn
+
+
+def history_events(number: int) -> Iterator[tuple]:
+    for idx in range(number):
+        event_type, event_subtype = EVENT_TYPES[idx % len(EVENT_TYPES)]
+        yield (
+            idx + 1, 0, f'event{idx // 3}', idx % 3,
+            START_TS_MS + idx * 60000 + random.randint(0, 59999), 'A', 'label',
+            random.choice(ASSETS), str(random.random() * 100), str(random.random() * 1000),
+            'some notes of the event', event_type, event_subtype,
+        )
+
+
+def timed_balances(number: int) -> Iterator[tuple]:
+    for idx in range(number):
+        yield (
+            'A' if idx % 5 else 'B', START_TS_MS // 1000 + idx // len(ASSETS) * 3600,
+            ASSETS[idx % len(ASSETS)], str(random.random() * 100), str(random.random() * 1000),
+        )
+
+
+def build_db(path: Path, cipher_page_size: int, events: int) -> None:
+    if path.exists():
+        return
+
+    print(f'Building {path} with {events} history events')
+    conn = connect(path, cipher_page_size)
+    conn.enable_wal()
+    conn.executescript(DB_SCRIPT_CREATE_TABLES)
+    conn.executescript('PRAGMA foreign_keys=OFF;')  # the synthetic assets are not in the DB
+    with conn.write_ctx() as write_cursor:
+        write_cursor.executemany(
+            'INSERT INTO history_events(identifier, entry_type, event_identifier, '
+            'sequence_index, timestamp, location, location_label, asset, amount, usd_value, '
+            'notes, type, subtype) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            list(history_events(events)),
+        )
+        write_cursor.executemany(
+            'INSERT OR IGNORE INTO timed_balances(category, timestamp, currency, amount, '
+            'usd_value) VALUES(?, ?, ?, ?, ?)',
+            list(timed_balances(events // 10)),
+        )
+    conn.close()
+
+
+def query_history_events(cursor: DBCursor, filter_query: HistoryEventFilterQuery) -> int:
+    """The query of DBHistoryEvents.get_history_events for premium users"""
+    prepared_query, bindings = filter_query.prepare()
+    return len(cursor.execute(
+        f'SELECT {HISTORY_BASE_ENTRY_FIELDS}, {EVM_EVENT_FIELDS}, {ETH_STAKING_EVENT_FIELDS} {ALL_EVENTS_DATA_JOIN}' + prepared_query,  # noqa: E501
+        bindings,
+    ).fetchall())
+
+
+def query_timed_balances(cursor: DBCursor) -> int:
+    """The query of DBHandler.query_timed_balances"""
+    return len(cursor.execute(
+        'SELECT timestamp, amount, usd_value, category FROM timed_balances '
+        'WHERE timestamp BETWEEN ? AND ? AND currency=? AND category=? ORDER BY timestamp ASC;',
+        (0, 2000000000, 'BTC', 'A'),
+    ).fetchall())
+
+
+def write_events(conn: DBConnection, events: int) -> int:
+    """Many small write transactions like those of the decoding of transactions"""
+    for idx in range(WRITE_TRANSACTIONS):
+        with conn.write_ctx() as write_cursor:
+            write_cursor.executemany(
+                'INSERT INTO history_events(entry_type, event_identifier, sequence_index, '
+                'timestamp, location, asset, amount, usd_value, type, subtype) '
+                'VALUES(0, ?, ?, ?, "A", "ETH", "1", "1", "receive", "none")',
+                [(f'written{idx}', seq, START_TS_MS + (events + idx) * 60000) for seq in range(10)],  # noqa: E501
+            )
+    with conn.write_ctx() as write_cursor:
+        write_cursor.execute('DELETE FROM history_events WHERE event_identifier LIKE "written%"')
+    return WRITE_TRANSACTIONS
+
+
+def _time(function: Callable[[], int], repeat: int) -> tuple[float, float]:
+    """Returns the time of the first and of the fastest of `repeat` runs of the function"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings[0], min(timings)
+
+
+def benchmark(
+        path: Path,
+        cipher_page_size: int,
+        profile: DBConnectionProfile,
+        events: int,
+        repeat: int,
+) -> dict[str, tuple[float, float]]:
+    conn = connect(path, cipher_page_size)
+    profile.apply(conn, encrypted=True)
+    if conn.enable_wal() is True:  # as the user DB of the app
+        profile.apply_wal(conn)
+    filter_queries = {
+        'events page': HistoryEventFilterQuery.make(limit=50, offset=events // 2),
+        'events of asset': HistoryEventFilterQuery.make(assets=(Asset('BTC'),)),
+        'events in range': HistoryEventFilterQuery.make(
+            from_ts=Timestamp(START_TS_MS // 1000),
+            to_ts=Timestamp(START_TS_MS // 1000 + events * 6),
+        ),
+    }
+    results = {}
+    with conn.read_ctx() as cursor:
+        for name, filter_query in filter_queries.items():
+            results[name] = _time(partial(query_history_events, cursor, filter_query), repeat)
+        results['timed balances'] = _time(partial(query_timed_balances, cursor), repeat)
+    results['writes'] = _time(partial(write_events, conn, events), repeat)
+    conn.close()
+    return results
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description='Benchmark the DB connection profiles')
+    p.add_argument('--events', type=int, default=2000000, help='Number of history events')
+    p.add_argument('--directory', type=Path, required=True, help='Where to build the DBs')
+    p.add_argument(
+        '--cipher-page-sizes',
+        type=int,
+        nargs='+',
+        default=[4096],
+        help='Cipher page sizes to build a DB with. Only new DBs can use a non-default one.',
+    )
+    p.add_argument(
+        '--profiles',
+        nargs='+',
+        choices=list(DB_CONNECTION_PROFILES),
+        default=list(DB_CONNECTION_PROFILES),
+    )
+    p.add_argument('--repeat', type=int, default=3, help='Runs of each query')
+    args = p.parse_args()
+    args.directory.mkdir(parents=True, exist_ok=True)
+    random.seed(0)
+
+    print(f'{"page size":>9} {"profile":>10} {"query":>16} {"first (s)":>10} {"best (s)":>10}')
+    for cipher_page_size in args.cipher_page_sizes:
+        path = args.directory / f'bench_{args.events}_{cipher_page_size}.db'
+        build_db(path, cipher_page_size, args.events)
+        for profile_name in args.profiles:
+            results = benchmark(
+                path=path,
+                cipher_page_size=cipher_page_size,
+                profile=DB_CONNECTION_PROFILES[profile_name],
+                events=args.events,
+                repeat=args.repeat,
+            )
+            for name, (first, best) in results.items():
+                print(f'{cipher_page_size:>9} {profile_name:>10} {name:>16} {first:>10.3f} {best:>10.3f}')  # noqa: E501
+
+
+if __name__ == '__main__':
+    main()
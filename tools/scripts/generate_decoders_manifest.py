@@ -0,0 +1,44 @@
+"""
+This script generates the manifest of the decoder modules of each EVM chain and puts it in
+rotkehlchen/chain/evm/decoding/decoders_manifest.py so that the transaction decoders don't
+need to walk the packages of the chain's modules to find their decoders.
+It needs to run whenever a decoder is added, removed or renamed.
+"""
+
+import argparse
+import datetime
+
+import rotkehlchen.rotkehlchen  # noqa: F401  # import all of rotki first so that the decoder modules import without circular imports
+from rotkehlchen.chain.evm.decoding.decoder import walk_decoder_modules
+from rotkehlchen.types import EVM_CHAINS_WITH_TRANSACTIONS
+from rotkehlchen.utils.misc import get_system_spec
+
+p = argparse.ArgumentParser()
+p.add_argument(
+    '--author',
+    help='Who is running this script? Used just for informational purposes',
+    type=str,
+    required=True,
+)
+args = p.parse_args()
+
+created_at = datetime.datetime.now(tz=datetime.timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+rotki_version = get_system_spec()['rotkehlchen']
+lines = [
+    '# This file contains the decoder modules of each evm chain and it should not be touched '
+    'manually but only generated by tools/scripts/generate_decoders_manifest.py',
+    f'# Created at {created_at} UTC with rotki version {rotki_version} by {args.author}',
+    '',
+    '# chain name -> (class name without the Decoder suffix, decoder module) of each decoder',
+    'DECODER_MODULES: dict[str, tuple[tuple[str, str], ...]] = {',
+]
+for blockchain in EVM_CHAINS_WITH_TRANSACTIONS:
+    chain_name = blockchain.name.lower()
+    lines.append(f"    '{chain_name}': (")
+    for class_name, module_name in walk_decoder_modules(f'rotkehlchen.chain.{chain_name}.modules'):
+        lines.append(f"        ('{class_name}', '{module_name}'),")
+    lines.append('    ),')
+lines.append('}')
+
+with open('rotkehlchen/chain/evm/decoding/decoders_manifest.py', 'w', encoding='utf8') as f:
+    f.write('\n'.join(lines) + '\n')